@@ -0,0 +1,254 @@
+
+from typing import Dict, List, Optional, Sequence, Tuple
+from string import ascii_letters
+from threading import Lock
+from math import prod
+
+import numpy as np
+
+from . import backend_manager as bm
+
+
+_Step = Tuple[str, Tuple[int, ...], Tuple]
+
+
+class ContractionPlan():
+    """A sequence of pairwise contractions found once for a signature.
+
+    Plans are built from the subscripts and the shapes of operands only, so they
+    can be reused by every call with the same signature. Calling the plan runs
+    the pairwise steps lowered to `matmul`: each step permutes its operands to
+    (batch, free, contracted) layouts and calls a batched `matmul`, which maps
+    to a batched GEMM for every backend. Steps without contracted indices are
+    lowered to broadcasting products. Use `einsum` instead to pass the pairwise
+    order to a backend einsum accepting it, e.g. `numpy.einsum(optimize=path)`.
+    """
+    def __init__(self, subscripts: str, shapes: Sequence[Tuple[int, ...]], *,
+                 optimize: str = 'optimal'):
+        inputs, output = _parse_subscripts(subscripts, shapes)
+        sizes: Dict[str, int] = {}
+        for subs, shape in zip(inputs, shapes):
+            for c, n in zip(subs, shape):
+                if sizes.get(c, 1) == 1:
+                    sizes[c] = n
+
+        # Axes with size 1 only broadcast, so they are squeezed out first.
+        self.squeeze: List[Tuple[int, ...]] = []
+        operands: List[str] = []
+        for subs, shape in zip(inputs, shapes):
+            axes = tuple(i for i, (c, n) in enumerate(zip(subs, shape))
+                         if n == 1 and sizes[c] != 1)
+            self.squeeze.append(axes)
+            operands.append(''.join(c for i, c in enumerate(subs) if i not in axes))
+
+        dummies = [np.broadcast_to(np.empty((), dtype=np.float64), tuple(sizes[c] for c in s))
+                   for s in operands]
+        if len(operands) > 6:
+            optimize = 'greedy'
+        self.expr = ','.join(operands) + '->' + output
+        self.path, _ = np.einsum_path(self.expr, *dummies, optimize=optimize)
+        self.steps: List[_Step] = []
+
+        for pair in self.path[1:]:
+            pair = tuple(sorted(pair))
+            subs = [operands.pop(i) for i in reversed(pair)][::-1]
+            rest = set(''.join(operands)) | set(output)
+
+            if len(subs) == 2 and all(len(set(s)) == len(s) for s in subs):
+                step = _pair_step(*subs, rest, sizes)
+                result = step[-1]
+                kind = 'matmul' if any(c in subs[1] and c not in rest for c in subs[0]) else 'mul'
+                self.steps.append((kind, pair, step))
+            else:
+                result = ''.join(c for c in dict.fromkeys(''.join(subs)) if c in rest)
+                expr = ','.join(subs) + '->' + result
+                self.steps.append(('einsum', pair, (expr, )))
+
+            operands.append(result)
+
+        final = operands[0]
+        self.final = None if final == output else f'{final}->{output}'
+
+    def _squeeze(self, operands: Sequence):
+        return [bm.squeeze(x, axis=axes) if axes else x
+                for x, axes in zip(operands, self.squeeze)]
+
+    def einsum(self, *operands):
+        """Run the backend einsum with the planned pairwise order."""
+        return bm.einsum(self.expr, *self._squeeze(operands), optimize=self.path)
+
+    def __call__(self, *operands):
+        ops = self._squeeze(operands)
+
+        for kind, pair, args in self.steps:
+            xs = [ops.pop(i) for i in reversed(pair)][::-1]
+            if kind == 'matmul':
+                ops.append(_pair_contract(*xs, *args))
+            elif kind == 'mul':
+                ops.append(_pair_multiply(*xs, *args))
+            else:
+                ops.append(bm.einsum(args[0], *xs))
+
+        result = ops[0]
+        if self.final is not None:
+            result = bm.einsum(self.final, result)
+        return result
+
+
+def _parse_subscripts(subscripts: str, shapes: Sequence[Tuple[int, ...]]):
+    subscripts = subscripts.replace(' ', '')
+    if '->' in subscripts:
+        lhs, output = subscripts.split('->')
+    else:
+        lhs, output = subscripts, None
+    inputs = lhs.split(',')
+
+    if len(inputs) != len(shapes):
+        raise ValueError(f"Got {len(shapes)} operands for subscripts '{subscripts}'.")
+
+    unused = [c for c in ascii_letters if c not in subscripts]
+    ell_ndim = max((len(shape) - len(subs) + 3 for subs, shape in zip(inputs, shapes)
+                    if '...' in subs), default=0)
+    ell = ''.join(unused[:ell_ndim])
+
+    for k, (subs, shape) in enumerate(zip(inputs, shapes)):
+        if '...' in subs:
+            n = len(shape) - len(subs) + 3
+            inputs[k] = subs.replace('...', ell[ell_ndim-n:])
+        if len(inputs[k]) != len(shape):
+            raise ValueError(f"Subscripts '{subs}' do not match the operand shaped {shape}.")
+
+    if output is None:
+        counts = {}
+        for c in ''.join(inputs):
+            counts[c] = counts.get(c, 0) + 1
+        output = ell + ''.join(sorted(c for c, n in counts.items() if n == 1 and c not in ell))
+    else:
+        output = output.replace('...', ell)
+
+    return inputs, output
+
+
+def _pair_step(a: str, b: str, rest: set, sizes: Dict[str, int]):
+    batch = [c for c in a if c in b and c in rest]
+    contracted = [c for c in a if c in b and c not in rest]
+    left = [c for c in a if c not in b and c in rest]
+    right = [c for c in b if c not in a and c in rest]
+    # Indices only in one operand and not needed later are summed beforehand.
+    a_sum = tuple(i for i, c in enumerate(a) if c not in b and c not in rest)
+    b_sum = tuple(i for i, c in enumerate(b) if c not in a and c not in rest)
+    a_kept = [c for c in a if c in b or c in rest]
+    b_kept = [c for c in b if c in a or c in rest]
+
+    a_perm = tuple(a_kept.index(c) for c in batch + left + contracted)
+    b_perm = tuple(b_kept.index(c) for c in batch + contracted + right)
+    n_batch = tuple(sizes[c] for c in batch)
+    n_left = prod(sizes[c] for c in left)
+    n_right = prod(sizes[c] for c in right)
+    n_contracted = prod(sizes[c] for c in contracted)
+    out_shape = n_batch + tuple(sizes[c] for c in left + right)
+    result = ''.join(batch + left + right)
+
+    if contracted:
+        a_shape = n_batch + (n_left, n_contracted)
+        b_shape = n_batch + (n_contracted, n_right)
+    else: # shapes to broadcast to (batch, left, right)
+        a_shape = n_batch + tuple(sizes[c] for c in left) + (1, ) * len(right)
+        b_shape = n_batch + (1, ) * len(left) + tuple(sizes[c] for c in right)
+
+    return a_sum, b_sum, a_perm, b_perm, a_shape, b_shape, out_shape, result
+
+
+def _pair_contract(x, y, a_sum, b_sum, a_perm, b_perm, a_shape, b_shape, out_shape, result):
+    if a_sum:
+        x = bm.sum(x, axis=a_sum)
+    if b_sum:
+        y = bm.sum(y, axis=b_sum)
+    x = bm.reshape(bm.permute_dims(x, a_perm), a_shape)
+    y = bm.reshape(bm.permute_dims(y, b_perm), b_shape)
+    return bm.reshape(bm.matmul(x, y), out_shape)
+
+
+def _pair_multiply(x, y, a_sum, b_sum, a_perm, b_perm, a_shape, b_shape, out_shape, result):
+    if a_sum:
+        x = bm.sum(x, axis=a_sum)
+    if b_sum:
+        y = bm.sum(y, axis=b_sum)
+    x = bm.reshape(bm.permute_dims(x, a_perm), a_shape)
+    y = bm.reshape(bm.permute_dims(y, b_perm), b_shape)
+    return x * y
+
+
+class ContractionPlanner():
+    """Cache of contraction plans per backend, subscripts and shapes of operands.
+
+    Parameters:
+        maxsize (int, optional): Maximum number of plans kept for each backend.
+            Defaults to 256.
+        optimize (str, optional): Strategy of `numpy.einsum_path` to find the
+            pairwise order, 'greedy' or 'optimal'. Defaults to 'optimal', and
+            'greedy' is always used for more than 6 operands.
+        lowering (dict, optional): Whether to lower the pairwise steps to `matmul`
+            for each backend. Backends not listed are lowered. Defaults to
+            {'numpy': False}, as `numpy.einsum` runs a given order with BLAS itself.
+    """
+    def __init__(self, maxsize: int = 256, *, optimize: str = 'optimal',
+                 lowering: Optional[Dict[str, bool]] = None):
+        self.maxsize = maxsize
+        self.optimize = optimize
+        self.lowering = {'numpy': False} if lowering is None else dict(lowering)
+        self._plans: Dict[str, Dict[Tuple, ContractionPlan]] = {}
+        # The planner is shared by the worker threads of parallel assembly.
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_plan(self, subscripts: str, *shapes: Tuple[int, ...]) -> ContractionPlan:
+        """Get the cached plan, or build a new one."""
+        key = (subscripts, shapes)
+        with self._lock:
+            plans = self._plans.setdefault(bm.backend_name, {})
+            plan = plans.get(key, None)
+            if plan is not None:
+                self.hits += 1
+                return plan
+            self.misses += 1
+
+        # Plans are built out of the lock; a plan built by two threads at
+        # the same time is kept once.
+        plan = ContractionPlan(subscripts, shapes, optimize=self.optimize)
+        with self._lock:
+            plans = self._plans.setdefault(bm.backend_name, {})
+            if key not in plans:
+                if len(plans) >= self.maxsize:
+                    plans.pop(next(iter(plans)))
+                plans[key] = plan
+            return plans[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._plans.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __call__(self, subscripts: str, *operands):
+        if not all(hasattr(x, 'shape') for x in operands):
+            return bm.einsum(subscripts, *operands)
+        shapes = tuple(tuple(x.shape) for x in operands)
+        plan = self.get_plan(subscripts, *shapes)
+        if self.lowering.get(bm.backend_name, True):
+            return plan(*operands)
+        return plan.einsum(*operands)
+
+
+planner = ContractionPlanner()
+
+
+def contract(subscripts: str, *operands):
+    """Evaluate an einsum expression by a cached contraction plan.
+
+    The pairwise order is found once per (backend, subscripts, shapes). Pairwise
+    contractions are lowered to batched `matmul` unless the backend einsum can
+    run the cached order itself.
+    """
+    return planner(subscripts, *operands)
@@ -10,6 +10,9 @@ from numpy.typing import NDArray
 from scipy.spatial import KDTree
 from numpy.linalg import det
 from scipy.sparse._sparsetools import coo_matvec, csr_matvec, csr_matvecs, coo_tocsr
+from scipy.sparse._sparsetools import csr_sort_indices, csr_sum_duplicates
+from scipy.sparse._sparsetools import csr_matmat_maxnnz, csr_matmat
+from scipy.sparse._sparsetools import bsr_matvec, bsr_matvecs
 
 from .base import (
     ModuleProxy, BackendProxy,
@@ -23,6 +26,49 @@ def _remove_device(func):
         return func(*args, **kwargs)
     return wrapper
 
+class _SparseExecutor():
+    # Row-partitioned execution of the scipy sparse kernels, which release
+    # the GIL, in a thread pool shared by all calls.
+    def __init__(self):
+        self.num_threads = 1
+        self.min_nnz = 100000
+        self._pool = None
+
+    def set_num_threads(self, num_threads: Optional[int] = None, min_nnz: int = 100000):
+        from os import cpu_count
+
+        if num_threads is None:
+            num_threads = cpu_count() or 1
+        if num_threads < 1:
+            raise ValueError("num_threads should be positive.")
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        self.num_threads = num_threads
+        self.min_nnz = min_nnz
+
+    def partition(self, crow, work: int):
+        # Row bounds of the parts with balanced nonzeros.
+        nparts = self.num_threads if work >= self.min_nnz else 1
+        nrow = crow.shape[0] - 1
+        if nparts <= 1 or nrow <= nparts:
+            return [(0, nrow)]
+        targets = np.linspace(0, crow[-1], nparts + 1)[1:-1]
+        bounds = np.unique(np.concatenate([[0], np.searchsorted(crow, targets), [nrow]]))
+        return list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+
+    def map(self, func, parts):
+        if len(parts) == 1:
+            return [func(*parts[0])]
+        if self._pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._pool = ThreadPoolExecutor(max_workers=self.num_threads)
+        return list(self._pool.map(lambda part: func(*part), parts))
+
+
+_sparse_executor = _SparseExecutor()
+
+
 class NumPyBackend(BackendProxy, backend_name='numpy'):
     DATA_CLASS = np.ndarray
 
@@ -90,8 +136,8 @@ class NumPyBackend(BackendProxy, backend_name='numpy'):
     ### Linear Algebra Functions ###
     # non-standard
     @staticmethod
-    def einsum(*args, **kwargs):
-        return np.einsum(*args, **kwargs, optimize=True)
+    def einsum(*args, optimize=True, **kwargs):
+        return np.einsum(*args, **kwargs, optimize=optimize)
 
     ### Manipulation Functions ###
     # python array API standard v2023.12
@@ -177,37 +223,134 @@ class NumPyBackend(BackendProxy, backend_name='numpy'):
             raise NotImplementedError("Batch sparse matrix multiplication has "
                                       "not been supported yet.")
 
+    @staticmethod
+    def set_sparse_threads(num_threads: Optional[int] = None, min_nnz: int = 100000) -> None:
+        """Set the number of threads of the sparse kernels (`csr_spmm`, `csr_spspmm`
+        and `bsr_spmm`).
+
+        Rows are partitioned into blocks with balanced nonzeros and the blocks
+        are processed by the scipy kernels in a thread pool.
+
+        Parameters:
+            num_threads (int | None, optional): Number of threads, or the number
+                of CPUs if None. Defaults to None.
+            min_nnz (int, optional): Matrices with less work stay single-threaded.
+                Defaults to 100000.
+        """
+        _sparse_executor.set_num_threads(num_threads, min_nnz)
+
     @staticmethod
     def csr_spmm(crow, col, values, shape, other):
         M, N = shape
 
         if values.ndim == 1:
+            if other.ndim not in (1, 2):
+                raise ValueError("`other` must be a 1-D or 2-D array.")
+
+            dtype = np.result_type(values.dtype, other.dtype)
+            values = np.asarray(values, dtype=dtype)
+            other = np.ascontiguousarray(other, dtype=dtype)
+            result = np.zeros((M, ) + other.shape[1:], dtype=dtype)
+            parts = _sparse_executor.partition(crow, values.shape[0] * max(other[0:1].size, 1))
+
+            # Row blocks keep the global offsets in crow, so col and values
+            # are passed as a whole without copy.
             if other.ndim == 1:
-                result = np.zeros((shape[0],), dtype=other.dtype)
-                csr_matvec(M, N, crow, col, values, other, result)
-                return result
-            elif other.ndim == 2:
-                n_vecs = other.shape[-1]
-                new_shape = (shape[0], other.shape[-1])
-                result = np.zeros(new_shape, dtype=other.dtype)
-                csr_matvecs(M, N, n_vecs, crow, col, values, other.ravel(), result.ravel())
-                return result
+                def kernel(start, stop):
+                    csr_matvec(stop - start, N, crow[start:stop+1], col, values,
+                               other, result[start:stop])
             else:
-                raise ValueError("`other` must be a 1-D or 2-D array.")
+                n_vecs = other.shape[-1]
+                x = other.ravel()
+                def kernel(start, stop):
+                    csr_matvecs(stop - start, N, n_vecs, crow[start:stop+1], col, values,
+                                x, result[start:stop].ravel())
+
+            _sparse_executor.map(kernel, parts)
+            return result
         else:
             raise NotImplementedError("Batch sparse matrix multiplication has "
                                       "not been supported yet.")
 
     @staticmethod
-    def csr_spspmm(crow1, col1, values1, shape1, crow2, col2, values2, shape2):
-        from scipy.sparse import csr_matrix
-        m1 = csr_matrix((values1, col1, crow1), shape=shape1)
-        m2 = csr_matrix((values2, col2, crow2), shape=shape2)
-        m3 = m1._matmul_sparse(m2)
-        return m3.indptr, m3.indices, m3.data, m3.shape
+    def bsr_spmm(crow, col, values, shape, other):
+        if other.ndim not in (1, 2):
+            raise ValueError("`other` must be a 1-D or 2-D array.")
+        nnzb, R, C = values.shape
+        n_brow, n_bcol = shape[0] // R, shape[1] // C
+
+        dtype = np.result_type(values.dtype, other.dtype)
+        data = np.ascontiguousarray(values, dtype=dtype).ravel()
+        other = np.ascontiguousarray(other, dtype=dtype)
+        result = np.zeros((shape[0], ) + other.shape[1:], dtype=dtype)
+        parts = _sparse_executor.partition(crow, nnzb * R * C * max(other[0:1].size, 1))
+
+        if other.ndim == 1:
+            def kernel(start, stop):
+                bsr_matvec(stop - start, n_bcol, R, C, crow[start:stop+1], col, data,
+                           other, result[start*R:stop*R])
+        else:
+            n_vecs = other.shape[-1]
+            x = other.ravel()
+            def kernel(start, stop):
+                bsr_matvecs(stop - start, n_bcol, n_vecs, R, C, crow[start:stop+1], col, data,
+                            x, result[start*R:stop*R].ravel())
+
+        _sparse_executor.map(kernel, parts)
+        return result
 
     @staticmethod
-    def coo_tocsr(indices, values, shape):
+    def csr_spspmm(crow1, col1, values1, shape1, crow2, col2, values2, shape2):
+        if values1.ndim != 1 or values2.ndim != 1:
+            raise NotImplementedError("Batch sparse matrix multiplication has "
+                                      "not been supported yet.")
+        parts = _sparse_executor.partition(crow1, values1.shape[0] + values2.shape[0])
+
+        if len(parts) == 1:
+            # The extra symbolic pass of the blocked product does not pay off
+            # with a single thread.
+            from scipy.sparse import csr_matrix
+            m1 = csr_matrix((values1, col1, crow1), shape=shape1)
+            m2 = csr_matrix((values2, col2, crow2), shape=shape2)
+            m3 = m1._matmul_sparse(m2)
+            return m3.indptr, m3.indices, m3.data, m3.shape
+
+        M, N = shape1[0], shape2[1]
+        dtype = np.result_type(values1.dtype, values2.dtype)
+        values1 = np.asarray(values1, dtype=dtype)
+        values2 = np.asarray(values2, dtype=dtype)
+        itype = np.result_type(crow1.dtype, col1.dtype, crow2.dtype, col2.dtype)
+        crow1, col1, crow2, col2 = (np.asarray(a, dtype=itype) for a in (crow1, col1, crow2, col2))
+
+        # Pass 1: upper bounds of nonzeros of each row block.
+        def symbolic(start, stop):
+            return csr_matmat_maxnnz(stop - start, N, crow1[start:stop+1], col1, crow2, col2)
+
+        maxnnz = _sparse_executor.map(symbolic, parts)
+        if sum(maxnnz) > np.iinfo(itype).max:
+            itype = np.int64
+            crow1, col1, crow2, col2 = (a.astype(itype) for a in (crow1, col1, crow2, col2))
+
+        # Pass 2: numeric product of each row block.
+        def numeric(start, stop, nnz):
+            crow = np.empty(stop - start + 1, dtype=itype)
+            col = np.empty(nnz, dtype=itype)
+            data = np.empty(nnz, dtype=dtype)
+            csr_matmat(stop - start, N, crow1[start:stop+1], col1, values1,
+                       crow2, col2, values2, crow, col, data)
+            # Columns are left in the order they are first hit in each row,
+            # as in scipy.
+            return crow, col[:crow[-1]], data[:crow[-1]]
+
+        blocks = _sparse_executor.map(numeric, [p + (n, ) for p, n in zip(parts, maxnnz)])
+        offsets = np.cumsum([0] + [b[0][-1] for b in blocks])
+        crow = np.concatenate([[0]] + [b[0][1:] + off for b, off in zip(blocks, offsets)])
+        col = np.concatenate([b[1] for b in blocks])
+        data = np.concatenate([b[2] for b in blocks])
+        return crow.astype(itype), col, data, (M, N)
+
+    @staticmethod
+    def coo_tocsr(indices, values, shape, *, coalesce=False):
         M, N = shape
         idx_dtype = indices.dtype
         major, minor = indices
@@ -215,8 +358,18 @@ class NumPyBackend(BackendProxy, backend_name='numpy'):
         crow = np.empty(M+1, dtype=idx_dtype)
         col = np.empty_like(minor, dtype=idx_dtype)
         data = np.empty_like(values, dtype=values.dtype)
+        # Counting sort by rows, linear in nnz.
         coo_tocsr(M, N, nnz, major, minor, values, crow, col, data)
 
+        if coalesce:
+            # Sort columns in each row and sum the duplicates, in place.
+            csr_sort_indices(M, crow, col, data)
+            csr_sum_duplicates(M, N, crow, col, data)
+            nnz = int(crow[-1])
+            if nnz < col.shape[0]:
+                col = col[:nnz].copy()
+                data = data[:nnz].copy()
+
         return crow, col, data
 
     @staticmethod
@@ -531,8 +531,10 @@ class PyTorchBackend(BackendProxy, backend_name='pytorch'):
             return torch.sparse.mm(mat, other)
 
     @staticmethod
-    def coo_tocsr(indices, values, shape):
+    def coo_tocsr(indices, values, shape, *, coalesce=False):
         mat = torch.sparse_coo_tensor(indices, values, size=shape)
+        if coalesce:
+            mat = mat.coalesce()
         mat = mat.to_sparse_csr()
         return mat.crow_indices(), mat.col_indices(), mat.values()
 
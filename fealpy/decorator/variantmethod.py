@@ -100,6 +100,9 @@ class VariantHandler(Generic[_T, _P, _R_co]):
     def set(self, val: Any):
         self.vm.set_key(self.instance, val)
 
+    def get(self) -> Any:
+        return self.vm.get_key(self.instance)
+
 
 @overload
 def variantmethod(func: Callable[Concatenate[_T, _P], _R_co]) -> Variantmethod[_T, _P, _R_co]: ...
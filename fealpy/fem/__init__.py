@@ -43,7 +43,7 @@ from .scalar_neumann_bc_integrator import ScalarNeumannBCIntegrator, ScalarRobin
 from .face_source_integrator import BoundaryFaceSourceIntegrator, InterFaceSourceIntegrator
 
 ### Dirichlet BC
-from .dirichlet_bc import DirichletBC
+from .dirichlet_bc import DirichletBC, PreparedDirichletBC
 from .dirichlet_bc_operator import DirichletBCOperator
 
 ### recovery estimate
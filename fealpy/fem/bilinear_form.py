@@ -1,16 +1,74 @@
-
-from typing import Optional, Literal, overload
+from typing import Optional, Literal, overload, List, Tuple, Sequence
 
 from .. import logger
 from ..typing import TensorLike
 from ..backend import backend_manager as bm
-from ..sparse import COOTensor, CSRTensor
+from ..sparse import COOTensor, CSRTensor, BSRTensor
+from ..operator import LinearOperator
 from .form import Form
 from .integrator import LinearInt
 
 
+class SparsityPattern():
+    """The symbolic part of a global matrix assembly.
+
+    SparsityPattern stores the CSR structure (`crow`, `col`) of the coalesced
+    global matrix, together with a scatter map for every chunk of local tensors
+    produced by `Form.assembly_local_iterative`. The scatter map gives the
+    location of each local entry in the CSR value array, so that a numeric
+    assembly only needs one `index_add` per chunk.
+
+    The pattern also records what it was built for: the sparse shape, the
+    number of local entries of every chunk and the topology versions of the
+    meshes, see `match`.
+    """
+    def __init__(self, crow: TensorLike, col: TensorLike,
+                 scatters: List[TensorLike], spshape: Tuple[int, int],
+                 versions: Tuple[int, ...] = ()):
+        self.crow = crow
+        self.col = col
+        self.scatters = scatters
+        self.spshape = tuple(spshape)
+        self.sizes = tuple(int(s.shape[0]) for s in scatters)
+        self.versions = tuple(versions)
+
+    @property
+    def nnz(self) -> int:
+        return self.col.shape[0]
+
+    def match(self, spshape: Tuple[int, int], sizes: Sequence[int],
+              versions: Tuple[int, ...] = ()) -> bool:
+        """Return True if the pattern can be reused for the chunks of the given sizes."""
+        return (self.spshape == tuple(spshape) and self.sizes == tuple(sizes)
+                and self.versions == tuple(versions))
+
+    @classmethod
+    def from_indices(cls, indices: List[TensorLike], spshape: Tuple[int, int],
+                     versions: Tuple[int, ...] = ()):
+        """Build the pattern from the (2, nnz) COO indices of every chunk."""
+        sizes = [ind.shape[1] for ind in indices]
+        indices = bm.concat(indices, axis=1)
+        flat = bm.astype(indices[0], bm.int64) * spshape[1] + indices[1]
+        uflat, inverse = bm.unique(flat, return_inverse=True)
+        row = uflat // spshape[1]
+        col = uflat % spshape[1]
+        count = bm.bincount(row, minlength=spshape[0])
+        crow = bm.concat([bm.zeros((1,), **bm.context(count)), bm.cumsum(count, axis=0)])
+        crow = bm.astype(crow, indices.dtype)
+
+        scatters = []
+        start = 0
+        for size in sizes:
+            scatters.append(inverse[start:start+size])
+            start += size
+
+        return cls(crow, bm.astype(col, indices.dtype), scatters, spshape, versions)
+
+
 class BilinearForm(Form[LinearInt]):
     _M = None
+    _pattern: Optional[SparsityPattern] = None
+    _keep_pattern: bool = False
 
     def _get_sparse_shape(self):
         spaces = self._spaces
@@ -43,6 +101,82 @@ class BilinearForm(Form[LinearInt]):
                 raise ValueError("Spaces should have the same dtype, "
                                 f"but got {s0.ftype} and {s1.ftype}.")
 
+    ### START: Sparsity Pattern Cache ###
+    def keep_pattern(self, status_on=True, /):
+        """Set whether to cache the sparsity pattern of the global matrix.
+
+        When enabled, the first call of `assembly()` performs a symbolic phase
+        building the CSR structure and the local-to-CSR scatter maps. Later
+        calls only evaluate the local tensors and scatter them into the values
+        of the cached pattern, skipping the sort in `coalesce` and `tocsr`.
+        The pattern is built again if the global shape, the chunking or the
+        topology of the meshes has changed. Other changes of the cell-to-dof
+        maps, like new regions of integrators, are not detected; call
+        `clear_pattern()` after them.
+        """
+        self._keep_pattern = status_on
+        if not status_on:
+            self.clear_pattern()
+        return self
+
+    def clear_pattern(self) -> None:
+        """Clear the cached sparsity pattern."""
+        self._pattern = None
+
+    def _add_integrator_impl(self, I, group=None, splitter=None):
+        self.clear_pattern()
+        return super()._add_integrator_impl(I, group, splitter)
+
+    def _local_indices(self, e2dofs_tuple, local_shape):
+        ue2dof = e2dofs_tuple[0]
+        ve2dof = e2dofs_tuple[1] if (len(e2dofs_tuple) > 1) else ue2dof
+        I = bm.broadcast_to(ve2dof[:, :, None], local_shape)
+        J = bm.broadcast_to(ue2dof[:, None, :], local_shape)
+        if getattr(self, '_transposed', False):
+            I, J = J, I
+        return bm.stack([I.ravel(), J.ravel()], axis=0)
+
+    def _pattern_assembly(self) -> CSRTensor:
+        self.check_space()
+        space = self._spaces
+        batch_size = self.batch_size
+        context = dict(dtype=space[0].ftype, device=bm.get_device(space[0]))
+        pattern = self._pattern
+        local_e2dofs = []
+        local_values = []
+
+        for group_tensor, e2dofs_tuple in self.assembly_local_iterative():
+            if (batch_size > 0) and (group_tensor.ndim == 3):
+                group_tensor = bm.stack([group_tensor]*batch_size, axis=0)
+            local_e2dofs.append((e2dofs_tuple, group_tensor.shape[-3:]))
+            local_values.append(bm.reshape(group_tensor, self._values_ravel_shape))
+
+        # 网格加密后整体矩阵的形状也会改变
+        spshape = self._get_sparse_shape()
+        if getattr(self, '_transposed', False):
+            spshape = tuple(reversed(spshape))
+        self.sparse_shape = spshape
+        sizes = [value.shape[-1] for value in local_values]
+        versions = tuple(s.mesh.version('topology') for s in space
+                         if hasattr(getattr(s, 'mesh', None), 'version'))
+
+        if (pattern is None) or not pattern.match(spshape, sizes, versions):
+            if pattern is not None:
+                logger.info("The mesh or the chunking of the bilinear form has changed, "
+                            "rebuilding the sparsity pattern.")
+            local_indices = [self._local_indices(e2dofs, shape) for e2dofs, shape in local_e2dofs]
+            pattern = SparsityPattern.from_indices(local_indices, spshape, versions)
+            self._pattern = pattern
+            logger.info(f"Sparsity pattern of the bilinear form built, with {pattern.nnz} non-zeros.")
+
+        value_shape = (pattern.nnz,) if (batch_size == 0) else (batch_size, pattern.nnz)
+        values = bm.zeros(value_shape, **context)
+        for scatter, value in zip(pattern.scatters, local_values):
+            values = bm.index_add(values, scatter, value, axis=-1)
+
+        return CSRTensor(pattern.crow, pattern.col, values, pattern.spshape)
+    ### END: Sparsity Pattern Cache ###
+
     def _scalar_assembly(self):
         self.check_space()
         space = self._spaces
@@ -57,6 +191,7 @@ class BilinearForm(Form[LinearInt]):
             values = bm.empty(init_value_shape, dtype=space[0].ftype, device=bm.get_device(space[0])),
             spshape = sparse_shape
         )
+        reduced_nnz = 0
         # for group in self.integrators.keys():
             # group_tensor, e2dofs = self._assembly_group(group, retain_ints)
         for group_tensor, e2dofs_tuple in self.assembly_local_iterative():
@@ -71,31 +206,100 @@ class BilinearForm(Form[LinearInt]):
             indices = bm.stack([I.ravel(), J.ravel()], axis=0)
             group_tensor = bm.reshape(group_tensor, self._values_ravel_shape)
             M = M.add(COOTensor(indices, group_tensor, sparse_shape))
+            M, reduced_nnz = self._reduce_buffer(M, reduced_nnz)
 
         return M
 
+    @staticmethod
+    def _block_indices(e2dof: TensorLike, space) -> TensorLike:
+        # Node indices of the tensor dofs, numbered as `node*k + component`.
+        if getattr(space, 'dof_priority', True):
+            raise ValueError("BSR format requires a TensorFunctionSpace with "
+                             "the dofs of a node numbered consecutively, "
+                             "i.e. shape=(-1, ...), but got "
+                             f"{type(space).__name__}.")
+        k = space.dof_numel
+        e2dof = bm.reshape(e2dof, (e2dof.shape[0], -1, k))
+        return e2dof[..., 0] // k
+
+    def _block_assembly(self) -> BSRTensor:
+        self.check_space()
+        spaces = self._spaces
+        if self.batch_size > 0:
+            raise ValueError("BSR format does not support batched bilinear forms.")
+        uspace = spaces[0]
+        vspace = spaces[1] if (len(spaces) > 1) else uspace
+        uk, vk = uspace.dof_numel, vspace.dof_numel
+        transposed = getattr(self, '_transposed', False)
+        brows, bcols, blocks = [], [], []
+
+        for group_tensor, e2dofs_tuple in self.assembly_local_iterative():
+            ue2dof = e2dofs_tuple[0]
+            ve2dof = e2dofs_tuple[1] if (len(e2dofs_tuple) > 1) else ue2dof
+            ublk = self._block_indices(ue2dof, uspace)
+            vblk = self._block_indices(ve2dof, vspace)
+            NC, vnb, unb = vblk.shape[0], vblk.shape[1], ublk.shape[1]
+            # (NC, vldof, uldof) -> (NC, vnb, unb, vk, uk)
+            block = bm.reshape(group_tensor, (NC, vnb, vk, unb, uk))
+            block = bm.permute_dims(block, (0, 1, 3, 2, 4))
+            I = bm.broadcast_to(vblk[:, :, None], (NC, vnb, unb))
+            J = bm.broadcast_to(ublk[:, None, :], (NC, vnb, unb))
+            if transposed:
+                I, J = J, I
+                block = bm.swapaxes(block, -1, -2)
+            brows.append(I.reshape(-1))
+            bcols.append(J.reshape(-1))
+            blocks.append(bm.reshape(block, (-1, ) + tuple(block.shape[-2:])))
+
+        spshape = self.sparse_shape
+        if transposed:
+            spshape = (spshape[1], spshape[0])
+
+        return BSRTensor.from_blocks(bm.concat(brows), bm.concat(bcols),
+                                     bm.concat(blocks), spshape)
+
     @overload
     def assembly(self) -> CSRTensor: ...
     @overload
     def assembly(self, *, format: Literal['coo']) -> COOTensor: ...
     @overload
     def assembly(self, *, format: Literal['csr']) -> CSRTensor: ...
+    @overload
+    def assembly(self, *, format: Literal['bsr']) -> BSRTensor: ...
     def assembly(self, *, format='csr'):
         """Assembly the bilinear form matrix.
 
         Parameters:
-            format (str, optional): Layout of the output ('csr' | 'coo'). Defaults to 'csr'.\n
+            format (str, optional): Layout of the output ('csr' | 'coo' | 'bsr'). Defaults to 'csr'.
+                'bsr' stores dense blocks of node pairs, and requires TensorFunctionSpace
+                with the dofs of a node numbered consecutively, e.g. shape=(-1, GD).\n
             retain_ints (bool, optional): Whether to retain the integrator cache.csr
 
         Returns:
-            global_matrix (CSRTensor | COOTensor): Global sparse matrix shaped ([batch, ]gdof, gdof).
+            global_matrix (CSRTensor | COOTensor | BSRTensor): Global sparse matrix shaped ([batch, ]gdof, gdof).
         """
+        if format == 'bsr':
+            self._M = self._block_assembly()
+            logger.info(f"Bilinear form matrix constructed, with shape {list(self._M.shape)}.")
+            return self._M
+
+        if self._keep_pattern:
+            if format == 'csr':
+                self._M = self._pattern_assembly()
+            elif format == 'coo':
+                M = self._pattern_assembly().tocoo()
+                self._M = COOTensor(M.indices, M.values, M.sparse_shape, is_coalesced=True)
+            else:
+                raise ValueError(f"Unsupported format {format}.")
+            logger.info(f"Bilinear form matrix constructed, with shape {list(self._M.shape)}.")
+            return self._M
+
         M = self._scalar_assembly()
         if getattr(self, '_transposed', False):
             M = M.T
 
         if format == 'csr':
-            self._M = M.coalesce().tocsr()
+            self._M = M.tocsr(coalesce=True)
         elif format == 'coo':
             self._M = M.coalesce()
         else:
@@ -121,8 +325,104 @@ class BilinearForm(Form[LinearInt]):
         transposed = self.copy()
         transposed._transposed = True
         transposed._M = self._M
+        transposed._keep_pattern = self._keep_pattern
         return transposed
 
+    ### START: Matrix-free Operator ###
+    def _operator_data(self, store: str):
+        """Yield the local data for the matrix-free operator, considering chunk size."""
+        for key, int_ in self.integrators.items():
+            splitter = self.get_splitter(key)
+            chunks = [None] if splitter is None else splitter(self.space, int_)
+            use_factor = (store == 'factor') and (len(self._spaces) == 1) \
+                         and hasattr(int_, 'fetch_fast_factors')
+
+            for indices in chunks:
+                factors = None
+                if use_factor:
+                    if indices is None:
+                        factors = int_.fetch_fast_factors(self.space)
+                    else:
+                        factors = int_.fetch_fast_factors(self.space, indices)
+
+                if factors is None:
+                    value, etg = self._assembly_kernel(key, indices)
+                    yield 'tensor', value, etg
+                else:
+                    if indices is None:
+                        etg = int_.to_global_dof(self.space)
+                    else:
+                        etg = int_.to_global_dof(self.space, indices=indices)
+                    yield 'factor', (int_.apply_fast_factors, factors), (etg, )
+
+    def operator(self, *, store: Literal['tensor', 'factor'] = 'tensor') -> LinearOperator:
+        """Build a matrix-free linear operator of the bilinear form.
+
+        The local data are computed once and kept by the operator, so that every
+        product only performs element-by-element contractions and an `index_add`,
+        without assembling the global sparse matrix.
+
+        Parameters:
+            store (str, optional): What to keep for each cell ('tensor' | 'factor').
+                'tensor' keeps the local matrices shaped (NC, vldof, uldof).
+                'factor' keeps the factors provided by the integrator's
+                `fetch_fast_factors` and applies them with `apply_fast_factors`,
+                e.g. the geometric factors and the reference tensor of the 'fast'
+                method on simplex meshes, or the 1D factors of the 'sumfac' method
+                on tensor-product meshes. Falls back to 'tensor' for integrators
+                without this support. Defaults to 'tensor'.
+
+        Returns:
+            LinearOperator: The operator accepting vectors shaped (gdof,) or (gdof, K).
+        """
+        if self.batch_size > 0:
+            raise ValueError("Matrix-free operator does not support batched forms.")
+        if store not in {'tensor', 'factor'}:
+            raise ValueError(f"Unsupported store {store}.")
+
+        transposed = getattr(self, '_transposed', False)
+        data = []
+        for kind, value, e2dofs_tuple in self._operator_data(store):
+            ue2dof = e2dofs_tuple[0]
+            ve2dof = e2dofs_tuple[1] if (len(e2dofs_tuple) > 1) else ue2dof
+            if kind == 'tensor' and transposed:
+                value = bm.swapaxes(value, -1, -2)
+            if transposed:
+                ue2dof, ve2dof = ve2dof, ue2dof
+            data.append((kind, value, ue2dof, ve2dof))
+
+        nrow, ncol = self.sparse_shape
+
+        def _apply(u: TensorLike, trans: bool) -> TensorLike:
+            shape = ((ncol, ) if trans else (nrow, )) + tuple(u.shape[1:])
+            v = bm.zeros(shape, **bm.context(u))
+
+            for kind, value, ue2dof, ve2dof in data:
+                if trans:
+                    ue2dof, ve2dof = ve2dof, ue2dof
+                gu = u[ue2dof] # (NC, uldof, ...)
+                if kind == 'tensor':
+                    subs = 'cji, cj... -> ci...' if trans else 'cij, cj... -> ci...'
+                    gv = bm.einsum(subs, value, gu)
+                else:
+                    apply, factors = value
+                    gv = apply(factors, gu, trans=trans)
+                v = bm.index_add(v, ve2dof.reshape(-1), gv.reshape((-1, ) + tuple(u.shape[1:])))
+
+            return v
+
+        def matvec(u: TensorLike) -> TensorLike:
+            return _apply(u, False)
+
+        def rmatvec(u: TensorLike) -> TensorLike:
+            return _apply(u, True)
+
+        logger.info(f"Matrix-free operator of the bilinear form constructed, "
+                    f"with shape {[nrow, ncol]}.")
+
+        return LinearOperator((nrow, ncol), matvec, rmatvec, dtype=self._spaces[0].ftype)
+    ### END: Matrix-free Operator ###
+
     def __matmul__(self, u: TensorLike):
         if self._M is not None:
             return self._M @ u
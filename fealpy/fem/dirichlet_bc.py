@@ -164,12 +164,19 @@ class DirichletBC():
         """
         A = self.check_matrix(matrix) if check else matrix
         f = self.check_vector(vector) if check else vector
+        uh = self._boundary_interpolate(f, uh, gd)
+        bd_idx = self.boundary_dof_index
+        f = f - A.matmul(uh[:])
+        f = bm.set_at(f, bd_idx, uh[bd_idx])
+        return f
+
+    def _boundary_interpolate(self, f: TensorLike, uh: Optional[TensorLike],
+                              gd: Optional[CoefLike]) -> TensorLike:
         gd = self.gd if gd is None else gd
-        
 
         if gd is None:
             raise RuntimeError("The boundary condition is None.")
-        
+
         if isinstance(self.space, tuple):
             if isinstance(gd, tuple):
                 assert len(gd) == len(self.space)
@@ -188,10 +195,20 @@ class DirichletBC():
                 uh = bm.zeros_like(f)
             uh, _ = self.space.boundary_interpolate(gd=gd,uh=uh,
                                                 threshold=self.threshold, method=self.method)
-        bd_idx = self.boundary_dof_index
-        f = f - A.matmul(uh[:])
-        f = bm.set_at(f, bd_idx, uh[bd_idx])
-        return f
+        return uh
+
+    def prepare(self, matrix: CSRTensor, /) -> 'PreparedDirichletBC':
+        """Prepare the boundary condition for matrices sharing the sparsity
+        pattern of `matrix`, see `PreparedDirichletBC`.
+
+        Parameters:
+            matrix (CSRTensor): A left-hand-size matrix with the sparsity pattern
+                used in later calls.
+
+        Returns:
+            PreparedDirichletBC: The prepared boundary condition.
+        """
+        return PreparedDirichletBC(self, self.check_matrix(matrix))
 
 
     # def apply_for_vspace_with_scalar_basis(self, A, f, uh, dflag=None):
@@ -218,6 +235,110 @@ class DirichletBC():
     #     return A, f
 
 
+class PreparedDirichletBC():
+    """Dirichlet boundary condition for a fixed sparsity pattern.
+
+    The index maps of the constrained matrix are computed once from the pattern
+    of a CSR matrix: the CSR structure after removing the boundary rows and
+    columns, the gather map of the values, and the block of boundary columns
+    in the interior rows, which lifts the boundary values to the right-hand side.
+    Later calls only gather values, as in time-dependent problems where the
+    values of the matrix change every step while the pattern does not.
+
+    Parameters:
+        bc (DirichletBC): The boundary condition providing the boundary dofs and `gd`.
+        matrix (CSRTensor): A matrix with the sparsity pattern.
+    """
+    def __init__(self, bc: DirichletBC, matrix: CSRTensor):
+        if not isinstance(matrix, CSRTensor):
+            raise ValueError('The type of matrix must be CSRTensor.')
+        self.bc = bc
+        self.shape = matrix.sparse_shape
+        self.nnz = matrix.nnz
+
+        isDDof = bm.reshape(bc.is_boundary_dof, (-1,))
+        isIDof = bm.logical_not(isDDof)
+        row, col = matrix.row, matrix.col
+        indices_context = bm.context(col)
+        ZERO = bm.zeros((1,), **indices_context)
+        bd_idx = bm.astype(bc.boundary_dof_index, col.dtype)
+
+        # Entries in the interior rows and columns are kept, and the boundary
+        # rows only have the diagonal entry.
+        remain_flag = isIDof[row] & isIDof[col]
+        remain_idx = bm.nonzero(remain_flag)[0]
+        nnz_per_row = bm.bincount(row[remain_idx], minlength=self.shape[0])
+        nnz_per_row = bm.astype(nnz_per_row, col.dtype) + bm.astype(isDDof, col.dtype)
+        self.crow = bm.concat([ZERO, bm.cumsum(nnz_per_row, axis=0)], axis=0)
+        NNZ = int(self.crow[-1])
+        diag_pos = self.crow[:-1][bd_idx]
+        is_diag = bm.zeros((NNZ,), dtype=bm.bool, device=bm.get_device(col))
+        is_diag = bm.set_at(is_diag, diag_pos, True)
+        remain_pos = bm.nonzero(bm.logical_not(is_diag))[0]
+
+        new_col = bm.empty((NNZ,), **indices_context)
+        new_col = bm.set_at(new_col, diag_pos, bd_idx)
+        self.col = bm.set_at(new_col, remain_pos, col[remain_idx])
+        # The value at `self.nnz` is an extra one appended for the diagonal.
+        gather = bm.full((NNZ,), self.nnz, **indices_context)
+        self._gather = bm.set_at(gather, remain_pos, bm.astype(remain_idx, col.dtype))
+
+        # Boundary columns in the interior rows, as a (gdof, NBD) CSR block.
+        lift_flag = isIDof[row] & isDDof[col]
+        self._lift_idx = bm.nonzero(lift_flag)[0]
+        bd_local = bm.cumsum(bm.astype(isDDof, col.dtype), axis=0) - 1
+        self._lift_col = bd_local[col[self._lift_idx]]
+        lift_count = bm.bincount(row[self._lift_idx], minlength=self.shape[0])
+        self._lift_crow = bm.concat([ZERO, bm.cumsum(bm.astype(lift_count, col.dtype), axis=0)], axis=0)
+        self.boundary_dof_index = bc.boundary_dof_index
+
+    def check_matrix(self, matrix: CSRTensor, /) -> CSRTensor:
+        """Check if the matrix has the shape and the number of non-zeros of the prepared pattern."""
+        if not isinstance(matrix, CSRTensor):
+            raise ValueError('The type of matrix must be CSRTensor.')
+        if (matrix.sparse_shape != self.shape) or (matrix.nnz != self.nnz):
+            raise ValueError('The matrix does not match the prepared sparsity pattern.')
+        return matrix
+
+    def apply(self, A: CSRTensor, f: TensorLike, uh: Optional[TensorLike]=None,
+              gd: Optional[CoefLike]=None, *,
+              check=True) -> Tuple[CSRTensor, TensorLike]:
+        """Apply Dirichlet boundary conditions. See `DirichletBC.apply()`."""
+        f = self.apply_vector(f, A, uh, gd, check=check)
+        A = self.apply_matrix(A, check=check)
+        return A, f
+
+    def apply_matrix(self, matrix: CSRTensor, *, check=True) -> CSRTensor:
+        """Apply Dirichlet boundary condition to left-hand-size matrix only,
+        by gathering the values into the prepared structure."""
+        A = self.check_matrix(matrix) if check else matrix
+        values = A.values
+        ONE = bm.ones(values.shape[:-1] + (1,), **bm.context(values))
+        values = bm.concat([values, ONE], axis=-1)[..., self._gather]
+        return CSRTensor(self.crow, self.col, values, self.shape)
+
+    def lifting_matrix(self, matrix: CSRTensor, /) -> CSRTensor:
+        """Return the block of boundary columns in the interior rows, shaped (gdof, NBD)."""
+        values = matrix.values[..., self._lift_idx]
+        shape = (self.shape[0], self.boundary_dof_index.shape[0])
+        return CSRTensor(self._lift_crow, self._lift_col, values, shape)
+
+    def apply_vector(self, vector: TensorLike, matrix: CSRTensor,
+                     uh: Optional[TensorLike]=None,
+                     gd: Optional[CoefLike]=None, *, check=True) -> TensorLike:
+        """Apply Dirichlet boundary contition to right-hand-size vector only.
+        Only the boundary values of `uh` are lifted, by `f - A[:, bd] @ uh[bd]`.
+        See `DirichletBC.apply_vector()` for the parameters."""
+        A = self.check_matrix(matrix) if check else matrix
+        f = self.bc.check_vector(vector) if check else vector
+        uh = self.bc._boundary_interpolate(f, uh, gd)
+        bd_idx = self.boundary_dof_index
+        f = f - self.lifting_matrix(A).matmul(uh[bd_idx])
+        f = bm.set_at(f, bd_idx, uh[bd_idx])
+        return f
+
+
+
 # backup
 def apply_csr_matrix(A: CSRTensor, isDDof: TensorLike):
     isIDof = bm.logical_not(isDDof)
@@ -1,4 +1,6 @@
-
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     Sequence, overload, Iterable, Dict, Tuple, Optional, Union, TypeVar, Generic,
     Callable
@@ -7,7 +9,8 @@ from typing import (
 from ..typing import TensorLike, Size, Index
 from ..backend import backend_manager as bm
 from ..functionspace import FunctionSpace as _FS
-from .integrator import Integrator, GroupIntegrator
+from ..sparse import COOTensor
+from .integrator import Integrator, GroupIntegrator, OpInt
 
 from .. import logger
 from abc import ABC
@@ -47,6 +50,8 @@ class Form(Generic[_I], ABC):
         # self.chunk_sizes = {}
         self._cursor = 0
         self.batch_size = batch_size
+        self._default_splitter = None
+        self._num_workers = 1
 
         self._values_ravel_shape = (-1,) if self.batch_size == 0 else (self.batch_size, -1)
         self.sparse_shape = self._get_sparse_shape()
@@ -56,6 +61,8 @@ class Form(Generic[_I], ABC):
         new_obj.integrators.update(self.integrators)
         # new_obj.chunk_sizes.update(self.chunk_sizes)
         new_obj.splitters.update(self.splitters)
+        new_obj._default_splitter = self._default_splitter
+        new_obj._num_workers = self._num_workers
         new_obj._values_ravel_shape = self._values_ravel_shape
         new_obj.sparse_shape = tuple(reversed(self.sparse_shape))
         return new_obj
@@ -121,6 +128,56 @@ class Form(Generic[_I], ABC):
 
         return self._add_integrator_impl(I, group, splitter)
 
+    def set_memory_budget(self, budget: Union[int, str, None], /):
+        """Set a memory budget for the assembly of the groups without splitter.
+
+        Entities are then assembled in chunks whose size is estimated by
+        `MemoryBudgetSplitter`, and the assembled chunks are reduced into a
+        coalesced buffer on the fly. A group whose integrator does not support
+        the `indices` argument is assembled without splitting.
+
+        Parameters:
+            budget (int | str | None): Number of bytes, or a string like '512MB'.
+                Assemble all entities at once if None.
+
+        Returns:
+            Self: The form itself.
+        """
+        if budget is None:
+            self._default_splitter = None
+        else:
+            self._default_splitter = MemoryBudgetSplitter(budget)
+        return self
+
+    def set_parallel(self, num_workers: int = -1, /):
+        """Assemble the chunks of entities in a thread pool.
+
+        Groups without splitter are split into `2 * num_workers` chunks.
+        Local tensors are yielded in the order of chunks, so the global tensor
+        is reduced in the same order as the serial assembly and the result is
+        deterministic. The first chunk of each group is assembled in the calling
+        thread, and a group falls back to the serial assembly if its integrator
+        does not support the `indices` argument.
+
+        Parameters:
+            num_workers (int, optional): Number of threads, -1 for the number of CPUs,
+                serial assembly if 1. Defaults to -1.
+
+        Returns:
+            Self: The form itself.
+        """
+        if num_workers < 0:
+            num_workers = os.cpu_count() or 1
+        elif num_workers == 0:
+            raise ValueError("num_workers should be positive or -1.")
+        self._num_workers = num_workers
+        return self
+
+    def get_splitter(self, group: str, /) -> Optional[_Splitter]:
+        """Get the splitter of the group, or the one given by the memory budget."""
+        splitter = self.splitters[group]
+        return self._default_splitter if splitter is None else splitter
+
     @overload
     def __lshift__(self: Self, other: Integrator) -> Self: ...
     def __lshift__(self, other):
@@ -159,15 +216,85 @@ class Form(Generic[_I], ABC):
         """Assembly local matrix considering chunk size.
         Yields local matrix and to_global_dof tuple."""
         for key, int_ in self.integrators.items():
-            splitter = self.splitters[key]
-            if splitter is None:
+            splitter = self.get_splitter(key)
+            if self._num_workers > 1:
+                logger.debug(f"(ASSEMBLY LOCAL PARALLEL) {key}")
+                yield from self._parallel_iterative(key, splitter)
+            elif splitter is None:
                 logger.debug(f"(ASSEMBLY LOCAL FULL) {key}")
                 yield self._assembly_kernel(key)
             else:
                 logger.debug(f"(ASSEMBLY LOCAL ITER) {key}")
-                for indices in splitter(self.space, int_):
+                result, chunks = self._assembly_first_chunk(key, splitter)
+                if result is not None:
+                    yield result
+                for indices in chunks:
                     yield self._assembly_kernel(key, indices)
 
+    def _assembly_first_chunk(self, group: str, splitter: _Splitter, /):
+        """Assemble the first chunk of the group, and return it with the
+        iterator of the remaining chunks.
+
+        If the integrator does not support the `indices` argument and the group
+        was added without splitter, i.e. it is split by the memory budget or for
+        the parallel assembly, the whole group is assembled at once instead and
+        no chunk remains. The result is None if there is no chunk.
+        """
+        chunks = iter(splitter(self.space, self.integrators[group]))
+        first = next(chunks, None)
+        if first is None:
+            return None, chunks
+
+        try:
+            return self._assembly_kernel(group, first), chunks
+        except TypeError:
+            if self.splitters[group] is not None:
+                raise
+            logger.warning(f"Integrator of {group} does not support `indices`, "
+                           "assembled without splitting.")
+            return self._assembly_kernel(group), iter(())
+
+    def _parallel_iterative(self, group: str, splitter: Optional[_Splitter], /):
+        num_workers = self._num_workers
+        int_ = self.integrators[group]
+
+        if splitter is None:
+            size = int_.size(self._spaces[0].mesh)
+            splitter = UniformSplitter(max(-(-size // (2 * num_workers)), 1))
+
+        # warm up the lazy data of mesh and space in the calling thread
+        result, chunks = self._assembly_first_chunk(group, splitter)
+        if result is None:
+            return
+
+        yield result
+        pending = deque()
+
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            for indices in chunks:
+                pending.append(executor.submit(self._assembly_kernel, group, indices))
+                if len(pending) >= 2 * num_workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    @staticmethod
+    def _reduce_buffer(M: COOTensor, reduced_nnz: int, /) -> Tuple[COOTensor, int]:
+        """Coalesce the COO buffer once the entries appended since the last
+        reduction outnumber the reduced ones.
+
+        This keeps the buffer within twice the size of the final tensor plus
+        one chunk, while every entry is coalesced only a constant number of
+        times on average.
+
+        Returns:
+            Tuple[COOTensor, int]: The buffer and the number of reduced entries.
+        """
+        if M.nnz - reduced_nnz > reduced_nnz:
+            M = M.coalesce()
+            reduced_nnz = M.nnz
+        return M, reduced_nnz
+
 
 class UniformSplitter():
     def __init__(self, chunk_size: int, /): # Arguments of split method
@@ -188,6 +315,84 @@ class UniformSplitter():
             start = stop
 
 
+def _parse_bytes(size: Union[int, str], /) -> int:
+    if isinstance(size, str):
+        units = {'KB': 1 << 10, 'MB': 1 << 20, 'GB': 1 << 30, 'TB': 1 << 40, 'B': 1}
+        text = size.strip().upper()
+        for unit, scale in units.items():
+            if text.endswith(unit):
+                return int(float(text[:-len(unit)]) * scale)
+        return int(float(text))
+    return int(size)
+
+
+class MemoryBudgetSplitter():
+    """Split the entities into chunks whose assembly fits a memory budget.
+
+    The footprint of one entity is estimated from the number of local dofs,
+    the number of quadrature points and the `dof_numel` of the spaces, covering
+    the basis values and gradients on quadrature points, the local tensor and
+    the global indices of its entries.
+    Integrators must support the `indices` argument to be split.
+
+    Parameters:
+        budget (int | str): Number of bytes, or a string like '512MB'.
+        factor (float, optional): Safety factor for the temporary tensors
+            created by the integrators. Defaults to 4.0.
+    """
+    def __init__(self, budget: Union[int, str], /, *, factor: float = 4.0):
+        self.budget = _parse_bytes(budget)
+        self.factor = factor
+
+        if self.budget <= 0:
+            raise ValueError("Memory budget should be positive.")
+
+    def estimate(self, space, integrator: Integrator) -> int:
+        """Estimate the number of bytes taken by one entity in the assembly."""
+        spaces = tuple(space) if isinstance(space, (list, tuple)) else (space, )
+        mesh = spaces[0].mesh
+        etype = getattr(integrator, 'etype', 'cell')
+        GD = mesh.geo_dimension()
+        ldofs = []
+
+        for s in spaces:
+            try:
+                ldofs.append(s.number_of_local_dofs(etype))
+            except Exception:
+                ldofs.append(s.number_of_local_dofs())
+
+        q = getattr(integrator, 'q', None)
+        if q is None:
+            q = getattr(spaces[0], 'p', 1) + 3
+        try:
+            NQ = mesh.quadrature_formula(q, etype).number_of_quadrature_points()
+        except Exception:
+            NQ = max(ldofs)
+
+        ftype = spaces[0].ftype
+        itype = getattr(spaces[0], 'itype', mesh.itype)
+        fsize = bm.finfo(ftype).bits // 8
+        isize = bm.iinfo(itype).bits // 8
+
+        vldof, uldof = ldofs[-1], ldofs[0]
+        nentry = vldof * uldof if isinstance(integrator, OpInt) else uldof
+        nbasis = sum(NQ * ldof * (1 + GD * getattr(s, 'dof_numel', 1))
+                     for s, ldof in zip(spaces, ldofs))
+        batch = max(getattr(integrator, 'batch_size', 0) or 0, 1)
+        nbytes = (nentry + nbasis) * fsize * batch + 2 * nentry * isize
+
+        return int(nbytes * self.factor)
+
+    def chunk_size(self, space, integrator: Integrator) -> int:
+        """The number of entities in each chunk."""
+        return max(self.budget // self.estimate(space, integrator), 1)
+
+    def __call__(self, space, integrator: Integrator):
+        chunk_size = self.chunk_size(space, integrator)
+        logger.debug(f"(FORM ITER) chunk size {chunk_size} from memory budget {self.budget}B")
+        yield from UniformSplitter(chunk_size)(space, integrator)
+
+
 # NOTE: deprecated.
 # An iteration util for the `_assembly_kernel` method.
 class IntegralIter():
@@ -46,6 +46,7 @@ class LinearForm(Form[LinearInt]):
             values = bm.empty(init_value_shape, dtype=space.ftype, device=bm.get_device(space)),
             spshape = sparse_shape
         )
+        reduced_nnz = 0
 
         for group_tensor, e2dofs_tuple in self.assembly_local_iterative():
             if (batch_size > 0) and (group_tensor.ndim == 2):
@@ -54,6 +55,7 @@ class LinearForm(Form[LinearInt]):
             indices = e2dofs_tuple[0].reshape(1, -1)
             group_tensor = bm.reshape(group_tensor, self._values_ravel_shape)
             M = M.add(COOTensor(indices, group_tensor, sparse_shape))
+            M, reduced_nnz = self._reduce_buffer(M, reduced_nnz)
 
         return M
 
@@ -49,6 +49,8 @@ class NonlinearForm(Form[NonlinearInt]):
             values = bm.empty(init_value_shape, dtype=space[0].ftype, device=device),
             spshape = (ugdof, )
         )
+        reduced_mnnz, reduced_vnnz = 0, 0
+
         for group_tensor, e2dofs_tuple in self.assembly_local_iterative():
             if isinstance(group_tensor, tuple):
                 op_tensor, src_tensor = group_tensor
@@ -67,12 +69,14 @@ class NonlinearForm(Form[NonlinearInt]):
                 indices = bm.stack([I.ravel(), J.ravel()], axis=0)
                 op_tensor = bm.reshape(op_tensor, self._values_ravel_shape)
                 M = M.add(COOTensor(indices, op_tensor, (vgdof, ugdof)))
+                M, reduced_mnnz = self._reduce_buffer(M, reduced_mnnz)
 
             if (batch_size > 0) and (src_tensor.ndim == 2):
                 src_tensor = bm.stack([src_tensor]*batch_size, axis=0)
             indices = e2dofs_tuple[0].reshape(1, -1)
             src_tensor = bm.reshape(src_tensor, self._values_ravel_shape)
             V = V.add(COOTensor(indices, src_tensor, (ugdof, )))
+            V, reduced_vnnz = self._reduce_buffer(V, reduced_vnnz)
 
         return M, V
 
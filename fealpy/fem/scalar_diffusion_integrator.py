@@ -1,12 +1,13 @@
 from typing import Optional, Literal
-from ..mesh.mesh_base import SimplexMesh
+from ..mesh.mesh_base import SimplexMesh, TensorMesh
 
 from ..backend import backend_manager as bm
 from ..typing import TensorLike, Index, _S, CoefLike
 
 from ..functionspace.space import FunctionSpace as _FS
-from ..utils import process_coef_func
+from ..utils import process_coef_func, is_scalar, fill_axis
 from ..functional import bilinear_integral, linear_integral, get_semilinear_coef
+from ..functional import tensor_bilinear_integral, tensor_evaluate, tensor_integral
 from ..decorator.variantmethod import variantmethod
 from .integrator import LinearInt, OpInt, CellInt, enable_cache
 
@@ -16,7 +17,7 @@ class ScalarDiffusionIntegrator(LinearInt, OpInt, CellInt):
     def __init__(self, coef: Optional[CoefLike] = None, q: Optional[int] = None, *,
                  region: Optional[TensorLike] = None,
                  batched: bool = False,
-                 method: Literal['fast', 'nonlinear', 'isopara', None] = None) -> None:
+                 method: Literal['fast', 'sumfac', 'nonlinear', 'isopara', None] = None) -> None:
         super().__init__()
         self.coef = coef
         self.q = q
@@ -51,6 +52,130 @@ class ScalarDiffusionIntegrator(LinearInt, OpInt, CellInt):
         bcs = self.fetch_qf(space)[0]
         return space.grad_basis(bcs, index=self.entity_selection(indices), variable='u')
 
+    @enable_cache
+    def fetch_simplex_factors(self, space: _FS, /, indices=None):
+        """Fetch the factors of the 'fast' assembly on simplex meshes.
+
+        Returns:
+            TensorLike: The reference tensor shaped (ldof, ldof, TD+1, TD+1),
+                integrating the products of basis gradients w.r.t. barycentric coordinates.
+            TensorLike: The geometric factor shaped (NC, TD+1, TD+1),
+                i.e. the inner products of `grad_lambda` scaled by the cell measure.
+        """
+        mesh = space.mesh
+        _, ws = self.fetch_qf(space)
+        gphi = self.fetch_gphiu(space, indices)
+        M = bm.einsum('q, qik, qjl -> ijkl', ws, gphi, gphi)
+        cm = self.fetch_measure(space, indices)
+        glambda = mesh.grad_lambda(index=self.entity_selection(indices))
+        G = bm.einsum('ckm, clm, c -> ckl', glambda, glambda, cm)
+        return M, G
+
+    @enable_cache
+    def fetch_tensor_factors(self, space: _FS, /, indices=None):
+        """Fetch the coefficient-free factors of the 'sumfac' assembly on
+        tensor-product meshes.
+
+        Returns:
+            Tuple[(TensorLike, TensorLike), ...]: The 1D shape functions and their
+                derivatives on the 1D quadrature points of each direction.
+            TensorLike: The quadrature weights shaped (NQ, ).
+            TensorLike: The jacobians shaped (NC, NQ, GD, TD).
+            TensorLike: The square roots of the Gram determinants shaped (NC, NQ).
+            TensorLike: The inverse of the first fundamental forms shaped (NC, NQ, TD, TD).
+        """
+        mesh = space.mesh
+        if not isinstance(mesh, TensorMesh):
+            raise RuntimeError("The 'sumfac' method of ScalarDiffusionIntegrator only "
+                               f"supports tensor-product meshes, but got {type(mesh).__name__}.")
+        if self.batched:
+            raise NotImplementedError("Batched coefficients are not supported by "
+                                      "the 'sumfac' method.")
+        bcs, ws = self.fetch_qf(space)
+        index = self.entity_selection(indices)
+        factors = mesh.shape_function_factors(bcs, p=space.p)
+        J = mesh.jacobi_matrix(bcs, index=index)
+        G = mesh.first_fundamental_form(J)
+        d = bm.sqrt(bm.abs(bm.linalg.det(G)))
+        Ginv = bm.linalg.inv(G)
+        return factors, ws, J, d, Ginv
+
+    def tensor_metric(self, space: _FS, /, indices=None):
+        """Get the factors of the 'sumfac' assembly with the current coefficient.
+
+        Returns:
+            Tuple[(TensorLike, TensorLike), ...]: The 1D factors, see `fetch_tensor_factors`.
+            TensorLike: The metric on the quadrature points shaped (NC, NQ, TD, TD),
+                containing quadrature weights, jacobians and the coefficient.
+        """
+        factors, ws, J, d, Ginv = self.fetch_tensor_factors(space, indices)
+        # 系数可能随时改变，不进入缓存
+        bcs = self.fetch_qf(space)[0]
+        index = self.entity_selection(indices)
+        coef = process_coef_func(self.coef, bcs=bcs, mesh=space.mesh, etype='cell', index=index)
+
+        if coef is None or is_scalar(coef):
+            D = bm.einsum('q, cq, cqmn -> cqmn', ws, d, Ginv)
+            if coef is not None:
+                D = D * coef
+        elif coef.ndim == 4:
+            JG = bm.einsum('cqkm, cqmn -> cqkn', J, Ginv)
+            D = bm.einsum('q, cq, cqkm, cqkl, cqln -> cqmn', ws, d, JG, coef, JG)
+        else:
+            coef = fill_axis(coef, 2)
+            D = bm.einsum('q, cq, cqmn, cq -> cqmn', ws, d, Ginv, coef)
+
+        return factors, D
+
+    def fetch_fast_factors(self, space: _FS, /, indices=None):
+        """Fetch the factors used in the matrix-free action of the current method.
+        Returns None if the current method does not support it."""
+        method = self.assembly.get()
+        if self.batched:
+            return None
+        if method == 'fast' and isinstance(space.mesh, SimplexMesh):
+            return ('simplex', ) + self.fetch_simplex_factors(space, indices)
+        if method == 'sumfac':
+            return ('tensor', ) + self.tensor_metric(space, indices)
+        return None
+
+    @staticmethod
+    def apply_fast_factors(factors, ue: TensorLike, /, trans: bool = False) -> TensorLike:
+        """Apply the local operators given by `fetch_fast_factors` to the local
+        DoFs `ue` shaped (NC, ldof) or (NC, ldof, K)."""
+        if factors[0] == 'simplex':
+            _, M, G = factors
+            # v_ci = M_ijkl G_ckl u_cj, computed as a GEMM with the reference
+            # tensor reshaped (ldof, ldof*(TD+1)**2) after the outer product of u and G.
+            NC, ldof = ue.shape[:2]
+            if trans:
+                M = bm.swapaxes(M, 0, 1)
+            Mr = bm.reshape(M, (ldof, -1))
+            if ue.ndim == 2:
+                T = bm.einsum('ckl, cj -> cjkl', G, ue)
+                return bm.reshape(T, (NC, -1)) @ Mr.T
+            else:
+                T = bm.einsum('ckl, cjr -> crjkl', G, ue)
+                ve = bm.reshape(T, (NC, ue.shape[-1], -1)) @ Mr.T
+                return bm.swapaxes(ve, -1, -2)
+        else:
+            _, factors, D = factors
+            TD = len(factors)
+            phi = [f[0] for f in factors]
+            if trans:
+                D = bm.swapaxes(D, -1, -2)
+            grad = []
+            for n in range(TD):
+                basis = [f[1] if k == n else f[0] for k, f in enumerate(factors)]
+                grad.append(tensor_evaluate(basis, ue)) # (NC, NQ, ...)
+            grad = bm.stack(grad, axis=2) # (NC, NQ, TD, ...)
+            flux = bm.einsum('cqmn, cqn... -> cqm...', D, grad)
+            ve = 0.
+            for m in range(TD):
+                basis = [f[1] if k == m else f[0] for k, f in enumerate(factors)]
+                ve = ve + tensor_integral(basis, flux[:, :, m])
+            return ve
+
     @variantmethod
     def assembly(self, space: _FS, /, indices=None) -> TensorLike:
         coef = self.coef
@@ -70,13 +195,8 @@ class ScalarDiffusionIntegrator(LinearInt, OpInt, CellInt):
         """
         mesh = space.mesh
         if isinstance(mesh, SimplexMesh):
-
-            _, ws = self.fetch_qf(space)
-            gphi = self.fetch_gphiu(space, indices)
-            M = bm.einsum('q, qik, qjl -> ijkl', ws, gphi, gphi)
-            cm = self.fetch_measure(space, indices)
-            glambda = mesh.grad_lambda(index=self.entity_selection(indices))
-            result = bm.einsum('ijkl, ckm, clm, c -> cij', M, glambda, glambda, cm)
+            M, G = self.fetch_simplex_factors(space, indices)
+            result = bm.einsum('ijkl, ckl -> cij', M, G)
         else:
             coef = self.coef
             mesh = space.mesh    
@@ -94,6 +214,19 @@ class ScalarDiffusionIntegrator(LinearInt, OpInt, CellInt):
             result = bm.einsum('cqkn, qijmn, cqkm, c -> cij', JG, M, JG, cm) # (NC, NQ, ldof, GD)
         return result
 
+    @assembly.register('sumfac')
+    def assembly(self, space: _FS, /, indices=None) -> TensorLike:
+        """Sum-factorized assembly on tensor-product meshes."""
+        factors, D = self.tensor_metric(space, indices)
+        TD = len(factors)
+        result = 0.
+        for m in range(TD):
+            basis1 = [f[1] if k == m else f[0] for k, f in enumerate(factors)]
+            for n in range(TD):
+                basis2 = [f[1] if k == n else f[0] for k, f in enumerate(factors)]
+                result = result + tensor_bilinear_integral(basis1, basis2, D[..., m, n])
+        return result
+
     @assembly.register('nonlinear')
     def assembly(self, space: _FS, /, indices=None) -> TensorLike:
         uh = self.uh
@@ -2,10 +2,11 @@ from typing import Optional
 
 from ..backend import backend_manager as bm
 from ..typing import TensorLike, Index, _S, CoefLike
-from ..mesh import HomogeneousMesh
+from ..mesh import HomogeneousMesh, TensorMesh
 from ..functionspace.space import FunctionSpace as _FS
-from ..utils import process_coef_func
+from ..utils import process_coef_func, is_scalar, fill_axis
 from ..functional import bilinear_integral, linear_integral, get_semilinear_coef
+from ..functional import tensor_bilinear_integral, tensor_evaluate, tensor_integral
 from ..decorator.variantmethod import variantmethod
 from .integrator import LinearInt, OpInt, CellInt, enable_cache
 
@@ -44,6 +45,70 @@ class ScalarMassIntegrator(LinearInt, OpInt, CellInt):
         phi = space.basis(bcs, index=index)
         return bcs, ws, phi, cm, index
 
+    @enable_cache
+    def fetch_tensor_factors(self, space: _FS, /, indices=None):
+        """Fetch the coefficient-free factors of the 'sumfac' assembly on
+        tensor-product meshes.
+
+        Returns:
+            Tuple[(TensorLike, TensorLike), ...]: The 1D shape functions and their
+                derivatives on the 1D quadrature points of each direction.
+            TensorLike: The quadrature points.
+            TensorLike: The weights on the quadrature points shaped (NC, NQ),
+                containing quadrature weights and jacobians.
+        """
+        mesh = getattr(space, 'mesh', None)
+        if not isinstance(mesh, TensorMesh):
+            raise RuntimeError("The 'sumfac' method of ScalarMassIntegrator only "
+                               f"supports tensor-product meshes, but got {type(mesh).__name__}.")
+        if self.batched:
+            raise NotImplementedError("Batched coefficients are not supported by "
+                                      "the 'sumfac' method.")
+        index = self.entity_selection(indices)
+        q = space.p+3 if self.q is None else self.q
+        qf = mesh.quadrature_formula(q, 'cell')
+        bcs, ws = qf.get_quadrature_points_and_weights()
+        factors = mesh.shape_function_factors(bcs, p=space.p)
+        J = mesh.jacobi_matrix(bcs, index=index)
+        G = mesh.first_fundamental_form(J)
+        D = ws * bm.sqrt(bm.abs(bm.linalg.det(G))) # (NC, NQ)
+        return factors, bcs, D
+
+    def tensor_metric(self, space: _FS, /, indices=None):
+        """Get the factors of the 'sumfac' assembly with the current coefficient.
+
+        Returns:
+            Tuple[(TensorLike, TensorLike), ...]: The 1D factors, see `fetch_tensor_factors`.
+            TensorLike: The weights on the quadrature points shaped (NC, NQ),
+                containing quadrature weights, jacobians and the coefficient.
+        """
+        factors, bcs, D = self.fetch_tensor_factors(space, indices)
+        # 系数可能随时改变，不进入缓存
+        index = self.entity_selection(indices)
+        coef = process_coef_func(self.coef, bcs=bcs, mesh=space.mesh, etype='cell', index=index)
+
+        if coef is not None:
+            D = D * (coef if is_scalar(coef) else fill_axis(coef, 2))
+
+        return factors, D
+
+    def fetch_fast_factors(self, space: _FS, /, indices=None):
+        """Fetch the factors used in the matrix-free action of the current method.
+        Returns None if the current method does not support it."""
+        if self.assembly.get() == 'sumfac' and not self.batched:
+            return self.tensor_metric(space, indices)
+        return None
+
+    @staticmethod
+    def apply_fast_factors(factors, ue: TensorLike, /, trans: bool = False) -> TensorLike:
+        """Apply the local operators given by `fetch_fast_factors` to the local
+        DoFs `ue` shaped (NC, ldof) or (NC, ldof, K)."""
+        factors, D = factors
+        phi = [f[0] for f in factors]
+        val = tensor_evaluate(phi, ue) # (NC, NQ, ...)
+        val = val * fill_axis(D, val.ndim)
+        return tensor_integral(phi, val)
+
     @variantmethod
     def assembly(self, space: _FS) -> TensorLike:
         coef = self.coef
@@ -53,6 +118,13 @@ class ScalarMassIntegrator(LinearInt, OpInt, CellInt):
 
         return bilinear_integral(phi, phi, ws, cm, val, batched=self.batched)
 
+    @assembly.register('sumfac')
+    def assembly(self, space: _FS, /, indices=None) -> TensorLike:
+        """Sum-factorized assembly on tensor-product meshes."""
+        factors, D = self.tensor_metric(space, indices)
+        phi = [f[0] for f in factors]
+        return tensor_bilinear_integral(phi, phi, D)
+
     @assembly.register('semilinear')
     def assembly(self, space: _FS) -> TensorLike:
         uh = self.uh
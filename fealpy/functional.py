@@ -1,7 +1,9 @@
 
-from typing import Optional
+from typing import Optional, Sequence
+from math import prod
 
 from .backend import backend_manager as bm
+from .backend.contraction import contract
 from .typing import TensorLike, CoefLike
 from .utils import is_scalar, is_tensor, fill_axis
 
@@ -21,7 +23,7 @@ def integral(value: TensorLike, weights: TensorLike, measure: TensorLike, *,
         if `entity_type` is True, otherwise [...].
     """
     subs = '...c' if entity_type else '...'
-    return bm.einsum(f'c, q, ...cq -> {subs}', measure, weights, value)
+    return contract(f'c, q, ...cq -> {subs}', measure, weights, value)
 
 
 def linear_integral(basis: TensorLike, weights: TensorLike, measure: TensorLike,
@@ -44,10 +46,10 @@ def linear_integral(basis: TensorLike, weights: TensorLike, measure: TensorLike,
             If `batched` is True, there will be a batch dimension as the first axis.
     """
     if source is None:
-        return bm.einsum('c, q, cq... -> c...', measure, weights, basis)
+        return contract('c, q, cq... -> c...', measure, weights, basis)
 
     if is_scalar(source):
-        return bm.einsum('c, q, cq... -> c...', measure, weights, basis) * source
+        return contract('c, q, cq... -> c...', measure, weights, basis) * source
 
     elif is_tensor(source):
         dof_shape = basis.shape[3:]
@@ -55,11 +57,11 @@ def linear_integral(basis: TensorLike, weights: TensorLike, measure: TensorLike,
 
         if source.ndim <= 2 + int(batched):
             source = fill_axis(source, 3 if batched else 2)
-            r = bm.einsum(f'c, q, cqid, ...cq -> ...cid', measure, weights, basis, source)
+            r = contract(f'c, q, cqid, ...cq -> ...cid', measure, weights, basis, source)
             return bm.reshape(r, r.shape[:-1] + dof_shape)
         else:
             source = fill_axis(source, 4 if batched else 3)
-            return bm.einsum(f'c, q, cqid, ...cqd -> ...ci', measure, weights, basis, source)
+            return contract(f'c, q, cqid, ...cqd -> ...ci', measure, weights, basis, source)
 
     else:
         raise TypeError(f"source should be int, float or TensorLike, but got {type(source)}.")
@@ -89,22 +91,112 @@ def bilinear_integral(basis1: TensorLike, basis2: TensorLike, weights: TensorLik
     basis2 = basis2.reshape(*basis2.shape[:3], -1) # (C, Q, J, dof_numel)
 
     if coef is None:
-        return bm.einsum(f'q, c, cqid, cqjd -> cij', weights, measure, basis1, basis2)
+        return contract(f'q, c, cqid, cqjd -> cij', weights, measure, basis1, basis2)
 
     if is_scalar(coef):
-        return bm.einsum(f'q, c, cqid, cqjd -> cij', weights, measure, basis1, basis2) * coef
+        return contract(f'q, c, cqid, cqjd -> cij', weights, measure, basis1, basis2) * coef
 
     elif is_tensor(coef):
         ndim = coef.ndim - int(batched)
         if ndim == 4:
-            return  bm.einsum(f'q, c, cqid, cqjn, ...cqdn -> ...cij', weights, measure, basis1, basis2, coef)
+            return  contract(f'q, c, cqid, cqjn, ...cqdn -> ...cij', weights, measure, basis1, basis2, coef)
         else:
             coef = fill_axis(coef, 4 if batched else 3)
-            return bm.einsum(f'q, c, cqid, cqjd, ...cqd -> ...cij', weights, measure, basis1, basis2, coef)
+            return contract(f'q, c, cqid, cqjd, ...cqd -> ...cij', weights, measure, basis1, basis2, coef)
         
     else:
         raise TypeError(f"coef should be int, float or TensorLike, but got {type(coef)}.")
 
+def _tensor_contract(value: TensorLike, mats: Sequence[TensorLike]) -> TensorLike:
+    # Contract axis k+1 of value (N, n_0, n_1, ...) with mats[k] shaped (m_k, n_k).
+    letters = 'abcdefgh'
+    TD = len(mats)
+    subs = letters[:TD]
+    for k, mat in enumerate(mats):
+        out = subs[:k] + 'z' + subs[k+1:]
+        value = bm.einsum(f'n{subs}, z{subs[k]} -> n{out}', value, mat)
+    return value
+
+
+def tensor_evaluate(basis: Sequence[TensorLike], value: TensorLike) -> TensorLike:
+    """Sum-factorized evaluation of a tensor-product expansion on quadrature points.
+
+    Parameters:
+        basis (Sequence[TensorLike[Q_k, J_k]]): The 1D basis of each direction
+            on the 1D quadrature points.
+        value (TensorLike[C, J, ...]): The local coefficients, where J is the
+            product of J_k with the 0-th direction being the slowest.
+
+    Returns:
+        TensorLike: The values on the tensor-product quadrature points, shaped (C, Q, ...).
+    """
+    C, J = value.shape[:2]
+    extra = value.shape[2:]
+    value = bm.reshape(value, (C, J, -1))
+    value = bm.swapaxes(value, 1, 2) # (C, K, J)
+    value = bm.reshape(value, (-1, ) + tuple(b.shape[1] for b in basis))
+    value = _tensor_contract(value, basis)
+    value = bm.reshape(value, (C, -1, prod(b.shape[0] for b in basis)))
+    return bm.reshape(bm.swapaxes(value, 1, 2), (C, -1) + extra)
+
+
+def tensor_integral(basis: Sequence[TensorLike], value: TensorLike) -> TensorLike:
+    """Sum-factorized integration of values on quadrature points against a tensor-product basis.
+    This is the transpose of `tensor_evaluate`.
+
+    Parameters:
+        basis (Sequence[TensorLike[Q_k, I_k]]): The 1D basis of each direction
+            on the 1D quadrature points.
+        value (TensorLike[C, Q, ...]): The values on the tensor-product quadrature
+            points, including quadrature weights and measures.
+
+    Returns:
+        TensorLike: The integration shaped (C, I, ...).
+    """
+    return tensor_evaluate([bm.swapaxes(b, 0, 1) for b in basis], value)
+
+
+def tensor_bilinear_integral(basis1: Sequence[TensorLike], basis2: Sequence[TensorLike],
+                             weights: TensorLike) -> TensorLike:
+    """Sum-factorized numerical integration on tensor-product cells.
+
+    Parameters:
+        basis1 (Sequence[TensorLike[Q_k, I_k]]): The 1D basis of each direction
+            on the 1D quadrature points.
+        basis2 (Sequence[TensorLike[Q_k, J_k]]): The 1D basis of each direction
+            on the 1D quadrature points.
+        weights (TensorLike[C, Q]): Values on the tensor-product quadrature points
+            with the 0-th direction being the slowest, including quadrature weights,
+            measures and coefficients.
+
+    Returns:
+        TensorLike: The result of the integration shaped (C, I, J), where the local
+            DoFs are ordered as the tensor product of the 1D basis.
+    """
+    TD = len(basis1)
+    C = weights.shape[0]
+    qshape = tuple(b.shape[0] for b in basis1)
+    value = bm.reshape(weights, (C, prod(qshape), 1))
+
+    # Contract one direction at a time, from the fastest to the slowest.
+    for k in reversed(range(TD)):
+        Q = qshape[k]
+        value = bm.reshape(value, (C, -1, Q, value.shape[-1]))
+        phi2 = bm.einsum('qi, qj -> qij', basis1[k], basis2[k])
+        value = bm.einsum('cpqr, qij -> cpijr', value, phi2)
+        value = bm.reshape(value, (C, value.shape[1], -1))
+
+    shape = [C]
+    for b1, b2 in zip(basis1, basis2):
+        shape.extend([b1.shape[1], b2.shape[1]])
+    value = bm.reshape(value, tuple(shape))
+    axes = (0, ) + tuple(range(1, 2*TD, 2)) + tuple(range(2, 2*TD+1, 2))
+    value = bm.permute_dims(value, axes)
+    I = prod(b.shape[1] for b in basis1)
+    J = prod(b.shape[1] for b in basis2)
+    return bm.reshape(value, (C, I, J))
+
+
 def get_semilinear_coef(value:TensorLike, coef: Optional[CoefLike]=None, batched: bool=False):
 
     if coef is None:
@@ -1,6 +1,8 @@
 
 from .mesh_data_structure import MeshDS
 from .mesh_base import Mesh, HomogeneousMesh, SimplexMesh, TensorMesh, StructuredMesh
+from .point_locator import PointLocator
+from .bisection import BisectionRefiner
 
 from .interval_mesh import IntervalMesh
 from .triangle_mesh import TriangleMesh
@@ -0,0 +1,314 @@
+from typing import Optional, Tuple
+
+from ..backend import backend_manager as bm
+from ..typing import TensorLike
+from ..sparse import csr_matrix, CSRTensor
+
+
+class BisectionRefiner():
+    """Vectorized newest vertex bisection and coarsening of triangle and
+    tetrahedron meshes.
+
+    Every cell is bisected at its refinement edge, which is given by the order
+    of its vertices:
+    - triangles follow `TriangleMesh.bisect`: the refinement edge is
+      (x1, x2), and (x0, x1, x2) is split into (z, x0, x1) and (z, x2, x0);
+    - tetrahedra are tagged by 0, 1 or 2 as in the algorithm of Maubach and
+      Stevenson: the refinement edge is (x0, x3), and (x0, x1, x2, x3) is split
+      into (x0, z, x1, x2) and (x3, z, x1, x2), or (x3, z, x2, x1) for tag 0,
+      with the tag increased by one.
+    The first refinement labels the longest edge of every cell as its
+    refinement edge, which gives the Kuhn order for `TetrahedronMesh.from_box`.
+
+    The conforming closure propagates over the edges of all the cells at once
+    until no cell has a bisected edge, so a call of `refine` costs a few array
+    passes per level of the closure. The refinement forest is kept as the HB
+    array, the two endpoints of the edge bisected to create each node (-1 for
+    the nodes of the initial mesh), which is all `coarsen` needs.
+
+    The refiner works in place on the mesh given. It starts over with a new
+    labeling and an empty forest if the cells of the mesh are assigned by
+    others in between.
+
+    Parameters:
+        mesh (TriangleMesh | TetrahedronMesh): The mesh to refine.
+    """
+    def __init__(self, mesh) -> None:
+        TD = mesh.top_dimension()
+        if TD not in (2, 3) or mesh.entity('cell').shape[1] != TD + 1:
+            raise ValueError("bisection needs a triangle or a tetrahedron mesh.")
+        self.mesh = mesh
+        self.TD = TD
+        self._cell_out = None
+
+    def _sync(self) -> None:
+        mesh = self.mesh
+        if mesh.entity('cell') is self._cell_out:
+            return
+        node = mesh.entity('node')
+        cell = mesh.entity('cell')
+        NN, NC = node.shape[0], cell.shape[0]
+        kwargs = bm.context(cell)
+        self.cell = self._label(node, cell)
+        self.tag = bm.zeros((NC, ), **kwargs)
+        self.HB = bm.full((NN, 2), -1, **kwargs)
+
+    def _label(self, node: TensorLike, cell: TensorLike) -> TensorLike:
+        """Put the longest edge of every cell at its refinement edge."""
+        le = self.mesh.localEdge
+        v = node[cell[:, le[:, 1]]] - node[cell[:, le[:, 0]]]
+        k = bm.argmax(bm.sum(v**2, axis=-1), axis=-1)
+        kwargs = bm.context(cell)
+        idx = bm.arange(cell.shape[0], **kwargs)[:, None]
+
+        if self.TD == 2:
+            # 旋转顶点，保持单元的定向
+            order = bm.tensor([[0, 1, 2], [1, 2, 0], [2, 0, 1]], **kwargs)
+            return cell[idx, order[k]]
+
+        # 最长边的端点作为 x0 和 x3，其余两个顶点按到 x0 的距离排序
+        order = bm.tensor([[0, 2, 3, 1], [0, 1, 3, 2], [0, 1, 2, 3],
+                           [1, 0, 3, 2], [1, 0, 2, 3], [2, 0, 1, 3]], **kwargs)
+        cell = cell[idx, order[k]]
+        d1 = bm.sum((node[cell[:, 1]] - node[cell[:, 0]])**2, axis=-1)
+        d2 = bm.sum((node[cell[:, 2]] - node[cell[:, 0]])**2, axis=-1)
+        swap = (d1 > d2)[:, None]
+        return bm.where(swap, cell[:, [0, 2, 1, 3]], cell)
+
+    def _refinement_edge(self, cell: TensorLike) -> Tuple[TensorLike, TensorLike]:
+        if self.TD == 2:
+            return cell[:, 1], cell[:, 2]
+        return cell[:, 0], cell[:, 3]
+
+    def _children(self, cell: TensorLike, tag: TensorLike, z: TensorLike):
+        if self.TD == 2:
+            T1 = bm.stack([z, cell[:, 0], cell[:, 1]], axis=1)
+            T2 = bm.stack([z, cell[:, 2], cell[:, 0]], axis=1)
+            return T1, T2, tag
+        T1 = bm.stack([cell[:, 0], z, cell[:, 1], cell[:, 2]], axis=1)
+        T2 = bm.stack([cell[:, 3], z, cell[:, 1], cell[:, 2]], axis=1)
+        T2 = bm.where((tag == 0)[:, None], T2[:, [0, 1, 3, 2]], T2)
+        return T1, T2, (tag + 1) % 3
+
+    def _commit(self, node, cell, tag, HB) -> None:
+        self.cell, self.tag, self.HB = cell, tag, HB
+        if self.TD == 3:
+            # 输出正定向的单元
+            v = node[cell[:, 1:]] - node[cell[:, :1]]
+            vol = bm.sum(bm.cross(v[:, 0], v[:, 1])*v[:, 2], axis=-1)
+            cell = bm.where((vol < 0)[:, None], cell[:, [0, 2, 1, 3]], cell)
+        mesh = self.mesh
+        mesh.node = node
+        mesh.cell = cell
+        mesh.construct()
+        self._cell_out = mesh.entity('cell')
+
+    @staticmethod
+    def _grow(a: TensorLike, n: int) -> TensorLike:
+        if a.shape[0] >= n:
+            return a
+        extra = bm.zeros((max(n, 2*a.shape[0]) - a.shape[0], ) + a.shape[1:],
+                         dtype=a.dtype, device=bm.get_device(a))
+        return bm.concat([a, extra], axis=0)
+
+    def refine(self, isMarkedCell: Optional[TensorLike]=None) -> Tuple[CSRTensor, TensorLike]:
+        """Bisect the marked cells once, and the cells needed to keep the mesh
+        conforming.
+
+        Parameters:
+            isMarkedCell (TensorLike, optional): The marked cells, as a bool
+                flag or an index array. Defaults to all cells.
+
+        Returns:
+            Tuple[CSRTensor, TensorLike]: The interpolation matrix of linear
+                Lagrange functions, with shape (NN_new, NN_old), and the old cell
+                containing every new cell, with shape (NC_new, ).
+        """
+        self._sync()
+        node, cell, tag, HB = self.mesh.entity('node'), self.cell, self.tag, self.HB
+        NN0 = NN = node.shape[0]
+        NC0 = NC = cell.shape[0]
+        kwargs = bm.context(cell)
+        local_edge = self.mesh.localEdge
+        M = 2**31
+
+        if isMarkedCell is None:
+            marked = bm.arange(NC, **kwargs)
+        elif isMarkedCell.dtype == bm.bool:
+            marked, = bm.nonzero(isMarkedCell)
+        else:
+            marked = isMarkedCell
+        parent = bm.arange(NC, **kwargs)
+
+        # 已二分但仍作为整条边出现在某些单元中的边，按编码排序
+        open_key = bm.zeros((0, ), dtype=bm.int64, device=bm.get_device(cell))
+        open_mid = bm.zeros((0, ), **kwargs)
+
+        while marked.shape[0] > 0:
+            nm = marked.shape[0]
+            a, b = self._refinement_edge(cell[marked])
+            key = bm.astype(bm.minimum(a, b), bm.int64)*M + bm.maximum(a, b)
+
+            z = bm.full((nm, ), -1, **kwargs)
+            if open_key.shape[0] > 0:
+                pos = bm.clip(bm.searchsorted(open_key, key), 0, open_key.shape[0] - 1)
+                found = open_key[pos] == key
+                z = bm.where(found, open_mid[pos], z)
+            new = z < 0
+            ukey, inv = bm.unique(key[new], return_inverse=True)
+            nnew = ukey.shape[0]
+            mid = bm.arange(NN, NN + nnew, **kwargs)
+            z = bm.set_at(z, new, mid[inv.reshape(-1)])
+            i0, i1 = bm.astype(ukey // M, cell.dtype), bm.astype(ukey % M, cell.dtype)
+
+            node = self._grow(node, NN + nnew)
+            node = bm.set_at(node, slice(NN, NN + nnew), (node[i0] + node[i1])/2)
+            HB = self._grow(HB, NN + nnew)
+            HB = bm.set_at(HB, slice(NN, NN + nnew), bm.stack([i0, i1], axis=1))
+            NN += nnew
+
+            T1, T2, t = self._children(cell[marked], tag[marked], z)
+            cell = self._grow(cell, NC + nm)
+            tag = self._grow(tag, NC + nm)
+            parent = self._grow(parent, NC + nm)
+            cell = bm.set_at(cell, marked, T1)
+            cell = bm.set_at(cell, slice(NC, NC + nm), T2)
+            tag = bm.set_at(tag, marked, t)
+            tag = bm.set_at(tag, slice(NC, NC + nm), t)
+            parent = bm.set_at(parent, slice(NC, NC + nm), parent[marked])
+            NC += nm
+
+            open_key = bm.concat([open_key, ukey])
+            open_mid = bm.concat([open_mid, mid])
+            order = bm.argsort(open_key)
+            open_key, open_mid = open_key[order], open_mid[order]
+
+            # 含有已二分的边的单元需要继续二分
+            isEnd = bm.zeros((NN, ), dtype=bm.bool, device=bm.get_device(cell))
+            isEnd = bm.set_at(isEnd, bm.astype(open_key // M, cell.dtype), True)
+            isEnd = bm.set_at(isEnd, bm.astype(open_key % M, cell.dtype), True)
+            cand, = bm.nonzero(bm.any(isEnd[cell[:NC]], axis=1))
+            e = cell[cand][:, local_edge]
+            ekey = bm.astype(bm.min(e, axis=-1), bm.int64)*M + bm.max(e, axis=-1)
+            pos = bm.clip(bm.searchsorted(open_key, ekey), 0, open_key.shape[0] - 1)
+            found = open_key[pos] == ekey
+            marked = cand[bm.any(found, axis=1)]
+            still = bm.unique(pos[found])
+            open_key, open_mid = open_key[still], open_mid[still]
+
+        node, cell, tag, HB = node[:NN], cell[:NC], tag[:NC], HB[:NN]
+        self._commit(node, cell, tag, HB)
+        P = self.interpolation_matrix(NN0)
+        self.mesh._record_refinement(P)
+        return P, parent[:NC]
+
+    def interpolation_matrix(self, NN0: int) -> CSRTensor:
+        """The interpolation matrix of linear Lagrange functions from the mesh
+        with the first NN0 nodes, composed from the HB array at once.
+
+        Parameters:
+            NN0 (int): The number of nodes of the coarse mesh.
+
+        Returns:
+            CSRTensor: The interpolation matrix, with shape (NN, NN0).
+        """
+        HB = self.HB
+        NN = HB.shape[0]
+        kwargs = bm.context(HB)
+        I = bm.repeat(bm.arange(NN0, NN, **kwargs), 2)
+        J = HB[NN0:].reshape(-1)
+        V = bm.full((J.shape[0], ), 0.5, dtype=bm.float64)
+
+        # 把父节点中的新节点逐层展开为粗网格节点
+        flag = J >= NN0
+        while bm.any(flag):
+            I = bm.concat([I[~flag], bm.repeat(I[flag], 2)])
+            V = bm.concat([V[~flag], bm.repeat(V[flag]/2, 2)])
+            J = bm.concat([J[~flag], HB[J[flag]].reshape(-1)])
+            flag = J >= NN0
+
+        i0 = bm.arange(NN0, **kwargs)
+        I = bm.concat([i0, I])
+        J = bm.concat([i0, J])
+        V = bm.concat([bm.ones((NN0, ), dtype=bm.float64), V])
+        return csr_matrix((V, (I, J)), shape=(NN, NN0))
+
+    def coarsen(self, isMarkedCell: TensorLike) -> Tuple[CSRTensor, TensorLike]:
+        """Undo the last bisection of the marked cells where possible.
+
+        A node created by bisection is removed if all the cells around it have
+        it as the newest vertex and are marked; the pairs of sibling cells
+        around it are then merged into their parents.
+
+        Parameters:
+            isMarkedCell (TensorLike): The cells marked for coarsening, as a bool
+                flag.
+
+        Returns:
+            Tuple[CSRTensor, TensorLike]: The interpolation matrix of linear
+                Lagrange functions, with shape (NN_new, NN_old), and the old cells
+                covering every new cell, with shape (NC_new, 2).
+        """
+        self._sync()
+        node, cell, tag, HB = self.mesh.entity('node'), self.cell, self.tag, self.HB
+        NN, NC = node.shape[0], cell.shape[0]
+        kwargs = bm.context(cell)
+        TD = self.TD
+        z = cell[:, TD - 2] # 最新顶点
+
+        # 周围的单元都以它为最新顶点且都被标记的节点可以删除
+        valence = bm.bincount(cell.reshape(-1), minlength=NN)
+        flag = isMarkedCell & (HB[z, 0] >= 0)
+        count = bm.bincount(z[flag], minlength=NN)
+        isGood = (count == valence) & (HB[:, 0] >= 0)
+
+        # 兄弟单元共享除最新顶点和加密边端点之外的顶点
+        if TD == 2:
+            other = bm.where((cell[:, 1] == HB[z, 0]) | (cell[:, 1] == HB[z, 1]),
+                             cell[:, 2], cell[:, 1])[:, None]
+        else:
+            other = bm.sort(cell[:, 2:], axis=1)
+
+        idx, = bm.nonzero(isGood[z])
+        if idx.shape[0] > 0:
+            order = bm.lexsort(tuple(other[idx].T[::-1]) + (z[idx], ))
+            idx = idx[order]
+            keys = bm.concat([z[idx, None], other[idx]], axis=1)
+            start = bm.concat([bm.ones((1, ), dtype=bm.bool, device=bm.get_device(cell)),
+                               bm.any(keys[1:] != keys[:-1], axis=1)])
+            gid = bm.cumsum(bm.astype(start, kwargs['dtype'])) - 1
+            size = bm.bincount(gid)
+            isGood = bm.set_at(isGood, z[idx[size[gid] != 2]], False)
+            idx = idx[isGood[z[idx]]]
+
+        # 每对兄弟单元中编号小的是第一个子单元
+        c0 = bm.minimum(idx[0::2], idx[1::2])
+        c1 = bm.maximum(idx[0::2], idx[1::2])
+        T1, T2 = cell[c0], cell[c1]
+        if TD == 2:
+            pcell = bm.stack([T1[:, 1], T1[:, 2], T2[:, 1]], axis=1)
+            ptag = tag[c0]
+        else:
+            pcell = bm.stack([T1[:, 0], T1[:, 2], T1[:, 3], T2[:, 0]], axis=1)
+            ptag = (tag[c0] + 2) % 3
+
+        cell = bm.set_at(cell, c0, pcell)
+        tag = bm.set_at(tag, c0, ptag)
+        children = bm.stack([bm.arange(NC, **kwargs)]*2, axis=1)
+        children = bm.set_at(children, (c0, 1), c1)
+        isKeepCell = bm.ones((NC, ), dtype=bm.bool, device=bm.get_device(cell))
+        isKeepCell = bm.set_at(isKeepCell, c1, False)
+        cell, tag, children = cell[isKeepCell], tag[isKeepCell], children[isKeepCell]
+
+        isKeepNode = ~isGood
+        keep, = bm.nonzero(isKeepNode)
+        NN1 = keep.shape[0]
+        idxMap = bm.full((NN, ), -1, **kwargs)
+        idxMap = bm.set_at(idxMap, keep, bm.arange(NN1, **kwargs))
+        HB = HB[keep]
+        HB = bm.where(HB >= 0, idxMap[HB], HB)
+        self._commit(node[keep], idxMap[cell], tag, HB)
+
+        V = bm.ones((NN1, ), dtype=bm.float64)
+        P = csr_matrix((V, (bm.arange(NN1, **kwargs), keep)), shape=(NN1, NN))
+        return P, children
@@ -3,6 +3,7 @@ from typing import Union, Optional
 from math import sqrt
 from ..backend import backend_manager as bm
 from .mesh_base import TensorMesh
+from .utils import cachedrelation
 from ..typing import TensorLike, Index, _S
 from .plot import Plotable
 
@@ -165,6 +166,7 @@ class HexahedronMesh(TensorMesh, Plotable):
         """
         return self.quad_to_ipoint(p, index)
 
+    @cachedrelation
     def cell_to_ipoint(self, p, index=_S):
         """!
         @brief Generate global indices for interpolation points in each cell
@@ -331,7 +333,7 @@ class HexahedronMesh(TensorMesh, Plotable):
             cell_old = self.entity('cell')
             face_old = self.entity('face')
 
-            if returnim is True:
+            if (returnim is True) or self.is_recording_refinement():
                 shape = (NN+NE+NF+NC,NN)
                 kargs = bm.context(node_old)
                 values = bm.ones(NN+2*NE+4*NF+8*NC,**kargs)
@@ -351,9 +353,10 @@ class HexahedronMesh(TensorMesh, Plotable):
                                     cell_old[:,0],cell_old[:,1],cell_old[:,2],cell_old[:,3],
                                     cell_old[:,4],cell_old[:,5],cell_old[:,6],cell_old[:,7]))
 
-                P = csr_matrix((values,(I,J)),shape)
-
-                IM.append(P)
+                P = csr_matrix((values, (I, J)), shape)
+                self._record_refinement(P)
+                if returnim is True:
+                    IM.append(P)
 
             node = bm.zeros((NN + NE + NF + NC, 3),
                             dtype=self.ftype, device=self.device)
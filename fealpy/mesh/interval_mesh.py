@@ -5,7 +5,7 @@ from ..backend import backend_manager as bm
 from ..typing import TensorLike , Index, _S
 from ..sparse import coo_matrix, csr_matrix
 from .mesh_data_structure import MeshDS
-from .utils import estr2dim
+from .utils import estr2dim, cachedrelation
 from .plot import Plotable
 from .mesh_base import SimplexMesh
 
@@ -206,7 +206,7 @@ class IntervalMesh(SimplexMesh,Plotable):
             newNode = (node[cell[:, 0]] + self.node[cell[:, 1]])/2
             self.node = bm.concatenate((node, newNode),axis=0)
             
-            if returnim is True:
+            if (returnim is True) or self.is_recording_refinement():
                 shape = (NN + NC, NN)
                 kargs = bm.context(node)
                 values = bm.ones(NN+2*NC, **kargs) 
@@ -219,8 +219,9 @@ class IntervalMesh(SimplexMesh,Plotable):
                 J = bm.concatenate((i0, cell[:, 0], cell[:, 1]))   
 
                 P = csr_matrix((values, (I, J)), shape)
-
-                IM.append(P)            
+                self._record_refinement(P)
+                if returnim is True:
+                    IM.append(P)
             
             part1 = bm.concatenate((cell[:,0],bm.arange(NN,NN+NC)),axis = 0)
             part2 = bm.concatenate((bm.arange(NN, NN+NC),cell[:, 1]),axis = 0)
@@ -381,6 +382,7 @@ class IntervalMesh(SimplexMesh,Plotable):
         edge = self.entity(1, index=index)
         return bm.edge_tangent(edge, self.node, unit=unit, out=out)
     
+    @cachedrelation
     def edge_to_ipoint(self, p: int, index: Index=_S) -> TensorLike:
         """Get the relationship between edges and integration points."""
         NN = self.number_of_nodes()
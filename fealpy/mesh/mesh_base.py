@@ -5,9 +5,12 @@ from ..backend import backend_manager as bm
 from ..typing import TensorLike, Index, _S
 from .. import logger
 from ..quadrature import Quadrature
+from ..sparse import csr_matrix
 from .mesh_data_structure import MeshDS
+from .point_locator import PointLocator
 from .utils import (
-    estr2dim, simplex_gdof, simplex_ldof, tensor_gdof, tensor_ldof
+    estr2dim, simplex_gdof, simplex_ldof, tensor_gdof, tensor_ldof, cachedrelation,
+    flocc_index, hilbert_index, morton_index
 )
 
 
@@ -129,6 +132,7 @@ class Mesh(MeshDS):
         return self.quadrature_formula(q, etype, qtype)
 
     # ipoints
+    @cachedrelation
     def edge_to_ipoint(self, p: int, index: Index=_S) -> TensorLike:
         """Get the relationship between edges and integration points."""
         NN = self.number_of_nodes()
@@ -183,6 +187,39 @@ class Mesh(MeshDS):
         raise NotImplementedError(f"hess shape function is not supported by {self.__class__.__name__}")
 
     # tools
+    # refinement history
+    def record_refinement(self, flag: bool=True) -> None:
+        """Start or stop recording the interpolation matrices of refinements.
+
+        While recording, every level of `uniform_refine` and `bisect` stores
+        the matrix interpolating nodal values from the mesh before the level to
+        the mesh after it. Together they describe the nested hierarchy used by
+        geometric multigrid, see `GAMGSolver.setup(A, mesh=mesh)`. Starting to
+        record again clears the history.
+
+        Parameters:
+            flag (bool, optional): Start recording if True, otherwise stop and
+                drop the history. Defaults to True.
+        """
+        self._refinement_history = [] if flag else None
+
+    def is_recording_refinement(self) -> bool:
+        return getattr(self, '_refinement_history', None) is not None
+
+    def refinement_history(self) -> list:
+        """Get the recorded interpolation matrices of the refinements.
+
+        Returns:
+            List(CSRTensor): The interpolation matrices, from the finest to
+                the coarsest.
+        """
+        history = getattr(self, '_refinement_history', None)
+        return [] if history is None else history[::-1]
+
+    def _record_refinement(self, P) -> None:
+        if self.is_recording_refinement():
+            self._refinement_history.append(P)
+
     def paraview(self, file_name = "temp.vtu",
             background_color='1.0, 1.0, 1.0',
             show_type='Surface With Edges',
@@ -373,6 +410,143 @@ class HomogeneousMesh(Mesh):
     def face_to_ipoint(self, p: int, index: Index=_S) -> TensorLike:
         raise NotImplementedError
 
+    # reorder
+    def node_ordering(self, method: str='rcm') -> TensorLike:
+        """Return a cache-friendly order of the nodes.
+
+        Parameters:
+            method (str, optional): 'rcm' for the reverse Cuthill-McKee order of
+                `node_to_node`, which minimizes the bandwidth of the assembled
+                matrices; 'hilbert' or 'morton' to sort the nodes along the
+                space-filling curve. Defaults to 'rcm'.
+
+        Returns:
+            TensorLike: The old index of every new node, with shape (NN, ).
+        """
+        if method == 'rcm':
+            import numpy as np
+            from scipy.sparse import csr_matrix as _csr
+            from scipy.sparse.csgraph import reverse_cuthill_mckee
+            NN = self.number_of_nodes()
+            edge = bm.to_numpy(self.entity('edge'))
+            I = edge.T.reshape(-1)
+            J = edge[:, ::-1].T.reshape(-1)
+            A = _csr((np.ones(I.shape[0], dtype=np.int8), (I, J)), shape=(NN, NN))
+            order = reverse_cuthill_mckee(A, symmetric_mode=True)
+            order = bm.from_numpy(order)
+            return bm.astype(bm.device_put(order, self.device), self.itype)
+        return self._curve_ordering(self.entity('node'), method)
+
+    def cell_ordering(self, method: str='hilbert') -> TensorLike:
+        """Return an order of the cells along a space-filling curve through
+        their barycenters.
+
+        Parameters:
+            method (str, optional): 'hilbert' or 'morton'. Defaults to 'hilbert'.
+
+        Returns:
+            TensorLike: The old index of every new cell, with shape (NC, ).
+        """
+        return self._curve_ordering(self.entity_barycenter('cell'), method)
+
+    def _curve_ordering(self, points: TensorLike, method: str) -> TensorLike:
+        if method == 'hilbert':
+            key = hilbert_index(points)
+        elif method == 'morton':
+            key = morton_index(points)
+        else:
+            raise ValueError(f"Unknown ordering method '{method}'.")
+        return bm.astype(bm.argsort(key), self.itype)
+
+    def reorder(self, node_order: Union[str, TensorLike, None]='rcm',
+                cell_order: Union[str, TensorLike, None]='hilbert'):
+        """Permute the nodes and the cells of the mesh in place to improve the
+        memory locality of assembly and of the assembled matrices.
+
+        The edges and faces are renumbered following the new order of the
+        cells. `nodedata`, `edgedata`, `facedata` and `celldata` are
+        permuted in the same way, while anything else built on the old
+        numbering, like the function spaces, must be rebuilt.
+        If the refinements are recorded (see `record_refinement`), the rows of
+        the finest interpolation matrix are permuted to the new nodes, so the
+        history still describes the hierarchy of the reordered mesh.
+
+        Parameters:
+            node_order (str | TensorLike | None, optional): A method of
+                `node_ordering`, the old index of every new node, or None to
+                keep the nodes. Defaults to 'rcm'.
+            cell_order (str | TensorLike | None, optional): A method of
+                `cell_ordering`, the old index of every new cell, or None to
+                keep the cells. Defaults to 'hilbert'.
+
+        Returns:
+            Tuple[TensorLike, TensorLike]: The old index of every new node and
+                of every new cell. For a field on the old nodes `u`, the field
+                on the new nodes is `u[nodeperm]`.
+        """
+        NN = self.number_of_nodes()
+        NC = self.number_of_cells()
+        kwargs = bm.context(self.entity('cell'))
+
+        if node_order is None:
+            nodeperm = bm.arange(NN, **kwargs)
+        elif isinstance(node_order, str):
+            nodeperm = self.node_ordering(node_order)
+        else:
+            nodeperm = node_order
+        if cell_order is None:
+            cellperm = bm.arange(NC, **kwargs)
+        elif isinstance(cell_order, str):
+            cellperm = self.cell_ordering(cell_order)
+        else:
+            cellperm = cell_order
+
+        node2new = bm.set_at(bm.zeros(NN, **kwargs), nodeperm, bm.arange(NN, **kwargs))
+        cell2face = self.cell_to_face()[cellperm]
+        cell2edge = self.cell_to_edge()[cellperm] if self.TD == 3 else None
+        NF = self.number_of_faces()
+        NE = self.number_of_edges()
+
+        data = [(getattr(self, 'nodedata', None), NN, nodeperm),
+                (getattr(self, 'celldata', None), NC, cellperm)]
+        if self.TD > 1:
+            # 面和边按包含它们的新单元的次序编号
+            i0, _ = flocc_index(cell2face.reshape(-1), NF)
+            faceperm = bm.argsort(i0)
+            face2new = bm.set_at(bm.zeros(NF, **kwargs), faceperm, bm.arange(NF, **kwargs))
+            cell2face = face2new[cell2face]
+            data.append((getattr(self, 'facedata', None), NF, faceperm))
+        if self.TD == 3:
+            index = cell2edge.reshape(-1)
+            i2 = bm.set_at(bm.zeros(NE, **kwargs), index, bm.arange(index.shape[0], **kwargs))
+            edgeperm = bm.argsort(i2)
+            edge2new = bm.set_at(bm.zeros(NE, **kwargs), edgeperm, bm.arange(NE, **kwargs))
+            cell2edge = edge2new[cell2edge]
+            data.append((getattr(self, 'edgedata', None), NE, edgeperm))
+
+        self.node = self.entity('node')[nodeperm]
+        self.cell = node2new[self.entity('cell')[cellperm]]
+        if self.TD == 1:
+            self.construct()
+        else:
+            self.construct_by_index(cell2face, NF, cell2edge, NE)
+
+        visited = set()
+        for d, N, perm in data:
+            if d is None or id(d) in visited:
+                continue
+            visited.add(id(d))
+            for key, val in d.items():
+                if bm.is_tensor(val) and val.ndim > 0 and val.shape[0] == N:
+                    d[key] = val[perm]
+
+        history = getattr(self, '_refinement_history', None)
+        if history:
+            P = history[-1]
+            history[-1] = csr_matrix((P.values, (node2new[P.row], P.col)), P.shape)
+
+        return nodeperm, cellperm
+
     # tools
     def integral(self, f, q=3, celltype=False) -> TensorLike:
         """
@@ -515,6 +689,113 @@ class SimplexMesh(HomogeneousMesh):
         elif variables == 'u':
             return H
 
+    # point location
+    def point_locator(self) -> PointLocator:
+        """Get the spatial index of the cells, which is built at the first call
+        and rebuilt after the nodes or the cells are changed.
+
+        Returns:
+            PointLocator: The spatial index.
+        """
+        locator = getattr(self, '_point_locator', None)
+        node, cell = self.entity('node'), self.entity('cell')
+        if (locator is None) or (not locator.is_valid(node, cell)):
+            locator = PointLocator(node, cell)
+            self._point_locator = locator
+        return locator
+
+    def location(self, points: TensorLike, tol: float=1e-12) -> Tuple[TensorLike, TensorLike]:
+        """Find the cells containing the points, and the barycentric coordinates
+        of the points in them.
+
+        Parameters:
+            points (TensorLike): The points, with shape (..., GD).
+            tol (float, optional): Tolerance of the barycentric coordinates for a
+                point on the boundary of a cell. Defaults to 1e-12.
+
+        Returns:
+            Tuple[TensorLike, TensorLike]: The cell index of every point, -1 for the
+                points outside the mesh, and the barycentric coordinates with
+                shape (NP, TD+1).
+        """
+        return self.point_locator().locate(points, tol=tol)
+
+    # refinement
+    def _refine_topology(self, edge_code: TensorLike, face_code: TensorLike,
+                         variant: Optional[TensorLike]=None):
+        """Number the edges and faces of the children of all cells in a uniform
+        refinement, using the topology of the current (coarse) mesh only.
+
+        Every new entity is numbered by its position in the coarse mesh: the
+        halves of the coarse edges first, then the parts of the coarse faces
+        (3D only), and the entities in the interior of the coarse cells last.
+        No sorting is needed, see `MeshDS.construct_by_index`.
+
+        Parameters:
+            edge_code (TensorLike): The codes of the local edges of every child,
+                with shape (NV, NCH, NEC), from `simplex_refine_pattern`. NV is the
+                number of split variants and NCH the number of children.
+            face_code (TensorLike): The codes of the local faces of every child,
+                with shape (NV, NCH, NFC).
+            variant (TensorLike, optional): The split variant of every cell, with
+                shape (NC, ). Defaults to the first variant for all cells.
+
+        Returns:
+            Tuple: cell2face, NF, cell2edge and NE of the refined mesh, where the
+                child j of the cell i is the cell j*NC + i.
+        """
+        TD = self.TD
+        cell = self.entity('cell')
+        edge = self.entity('edge')
+        cell2edge = self.cell_to_edge()
+        NC, NVC = cell.shape
+        NE = self.number_of_edges()
+        NEC = cell2edge.shape[1]
+        NFC = self.number_of_faces_of_cells()
+        kwargs = bm.context(cell)
+
+        # 边 e 在端点 edge[e, s] 一侧的一半，编号为 2e + s
+        side = edge[cell2edge][..., 1:2] == cell[:, None, :]
+        half = 2*cell2edge[..., None] + bm.astype(side, cell.dtype)
+        half = half.reshape(NC, NEC*NVC)
+        nfi = int(bm.max(face_code)) - (NEC*NVC + NFC*(NVC+1)) + 1
+        nei = int(bm.max(edge_code)) - (NEC*NVC + NFC*(NVC+1)) + 1
+        inner = bm.arange(NC, **kwargs)[:, None]
+
+        if TD == 2:
+            zeros = bm.zeros((NC, NFC*(NVC+1)), **kwargs)
+            edge_table = bm.concat([half, zeros, 2*NE + nei*inner +
+                                    bm.arange(nei, **kwargs)], axis=1)
+            face_table = edge_table
+            NF = NE = 2*NE + nei*NC
+        else:
+            NF = self.number_of_faces()
+            face = self.entity('face')
+            cell2face = self.cell_to_face()
+            # 面 f 上角点 face[f, t] 处的部分编号为 4f + t，中心部分为 4f + 3；
+            # 面内截去角点 face[f, t] 的边编号为 2NE + 3f + t
+            f = face[cell2face]
+            pos = (f[..., 1:2] == cell[:, None, :]) + 2*(f[..., 2:3] == cell[:, None, :])
+            pos = bm.concat([bm.astype(pos, cell.dtype),
+                             bm.full((NC, NFC, 1), 3, **kwargs)], axis=-1)
+            face_part = (4*cell2face[..., None] + pos).reshape(NC, -1)
+            edge_part = (2*NE + 3*cell2face[..., None] + pos).reshape(NC, -1)
+            face_table = bm.concat([bm.zeros_like(half), face_part, 4*NF +
+                                    nfi*inner + bm.arange(nfi, **kwargs)], axis=1)
+            edge_table = bm.concat([half, edge_part, 2*NE + 3*NF +
+                                    nei*inner + bm.arange(nei, **kwargs)], axis=1)
+            NE = 2*NE + 3*NF + nei*NC
+            NF = 4*NF + nfi*NC
+
+        def gather(table, code):
+            if variant is None:
+                local = table[:, code[0]]
+            else:
+                local = table[inner[..., None], code[variant]]
+            return bm.swapaxes(local, 0, 1).reshape(-1, code.shape[-1])
+
+        return gather(face_table, face_code), NF, gather(edge_table, edge_code), NE
+
 class TensorMesh(HomogeneousMesh):
     # ipoints
     def number_of_local_ipoints(self, p: int, iptype: Union[int, str]='cell') -> int:
@@ -579,6 +860,27 @@ class TensorMesh(HomogeneousMesh):
     face_shape_function = shape_function
     edge_shape_function = shape_function
 
+    def shape_function_factors(self, bcs: Tuple[TensorLike], p: int=1) -> Tuple[Tuple[TensorLike, TensorLike], ...]:
+        """The 1D factors of the tensor-product shape functions.
+
+        Parameters:
+            bcs (Tuple[Tensor, ...]): The 1D bc points of each direction, in shape (NQ_k, 2).\n
+            p (int, optional): The order of the shape function. Defaults to 1.
+
+        Returns:
+            Tuple[(Tensor, Tensor), ...]: The values and the derivatives of the\
+            1D shape functions in each direction, both in shape (NQ_k, p+1).
+        """
+        assert isinstance(bcs, tuple)
+        Dlambda = bm.array([-1, 1], dtype=self.ftype, device=bm.get_device(bcs[0]))
+        factors = []
+        for bc in bcs:
+            phi = bm.simplex_shape_function(bc, p=p)
+            R = bm.simplex_grad_shape_function(bc, p=p)
+            dphi = bm.einsum('...ij, j->...i', R, Dlambda)
+            factors.append((phi, dphi))
+        return tuple(factors)
+
     def grad_shape_function(self, bcs: Tuple[TensorLike], p: int=1, *, index: Index=_S,
                             variables: str='u', mi: Optional[TensorLike]=None) -> TensorLike:
         assert isinstance(bcs, tuple)
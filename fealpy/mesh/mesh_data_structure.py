@@ -5,7 +5,7 @@ from ..backend import backend_manager as bm
 from ..typing import TensorLike, Index, EntityName, _S, _int_func
 from .. import logger
 from ..sparse import COOTensor
-from .utils import estr2dim, edim2entity, MeshMeta, flocc
+from .utils import estr2dim, edim2entity, MeshMeta, flocc, flocc_index, cachedrelation
 
 
 ##################################################
@@ -15,6 +15,10 @@ from .utils import estr2dim, edim2entity, MeshMeta, flocc
 
 class MeshDS(metaclass=MeshMeta):
     _STORAGE_ATTR = ['cell', 'face', 'edge', 'node']
+    _TOPOLOGY_ATTR = ['cell', 'face', 'edge', 'face2cell', 'edge2cell',
+                      'cell2face', 'cell2edge', 'face2edge']
+    _COMPACT_ATTR = ['cell', 'face', 'edge', 'face2cell', 'edge2cell',
+                     'cell2face', 'cell2edge']
     cell: TensorLike
     face: TensorLike
     edge: TensorLike
@@ -28,6 +32,10 @@ class MeshDS(metaclass=MeshMeta):
     def __init__(self, *, TD: int, itype, ftype) -> None:
         assert hasattr(self, '_entity_dim_method_name_map')
         self._entity_storage: Dict[int, TensorLike] = {}
+        self._relation_cache: Dict[tuple, Any] = {}
+        self._relation_stats = {'hits': 0, 'misses': 0}
+        self._version = {'node': 0, 'topology': 0}
+        self._compact: Optional[Dict[str, bool]] = None
         self._entity_factory: Dict[int, Callable] = {
             k: getattr(self, self._entity_dim_method_name_map[k])
             for k in self._entity_dim_method_name_map
@@ -41,11 +49,21 @@ class MeshDS(metaclass=MeshMeta):
     def __getattr__(self, name: str):
         if name in self._STORAGE_ATTR:
             etype_dim = estr2dim(self, name)
+            if self._is_derived(etype_dim):
+                return self._compact_get(name)
             return edim2entity(self._entity_storage, self._entity_factory, etype_dim)
+        elif name in self._COMPACT_ATTR and self.__dict__.get('_compact', None) is not None:
+            return self._compact_get(name)
         else:
             return object.__getattribute__(self, name)
 
     def __setattr__(self, name: str, value: Any) -> None:
+        if name in self._COMPACT_ATTR and self.__dict__.get('_compact', None) is not None:
+            value = self._compact_set(name, value)
+            if value is None:
+                self._bump_version('topology')
+                return
+
         if name in self._STORAGE_ATTR:
             if not hasattr(self, '_entity_storage'):
                 raise RuntimeError('please call super().__init__() before setting attributes.')
@@ -54,6 +72,11 @@ class MeshDS(metaclass=MeshMeta):
         else:
             super().__setattr__(name, value)
 
+        if name == 'node':
+            self._bump_version('node')
+        elif name in self._TOPOLOGY_ATTR:
+            self._bump_version('topology')
+
     def __delattr__(self, name: str) -> None:
         if name in self._STORAGE_ATTR:
             del self._entity_storage[estr2dim(self, name)]
@@ -63,6 +86,212 @@ class MeshDS(metaclass=MeshMeta):
     def clear(self) -> None:
         """Remove all entities from the storage."""
         self._entity_storage.clear()
+        self.clear_relation_cache()
+
+    ### relation cache
+    # NOTE: The relations decorated by `cachedrelation` are cached until the
+    # nodes or the topology are assigned, which is tracked by the version
+    # counters. Modifying the arrays in place is not tracked, so call
+    # `clear_relation_cache` after that.
+    def _bump_version(self, name: str) -> None:
+        version = self.__dict__.get('_version', None)
+        if version is not None:
+            version[name] += 1
+            self._relation_cache.clear()
+
+    def version(self, name: str='topology') -> int:
+        """Return the version counter of the 'node' or the 'topology', which is
+        increased every time the nodes (or the cells, faces, edges and their
+        relations) are assigned."""
+        return self._version[name]
+
+    def _relation_cache_get(self, key: tuple):
+        cache = self.__dict__.get('_relation_cache', None)
+        if cache is None: # MeshDS.__init__ is not called
+            return None
+        value = cache.get(key, None)
+        self._relation_stats['misses' if value is None else 'hits'] += 1
+        return value
+
+    def _relation_cache_set(self, key: tuple, value: Any) -> None:
+        cache = self.__dict__.get('_relation_cache', None)
+        if cache is not None:
+            cache[key] = value
+
+    def clear_relation_cache(self) -> None:
+        """Drop all the cached relations."""
+        if '_relation_cache' in self.__dict__:
+            self._relation_cache.clear()
+
+    def relation_cache_info(self) -> Dict[str, Any]:
+        """Return the statistics of the relation cache.
+
+        Returns:
+            Dict: The number of 'hits' and 'misses' since the mesh is created,
+                the cached relations as 'entries', and the 'version' counters.
+        """
+        return {
+            'hits': self._relation_stats['hits'],
+            'misses': self._relation_stats['misses'],
+            'entries': list(self._relation_cache.keys()),
+            'version': dict(self._version)
+        }
+
+    ### compact storage
+    # NOTE: In the compact mode, only the cells, the packed face2cell and, in
+    # 3D, the edges are stored. The other relations are derived from them on
+    # access, and kept in the relation cache if enabled.
+    def compact(self, ftype=None, *, keep_edges: bool=True, cache: bool=True) -> None:
+        """Switch to a memory-lean storage of the topology.
+
+        - The index dtype is the narrowest one that holds every entity count and
+          number of local entities, int32 or int64. Narrower types overflow in
+          the numbering of the interpolation points.
+        - `face2cell` is stored as the two cell indices and one int8 holding the
+          two local face indices.
+        - The faces, `cell2face` and `edge2cell` (and the edges and `cell2edge`
+          in 2D) are not stored, but derived from the cells and `face2cell`.
+        The numbering of all entities is unchanged, except that the edges of a
+        3D mesh are renumbered as in `construct` if they are not kept.
+
+        The compact mode stays on when the mesh is refined; call `expand` to
+        store everything again.
+
+        Parameters:
+            ftype (dtype, optional): The float dtype of the nodes, such as
+                float32. Defaults to None, keeping the nodes.
+            keep_edges (bool, optional): Keep the edges and `cell2edge` of a 3D
+                mesh. Otherwise they are rebuilt by sorting when needed.
+                Defaults to True.
+            cache (bool, optional): Keep the derived relations in the relation
+                cache after they are built, see `clear_relation_cache`.
+                Defaults to True.
+        """
+        if not self.is_homogeneous():
+            raise RuntimeError('Can not compact a non-homogeneous mesh.')
+        relation = {name: getattr(self, name) for name in ['face2cell', 'edge', 'cell2edge']
+                    if self.TD == 3 or name == 'face2cell'}
+        self.expand()
+        for name in ['face2cell', 'edge2cell', 'cell2face', 'cell2edge']:
+            self.__dict__.pop(name, None)
+        if self.TD > 1:
+            self._entity_storage.pop(self.TD - 1, None)
+            self._entity_storage.pop(1, None)
+
+        self._compact = {'keep_edges': keep_edges, 'cache': cache}
+        self.cell = self.entity('cell')
+        for name, value in relation.items():
+            setattr(self, name, value)
+        if ftype is not None:
+            self.ftype = ftype
+            self.node = bm.astype(self.entity('node'), ftype)
+            if 'fkwargs' in self.__dict__:
+                self.fkwargs = bm.context(self.node)
+
+    def expand(self) -> None:
+        """Leave the compact mode and store all the relations again, see `compact`."""
+        if self._compact is None:
+            return
+        names = ['face', 'edge', 'face2cell', 'cell2face', 'cell2edge']
+        if self.TD == 2:
+            names.append('edge2cell')
+        relation = {name: getattr(self, name) for name in names
+                    if self.TD > 1 or name in ('face2cell', 'cell2face')}
+        self._compact = None
+        self.__dict__.pop('_face2cell_index', None)
+        self.__dict__.pop('_face2cell_local', None)
+        for name, value in relation.items():
+            setattr(self, name, value)
+
+    def is_compact(self) -> bool:
+        """Return True if the mesh is in the compact mode, see `compact`."""
+        return self._compact is not None
+
+    def storage_nbytes(self) -> int:
+        """Return the bytes of the nodes, the entities and the relations stored
+        by the mesh, without the relation cache."""
+        arrays = list(self._entity_storage.values())
+        arrays.extend(self.__dict__[name] for name in self._TOPOLOGY_ATTR + [
+                      '_face2cell_index', '_face2cell_local'] if name in self.__dict__)
+        count, visited = 0, set()
+        for a in arrays:
+            if bm.is_tensor(a) and id(a) not in visited:
+                visited.add(id(a))
+                count += a.nbytes
+        return count
+
+    def _is_derived(self, etype_dim: int) -> bool:
+        compact = self.__dict__.get('_compact', None)
+        if compact is None or self.TD == 1:
+            return False
+        if etype_dim == self.TD - 1:
+            return True
+        return etype_dim == 1 and not compact['keep_edges']
+
+    def _compact_set(self, name: str, value: Any) -> Any:
+        """Cast or pack a relation assigned in the compact mode. Returns None if
+        it is not stored."""
+        if name == 'cell':
+            NN = self.count('node')
+            NLE = max(value.shape[1], self.localEdge.shape[0], self.localFace.shape[0])
+            bound = max(NN, value.shape[0] * NLE)
+            self.itype = bm.int32 if bound < 2**31 - 1 else bm.int64
+            value = bm.astype(value, self.itype)
+            if 'ikwargs' in self.__dict__:
+                self.ikwargs = bm.context(value)
+            return value
+
+        if name == 'face2cell':
+            loc = bm.astype(value[:, 2] | (value[:, 3] << 4), bm.int8)
+            self.__dict__['_face2cell_index'] = bm.astype(value[:, :2], self.itype)
+            self.__dict__['_face2cell_local'] = loc
+            return None
+
+        if name in ('edge', 'cell2edge') and self.TD == 3 and self._compact['keep_edges']:
+            return bm.astype(value, self.itype)
+        if name in self._STORAGE_ATTR:
+            self._entity_storage.pop(estr2dim(self, name), None)
+        return None
+
+    def _compact_get(self, name: str) -> TensorLike:
+        """Derive a relation not stored in the compact mode."""
+        key = ('_compact', name)
+        value = self._relation_cache_get(key)
+        if value is not None:
+            return value
+
+        if name == 'face2cell':
+            index = self.__dict__.get('_face2cell_index', None)
+            if index is None:
+                raise AttributeError(name)
+            loc = bm.astype(self.__dict__['_face2cell_local'], self.itype)
+            value = bm.concat([index, (loc & 15)[:, None], (loc >> 4)[:, None]], axis=1)
+        elif name == 'edge2cell':
+            if self.TD != 2:
+                raise AttributeError(name)
+            return self.face2cell
+        elif name == 'cell2face' or (name == 'cell2edge' and self.TD == 2):
+            return self.cell_to_face() # cached by itself
+        elif name == 'face' or (name == 'edge' and self.TD == 2):
+            face2cell = self.face2cell
+            value = self.entity('cell')[face2cell[:, 0:1], self.localFace[face2cell[:, 2]]]
+        elif name in ('edge', 'cell2edge'):
+            NC = self.number_of_cells()
+            NEC = self.number_of_edges_of_cells()
+            totalEdge = self.total_edge()
+            i2, _, j = flocc(bm.sort(totalEdge, axis=1))
+            edge = totalEdge[i2, :]
+            cell2edge = bm.astype(j.reshape(NC, NEC), self.itype)
+            if self._compact['cache']:
+                self._relation_cache_set(('_compact', 'edge'), edge)
+                self._relation_cache_set(('_compact', 'cell2edge'), cell2edge)
+            return edge if name == 'edge' else cell2edge
+        else:
+            raise AttributeError(name)
+
+        if self._compact['cache']:
+            self._relation_cache_set(key, value)
+        return value
 
     ### properties
     def top_dimension(self) -> int: return self.TD
@@ -74,6 +303,10 @@ class MeshDS(metaclass=MeshMeta):
     ### counters
     def count(self, etype: Union[int, str]) -> int:
         """Return the number of entities of the given type."""
+        if isinstance(etype, str):
+            etype = estr2dim(self, etype)
+        if self._is_derived(etype) and etype == self.TD - 1:
+            return self.__dict__['_face2cell_index'].shape[0]
         entity = self.entity(etype)
 
         if entity is None:
@@ -119,6 +352,9 @@ class MeshDS(metaclass=MeshMeta):
         """
         if isinstance(etype, str):
             etype = estr2dim(self, etype)
+        if self._is_derived(etype):
+            entity = self._compact_get('face' if etype == self.TD - 1 else 'edge')
+            return entity if index is None else entity[index]
         return edim2entity(self.storage(), self._entity_factory, etype, index)
 
     ### topology
@@ -137,6 +373,7 @@ class MeshDS(metaclass=MeshMeta):
                                'has been constructed.')
         return self.cell2edge[index]
 
+    @cachedrelation
     def face_to_edge(self, index: Index=_S):
         assert self.TD == 3
         cell2edge = self.cell2edge
@@ -146,6 +383,7 @@ class MeshDS(metaclass=MeshMeta):
 
         return face2edge[index]
 
+    @cachedrelation
     def cell_to_face(self, index: Index=_S) -> TensorLike:
         NC = self.number_of_cells()
         NF = self.number_of_faces()
@@ -173,6 +411,7 @@ class MeshDS(metaclass=MeshMeta):
         face2cell = self.face2cell[index]
         return face2cell
 
+    @cachedrelation
     def cell_to_cell(self):
         NC = self.number_of_cells()
         face2cell = self.face2cell
@@ -182,6 +421,7 @@ class MeshDS(metaclass=MeshMeta):
         cell2cell[face2cell[:, 1], face2cell[:, 3]] = face2cell[:, 0]
         return cell2cell
     
+    @cachedrelation
     def node_to_node(self):
         NN = self.number_of_nodes()
         NE = self.number_of_edges()
@@ -191,6 +431,7 @@ class MeshDS(metaclass=MeshMeta):
         node2node = COOTensor(indice, data, spshape=(NN, NN))
         return node2node
 
+    @cachedrelation
     def node_to_edge(self):
         NN = self.number_of_nodes()
         NE = self.number_of_edges()
@@ -202,6 +443,7 @@ class MeshDS(metaclass=MeshMeta):
         node2edge = COOTensor(indice, data, spshape=(NN, NE))
         return node2edge
 
+    @cachedrelation
     def node_to_cell(self):
         NN = self.number_of_nodes()
         NC = self.number_of_cells()
@@ -213,6 +455,7 @@ class MeshDS(metaclass=MeshMeta):
         node2edge = COOTensor(indice, data, spshape=(NN, NC))
         return node2edge
     
+    @cachedrelation
     def node_to_face(self):
         NN = self.number_of_nodes()
         NF = self.number_of_faces()
@@ -225,6 +468,7 @@ class MeshDS(metaclass=MeshMeta):
         return node2edge
 
     ### boundary
+    @cachedrelation(copy=True)
     def boundary_node_flag(self) -> TensorLike:
         """Return a boolean tensor indicating the boundary nodes.
 
@@ -242,6 +486,7 @@ class MeshDS(metaclass=MeshMeta):
                 bd_node_flag[bd_face2node.ravel()] = True
         return bd_node_flag
 
+    @cachedrelation(copy=True)
     def boundary_face_flag(self) -> TensorLike:
         """Return a boolean tensor indicating the boundary faces.
 
@@ -250,6 +495,7 @@ class MeshDS(metaclass=MeshMeta):
         """
         return self.face2cell[:, 0] == self.face2cell[:, 1]
 
+    @cachedrelation(copy=True)
     def boundary_cell_flag(self) -> TensorLike:
         """Return a boolean tensor indicating the boundary cells.
 
@@ -338,3 +584,53 @@ class MeshDS(metaclass=MeshMeta):
         logger.info(f"Mesh toplogy relation constructed, with {NC} cells, {NF} "
                     f"faces, {NN} nodes "
                     f"on device ?")
+
+    def construct_by_index(self, cell2face: TensorLike, NF: int,
+                           cell2edge: Optional[TensorLike]=None,
+                           NE: Optional[int]=None):
+        """Construct the topology from a global numbering of faces (and edges
+        in 3D) that is already known, for example from the coarse mesh during
+        refinement. Faces and edges are found by direct addressing in O(N)
+        instead of sorting, see `construct`.
+
+        Parameters:
+            cell2face (TensorLike): The global face index of every local face of
+                the cells, with shape (NC, NFC). Every face in [0, NF) must be
+                shared by one or two cells.
+            NF (int): The number of faces.
+            cell2edge (TensorLike, optional): The global edge index of every local
+                edge of the cells, with shape (NC, NEC). Required in 3D.
+            NE (int, optional): The number of edges. Required in 3D.
+        """
+        if not self.is_homogeneous():
+            raise RuntimeError('Can not construct for a non-homogeneous mesh.')
+
+        NC = self.number_of_cells()
+        NFC = self.number_of_faces_of_cells()
+        i0, i1 = flocc_index(cell2face.reshape(-1), NF)
+
+        if self.TD > 1:
+            self.face = self.total_face()[i0, :]
+
+        self.cell2face = bm.astype(cell2face, self.itype)
+        self.face2cell = bm.astype(
+            bm.stack([i0//NFC, i1//NFC, i0%NFC, i1%NFC], axis=-1),
+            self.itype
+        )
+
+        if self.TD == 3:
+            if cell2edge is None:
+                raise ValueError("cell2edge and NE are required for 3-d meshes.")
+            # 一条边被多个单元共用，任取其中一个单元给出边的方向
+            index = cell2edge.reshape(-1)
+            i2 = bm.set_at(bm.full((NE,), -1, **bm.context(index)),
+                           index, bm.arange(index.shape[0], **bm.context(index)))
+            self.edge = self.total_edge()[i2, :]
+            self.cell2edge = bm.astype(cell2edge, self.itype)
+
+        elif self.TD == 2:
+            self.edge2cell = self.face2cell
+            self.cell2edge = self.cell2face
+
+        logger.info(f"Mesh toplogy relation constructed by index, with {NC} cells, "
+                    f"{NF} faces, {self.number_of_nodes()} nodes.")
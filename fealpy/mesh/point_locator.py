@@ -0,0 +1,143 @@
+from typing import Tuple
+
+from ..backend import backend_manager as bm
+from ..typing import TensorLike
+
+
+class PointLocator():
+    """Spatial index to locate points in a simplex mesh.
+
+    The bounding box of the mesh is covered by a uniform grid of buckets,
+    and every bucket lists the cells whose bounding boxes overlap it, the
+    cells overlapping it most first. A point is then tested only against the
+    cells of its bucket, one candidate for all the points at a time, until
+    the barycentric coordinates in a cell are all nonnegative. Building and
+    querying are vectorized over all the cells and the points.
+
+    The locator belongs to one geometry of the mesh. `is_valid` tells
+    whether the mesh has been changed since it was built, see
+    `SimplexMesh.location`.
+
+    Parameters:
+        node (TensorLike): The nodes, with shape (NN, GD).
+        cell (TensorLike): The simplices, with shape (NC, GD+1).
+        density (float, optional): The number of buckets per cell. More buckets
+            leave fewer candidates for a point but take more memory. Defaults to 2.0.
+    """
+    def __init__(self, node: TensorLike, cell: TensorLike, density: float=2.0) -> None:
+        NC, NVC = cell.shape
+        GD = node.shape[1]
+        if NVC != GD + 1:
+            raise ValueError("point location needs simplices of the same dimension "
+                             f"as the space, but got {NVC - 1}-simplices in {GD}D.")
+        self.node = node
+        self.cell = cell
+        self._node = bm.copy(node)
+
+        kwargs = bm.context(cell)
+        v = node[cell] # (NC, NVC, GD)
+        self.origin = v[:, 0]
+        # lambda[1:] = (x - v0) @ inv(B)，B 的行是从 v0 出发的边向量
+        self.invB = bm.linalg.inv(v[:, 1:] - v[:, :1])
+
+        cmin, cmax = bm.min(v, axis=1), bm.max(v, axis=1)
+        self.pmin, pmax = bm.min(cmin, axis=0), bm.max(cmax, axis=0)
+        extent = pmax - self.pmin
+        vol = bm.prod(bm.clip(extent, float(bm.max(extent))*1e-8, None))
+        h = max(float(vol/(density*NC))**(1/GD), 1e-300)
+        self.h = h
+        self.shape = bm.astype(bm.clip(bm.ceil(extent/h), 1, None), cell.dtype)
+
+        # 每个单元覆盖的桶：按维展开 [lo, hi] 内的所有桶，同时计算包围盒与桶的重叠比例
+        lo = self._bucket_index(cmin)
+        hi = self._bucket_index(cmax)
+        span = hi - lo + 1
+        num = bm.prod(span, axis=1)
+        cidx = bm.repeat(bm.arange(NC, **kwargs), num)
+        start = bm.cumsum(num) - num
+        local = bm.arange(cidx.shape[0], **kwargs) - start[cidx]
+        bid = bm.zeros_like(cidx)
+        overlap = bm.ones(cidx.shape[0], dtype=node.dtype)
+        for d in range(GD):
+            s = span[cidx, d]
+            k = lo[cidx, d] + local % s
+            bid = bid*self.shape[d] + k
+            b0 = self.pmin[d] + k*h
+            overlap *= bm.minimum(cmax[cidx, d], b0 + h) - bm.maximum(cmin[cidx, d], b0)
+            local = local // s
+
+        # 桶内的单元按重叠从大到小排列，包含点的单元通常排在前面
+        order = bm.lexsort([-overlap, bid])
+        self.bucket_cell = cidx[order]
+        NB = int(bm.prod(self.shape))
+        self.bucket_ptr = bm.concatenate([bm.zeros(1, **kwargs),
+                bm.cumsum(bm.bincount(bid, minlength=NB))])
+        self.bucket_ptr = bm.astype(self.bucket_ptr, cell.dtype)
+
+    def _bucket_index(self, p: TensorLike) -> TensorLike:
+        idx = bm.astype(bm.floor((p - self.pmin)/self.h), self.cell.dtype)
+        return bm.clip(idx, 0, self.shape - 1)
+
+    def is_valid(self, node: TensorLike, cell: TensorLike) -> bool:
+        """Whether the locator is built for the given nodes and cells. Nodes
+        moved in place are detected by comparing the coordinates."""
+        return (node is self.node) and (cell is self.cell) and \
+            (node.shape == self._node.shape) and bool(bm.all(node == self._node))
+
+    def barycentric(self, points: TensorLike, index: TensorLike) -> TensorLike:
+        """The barycentric coordinates of the points in the given cells."""
+        lam = bm.einsum('pi, pij -> pj', points - self.origin[index], self.invB[index])
+        return bm.concatenate([1 - bm.sum(lam, axis=1, keepdims=True), lam], axis=1)
+
+    def locate(self, points: TensorLike, tol: float=1e-12,
+               chunk: int=65536) -> Tuple[TensorLike, TensorLike]:
+        """Find the cells containing the points.
+
+        Parameters:
+            points (TensorLike): The points, with shape (NP, GD).
+            tol (float, optional): A point is in a cell if all its barycentric
+                coordinates are not less than -tol. Defaults to 1e-12.
+            chunk (int, optional): Number of points processed at a time, which
+                bounds the temporary memory. Defaults to 65536.
+
+        Returns:
+            Tuple[TensorLike, TensorLike]: The cell containing every point, -1 for
+                the points outside the mesh, and the barycentric coordinates of the
+                points in these cells, with shape (NP, GD+1), 0 outside the mesh.
+                A point on the boundary of several cells is given one of them.
+        """
+        points = points.reshape(-1, self.node.shape[1])
+        NP = points.shape[0]
+        kwargs = bm.context(self.cell)
+        cell_index = bm.full((NP, ), -1, **kwargs)
+        bcs = bm.zeros((NP, self.cell.shape[1]), dtype=points.dtype)
+
+        for s in range(0, NP, chunk):
+            p = points[s:s+chunk]
+            pidx = bm.arange(s, s + p.shape[0], **kwargs)
+            inside = bm.all((p >= self.pmin - tol*self.h) &
+                            (p <= self.pmin + self.shape*self.h + tol*self.h), axis=1)
+            p, pidx = p[inside], pidx[inside]
+
+            bidx = self._bucket_index(p)
+            bid = bm.zeros_like(pidx)
+            for d in range(p.shape[1]):
+                bid = bid*self.shape[d] + bidx[:, d]
+            first = self.bucket_ptr[bid]
+            num = self.bucket_ptr[bid + 1] - first
+
+            # 逐轮检查每个点的下一个候选单元，找到后就不再检查
+            k = 0
+            while p.shape[0] > 0:
+                flag = num > k
+                p, pidx, first, num = p[flag], pidx[flag], first[flag], num[flag]
+                cidx = self.bucket_cell[first + k]
+                lam = self.barycentric(p, cidx)
+                flag = bm.all(lam >= -tol, axis=1)
+                cell_index = bm.set_at(cell_index, pidx[flag], cidx[flag])
+                bcs = bm.set_at(bcs, pidx[flag], lam[flag])
+                flag = ~flag
+                p, pidx, first, num = p[flag], pidx[flag], first[flag], num[flag]
+                k += 1
+
+        return cell_index, bcs
@@ -3,7 +3,7 @@ from typing import Union, Optional, List, Tuple, Any, Callable
 from ..backend import backend_manager as bm
 from ..typing import TensorLike, Index, _S
 from .. import logger
-from .utils import estr2dim
+from .utils import estr2dim, cachedrelation
 
 from .mesh_base import TensorMesh
 from .plot import Plotable
@@ -191,6 +191,7 @@ class QuadrangleMesh(TensorMesh, Plotable):
     def number_of_corner_nodes(self):
         return self.number_of_nodes()
 
+    @cachedrelation
     def cell_to_ipoint(self, p: int, index: Index = _S):
         """
         @brief 获取单元上的双 p 次插值点
@@ -419,7 +420,7 @@ class QuadrangleMesh(TensorMesh, Plotable):
             edge2node = self.edge_to_node()
             cell2node = self.cell_to_node()
 
-            if returnim is True:
+            if (returnim is True) or self.is_recording_refinement():
                 shape = (NN+NE+NC,NN)
                 kargs = bm.context(node)
                 values = bm.ones(NN+2*NE+4*NC,**kargs)
@@ -433,9 +434,10 @@ class QuadrangleMesh(TensorMesh, Plotable):
                 I = bm.concatenate((i0,i1,i1,i2,i2,i2,i2))
                 J = bm.concatenate((i0,edge[:,0],edge[:,1],cell[:,0],cell[:,1],cell[:,2],cell[:,3]))
 
-                P = csr_matrix((values,(I,J)),shape)
-
-                IM.append(P)
+                P = csr_matrix((values, (I, J)), shape)
+                self._record_refinement(P)
+                if returnim is True:
+                    IM.append(P)
 
             # Find the cutted edge
             cell2edge = self.cell2edge
@@ -3,6 +3,7 @@ from math import sqrt
 from ..backend import backend_manager as bm
 from ..typing import TensorLike, Index, _S
 from .mesh_base import SimplexMesh
+from .utils import simplex_refine_pattern, cachedrelation
 from .plot import Plotable
 from fealpy.sparse import coo_matrix,csr_matrix
 
@@ -338,6 +339,7 @@ class TetrahedronMesh(SimplexMesh, Plotable):
                     node[cell,:]).reshape(-1, GD)
         return ipoints[index]
 
+    @cachedrelation
     def face_to_ipoint(self, p, index=_S):
         """
         @brief 获取网格中每个三角形面与插值点的对应关系
@@ -377,6 +379,7 @@ class TetrahedronMesh(SimplexMesh, Plotable):
 
         return face2ipoint[index]
 
+    @cachedrelation
     def cell_to_ipoint(self, p, index=_S):
         """
         @brief 获取单元与插值点的对应关系
@@ -430,7 +433,7 @@ class TetrahedronMesh(SimplexMesh, Plotable):
             isInCellIPoint = ~(isFaceIPoint[0] | isFaceIPoint[1] | isFaceIPoint[2] | isFaceIPoint[3])
             cell2ipoint[:, isInCellIPoint] = base + bm.arange(NC*idof,**self.ikwargs).reshape(NC, idof)
 
-        return cell2ipoint
+        return cell2ipoint[index]
 
     def direction(self,i):
         """
@@ -568,6 +571,23 @@ class TetrahedronMesh(SimplexMesh, Plotable):
 
         return P
 
+    def _uniform_refine_code(self):
+        """The codes of the edges and faces of the children in `uniform_refine`,
+        for the three ways to split the inner octahedron, see
+        `SimplexMesh._refine_topology`."""
+        p = lambda *k: tuple(4 + i for i in k)
+        corner = [p(0, 2, 1) + (0, ), p(0, 3, 4) + (1, ),
+                  p(1, 5, 3) + (2, ), p(2, 4, 5) + (3, )]
+        edge, face = [], []
+        for T in [(1, 3, 4, 2, 5, 0), (0, 2, 5, 3, 4, 1), (0, 4, 5, 1, 3, 2)]:
+            children = corner + [p(T[a], T[b], T[4], T[5])
+                                 for a, b in [(0, 1), (1, 2), (2, 3), (3, 0)]]
+            e, f = simplex_refine_pattern(self.localEdge, self.localFace, children)
+            edge.append(e)
+            face.append(f)
+        kwargs = bm.context(self.cell)
+        return bm.tensor(edge, **kwargs), bm.tensor(face, **kwargs)
+
     def uniform_refine(self, n=1, returnim=False):
         """
         Uniform refine the tetrahedral mesh n times.
@@ -599,7 +619,7 @@ class TetrahedronMesh(SimplexMesh, Plotable):
 
             self.node = bm.concatenate((node, newNode), axis=0)
 
-            if returnim is True:
+            if (returnim is True) or self.is_recording_refinement():
                 shape = (NN + NE, NN)
                 kargs = bm.context(node)
                 values = bm.ones(NN+2*NE, **kargs) 
@@ -611,8 +631,9 @@ class TetrahedronMesh(SimplexMesh, Plotable):
                 J = bm.concatenate((i0, edge[:, 0], edge[:, 1]))   
 
                 P = csr_matrix((values, (I, J)), shape)
-
-                IM.append(P)
+                self._record_refinement(P)
+                if returnim is True:
+                    IM.append(P)
 
             p = edge2newNode[cell2edge]
             newCell = bm.zeros((8*NC, 4), **self.ikwargs)
@@ -656,8 +677,12 @@ class TetrahedronMesh(SimplexMesh, Plotable):
             newCell = bm.set_at(newCell , (slice(7*NC , 8*NC),1) , p[bm.arange(NC), T[:, 0]])
             newCell = bm.set_at(newCell , (slice(7*NC , 8*NC),2) , p[bm.arange(NC), T[:, 4]])
             newCell = bm.set_at(newCell , (slice(7*NC , 8*NC),3) , p[bm.arange(NC), T[:, 5]])
+
+            # 新边、新面和拓扑关系直接由粗网格的拓扑得到，不需要排序
+            edge_code, face_code = self._uniform_refine_code()
+            cell2face, NF, cell2edge, NE = self._refine_topology(edge_code, face_code, idx)
             self.cell = newCell
-            self.construct()
+            self.construct_by_index(cell2face, NF, cell2edge, NE)
 
         if returnim is True:
             IM.reverse()
@@ -3,7 +3,7 @@ from ..backend import backend_manager as bm
 from ..typing import TensorLike, Index, _S
 from .. import logger
 
-from .utils import simplex_gdof, simplex_ldof
+from .utils import simplex_gdof, simplex_ldof, simplex_refine_pattern, cachedrelation
 from .mesh_base import SimplexMesh, estr2dim
 from .plot import Plotable
 from fealpy.sparse import csr_matrix
@@ -206,6 +206,7 @@ class TriangleMesh(SimplexMesh, Plotable):
 
         return bm.concatenate(ipoint_list, axis=0)[index]  # (gdof, GD)
 
+    @cachedrelation
     def cell_to_ipoint(self, p: int, index: Index=_S):
         """
         Get the map from local index to global index for interpolation points.
@@ -361,6 +362,14 @@ class TriangleMesh(SimplexMesh, Plotable):
         length = bm.sqrt(bm.square(v).sum(axis=1))
         return v/length.reshape(-1, 1)
 
+    def _uniform_refine_code(self):
+        """The codes of the edges of the children in `uniform_refine`, see
+        `SimplexMesh._refine_topology`."""
+        children = [(0, 5, 4), (5, 1, 3), (4, 3, 2), (3, 4, 5)]
+        edge, face = simplex_refine_pattern(self.localEdge, self.localFace, children)
+        kwargs = bm.context(self.cell)
+        return bm.tensor([edge], **kwargs), bm.tensor([face], **kwargs)
+
     def uniform_refine(self, n=1, surface=None, interface=None, returnim=False):
         """
         Uniform refine the triangle mesh n times.
@@ -390,7 +399,7 @@ class TriangleMesh(SimplexMesh, Plotable):
             edge2newNode = bm.arange(NN, NN + NE, **kargs)
             newNode = (node[edge[:, 0], :] + node[edge[:, 1], :]) / 2.0
             
-            if returnim is True:
+            if (returnim is True) or self.is_recording_refinement():
                 shape = (NN + NE, NN)
                 kargs = bm.context(node)
                 values = bm.ones(NN+2*NE, **kargs) 
@@ -402,15 +411,18 @@ class TriangleMesh(SimplexMesh, Plotable):
                 J = bm.concatenate((i0, edge[:, 0], edge[:, 1]))   
 
                 P = csr_matrix((values, (I, J)), shape)
-
-                IM.append(P)
+                self._record_refinement(P)
+                if returnim is True:
+                    IM.append(P)
             
             self.node = bm.concatenate((node, newNode), axis=0)
             p = bm.concatenate((cell, edge2newNode[cell2edge]), axis=1)
+            # 新边和拓扑关系直接由粗网格的拓扑得到，不需要排序
+            cell2face, NF, _, _ = self._refine_topology(*self._uniform_refine_code())
             self.cell = bm.concatenate(
                     (p[:,[0,5,4]], p[:,[5,1,3]], p[:,[4,3,2]], p[:,[3,4,5]]),
                     axis=0)
-            self.construct()
+            self.construct_by_index(cell2face, NF)
 
         if returnim is True:
             IM.reverse()
@@ -423,18 +435,6 @@ class TriangleMesh(SimplexMesh, Plotable):
         """
         pass
     
-    def location(self, points):
-        """
-        @breif  给定一组点 p , 找到这些点所在的单元
-
-        这里假设：
-
-        1. 所有点在网格内部，
-        2. 网格中没有洞
-        3. 区域还要是凸的
-        """
-        pass
-
     def circumcenter(self, index: Index=_S, returnradius=False):
         """
         @brief 计算三角形外接圆的圆心和半径
@@ -568,7 +568,7 @@ class TriangleMesh(SimplexMesh, Plotable):
         if 'data' in options:
             pass
 
-        if 'IM' in options:
+        if ('IM' in options) or self.is_recording_refinement():
             nn = len(newNode)
             IM = COOTensor( indices=bm.stack((bm.arange(NN), bm.arange(NN)), axis=0),
                             values=bm.ones(NN), 
@@ -598,11 +598,15 @@ class TriangleMesh(SimplexMesh, Plotable):
             #             edge[isCutEdge, 1]
             #         )
             #     ), shape=(NN + nn, NN))
-            options['IM'] = IM.tocsr()
+            IM = IM.tocsr()
+            self._record_refinement(IM)
+            if 'IM' in options:
+                options['IM'] = IM
 
         if 'HB' in options:
             options['HB'] = bm.arange(NC)
 
+        NE1 = NE + len(newNode)
         for k in range(2):
             idx, = bm.nonzero(edge2newNode[cell2edge0] > 0)
             nc = len(idx)
@@ -665,16 +669,23 @@ class TriangleMesh(SimplexMesh, Plotable):
             cell = bm.set_at(cell , (R, 0), p3)
             cell = bm.set_at(cell , (R, 1), p2)
             cell = bm.set_at(cell , (R, 2), p0)
-            if k == 0:
-                cell2edge0 = bm.zeros((NC + nc,), dtype=self.itype, device=self.device)
-                cell2edge0 = bm.set_at(cell2edge0 , slice(NC) , cell2edge[:, 0])
-                cell2edge0 = bm.set_at(cell2edge0 , L , cell2edge[idx, 2])
-                cell2edge0 = bm.set_at(cell2edge0 , R , cell2edge[idx, 1])
+
+            # 被二分的边 e 在 edge[e, 0] 一侧的一半仍编号为 e，另一半编号为
+            # NE + (新节点编号 - NN)，二分单元的新边依次编号在其后
+            e0, e1, e2 = cell2edge[idx, 0], cell2edge[idx, 1], cell2edge[idx, 2]
+            h1 = bm.where(p1 == edge[e0, 0], e0, NE + p3 - NN)
+            h2 = bm.where(p2 == edge[e0, 0], e0, NE + p3 - NN)
+            enew = bm.arange(NE1, NE1 + nc, dtype=self.itype, device=self.device)
+            NE1 = NE1 + nc
+            cell2edge = bm.concatenate((cell2edge, bm.zeros((nc, 3), dtype=self.itype, device=self.device)), axis=0)
+            cell2edge = bm.set_at(cell2edge, L, bm.stack((e2, h1, enew), axis=1))
+            cell2edge = bm.set_at(cell2edge, R, bm.stack((e1, enew, h2), axis=1))
+            cell2edge0 = cell2edge[:, 0]
             NC = NC + nc
 
         self.NN = self.node.shape[0]
         self.cell = cell
-        self.construct()
+        self.construct_by_index(cell2edge, NE1)
 
     def coarsen(self, isMarkedCell=None, options={}):
         """
@@ -1,6 +1,8 @@
 
-from typing import Dict, Callable, TypeVar, Tuple, Any
+from typing import Dict, Callable, TypeVar, Tuple, Any, Optional
 from math import comb
+from functools import wraps
+from inspect import signature
 
 from ..backend import backend_manager as bm
 from ..backend import TensorLike
@@ -110,6 +112,171 @@ def flocc(array: TensorLike, /):
     return i0, i1, j
 
 
+def flocc_index(index: TensorLike, size: int, /):
+    """Find the first and last occurrence of each entity, given the global index
+    of the entities in a 1D array, such as a flattened cell_to_face.
+
+    Unlike `flocc`, the entities are already numbered, so the occurrences are
+    found by direct addressing in O(N), without sorting. Every index in
+    [0, size) must occur once or twice.
+
+    Returns:
+        out (TensorLike, TensorLike):
+        - The first occurrence index of each entity.
+        - The last occurrence index of each entity.
+    """
+    kwargs = bm.context(index)
+    loc = bm.arange(index.shape[0], **kwargs)
+    a = bm.set_at(bm.full((size,), -1, **kwargs), index, loc)
+    # 出现两次的实体，上面只写入了其中一次，再写入另一次
+    other = a[index] != loc
+    b = bm.set_at(bm.copy(a), index[other], loc[other])
+    return bm.minimum(a, b), bm.maximum(a, b)
+
+
+def _quantize(points: TensorLike, bits: int) -> Tuple[TensorLike, ...]:
+    """Map the points to integer coordinates in [0, 2**bits) on each axis."""
+    pmin = bm.min(points, axis=0)
+    h = bm.max(points, axis=0) - pmin
+    h = bm.where(h > 0, h, 1.0)
+    q = bm.floor((points - pmin) / h * ((1 << bits) - 1))
+    q = bm.astype(q, bm.int64)
+    return tuple(q[:, i] for i in range(points.shape[1]))
+
+
+def _default_bits(points: TensorLike) -> int:
+    # 每个轴比均匀分布的点所需的位数多两位，且键不超过 int64
+    N, GD = points.shape
+    return max(1, min(62 // GD, (max(N, 2) - 1).bit_length() // GD + 2))
+
+
+def morton_index(points: TensorLike, bits: Optional[int]=None) -> TensorLike:
+    """The position of the points on the Morton (Z-order) curve through their
+    bounding box.
+
+    Parameters:
+        points (TensorLike): The coordinates, with shape (N, GD).
+        bits (int, optional): The bits per axis. Defaults to enough bits to
+            separate the points if they are spread evenly.
+
+    Returns:
+        TensorLike: The int64 keys, with shape (N, ). Sorting the points by the
+            keys orders them along the curve.
+    """
+    GD = points.shape[1]
+    bits = _default_bits(points) if bits is None else bits
+    x = _quantize(points, bits)
+    key = bm.zeros(points.shape[0], dtype=bm.int64, device=bm.get_device(points))
+    for j in range(bits-1, -1, -1):
+        for i in range(GD):
+            key = (key << 1) | ((x[i] >> j) & 1)
+    return key
+
+
+def hilbert_index(points: TensorLike, bits: Optional[int]=None) -> TensorLike:
+    """The position of the points on the Hilbert curve through their bounding
+    box, computed by the algorithm of Skilling (2004).
+
+    Neighbouring keys are always neighbouring points, unlike the Morton curve,
+    which jumps at the boundaries of its quadrants.
+
+    Parameters:
+        points (TensorLike): The coordinates, with shape (N, GD).
+        bits (int, optional): The bits per axis. Defaults to enough bits to
+            separate the points if they are spread evenly.
+
+    Returns:
+        TensorLike: The int64 keys, with shape (N, ).
+    """
+    GD = points.shape[1]
+    bits = _default_bits(points) if bits is None else bits
+    x = list(_quantize(points, bits))
+
+    # 逆向消去各层的旋转和翻转
+    q = 1 << (bits - 1)
+    while q > 1:
+        p = q - 1
+        for i in range(GD):
+            flag = (x[i] & q) != 0
+            t = bm.where(flag, 0, (x[0] ^ x[i]) & p)
+            x[0] = bm.where(flag, x[0] ^ p, x[0] ^ t)
+            if i > 0:
+                x[i] = x[i] ^ t
+        q >>= 1
+
+    # Gray 编码
+    for i in range(1, GD):
+        x[i] = x[i] ^ x[i-1]
+    t = bm.zeros_like(x[0])
+    q = 1 << (bits - 1)
+    while q > 1:
+        t = bm.where((x[GD-1] & q) != 0, t ^ (q - 1), t)
+        q >>= 1
+    x = [xi ^ t for xi in x]
+
+    key = bm.zeros_like(x[0])
+    for j in range(bits-1, -1, -1):
+        for i in range(GD):
+            key = (key << 1) | ((x[i] >> j) & 1)
+    return key
+
+
+def simplex_refine_pattern(local_edge, local_face, children):
+    """Classify the edges and faces of the children of a refined simplex by
+    where they lie in the parent, see `SimplexMesh._refine_topology`.
+
+    The children are given by local labels: the vertex i of the parent is
+    labelled i, and the midpoint of the local edge k is labelled NVC + k.
+    Every edge and face of a child is coded by its position in the parent, as
+    an index into a table of NEC*NVC + NFC*(NVC+1) + n entries per cell:
+    - k*NVC + i: the half of the parent edge k at the vertex i;
+    - NEC*NVC + k*(NVC+1) + i: the part of the parent face k at the vertex i,
+      i.e. the corner of the face (for faces) or the edge cutting the corner
+      off (for edges), with i = NVC for the center of the face;
+    - NEC*NVC + NFC*(NVC+1) + s: the s-th entity in the interior of the parent.
+
+    Parameters:
+        local_edge (Sequence): local edges of the parent.
+        local_face (Sequence): local faces of the parent.
+        children (Sequence): the children of the parent, in local labels.
+
+    Returns:
+        edge, face (List[List[int]]): the codes of the local edges and the
+            local faces of every child.
+    """
+    local_edge = [tuple(int(v) for v in e) for e in local_edge]
+    local_face = [tuple(int(v) for v in f) for f in local_face]
+    NVC = len(children[0])
+    NEC, NFC = len(local_edge), len(local_face)
+    full = (1 << NVC) - 1
+    edge_mask = [(1 << a) | (1 << b) for a, b in local_edge]
+    mask = [1 << i for i in range(NVC)] + edge_mask
+    face_mask = [sum(1 << v for v in f) for f in local_face]
+    interior = ({}, {})
+
+    def code(labels, slots):
+        m = [mask[l] for l in labels]
+        carrier = 0
+        for v in m:
+            carrier |= v
+        vertex = [l for l in labels if l < NVC]
+        if carrier == full:
+            s = slots.setdefault(frozenset(labels), len(slots))
+            return NEC*NVC + NFC*(NVC+1) + s
+        if carrier in edge_mask:
+            return edge_mask.index(carrier)*NVC + vertex[0]
+        k = face_mask.index(carrier)
+        if len(labels) == 2: # 面上的边，用它截去的角点编号
+            i = (m[0] & m[1]).bit_length() - 1
+        else:
+            i = vertex[0] if len(vertex) > 0 else NVC
+        return NEC*NVC + k*(NVC+1) + i
+
+    edge = [[code([c[a], c[b]], interior[0]) for a, b in local_edge] for c in children]
+    face = [[code([c[v] for v in f], interior[1]) for f in local_face] for c in children]
+    return edge, face
+
+
 # NOTE: this meta class is used to register the entity factory method.
 # The entity factory methods can works in Structured meshes such as
 # UniformMesh2d to construct entities like `cell`.
@@ -155,6 +322,52 @@ def entitymethod(top_dim: int):
     return decorator
 
 
+def cachedrelation(meth: Optional[_Meth]=None, *, copy: bool=False):
+    """A decorator memoizing a topological relation of the mesh, such as
+    `cell_to_cell` or `cell_to_ipoint(p)`, in the relation cache of `MeshDS`.
+
+    The result is computed for all entities and cached for each value of the
+    other arguments; an `index` argument is applied to the cached result. The
+    cache is dropped when the nodes or the topology of the mesh are assigned,
+    see `MeshDS.relation_cache_info`.
+
+    Parameters:
+        copy (bool, optional): Return a copy of the cached result, for results
+            often modified in place by the callers, like the boundary flags.
+            Defaults to False.
+    """
+    def decorator(meth: _Meth) -> _Meth:
+        sig = signature(meth)
+        has_index = 'index' in sig.parameters
+
+        @wraps(meth)
+        def wrapper(self, *args, **kwargs):
+            bound = sig.bind(self, *args, **kwargs)
+            index = bound.arguments.pop('index', None) if has_index else None
+            key = (meth.__name__, ) + tuple(bound.arguments.items())[1:]
+            try:
+                hash(key)
+            except TypeError:
+                return meth(self, *args, **kwargs)
+
+            value = self._relation_cache_get(key)
+            if value is None:
+                bound.arguments.pop('self')
+                value = meth(self, **bound.arguments)
+                self._relation_cache_set(key, value)
+            if copy:
+                value = bm.copy(value)
+            if index is None:
+                return value
+            return value[index]
+
+        return wrapper
+
+    if meth is None:
+        return decorator
+    return decorator(meth)
+
+
 def simplex_ldof(p: int, iptype: int) -> int:
     """Number of local dofs in a simplex entity."""
     if iptype == 0:
@@ -1,13 +1,51 @@
+from typing import Callable, Optional, Tuple
+
+from ..backend import TensorLike
 
 
 class LinearOperator:
+    """A linear operator defined by its action.
+
+    Parameters:
+        shape (Tuple[int, int]): Shape of the operator.
+        matvec (Callable): Action of the operator on a vector shaped (N,),
+            or on a block of vectors shaped (N, K).
+        rmatvec (Callable, optional): Action of the transposed operator.
+            Defaults to None.
+        dtype (dtype, optional): Scalar type of the operator. Defaults to None.
+    """
+    def __init__(self, shape: Tuple[int, int], matvec: Callable[[TensorLike], TensorLike],
+                 rmatvec: Optional[Callable[[TensorLike], TensorLike]] = None,
+                 dtype=None):
+        self.shape = tuple(shape)
+        self.dtype = dtype
+        self._matvec_impl = matvec
+        self._rmatvec_impl = rmatvec
+
+    def __repr__(self) -> str:
+        return f"LinearOperator(shape={self.shape}, dtype={self.dtype})"
+
+    @property
+    def ndim(self) -> int:
+        return 2
+
+    def matvec(self, x: TensorLike) -> TensorLike:
+        return self._matvec_impl(x)
 
-    def __init__(self, shape, matvec):
-        self.__matvec_impl = matvec
+    def rmatvec(self, x: TensorLike) -> TensorLike:
+        if self._rmatvec_impl is None:
+            raise NotImplementedError("rmatvec is not defined for this operator.")
+        return self._rmatvec_impl(x)
 
+    @property
+    def T(self) -> 'LinearOperator':
+        if self._rmatvec_impl is None:
+            raise NotImplementedError("rmatvec is not defined for this operator.")
+        shape = (self.shape[1], self.shape[0])
+        return LinearOperator(shape, self._rmatvec_impl, self._matvec_impl, self.dtype)
 
     def _matvec(self, x):
-        return self.__matvec_impl(x)
+        return self.matvec(x)
 
     def __matmul__(self, x):
-        return self.__matvec_impl(x)
\ No newline at end of file
+        return self.matvec(x)
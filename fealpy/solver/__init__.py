@@ -11,4 +11,6 @@ from .lgmres import lgmres
 from .direct_solver_manger import DirectSolverManager
 from .iterative_solver_manger import IterativeSolverManager
 from .bicgstab import bicgstab
-from .bicg import bicg
\ No newline at end of file
+from .bicg import bicg
+from .ilu import ILU0, IC0, ILUT
+from .recycling import gcrodr, deflated_cg, SolverSession
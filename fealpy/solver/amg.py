@@ -1,4 +1,6 @@
 from .amg_core import classical_strength_of_connection, rs_cf_splitting,rs_direct_interpolation
+from .amg_core import signed_strength_of_connection, pmis_cf_splitting, rs_standard_interpolation
+from .amg_core import nodal_strength_of_connection, standard_aggregation, fit_candidates, smooth_prolongation
 from ..sparse import csr_matrix
 from ..backend import backend_manager as bm
 
@@ -14,6 +16,62 @@ def ruge_stuben_amg(A,theta = 0.25):
     p,r = rs_direct_interpolation(Ap, Aj, Ax,Sp, Sj, Sx, splitting)
     return p,r
 
+def pmis_amg(A, theta=0.25, itype='S', seed=0):
+    """
+    One level of classical AMG built only from array operations: signed
+    strength of connection, PMIS C/F splitting, and standard ('S') or direct
+    ('D') interpolation.
+
+    Parameters:
+        A (CSRTensor): the matrix.
+        theta (float): strength threshold. Defaults to 0.25.
+        itype (str): interpolation, 'S' for standard and 'D' for direct. Defaults to 'S'.
+        seed (int, optional): seed of the PMIS weights. Defaults to 0.
+
+    Returns:
+        p (CSRTensor), r (CSRTensor): prolongation and restriction.
+    """
+    n_row = A.shape[0]
+    Ap, Aj, Ax = A.indptr, A.indices, A.data
+    Sp, Sj, Sx = signed_strength_of_connection(Ap, Aj, Ax, n_row, theta)
+    S = csr_matrix((Sx, Sj, Sp), shape=(n_row, n_row))
+    T = S.T
+    splitting = pmis_cf_splitting(Sp, Sj, T.indptr, T.indices, n_row, seed=seed)
+    if itype == 'D':
+        p, r = rs_direct_interpolation(Ap, Aj, Ax, Sp, Sj, Sx, splitting)
+    else:
+        p, r = rs_standard_interpolation(Ap, Aj, Ax, Sp, Sj, Sx, splitting)
+    return p, r
+
+def smoothed_aggregation_amg(A, B, dof_node, theta=0.0, omega=4.0/3.0, seed=0):
+    """
+    One level of smoothed aggregation AMG: nodal strength of connection,
+    aggregation of the nodes, tentative prolongation fitting the
+    near-nullspace candidates B, and its damped Jacobi smoothing.
+
+    Parameters:
+        A (CSRTensor): the matrix.
+        B (TensorLike): the near-nullspace candidates, with shape (n, K).
+        dof_node (TensorLike): the node of each dof, all the dofs of a node
+            go to the same aggregate.
+        theta (float): strength threshold. Defaults to 0.0.
+        omega (float): damping factor of the prolongation smoother. Defaults to 4/3.
+        seed (int, optional): seed of the aggregation weights and of the
+            spectral radius estimate. Defaults to 0.
+
+    Returns:
+        p (CSRTensor), r (CSRTensor): prolongation and restriction.
+        Bc (TensorLike): the candidates on the coarse level.
+        cnode (TensorLike): the node (aggregate) of each coarse dof.
+    """
+    n_node = int(bm.max(dof_node)) + 1
+    Sp, Sj, Sx = nodal_strength_of_connection(A, dof_node, n_node, theta)
+    agg = standard_aggregation(Sp, Sj, n_node, seed=seed)
+    T, Bc, cnode = fit_candidates(agg[dof_node], B)
+    p = smooth_prolongation(A, T, omega=omega, seed=seed)
+    r = p.T.tocsr()
+    return p, r, Bc, cnode
+
 # def ruge_stuben_coarse(A,theta = 0.025):
 #     isC,Am = ruge_stuben_chen_coarsen(A,theta)
 #     p,r = two_points_interpolation(A,isC)
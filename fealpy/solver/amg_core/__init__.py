@@ -1,3 +1,18 @@
-from .amg_connection import classical_strength_of_connection
-from .amg_interpolation import rs_direct_interpolation
-from .amg_splitting import rs_cf_splitting
\ No newline at end of file
+from .amg_connection import classical_strength_of_connection, signed_strength_of_connection
+from .amg_interpolation import rs_direct_interpolation, rs_standard_interpolation
+from .amg_splitting import rs_cf_splitting, pmis_cf_splitting
+from .amg_aggregation import (
+    rigid_body_modes,
+    nodal_strength_of_connection,
+    standard_aggregation,
+    fit_candidates,
+    smooth_prolongation
+)
+from .amg_relaxation import (
+    approximate_spectral_radius,
+    multicolor,
+    GaussSeidelSmoother,
+    L1JacobiSmoother,
+    ChebyshevSmoother,
+    MulticolorGaussSeidelSmoother
+)
@@ -0,0 +1,211 @@
+import numpy as np
+
+from fealpy.backend import backend_manager as bm
+from fealpy.sparse import coo_matrix, csr_matrix
+
+from .amg_connection import symmetric_strength_of_connection
+from .amg_relaxation import diagonal, _safe_inverse, approximate_spectral_radius
+
+
+def rigid_body_modes(node):
+    """
+    Rigid body modes of a body with the given nodes, the near-nullspace of
+    linear elasticity. The dofs are ordered node by node, i.e. the dof of the
+    component c at the node i is i*GD + c, as in a `TensorFunctionSpace` with
+    shape (-1, GD).
+
+    Parameters:
+        node (TensorLike): the nodes, with shape (NN, GD), GD = 1, 2 or 3.
+
+    Returns:
+        TensorLike: the modes, with shape (NN*GD, K), where K = 1, 3 or 6 is
+            the number of translations and rotations.
+    """
+    NN, GD = node.shape
+    x = node - bm.mean(node, axis=0) # 以形心为原点，改善条件数
+    one = bm.ones(NN, dtype=node.dtype)
+    zero = bm.zeros(NN, dtype=node.dtype)
+    if GD == 1:
+        B = [[one]]
+    elif GD == 2:
+        B = [[one, zero], [zero, one], [-x[:, 1], x[:, 0]]]
+    elif GD == 3:
+        B = [[one, zero, zero], [zero, one, zero], [zero, zero, one],
+             [zero, -x[:, 2], x[:, 1]],
+             [x[:, 2], zero, -x[:, 0]],
+             [-x[:, 1], x[:, 0], zero]]
+    else:
+        raise ValueError(f"unsupported geometric dimension {GD}")
+    B = bm.stack([bm.stack(b, axis=1) for b in B], axis=-1) # (NN, GD, K)
+    return B.reshape(NN*GD, -1)
+
+
+def nodal_strength_of_connection(A, dof_node, n_node, theta=0.0):
+    """
+    Symmetric strength of connection between the nodes of a system with
+    several dofs per node. The matrix is first collapsed to the nodes, with
+    the Frobenius norm of each nodal block as the entry, and then the SA
+    criterion |a_ij| >= theta * sqrt(|a_ii| |a_jj|) is applied.
+
+    Parameters:
+        A (CSRTensor): the matrix.
+        dof_node (TensorLike): the node of each dof.
+        n_node (int): number of nodes.
+        theta (float): threshold parameter. Defaults to 0.0.
+
+    Returns:
+        Sp, Sj, Sx (TensorLike): CSR arrays of the strength matrix of the
+            nodes, with the diagonal.
+    """
+    Ap, Aj, Ax = A.indptr, A.indices, A.data
+    row = bm.repeat(bm.arange(A.shape[0]), Ap[1:] - Ap[:-1])
+    C = coo_matrix((Ax**2, (dof_node[row], dof_node[Aj])),
+                   shape=(n_node, n_node)).coalesce()
+    (crow, ccol), cval = C.indices, bm.sqrt(C.values)
+    Cp = bm.concatenate(([0], bm.cumsum(bm.bincount(crow, minlength=n_node))))
+    return symmetric_strength_of_connection(Cp, ccol, cval, n_node, theta)
+
+
+def standard_aggregation(Sp, Sj, n_nodes, seed=0):
+    """
+    Aggregation of the nodes built only from array operations.
+
+    The roots of the aggregates form a distance-2 maximal independent set of
+    the strength graph, which is found in passes like PMIS: in each pass the
+    undecided nodes with the largest random weight within distance 2 become
+    roots, and an aggregate is a root with all its neighbours. A node is
+    undecided if neither it nor a neighbour is aggregated. The nodes left
+    over join an aggregate of a neighbour. Isolated nodes are not aggregated.
+
+    Parameters:
+        Sp, Sj (TensorLike): CSR arrays of the strength matrix S.
+        n_nodes (int): number of nodes.
+        seed (int, optional): seed of the random weights, None for a fresh
+            random state. Defaults to 0, so the aggregation is reproducible.
+
+    Returns:
+        TensorLike: the aggregate of each node, -1 for isolated nodes.
+    """
+    srow = bm.repeat(bm.arange(n_nodes), Sp[1:] - Sp[:-1])
+    flag = srow != Sj
+    # 对称化的强连接图，不含对角
+    gi = bm.concatenate((srow[flag], Sj[flag]))
+    gj = bm.concatenate((Sj[flag], srow[flag]))
+    degree = bm.bincount(gi, minlength=n_nodes)
+    weight = degree + bm.from_numpy(np.random.default_rng(seed).random(n_nodes))
+
+    agg = bm.full(n_nodes, -1, dtype=Sj.dtype)
+    n_agg = 0
+    while True:
+        isagg = agg >= 0
+        near = bm.zeros(n_nodes, dtype=bool)
+        near[gi[isagg[gj]]] = True
+        isU = (degree > 0) & ~isagg & ~near
+        if not bm.any(isU):
+            break
+
+        # 距离 2 以内未定点中权重最大的点成为根
+        w = bm.where(isU, weight, -1.0)
+        m1 = bm.copy(w)
+        bm.maximum.at(m1, gi, w[gj])
+        m2 = bm.copy(m1)
+        bm.maximum.at(m2, gi, m1[gj])
+        isroot = isU & (w == m2)
+
+        roots = bm.nonzero(isroot)[0]
+        agg[roots] = n_agg + bm.arange(len(roots), dtype=agg.dtype)
+        n_agg += len(roots)
+        # 根的邻居加入根所在的聚集
+        flag = isroot[gj] & (agg[gi] < 0)
+        agg[gi[flag]] = agg[gj[flag]]
+
+    # 剩余的点加入邻居所在的聚集
+    while True:
+        flag = (agg[gi] < 0) & (agg[gj] >= 0)
+        if not bm.any(flag):
+            break
+        agg[gi[flag]] = agg[gj[flag]]
+
+    return agg
+
+
+def fit_candidates(agg, B, tol=1e-10):
+    """
+    Tentative prolongation of smoothed aggregation, which interpolates the
+    near-nullspace candidates B exactly. On each aggregate the rows of B are
+    orthonormalized, B_a = Q_a R_a, by Gram-Schmidt done for all the
+    aggregates at once; Q is the tentative prolongation and R stacks the
+    candidates of the coarse level. Columns of Q on which the candidates are
+    linearly dependent are dropped.
+
+    Parameters:
+        agg (TensorLike): the aggregate of each dof, -1 for no aggregate.
+        B (TensorLike): the candidates, with shape (n, K).
+        tol (float): relative tolerance to drop dependent columns.
+
+    Returns:
+        T (CSRTensor): the tentative prolongation, with shape (n, nc).
+        Bc (TensorLike): the coarse candidates, with shape (nc, K).
+        cagg (TensorLike): the aggregate of each coarse dof.
+    """
+    n, K = B.shape
+    idx = bm.nonzero(agg >= 0)[0]
+    a = agg[idx]
+    Bf = B[idx]
+    n_agg = int(bm.max(a)) + 1 if len(a) > 0 else 0
+
+    Q = bm.zeros(Bf.shape, dtype=B.dtype)
+    R = bm.zeros((n_agg, K, K), dtype=B.dtype)
+    keep = bm.zeros((n_agg, K), dtype=bool)
+    for k in range(K):
+        v = bm.copy(Bf[:, k])
+        nrm0 = bm.sqrt(bm.bincount(a, weights=v*v, minlength=n_agg))
+        for j in range(k):
+            d = bm.bincount(a, weights=Q[:, j]*v, minlength=n_agg)
+            R[:, j, k] = d
+            v -= d[a]*Q[:, j]
+        nrm = bm.sqrt(bm.bincount(a, weights=v*v, minlength=n_agg))
+        keep[:, k] = nrm > tol*nrm0
+        R[:, k, k] = bm.where(keep[:, k], nrm, 0.0)
+        Q[:, k] = v*bm.where(keep[:, k], 1/bm.where(keep[:, k], nrm, 1.0), 0.0)[a]
+
+    # 去掉线性相关的列，粗自由度按聚集排列
+    cidx = bm.full((n_agg, K), -1, dtype=agg.dtype)
+    nc = int(bm.sum(keep))
+    cidx[keep] = bm.arange(nc, dtype=agg.dtype)
+    cagg = bm.repeat(bm.arange(n_agg, dtype=agg.dtype), bm.sum(keep, axis=1))
+    Bc = R[keep] # R[a, j, :] 是粗自由度 (a, j) 上的候选向量
+
+    col = cidx[a]
+    flag = keep[a]
+    T = csr_matrix((Q[flag], (bm.broadcast_to(idx[:, None], Q.shape)[flag], col[flag])),
+                   shape=(n, nc))
+    return T, Bc, cagg
+
+
+def smooth_prolongation(A, T, omega=4.0/3.0, maxit=10, seed=0):
+    """
+    Damped Jacobi smoothing of the tentative prolongation,
+
+        P = (I - omega / rho * D^{-1} A) T,
+
+    where rho is the spectral radius of D^{-1} A estimated by Lanczos.
+
+    Parameters:
+        A (CSRTensor): the matrix.
+        T (CSRTensor): the tentative prolongation.
+        omega (float): the damping factor. Defaults to 4/3.
+        maxit (int): number of Lanczos steps. Defaults to 10.
+        seed (int, optional): seed of the Lanczos start vector. Defaults to 0.
+
+    Returns:
+        CSRTensor: the smoothed prolongation.
+    """
+    n = A.shape[0]
+    Ap, Aj, Ax = A.indptr, A.indices, A.data
+    row = bm.repeat(bm.arange(n), Ap[1:] - Ap[:-1])
+    dinv = _safe_inverse(diagonal(A))
+    rho = approximate_spectral_radius(A, dinv, maxit=maxit, seed=seed)
+
+    DA = csr_matrix(((omega/rho)*dinv[row]*Ax, Aj, Ap), shape=A.shape)
+    return T.add(DA @ T, alpha=-1).tocoo().coalesce().tocsr()
@@ -91,4 +91,42 @@ def symmetric_strength_of_connection( Ap, Aj, Ax,n_row, theta = 0.25):
     Sp_new = bm.concatenate(([0], bm.cumsum(row_counts)))
     
     
-    return Sp_new, Sj_new, Sx_new
\ No newline at end of file
+    return Sp_new, Sj_new, Sx_new
+
+
+def signed_strength_of_connection(Ap, Aj, Ax, n_row, theta=0.25):
+    """
+    Classical (signed) strength of connection, fully vectorized.
+
+    The off-diagonal entry A[i, j] is a strong connection if
+
+        -A[i, j] >= theta * max_{k != i} (-A[i, k]),
+
+    so only negative couplings can be strong. The diagonal is not stored in S.
+
+    Parameters:
+        Ap, Aj, Ax (TensorLike): CSR arrays of the matrix A.
+        n_row (int): number of rows of A.
+        theta (float): threshold parameter in (0, 1]. Defaults to 0.25.
+
+    Returns:
+        Sp, Sj, Sx (TensorLike): CSR arrays of S, Sx holds the values of A.
+    """
+    row_inds = bm.repeat(bm.arange(n_row), Ap[1:] - Ap[:-1])
+    is_offdiag = (Aj != row_inds)
+    neg = bm.where(is_offdiag, -Ax, 0)
+
+    # 按行求最大值，空行不参与 reduceat
+    max_neg = bm.zeros(n_row, dtype=Ax.dtype)
+    nonempty = Ap[1:] > Ap[:-1]
+    if bm.any(nonempty):
+        max_neg[nonempty] = bm.maximum.reduceat(neg, Ap[:-1][nonempty])
+
+    keep = is_offdiag & (neg > 0) & (neg >= theta * max_neg[row_inds])
+
+    Sj_new = Aj[keep]
+    Sx_new = Ax[keep]
+    row_counts = bm.bincount(row_inds[keep], minlength=n_row)
+    Sp_new = bm.concatenate(([0], bm.cumsum(row_counts)))
+
+    return Sp_new, Sj_new, Sx_new
@@ -3,59 +3,129 @@ from fealpy.sparse.ops import spdiags
 from fealpy.sparse import csr_matrix
 
 def rs_direct_interpolation(Ap, Aj, Ax, Sp, Sj, Sx, splitting):
+    """
+    Classical direct interpolation: an F node interpolates from its strong C
+    neighbours, with the weights of the positive and negative couplings scaled
+    separately to keep the row sums.
+
+    Parameters:
+        Ap, Aj, Ax (TensorLike): CSR arrays of the matrix A.
+        Sp, Sj, Sx (TensorLike): CSR arrays of the strength matrix S, Sx holds the values of A.
+        splitting (TensorLike): the C/F splitting, nonzero for C nodes.
+
+    Returns:
+        P (CSRTensor), R (CSRTensor): the prolongation and its transpose.
+    """
+    n_nodes = len(splitting)
+    row = bm.repeat(bm.arange(n_nodes), Ap[1:] - Ap[:-1])
+    srow = bm.repeat(bm.arange(n_nodes), Sp[1:] - Sp[:-1])
+    return _direct_interpolation(row, Aj, Ax, srow, Sj, Sx, splitting)
+
+
+def rs_standard_interpolation(Ap, Aj, Ax, Sp, Sj, Sx, splitting, trunc=0.2):
+    """
+    Classical standard interpolation. Each F node i first eliminates its
+    strong F neighbours k with their equations,
 
+        A_hat[i, :] = A[i, :] - sum_k A[i, k] / A[k, k] * A[k, :],
+
+    then interpolates directly from the C nodes strongly connected to i or to
+    one of these k. Unlike direct interpolation, it stays accurate with
+    splittings where F nodes may have few C neighbours, such as PMIS.
+
+    Parameters:
+        Ap, Aj, Ax (TensorLike): CSR arrays of the matrix A.
+        Sp, Sj, Sx (TensorLike): CSR arrays of the strength matrix S, Sx holds the values of A.
+        splitting (TensorLike): the C/F splitting, nonzero for C nodes.
+
+    Returns:
+        P (CSRTensor), R (CSRTensor): the prolongation and its transpose.
+    """
+    n_nodes = len(splitting)
+    isC = splitting != 0
+    shape = (n_nodes, n_nodes)
+    row = bm.repeat(bm.arange(n_nodes), Ap[1:] - Ap[:-1])
+    srow = bm.repeat(bm.arange(n_nodes), Sp[1:] - Sp[:-1])
+
+    diag_flag = (Aj == row)
+    diag = bm.bincount(row[diag_flag], weights=Ax[diag_flag], minlength=n_nodes)
+
+    # Z[i, k] = A[i, k] / A[k, k] for F nodes i and their strong F neighbours k
+    flag = ~isC[srow] & ~isC[Sj] & (Sj != srow)
+    zi, zk = srow[flag], Sj[flag]
+    Z = csr_matrix((Sx[flag] / diag[zk], (zi, zk)), shape=shape)
+    A = csr_matrix((Ax, Aj, Ap), shape=shape)
+    Ahat = A.add(Z @ A, alpha=-1).tocoo().coalesce()
+    (hrow, hcol), hval = Ahat.indices, Ahat.values
+    keys = hrow * n_nodes + hcol
+
+    # 插值点集：i 的强 C 邻点，以及 i 的强 F 邻点的强 C 邻点
+    flag = isC[Sj]
+    SC = csr_matrix((bm.ones_like(Sx[flag]), (srow[flag], Sj[flag])), shape=shape)
+    ZSC = csr_matrix((bm.abs(Z.values), Z.col, Z.crow), shape=shape) @ SC
+    M = SC.add(ZSC).tocoo().coalesce()
+    # 合并后的键是有序且唯一的，用二分查找判断 A_hat 的元素是否在插值点集中
+    strong_keys = M.indices[0] * n_nodes + M.indices[1]
+    loc = bm.searchsorted(strong_keys, keys)
+    loc = bm.where(loc < len(strong_keys), loc, 0)
+    strong = (strong_keys[loc] == keys) if len(strong_keys) > 0 else (keys < 0)
+
+    return _direct_interpolation(hrow, hcol, hval, hrow[strong], hcol[strong],
+                                 hval[strong], splitting, trunc=trunc)
+
+
+def _direct_interpolation(row, col, val, srow, scol, sval, splitting, trunc=0.0):
+    """
+    Direct interpolation weights of the matrix given by (row, col, val), from
+    the strong entries (srow, scol, sval), in one pass over the entries.
+    """
     n_nodes = len(splitting)
-    row_indices = bm.repeat(bm.arange(n_nodes), Sp[1:] - Sp[:-1])     # 2. 判断每个邻接记录是否满足条件：对应的 Sj 是 C 点，且不等于自身
-    valid = splitting[Sj] & (Sj != row_indices)  # 3. 对每个行号统计符合条件的邻接记录个数
-    neighbor_counts = bm.bincount(row_indices, weights=valid.astype(int), minlength=n_nodes)   # 4. 对于 C 点固定计数为 1，F 点使用统计到的邻接记录个数
-    counts = bm.where(splitting, 1, neighbor_counts)     # 5. 构造 P 的行指针（CSR格式），首元素为 0，后续为累计和
-    Pp = bm.concatenate(([0], bm.cumsum(counts).astype(int)))   # 计算 P 的列索引 (Pj) 和数值 (Px)
-    Pj = bm.zeros(Pp[-1], dtype=int)
-    Px = bm.zeros(Pp[-1], dtype=float)
-
-    for i in range(n_nodes):
-        if splitting[i] == True:
-            Pj[Pp[i]] = i
-            Px[Pp[i]] = 1.0  # C 点直接映射到自身
-        else:      # 计算 F 点插值的权重
-            sum_strong_pos, sum_strong_neg = 0, 0
-            for jj in range(Sp[i], Sp[i+1]):
-                if splitting[Sj[jj]] == True and Sj[jj] != i:
-                    if Sx[jj] < 0:
-                        sum_strong_neg += Sx[jj]
-                    else:
-                        sum_strong_pos += Sx[jj]
-
-            sum_all_pos, sum_all_neg, diag = 0, 0, 0
-            for jj in range(Ap[i], Ap[i+1]):
-                if Aj[jj] == i:
-                    diag += Ax[jj]
-                else:
-                    if Ax[jj] < 0:
-                        sum_all_neg += Ax[jj]
-                    else:
-                        sum_all_pos += Ax[jj]
-
-            alpha = sum_all_neg / sum_strong_neg if sum_strong_neg != 0 else 0
-            beta = sum_all_pos / sum_strong_pos if sum_strong_pos != 0 else 0
-
-            if sum_strong_pos == 0:
-                diag += sum_all_pos
-                beta = 0
-
-            neg_coeff = -alpha / diag if diag != 0 else 0
-            pos_coeff = -beta / diag if diag != 0 else 0         # 计算 P 的插值系数
-            nnz_index = Pp[i]
-            for jj in range(Sp[i], Sp[i+1]):
-                if splitting[Sj[jj]] == True and Sj[jj] != i:
-                    Pj[nnz_index] = Sj[jj]
-                    Px[nnz_index] = neg_coeff * Sx[jj] if Sx[jj] < 0 else pos_coeff * Sx[jj]
-                    nnz_index += 1
-
-    coarse_map = bm.cumsum(splitting) - 1  # 计算 C 点编号映射
-    Pj[:] = coarse_map[Pj[:]]
-    n_coarse = bm.sum(splitting)  # C 点个数
-    p = csr_matrix((Px, Pj, Pp), shape=(n_nodes, n_coarse))
+    isC = splitting != 0
+
+    offdiag = (col != row)
+    diag = bm.bincount(row[~offdiag], weights=val[~offdiag], minlength=n_nodes)
+    flag = offdiag & (val < 0)
+    sum_all_neg = bm.bincount(row[flag], weights=val[flag], minlength=n_nodes)
+    flag = offdiag & (val > 0)
+    sum_all_pos = bm.bincount(row[flag], weights=val[flag], minlength=n_nodes)
+
+    # F 点到 C 点的强连接
+    flag = ~isC[srow] & isC[scol] & (scol != srow)
+    srow, scol, sval = srow[flag], scol[flag], sval[flag]
+    is_neg = sval < 0
+    sum_strong_neg = bm.bincount(srow[is_neg], weights=sval[is_neg], minlength=n_nodes)
+    sum_strong_pos = bm.bincount(srow[~is_neg], weights=sval[~is_neg], minlength=n_nodes)
+
+    has_neg = sum_strong_neg != 0
+    has_pos = sum_strong_pos != 0
+    alpha = bm.where(has_neg, sum_all_neg / bm.where(has_neg, sum_strong_neg, 1), 0)
+    beta = bm.where(has_pos, sum_all_pos / bm.where(has_pos, sum_strong_pos, 1), 0)
+    # 没有正的强连接时，正的连接加到对角上
+    diag = bm.where(has_pos, diag, diag + sum_all_pos)
+
+    has_diag = diag != 0
+    diag = bm.where(has_diag, diag, 1)
+    neg_coeff = bm.where(has_diag, -alpha / diag, 0)
+    pos_coeff = bm.where(has_diag, -beta / diag, 0)
+    weight = bm.where(is_neg, neg_coeff[srow], pos_coeff[srow]) * sval
+
+    if trunc > 0:
+        # 去掉相对较小的插值权重，并按行缩放保持行和不变
+        wmax = bm.zeros(n_nodes, dtype=weight.dtype)
+        bm.maximum.at(wmax, srow, bm.abs(weight))
+        flag = bm.abs(weight) >= trunc * wmax[srow]
+        total = bm.bincount(srow, weights=weight, minlength=n_nodes)
+        kept = bm.bincount(srow[flag], weights=weight[flag], minlength=n_nodes)
+        scale = bm.where(kept != 0, total / bm.where(kept != 0, kept, 1), 1)
+        srow, scol, weight = srow[flag], scol[flag], weight[flag] * scale[srow[flag]]
+
+    coarse_map = bm.cumsum(isC) - 1  # 计算 C 点编号映射
+    n_coarse = int(bm.sum(isC))  # C 点个数
+    cnode = bm.nonzero(isC)[0]
+    I = bm.concatenate((cnode, srow))
+    J = bm.concatenate((coarse_map[cnode], coarse_map[scol]))
+    V = bm.concatenate((bm.ones(n_coarse, dtype=weight.dtype), weight))
+    p = csr_matrix((V, (I, J)), shape=(n_nodes, n_coarse))
     r = p.T
     return p, r
 
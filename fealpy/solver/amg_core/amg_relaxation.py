@@ -0,0 +1,246 @@
+import numpy as np
+from scipy.sparse.linalg import splu
+
+from fealpy.backend import backend_manager as bm
+from fealpy.sparse import csr_matrix
+
+
+def diagonal(A):
+    """
+    The diagonal of the CSR matrix A.
+    """
+    n = A.shape[0]
+    Ap, Aj, Ax = A.indptr, A.indices, A.data
+    row = bm.repeat(bm.arange(n), Ap[1:] - Ap[:-1])
+    flag = row == Aj
+    return bm.bincount(row[flag], weights=Ax[flag], minlength=n)
+
+
+def _safe_inverse(d):
+    flag = d != 0
+    return bm.where(flag, 1/bm.where(flag, d, 1.0), 0.0)
+
+
+def approximate_spectral_radius(A, dinv=None, maxit=10, seed=0):
+    """
+    Estimate the largest eigenvalue of D^{-1} A for a symmetric positive
+    definite A by a few Lanczos steps on D^{-1/2} A D^{-1/2}. The largest Ritz
+    value converges from below and is accurate to a few percent after about
+    ten steps.
+
+    Parameters:
+        A (CSRTensor): the matrix.
+        dinv (TensorLike, optional): the inverse of the diagonal scaling D,
+            defaults to no scaling.
+        maxit (int): number of Lanczos steps. Defaults to 10.
+        seed (int, optional): seed of the random start vector, None for a
+            fresh random state. Defaults to 0, so the estimate is reproducible.
+
+    Returns:
+        float: the estimate of the spectral radius.
+    """
+    n = A.shape[0]
+    s = bm.ones(n, dtype=A.data.dtype) if dinv is None else bm.sqrt(bm.abs(dinv))
+    v = bm.from_numpy(np.random.default_rng(seed).random(n))
+    v /= bm.linalg.norm(v)
+    v0 = bm.zeros_like(v)
+    beta = 0.0
+    alpha, betas = [], []
+    for _ in range(min(maxit, n)):
+        w = s*(A @ (s*v)) - beta*v0
+        a = bm.dot(w, v)
+        w -= a*v
+        alpha.append(a)
+        beta = bm.linalg.norm(w)
+        if beta <= 1e-12*abs(a):
+            break
+        betas.append(beta)
+        v0, v = v, w/beta
+
+    k = len(alpha)
+    T = bm.zeros((k, k), dtype=v.dtype) # Lanczos 三对角矩阵
+    i = bm.arange(k)
+    T[i, i] = bm.array(alpha)
+    T[i[:-1], i[1:]] = bm.array(betas[:k-1])
+    T[i[1:], i[:-1]] = bm.array(betas[:k-1])
+    return max(float(bm.max(bm.abs(bm.linalg.eigvalsh(T)))), 1e-12)
+
+
+def multicolor(Ap, Aj, n_nodes, seed=0):
+    """
+    Color the graph of a matrix, so that nodes of the same color are not
+    coupled. In each pass the uncolored nodes with a larger random weight
+    than all their uncolored neighbours get the next color, as in the
+    Jones-Plassmann algorithm, so there is no loop over the nodes.
+
+    Parameters:
+        Ap, Aj (TensorLike): CSR arrays of the matrix.
+        n_nodes (int): number of nodes.
+        seed (int, optional): seed of the random weights, None for a fresh
+            random state. Defaults to 0, so the coloring is reproducible.
+
+    Returns:
+        TensorLike: the color of each node, from 0 to the number of colors - 1.
+    """
+    row = bm.repeat(bm.arange(n_nodes), Ap[1:] - Ap[:-1])
+    flag = row != Aj
+    gi = bm.concatenate((row[flag], Aj[flag]))
+    gj = bm.concatenate((Aj[flag], row[flag]))
+    weight = bm.from_numpy(np.random.default_rng(seed).random(n_nodes))
+
+    color = bm.full(n_nodes, -1, dtype=Aj.dtype)
+    c = 0
+    while True:
+        isU = color < 0
+        if not bm.any(isU):
+            break
+        flag = isU[gi] & isU[gj]
+        gi, gj = gi[flag], gj[flag]
+        not_max = bm.zeros(n_nodes, dtype=bool)
+        not_max[gi[weight[gj] > weight[gi]]] = True
+        color[isU & ~not_max] = c
+        c += 1
+    return color
+
+
+class GaussSeidelSmoother():
+    """
+    Forward Gauss-Seidel for presmoothing and backward Gauss-Seidel for
+    postsmoothing. With the natural ordering and diagonal pivots, the LU
+    factors of a triangular matrix have no fill-in, and SuperLU solves with
+    them much faster than `spsolve_triangular`, which checks and converts the
+    matrix on every call.
+    """
+    def __init__(self, A, L, U, sstep=1):
+        self.A = A
+        self.sstep = sstep
+        self.Lsolve = self._triangular_solver(L)
+        self.Usolve = self._triangular_solver(U)
+
+    @staticmethod
+    def _triangular_solver(T):
+        return splu(T.to_scipy().tocsc(), permc_spec='NATURAL', diag_pivot_thresh=0,
+                    options={'SymmetricMode': True}).solve
+
+    def presmooth(self, r):
+        A, solve = self.A, self.Lsolve
+        e = solve(r)
+        for i in range(self.sstep):
+            e += solve(r - A @ e)
+        return e
+
+    def postsmooth(self, r, e):
+        A, solve = self.A, self.Usolve
+        for i in range(self.sstep + 1):
+            e += solve(r - A @ e)
+        return e
+
+
+class L1JacobiSmoother():
+    """
+    l1-Jacobi, e += D_l1^{-1} (r - A e), where D_l1 holds the l1 norms of the
+    rows of A. It converges for any symmetric positive definite A without a
+    damping parameter.
+    """
+    def __init__(self, A, sstep=1):
+        self.A = A
+        self.sstep = sstep
+        Ap, Ax = A.indptr, A.data
+        row = bm.repeat(bm.arange(A.shape[0]), Ap[1:] - Ap[:-1])
+        d = bm.bincount(row, weights=bm.abs(Ax), minlength=A.shape[0])
+        self.dinv = _safe_inverse(d)
+
+    def presmooth(self, r):
+        return self.postsmooth(r, bm.zeros_like(r))
+
+    def postsmooth(self, r, e):
+        A, dinv = self.A, self.dinv
+        for i in range(self.sstep + 1):
+            e += dinv*(r - A @ e)
+        return e
+
+
+class ChebyshevSmoother():
+    """
+    Chebyshev polynomial smoother of D^{-1} A with degree sstep + 1. It damps
+    the error components with the eigenvalues in [lower*rho, upper*rho],
+    where rho is the spectral radius of D^{-1} A estimated once by Lanczos.
+
+    Reference:
+        M. Adams, M. Brezina, J. Hu, R. Tuminaro, Parallel multigrid smoothing:
+        polynomial versus Gauss-Seidel, J. Comput. Phys., 2003.
+    """
+    def __init__(self, A, sstep=1, lower=1.0/30.0, upper=1.1, seed=0):
+        self.A = A
+        self.degree = sstep + 1
+        self.dinv = _safe_inverse(diagonal(A))
+        rho = approximate_spectral_radius(A, self.dinv, seed=seed)
+        self.bounds = (lower*rho, upper*rho)
+
+    def presmooth(self, r):
+        return self.postsmooth(r, bm.zeros_like(r))
+
+    def postsmooth(self, r, e):
+        A, dinv = self.A, self.dinv
+        a, b = self.bounds
+        theta, delta = (b + a)/2, (b - a)/2
+        sigma = theta/delta
+        rho = 1/sigma
+        res = r - A @ e
+        d = dinv*res/theta
+        for k in range(self.degree):
+            e += d
+            if k == self.degree - 1:
+                break
+            res -= A @ d
+            rho_new = 1/(2*sigma - rho)
+            d = rho_new*rho*d + 2*rho_new/delta*(dinv*res)
+            rho = rho_new
+        return e
+
+
+class MulticolorGaussSeidelSmoother():
+    """
+    Gauss-Seidel in a multicolor ordering. The nodes of one color are not
+    coupled, so a sweep updates a whole color at once with a SpMV on its rows.
+    Presmoothing goes through the colors forward and postsmoothing backward,
+    which keeps the cycle symmetric.
+    """
+    def __init__(self, A, sstep=1, seed=0):
+        self.A = A
+        self.sstep = sstep
+        n = A.shape[0]
+        Ap, Aj, Ax = A.indptr, A.indices, A.data
+        color = multicolor(Ap, Aj, n, seed=seed)
+        dinv = _safe_inverse(diagonal(A))
+        row = bm.repeat(bm.arange(n), Ap[1:] - Ap[:-1])
+
+        self.index, self.rows, self.dinv = [], [], []
+        for c in range(int(bm.max(color)) + 1):
+            idx = bm.nonzero(color == c)[0]
+            local = bm.full(n, -1, dtype=Aj.dtype)
+            local[idx] = bm.arange(len(idx), dtype=Aj.dtype)
+            flag = local[row] >= 0
+            self.index.append(idx)
+            self.rows.append(csr_matrix((Ax[flag], (local[row[flag]], Aj[flag])),
+                                        shape=(len(idx), n)))
+            self.dinv.append(dinv[idx])
+
+    def _sweep(self, r, e, colors):
+        for c in colors:
+            idx = self.index[c]
+            e[idx] += self.dinv[c]*(r[idx] - self.rows[c] @ e)
+        return e
+
+    def presmooth(self, r):
+        e = bm.zeros_like(r)
+        colors = range(len(self.index))
+        for i in range(self.sstep + 1):
+            self._sweep(r, e, colors)
+        return e
+
+    def postsmooth(self, r, e):
+        colors = range(len(self.index) - 1, -1, -1)
+        for i in range(self.sstep + 1):
+            self._sweep(r, e, colors)
+        return e
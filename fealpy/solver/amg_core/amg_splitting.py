@@ -1,4 +1,6 @@
 
+import numpy as np
+
 from fealpy.backend import backend_manager as bm
 from fealpy.sparse.ops import spdiags
 from fealpy.sparse import csr_matrix
@@ -47,6 +49,7 @@ def rs_cf_splitting(Sp, Sj, Tp, Tj, n_nodes):
             for jj in range(Tp[i], Tp[i+1]):
                 j = Tj[jj]
                 if splitting[j] == U_NODE:
+                    splitting[j] = F_NODE
                     # 更新邻居 k 的 lambda 值
                     for kk in range(Sp[j], Sp[j+1]):
                         k = Sj[kk]
@@ -97,6 +100,63 @@ def rs_cf_splitting(Sp, Sj, Tp, Tj, n_nodes):
 
     return splitting
 
+def pmis_cf_splitting(Sp, Sj, Tp, Tj, n_nodes, seed=0):
+    """
+    Parallel modified independent set (PMIS) C/F splitting.
+
+    Every node gets the weight |S^T_i| + rand(0, 1). In each pass the
+    undecided nodes with a larger weight than all their undecided strong
+    neighbours (in S or S^T) become C nodes, and the undecided nodes that
+    strongly depend on a new C node become F nodes. A pass only involves array
+    operations on the edges of S, so there is no loop over the nodes.
+
+    Parameters:
+        Sp, Sj (TensorLike): CSR arrays of the strength matrix S, without diagonal.
+        Tp, Tj (TensorLike): CSR arrays of S^T.
+        n_nodes (int): number of nodes.
+        seed (int, optional): seed of the random weights, None for a fresh
+            random state. Defaults to 0, so the splitting is reproducible.
+
+    Returns:
+        TensorLike: the splitting, C_NODE (1) for C nodes and F_NODE (0) for F nodes.
+
+    Reference:
+        H. De Sterck, U. M. Yang, J. J. Heys, Reducing complexity in parallel
+        algebraic multigrid preconditioners, SIAM J. Matrix Anal. Appl., 2006.
+    """
+    srow = bm.repeat(bm.arange(n_nodes), Sp[1:] - Sp[:-1]) # i 强依赖于 Sj
+    lambda_vals = Tp[1:] - Tp[:-1]
+    weight = lambda_vals + bm.from_numpy(np.random.default_rng(seed).random(n_nodes))
+
+    splitting = bm.full(n_nodes, U_NODE, dtype=int)
+    # 不影响其他点的节点为 F
+    splitting[lambda_vals == 0] = F_NODE
+
+    # 对称化的强连接图
+    gi = bm.concatenate((srow, Sj))
+    gj = bm.concatenate((Sj, srow))
+
+    while True:
+        isU = splitting == U_NODE
+        if not bm.any(isU):
+            break
+        # 只保留两端都未标记的边
+        flag = isU[gi] & isU[gj]
+        gi, gj = gi[flag], gj[flag]
+
+        # 权重为邻域局部最大的未标记点成为 C 点
+        not_max = bm.zeros(n_nodes, dtype=bool)
+        not_max[gi[weight[gj] > weight[gi]]] = True
+        isC = isU & ~not_max
+        splitting[isC] = C_NODE
+
+        # 强依赖于新 C 点的未标记点成为 F 点
+        flag = isC[Sj] & (splitting[srow] == U_NODE)
+        splitting[srow[flag]] = F_NODE
+
+    return splitting
+
+
 def ruge_stuben_coarsen(A, theta=0.025):
     
     """Ruge-Stuben coarsening method for multigrid preconditioning.
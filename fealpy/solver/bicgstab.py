@@ -25,6 +25,7 @@ def bicgstab(
     Parameters:
         A (SupportsMatmul): The coefficient matrix of the linear system.
         b (TensorLike): The right-hand side vector of the linear system, can be a 1D or 2D tensor.
+            The columns of a 2D tensor are solved together, each one stops at its own tolerance.
         x0 (TensorLike, optional): Initial guess for the solution, a 1D or 2D tensor.
             Must have the same shape as b when reshaped appropriately. Defaults to None.
         atol (float, optional): Absolute tolerance for convergence. Defaults to 1e-8.
@@ -36,7 +37,8 @@ def bicgstab(
 
     Returns:
         TensorLike: The approximate solution to the system Ax = b.
-        dict: Information dictionary containing residual, iteration count, and relative tolerance.
+        dict: Information dictionary containing residual and iteration count, which are
+            given for every column if b is a 2D tensor.
 
     Raises:
         ValueError: If inputs do not meet specified conditions (e.g., dimensions mismatch).
@@ -60,6 +62,9 @@ def bicgstab(
     m, _ = A.shape  # Matrix dimensions
 
     maxit = maxit or 5 * m  # Default maximum iterations
+    if b.ndim == 2:
+        return _bicgstab_block(A, b, x0, atol, rtol, maxit, M)
+
     if x0 is None:
         r = b.copy()
     else:
@@ -150,3 +155,73 @@ def bicgstab(
     info['residual'] = res
     info['niter'] = niter+1
     return x, info
+
+
+def _bicgstab_block(A, b, x0, atol, rtol, maxit, M):
+    """BiCGSTAB on the columns of `b` at once, sharing the matrix products.
+    Columns that converge or break down are removed from the iteration."""
+    def dot(u, v):
+        return bm.sum(u * v, axis=0)
+
+    device = bm.get_device(b)
+    k = b.shape[1]
+    sol = bm.copy(x0)
+    residual = bm.zeros(k, dtype=b.dtype, device=device)
+    niters = bm.zeros(k, dtype=bm.int64, device=device)
+    active = bm.arange(k, device=device)
+    tol = rtol * bm.linalg.norm(b, axis=0)
+    tol = bm.where(tol > atol, tol, atol)
+    rhotol = bm.finfo(x0.dtype).eps**2
+
+    x = x0
+    r = b - A @ x0
+    r1 = r
+    p = r
+    a = dot(r, r1)
+
+    for niter in range(maxit):
+        Mp = M @ p if M is not None else p
+        AMp = A @ Mp
+        c = dot(AMp, r1)
+        eta = a / bm.where(c == 0, 1, c)
+        eta = bm.where(c == 0, 0, eta)
+
+        q = r - eta * AMp
+        qnorm = bm.linalg.norm(q, axis=0)
+        Mq = M @ q if M is not None else q
+        AMq = A @ Mq
+        d = dot(AMq, AMq)
+        w = dot(AMq, Mq) / bm.where(d == 0, 1, d)
+        # Columns converged at the half step only take the eta update.
+        w = bm.where((qnorm <= tol) | (c == 0), 0, w)
+
+        x = x + eta * Mp + w * Mq
+        r = q - w * AMq
+        res = bm.linalg.norm(r, axis=0)
+        a_pre = a
+        a = dot(r, r1)
+
+        done = (res <= tol) | (c == 0) | (bm.abs(a) < rhotol)
+        if niter + 1 >= maxit:
+            done = bm.ones_like(done)
+        if bm.any(done):
+            idx = active[done]
+            sol = bm.set_at(sol, (slice(None), idx), x[:, done])
+            residual = bm.set_at(residual, idx, res[done])
+            niters = bm.set_at(niters, idx, niter + 1)
+            keep = ~done
+            active = active[keep]
+            if active.shape[0] == 0:
+                break
+            x, r, r1, p, AMp = x[:, keep], r[:, keep], r1[:, keep], p[:, keep], AMp[:, keep]
+            a, a_pre, eta, w, tol = a[keep], a_pre[keep], eta[keep], w[keep], tol[keep]
+
+        mu = (eta / w) * (a / a_pre)
+        p = mu * (p - w * AMp) + r
+
+    if active.shape[0] == 0:
+        logger.info(f"bicgstab: all {k} columns stopped within {int(bm.max(niters))} iterations")
+    else:
+        logger.info(f"bicgstab failed to converge within {maxit} iterations.")
+
+    return sol, {'residual': residual, 'niter': niters}
@@ -19,7 +19,8 @@ def cg(A: SupportsMatmul, b: TensorLike, x0: Optional[TensorLike]=None, M: Optio
 
     Parameters:
         A (SupportsMatmul): The coefficient matrix of the linear system.
-        b (TensorLike): The right-hand side vector of the linear system, can be a 1D or 2D tensor.
+        b (TensorLike): The right-hand side vector of the linear system, can be a 1D or 2D tensor.\
+        The columns of a 2D tensor are solved together, each one stops at its own tolerance.
         x0 (TensorLike): Initial guess for the solution, a 1D or 2D tensor.\
         Must have the same shape as b when reshaped appropriately.
         batch_first (bool, optional): Whether the batch dimension of `b` and `x0`\
@@ -28,7 +29,8 @@ def cg(A: SupportsMatmul, b: TensorLike, x0: Optional[TensorLike]=None, M: Optio
         rtol (float, optional): Relative tolerance for convergence. Default is 1e-8.
         maxit (int, optional): Maximum number of iterations allowed. Default is 10000.\
         If not provided, the method will continue until convergence based on the given tolerances.
-        returninfo(bool):if or not return info{['residual],['niter]}
+        returninfo(bool):if or not return info{['residual],['niter]}, which are\
+        given for every column if b is a 2D tensor.
 
     Returns:
         Tensor: The approximate solution to the system Ax = b.
@@ -82,35 +84,76 @@ def _cg_impl(A: SupportsMatmul, b: TensorLike, x0: TensorLike, M: SupportsMatmul
     z = M @ r if M is not None else r
     p = z               # (dof, batch)
     n_iter = 0
-    b_norm = bm.linalg.norm(b)
+    b_norm = bm.linalg.norm(b, axis=0) # (batch,)
     sum_func = bm.sum
     sqrt_func = bm.sqrt
     rTr = sum_func(r * z, axis=0)
-    Ap = A @ p
+
+    if b.ndim == 2:
+        # Block CG: every column converges on its own. Converged columns are
+        # moved to `sol` and deflated from the iteration, so that later
+        # products only involve the active columns.
+        sol = bm.copy(x)
+        residual = sqrt_func(rTr)
+        niter = bm.zeros(b.shape[1], dtype=bm.int64, device=bm.get_device(b))
+        keep = (residual >= atol) & (residual >= rtol * b_norm)
+        active = bm.arange(b.shape[1], device=bm.get_device(b))[keep]
+        if active.shape[0] == 0:
+            info['residual'] = residual
+            info['niter'] = niter
+            return sol, info
+        x, r, z, p = x[:, keep], r[:, keep], z[:, keep], p[:, keep]
+        rTr, b_norm = rTr[keep], b_norm[keep]
+
     # iterate
     while True:
         Ap = A @ p      # (dof, batch)
         alpha = rTr / sum_func(p*Ap, axis=0)  # r @ r / (p @ Ap) # (batch,)
         x = x + alpha[None, ...] * p  # (dof, batch)
         r_new = r - alpha[None, ...] * Ap
-        z_new = M @ r_new if M is not None  else r_new 
+        z_new = M @ r_new if M is not None  else r_new
         rTr_new = sum_func(r_new*z_new, axis=0)  # (batch,)
-        r_norm_new = sqrt_func(sum_func(rTr_new))
+        r_norm_new = sqrt_func(rTr_new)
 
         n_iter += 1
-        info['residual'] = r_norm_new
-        info['niter'] = n_iter
-        if r_norm_new < atol:
-            logger.info(f"CG: converged in {n_iter} iterations, "
-                        "stopped by absolute tolerance.")
-            break
-
-        if r_norm_new < rtol * b_norm:
-            logger.info(f"CG: converged in {n_iter} iterations, "
-                        "stopped by relative tolerance.")
-            break
-
-        if (maxit is not None) and (n_iter >= maxit):
+        stop = (maxit is not None) and (n_iter >= maxit)
+
+        if b.ndim == 1:
+            info['residual'] = r_norm_new
+            info['niter'] = n_iter
+            if r_norm_new < atol:
+                logger.info(f"CG: converged in {n_iter} iterations, "
+                            "stopped by absolute tolerance.")
+                break
+
+            if r_norm_new < rtol * b_norm:
+                logger.info(f"CG: converged in {n_iter} iterations, "
+                            "stopped by relative tolerance.")
+                break
+        else:
+            done = (r_norm_new < atol) | (r_norm_new < rtol * b_norm)
+            if stop:
+                done = bm.ones_like(done)
+            if bm.any(done):
+                idx = active[done]
+                sol = bm.set_at(sol, (slice(None), idx), x[:, done])
+                residual = bm.set_at(residual, idx, r_norm_new[done])
+                niter = bm.set_at(niter, idx, n_iter)
+                keep = ~done
+                active = active[keep]
+                x, p, r_new, z_new = x[:, keep], p[:, keep], r_new[:, keep], z_new[:, keep]
+                rTr, rTr_new, b_norm = rTr[keep], rTr_new[keep], b_norm[keep]
+
+            if active.shape[0] == 0:
+                info['residual'] = residual
+                info['niter'] = niter
+                x = sol
+                if not stop:
+                    logger.info(f"CG: all {b.shape[1]} columns converged in "
+                                f"{n_iter} iterations.")
+                    break
+
+        if stop:
             logger.info(f"CG: failed, stopped by maxit ({maxit}).")
             break
 
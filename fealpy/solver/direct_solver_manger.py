@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any, List
 import asyncio
 import inspect
+from types import SimpleNamespace
 from ..backend import backend_manager as bm
 from ..sparse import COOTensor, CSRTensor
 import numpy as np
@@ -20,6 +21,14 @@ class DirectSolverManager:
         mgr = DirectSolverManager(solver_name='auto')
         mgr.set_matrix(A, matrix_type='U')
         x = mgr.solve(b)
+
+    The matrix is factorized once, at the first `solve()` or by `factorize()`,
+    and later solves reuse the factorization. When only the values of the
+    matrix change, `refactor(values)` reuses the symbolic analysis:
+        mgr.set_matrix(A)
+        for step in steps:
+            mgr.refactor(new_values) # only if the values changed
+            x = mgr.solve(b)
     """
     _SOLVER_MAPPING: Dict[str, type] = {}
     _solver_cache = threading.local()
@@ -51,23 +60,29 @@ class DirectSolverManager:
         self._available: List[str] = []
         self._matrix_type: str = 'G'
         self.raw_kwargs: Dict[str, Any] = {}
+        self._factor = None
+        self._factor_solver = None
 
     @classmethod
     def available_solvers(cls) -> List[str]:
         """Return the list of all registered solver names."""
         return list(cls._SOLVER_MAPPING.keys())
 
-    def set_matrix(self, A: Any, matrix_type: str = 'G') -> None:
+    def set_matrix(self, A: Any, matrix_type: str = 'G', *, factorize: bool = False) -> None:
         """
-        Set the system matrix and its type; clears any cached solver and updates available solvers.
+        Set the system matrix and its type; clears any cached solver and factorization,
+        and updates available solvers.
 
         Parameters:
             A: COOTensor or CSRTensor representing the system matrix.
             matrix_type: 'G' for general, 'L' for lower triangular, 'U' for upper triangular, 'SP' for symmetric positive definite.
+            factorize: whether to factorize the matrix now; otherwise it is
+                factorized at the first `solve()`. Defaults to False.
         """
         self.A = A
         self._matrix_type = matrix_type
         self.device = A.indices.device
+        self.free_factor()
         
         # Clear thread-local solver cache
         for attr in ('solver', 'solver_name'):
@@ -77,6 +92,9 @@ class DirectSolverManager:
         # Update list of available solvers
         self._available = self._filter_solvers()
 
+        if factorize:
+            self.factorize()
+
     def _filter_solvers(self) -> List[str]:
         """
         Filter registered solvers by device type: use cupy on GPU, others on CPU.
@@ -150,25 +168,70 @@ class DirectSolverManager:
             if hasattr(self._solver_cache, attr):
                 delattr(self._solver_cache, attr)
 
+    def factorize(self) -> None:
+        """
+        Run the symbolic and numeric factorization of the matrix with the current
+        solver. The factorization is kept until the matrix or the solver changes.
+        """
+        if self.A is None:
+            raise ValueError("Matrix not set, call set_matrix() first.")
+        self.free_factor()
+        solver = self.get_solver()
+        self._factor = solver.factorize(self.A, matrix_type=self._matrix_type)
+        self._factor_solver = solver
+
+    def refactor(self, values: Any) -> None:
+        """
+        Replace the values of the matrix, keeping its sparsity pattern, and update
+        the factorization. Solvers supporting it reuse the symbolic analysis
+        (ordering and elimination tree) and only redo the numeric factorization.
+
+        Parameters:
+            values: new non-zero values, in the order of `A.values`.
+        """
+        if self.A is None:
+            raise ValueError("Matrix not set, call set_matrix() first.")
+        A = self.A
+        if values.shape != A.values.shape:
+            raise ValueError(f"The shape of values {tuple(values.shape)} does not match "
+                             f"the matrix values {tuple(A.values.shape)}.")
+        if isinstance(A, COOTensor):
+            self.A = COOTensor(A.indices, values, A.sparse_shape, is_coalesced=A.is_coalesced)
+        else:
+            self.A = CSRTensor(A.crow, A.col, values, A.sparse_shape)
+
+        if self._factor is None or self._factor_solver is not self.get_solver():
+            self.factorize()
+        else:
+            self._factor = self._factor_solver.refactorize(
+                self._factor, self.A, matrix_type=self._matrix_type)
+
+    def free_factor(self) -> None:
+        """Release the factorization."""
+        if self._factor is not None:
+            self._factor_solver.free(self._factor)
+        self._factor = None
+        self._factor_solver = None
+
     def solve(self, b: Any):
         """
-        Synchronously solve A x = b, then clear the solver cache.
+        Synchronously solve A x = b, reusing the factorization of A.
 
         Parameters:
-            b: right-hand side vector or tensor.
+            b: right-hand side vector or tensor, shaped (N,) or (N, K). The K
+                columns are solved together with one factorization.
         Returns:
-            x: solution as a NumPy ndarray.
+            x: solution with the shape of `b`.
         """
         if self.A is None:
             raise ValueError("Matrix not set, call set_matrix() first.")
-        solver = self.get_solver()
-        x = solver.solve(self.A, b, matrix_type=self._matrix_type)
-        self._clear_cache()
-        return x
+        if self._factor is None or self._factor_solver is not self.get_solver():
+            self.factorize()
+        return self._factor_solver.solve_factorized(self._factor, b)
 
     async def solve_async(self, b: Any) -> np.ndarray:
         """
-        Asynchronously solve A x = b, then clear the solver cache.
+        Asynchronously solve A x = b, reusing the factorization of A.
 
         Parameters:
             b: right-hand side vector or tensor.
@@ -182,16 +245,25 @@ class DirectSolverManager:
         if hasattr(solver, 'solve_async') and inspect.iscoroutinefunction(solver.solve_async):
             x = await solver.solve_async(self.A, arr, matrix_type=self._matrix_type)
         else:
+            if self._factor is None or self._factor_solver is not solver:
+                self.factorize()
+            factor = self._factor
             loop = asyncio.get_event_loop()
             x = await loop.run_in_executor(
                 None,
-                lambda: solver.solve(self.A, arr, matrix_type=self._matrix_type)
+                lambda: solver.solve_factorized(factor, arr)
             )
-        self._clear_cache()
         return x
 
 class BaseSolver(ABC):
-    """Abstract base class for all solver implementations."""
+    """Abstract base class for all solver implementations.
+
+    Besides `solve`, solvers provide a factorization interface used by the
+    manager to solve many right-hand sides: `factorize` returns a handle of the
+    factorization, which is passed to `solve_factorized`, `refactorize` and
+    `free`. Handles hold all the state, so solver instances stay stateless.
+    The defaults keep the matrix only and solve from scratch every time.
+    """
 
     def __init__(self, **kwargs):
         self.kwargs = kwargs
@@ -201,6 +273,32 @@ class BaseSolver(ABC):
         """Solve the linear system A x = b."""
         pass
 
+    def factorize(self, A: Any, matrix_type: str = 'G') -> Any:
+        """Factorize A and return the handle of the factorization."""
+        return SimpleNamespace(A=A, matrix_type=matrix_type)
+
+    def solve_factorized(self, factor: Any, b: Any):
+        """Solve the linear system with a factorized matrix."""
+        return self.solve(factor.A, b, matrix_type=factor.matrix_type)
+
+    def refactorize(self, factor: Any, A: Any, matrix_type: str = 'G') -> Any:
+        """Factorize a matrix with the sparsity pattern of the factorized one,
+        reusing the symbolic analysis if supported."""
+        self.free(factor)
+        return self.factorize(A, matrix_type=matrix_type)
+
+    def free(self, factor: Any) -> None:
+        """Release the memory of a factorization."""
+        pass
+
+    @staticmethod
+    def _to_scipy(A):
+        if isinstance(A, COOTensor):
+            return A.to_scipy().tocsr()
+        elif isinstance(A, CSRTensor):
+            return A.to_scipy()
+        return A
+
 @DirectSolverManager.register('scipy')
 class ScipySolver(BaseSolver):
     """Solver using scipy.sparse.linalg."""
@@ -219,6 +317,41 @@ class ScipySolver(BaseSolver):
         else:
             return bm.tensor(spsolve(A, b, **self.kwargs))
 
+    def factorize(self, A, matrix_type: str = 'G'):
+        A = self._to_scipy(A)
+        if matrix_type in ('U', 'L'):
+            return SimpleNamespace(A=A, matrix_type=matrix_type)
+        from scipy.sparse.linalg import splu
+        permc_spec = self.kwargs.get('permc_spec', 'COLAMD')
+        lu = splu(A.tocsc(), permc_spec=permc_spec)
+        # perm_c maps the original columns to their positions in the ordering.
+        return SimpleNamespace(A=A, matrix_type=matrix_type, lu=lu, perm=None,
+                               order=np.argsort(lu.perm_c))
+
+    def solve_factorized(self, factor, b):
+        if not hasattr(factor, 'lu'):
+            return self.solve(factor.A, b, matrix_type=factor.matrix_type)
+        b = bm.to_numpy(b) if not isinstance(b, np.ndarray) else b
+        y = factor.lu.solve(b)
+        if factor.perm is None:
+            return bm.tensor(y)
+        x = np.empty_like(y)
+        x[factor.perm] = y
+        return bm.tensor(x)
+
+    def refactorize(self, factor, A, matrix_type: str = 'G'):
+        if not hasattr(factor, 'lu'):
+            return self.factorize(A, matrix_type=matrix_type)
+        # The fill-reducing column ordering of the first factorization is
+        # reused, skipping COLAMD: (A P) y = b is factorized in the natural
+        # order, and x = P y.
+        from scipy.sparse.linalg import splu
+        A = self._to_scipy(A)
+        order = factor.order
+        lu = splu(A.tocsc()[:, order], permc_spec='NATURAL')
+        return SimpleNamespace(A=A, matrix_type=matrix_type, lu=lu, perm=order,
+                               order=order)
+
 @DirectSolverManager.register('mumps')
 class MumpsSolver(BaseSolver):
     """Solver using MUMPS (via pymumps)."""
@@ -234,13 +367,56 @@ class MumpsSolver(BaseSolver):
         sym_map = {'G': 0, 'SP': 1, 'S': 2}
         ctx = DMumpsContext(par=1, sym=sym_map.get(matrix_type, 0), comm=None)
         ctx.set_centralized_sparse(A)
-        x = b.copy()
-        ctx.set_rhs(x)
+        x = self._set_rhs(ctx, b)
         ctx.set_silent()
         ctx.run(job=6)
         ctx.destroy()
         return bm.tensor(x)
 
+    @staticmethod
+    def _set_rhs(ctx, b: np.ndarray) -> np.ndarray:
+        """Set a copy of `b` as the right-hand side, which MUMPS overwrites with
+        the solution. The columns of a 2-D `b` are solved together."""
+        if b.ndim == 1:
+            x = np.array(b, dtype=np.float64)
+            ctx.set_rhs(x)
+            return x
+        # Dense multiple right-hand sides are stored column by column.
+        x = np.array(b, dtype=np.float64, order='F')
+        ctx._refs.update(rhs=x)
+        ctx.id.nrhs = x.shape[1]
+        ctx.id.lrhs = x.shape[0]
+        ctx.id.rhs = ctx.cast_array(x)
+        return x
+
+    def factorize(self, A, matrix_type: str = 'G'):
+        from mumps import DMumpsContext
+        A = self._to_scipy(A).tocoo()
+        sym_map = {'G': 0, 'SP': 1, 'S': 2}
+        ctx = DMumpsContext(par=1, sym=sym_map.get(matrix_type, 0), comm=None)
+        ctx.set_centralized_sparse(A)
+        ctx.set_silent()
+        ctx.run(job=4) # analysis + factorization
+        # MUMPS keeps pointers to the arrays of A, so they are held by the handle.
+        return SimpleNamespace(ctx=ctx, A=A)
+
+    def solve_factorized(self, factor, b):
+        b = bm.to_numpy(b) if not isinstance(b, np.ndarray) else b
+        x = self._set_rhs(factor.ctx, b)
+        factor.ctx.run(job=3) # solve only
+        return bm.tensor(x)
+
+    def refactorize(self, factor, A, matrix_type: str = 'G'):
+        # Numeric factorization on the analysis of the same pattern.
+        A = self._to_scipy(A).tocoo()
+        factor.ctx.set_centralized_assembled_values(A.data)
+        factor.A = A
+        factor.ctx.run(job=2)
+        return factor
+
+    def free(self, factor):
+        factor.ctx.destroy()
+
 @DirectSolverManager.register('pardiso')
 class PardisoSolver(BaseSolver):
     """Solver using pypardiso."""
@@ -260,6 +436,23 @@ class PardisoSolver(BaseSolver):
         solver.free_memory(everything=True)
         return bm.tensor(x)
 
+    def factorize(self, A, matrix_type: str = 'G'):
+        from pypardiso import PyPardisoSolver
+        A = self._to_scipy(A)
+        mapping = {'G': 11, 'SP': 1, 'S': 1}
+        solver = PyPardisoSolver()
+        solver.set_matrix_type(mapping.get(matrix_type.upper(), 11))
+        solver.factorize(A)
+        return SimpleNamespace(solver=solver, A=A)
+
+    def solve_factorized(self, factor, b):
+        b = bm.to_numpy(b) if not isinstance(b, np.ndarray) else b
+        # pypardiso skips the factorization for the matrix it factorized.
+        return bm.tensor(factor.solver.solve(factor.A, b))
+
+    def free(self, factor):
+        factor.solver.free_memory(everything=True)
+
 @DirectSolverManager.register('cholmod')
 class CholmodSolver(BaseSolver):
     """Solver using scikit-sparse Cholmod."""
@@ -276,6 +469,21 @@ class CholmodSolver(BaseSolver):
         factor = cholesky(A)
         return bm.tensor(factor(b))
 
+    def factorize(self, A, matrix_type: str = 'G'):
+        if matrix_type != 'SP':
+            raise ValueError("CholmodSolver only supports SP type")
+        from sksparse.cholmod import cholesky
+        return cholesky(self._to_scipy(A).tocsc())
+
+    def solve_factorized(self, factor, b):
+        b = bm.to_numpy(b) if not isinstance(b, np.ndarray) else b
+        return bm.tensor(factor(b))
+
+    def refactorize(self, factor, A, matrix_type: str = 'G'):
+        # Numeric factorization on the symbolic analysis of the same pattern.
+        factor.cholesky_inplace(self._to_scipy(A).tocsc())
+        return factor
+
 @DirectSolverManager.register('cupy')
 class CupySolver(BaseSolver):
     """Solver using CuPy for GPU-based sparse solutions."""
@@ -313,6 +521,11 @@ class CupySolver(BaseSolver):
             x = spsolve_triangular(A_gpu, b_gpu, lower=True, **self.kwargs)
         else:
             from cupyx.scipy.sparse.linalg import spsolve
-            x = spsolve(A_gpu, b_gpu, **self.kwargs)
+            if b_gpu.ndim == 2:
+                # spsolve of cupyx takes one right-hand side at a time.
+                x = cp.stack([spsolve(A_gpu, b_gpu[:, i], **self.kwargs)
+                              for i in range(b_gpu.shape[1])], axis=1)
+            else:
+                x = spsolve(A_gpu, b_gpu, **self.kwargs)
 
         return bm.tensor(x)
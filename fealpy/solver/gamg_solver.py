@@ -2,15 +2,36 @@
 from ..backend import backend_manager as bm
 from ..operator import LinearOperator
 from .cg import cg
-from scipy.sparse.linalg import spsolve_triangular,spsolve
-from .amg import ruge_stuben_amg
+from scipy.sparse.linalg import spsolve, splu
+from .amg import ruge_stuben_amg, pmis_amg, smoothed_aggregation_amg
+from .amg_core import (
+    GaussSeidelSmoother,
+    L1JacobiSmoother,
+    ChebyshevSmoother,
+    MulticolorGaussSeidelSmoother
+)
 from ..sparse.coo_tensor import COOTensor
 from ..sparse.csr_tensor import CSRTensor
+from ..sparse import csr_matrix
 from .. import logger
 from ..utils import timer
 import time 
 from scipy.sparse.linalg import eigs
 
+def _nodal_prolongation(P, k):
+    """
+    Extend a nodal prolongation to k dofs per node ordered node by node,
+    i.e. the Kronecker product of P and the identity of order k.
+    """
+    P = P.tocoo()
+    (row, col), val = P.indices, P.values
+    c = bm.arange(k, dtype=row.dtype)
+    row = (row[:, None]*k + c).reshape(-1)
+    col = (col[:, None]*k + c).reshape(-1)
+    val = bm.repeat(val, k)
+    return csr_matrix((val, (row, col)), shape=(P.shape[0]*k, P.shape[1]*k))
+
+
 class GAMGSolver():
     """
     Fast Solvers for Geometric and Algebraic Multigrid Methods
@@ -25,10 +46,18 @@ class GAMGSolver():
     Parameters:
         theta(float) : Coarsening coefficient
         csize(int)   : Size of the coarsest problem
-        ctype(str)   : Coarsening method
-        itype(str)   : Interpolation method
+        ctype(str)   : Coarsening method, 'C' for the classical Ruge-Stuben
+                       coarsening, 'PMIS' for the vectorized PMIS coarsening,
+                       'SA' for the smoothed aggregation
+        itype(str)   : Interpolation method, for 'PMIS' coarsening 'D' is the
+                       direct interpolation, otherwise the standard one
         ptype(str)   : Preconditioner type
         sstep(int)   : Default number of smoothing steps
+        smoother(str|list) : Smoother, 'GS' for the Gauss-Seidel, 'MCGS' for
+                       the multicolor Gauss-Seidel, 'L1Jacobi' for the
+                       l1-Jacobi, 'Chebyshev' for the Chebyshev polynomial
+                       smoother; a list gives the smoother of each level,
+                       its last entry is used for the remaining levels
         isolver(str) : Default iterative solver; other options include 'MG'
         maxit(int)   : Default maximum number of iterations
         csolver(str) : Default solver for the coarsest grid
@@ -45,6 +74,7 @@ class GAMGSolver():
             itype: str = 'T', # 插值方法
             ptype: str = 'V', # 预条件类型
             sstep: int = 1, # 默认光滑步数
+            smoother = 'GS', # 光滑子，可以逐层指定
             isolver: str = 'MG', # 默认迭代解法器，还可以选择'MG'
             maxit: int = 200,   # 默认迭代最大次数
             csolver: str = 'direct', # 默认粗网格解法器
@@ -57,21 +87,42 @@ class GAMGSolver():
         self.itype = itype
         self.ptype = ptype
         self.sstep = sstep
+        self.smoother = smoother
         self.isolver = isolver
         self.maxit = maxit
         self.csolver = csolver
         self.rtol = rtol
         self.atol = atol
+        self.seed = 0
 
-    def setup(self, A, P=None, R=None, mesh=None, space=None, cdegree=[1]):
+    def setup(self, A, P=None, R=None, mesh=None, space=None, cdegree=[1],
+              B=None, dof_numel=1, Ac=None, seed=0):
         """
 
         Parameters:
             A (CSRTensor): the matrix
             P (Optional[list]): prolongation matrix, from finnest to coarsest
             R (Optional[list]): restriction matrix, from coarsest to finnest
-            mesh (Optional[Mesh]): the mesh
+            mesh (Optional[Mesh]): the mesh, whose recorded refinements (see
+                `Mesh.record_refinement`) give the geometric hierarchy
+            space (Optional[FunctionSpace]): the Lagrange space of A, its
+                prolongations to the degrees `cdegree` are used first
+            cdegree (list): the degrees of the p-coarsening, in ascending order
+            B (Optional[Tensor]): near-nullspace vectors for the smoothed
+                aggregation, with shape (N, K), e.g. `rigid_body_modes(node)`
+                for elasticity. Defaults to the constant vector of each component.
+            dof_numel (int): number of dofs per node for the smoothed
+                aggregation and the geometric hierarchy, the dofs must be
+                ordered node by node, i.e. a `TensorFunctionSpace` with shape
+                (-1, dof_numel).
+            Ac (Optional[list]): rediscretized matrices of the geometric
+                levels, from fine to coarse, instead of the Galerkin products
+            seed (Optional[int]): seed of the random weights of the algebraic
+                coarsening and of the smoothers, None for a fresh random
+                state. Defaults to 0, so the hierarchy is reproducible.
         """
+        start_time = time.time()
+        self.seed = seed
         # 1. Initialize the storage structure for operators
         self.A = [A]  # List to store the system matrices at each level
         self.L = []   # List to store the lower triangular matrices
@@ -100,17 +151,51 @@ class GAMGSolver():
                 self.R.append(r)
                 self.A.append(r @ self.A[-1] @ p)
         elif mesh is not None: # geometric coarsening from finnest to coarsest
-            pass
+            Ps = mesh.refinement_history()
+            if len(Ps) == 0:
+                raise ValueError("no refinement of the mesh is recorded, "
+                                 "call `mesh.record_refinement()` before refining it.")
+            for l, p in enumerate(Ps):
+                if dof_numel > 1:
+                    p = _nodal_prolongation(p, dof_numel)
+                if p.shape[0] != self.A[-1].shape[0]:
+                    raise ValueError(f"the prolongation of the refinement has {p.shape[0]} "
+                                     f"rows, but the matrix has {self.A[-1].shape[0]}.")
+                self.L.append(self.A[-1].tril())
+                self.U.append(self.A[-1].triu())
+                self.P.append(p)
+                r = p.T.tocsr()
+                self.R.append(r)
+                if Ac is not None:
+                    self.A.append(Ac[l].tocsr())
+                else:
+                    self.A.append(r @ self.A[-1] @ p)
+                if self.A[-1].shape[0] < self.csize:
+                    break
+            logger.info(f"Geometric coarsening time: {time.time()-start_time}")
         else: # algebraic coarsening 
             NN = bm.ceil(bm.log2(self.A[-1].shape[0])/2-4)
             NL = max(min(int(NN), 8), 2) # 估计粗化的层数 
-            start_time = time.time()
+            if self.ctype == 'SA':
+                N = self.A[-1].shape[0]
+                dof_node = bm.arange(N) // dof_numel
+                if B is None:
+                    B = bm.zeros((N, dof_numel), dtype=self.A[-1].dtype)
+                    B[bm.arange(N), bm.arange(N) % dof_numel] = 1.0
             for l in range(NL):
+                if self.ctype == 'SA':
+                    p, r, B, dof_node = smoothed_aggregation_amg(
+                            self.A[-1], B, dof_node, self.theta, seed=seed)
+                elif self.ctype == 'PMIS':
+                    p, r = pmis_amg(self.A[-1], self.theta, itype=self.itype,
+                                    seed=seed)
+                else:
+                    p, r = ruge_stuben_amg(self.A[-1], self.theta)
+                if p.shape[1] in (0, self.A[-1].shape[0]): # 无法继续粗化
+                    break
+
                 self.L.append(self.A[-1].tril()) # 前磨光的光滑子
                 self.U.append(self.A[-1].triu()) # 后磨光的光滑子
-
-                p, r = ruge_stuben_amg(self.A[-1], self.theta)
-                
                 self.P.append(p)
                 self.R.append(r)
 
@@ -131,6 +216,50 @@ class GAMGSolver():
             #     N = self.A[-1].shape[0]
             #     self.A[-1] += 1e-12*bm.eye(N)  
 
+        self.setup_cycle()
+        self.setup_time = time.time() - start_time
+
+    def setup_cycle(self):
+        """
+        Prebuild the operators used by the cycles from the hierarchy, so that
+        a cycle runs without format conversions or factorizations: the
+        smoother of each level is set up, e.g. the triangular matrices of
+        Gauss-Seidel are factorized and the eigenvalue bounds of Chebyshev
+        are estimated, and the coarsest matrix is LU factorized.
+        Call it again if the matrices of the hierarchy are changed.
+        """
+        self.smoothers = []
+        for l in range(len(self.A) - 1):
+            self.smoothers.append(self.build_smoother(l))
+
+        Ac = self.A[-1].to_scipy().tocsc()
+        try:
+            self.csolve = splu(Ac).solve
+        except RuntimeError:
+            logger.warning("GAMG: the coarsest matrix is singular, "
+                           "fall back to spsolve on it.")
+            self.csolve = lambda r: spsolve(Ac, r)
+
+    def build_smoother(self, level):
+        """
+        Build the smoother of the level chosen by `smoother`.
+        """
+        smoother = self.smoother
+        if isinstance(smoother, (list, tuple)):
+            smoother = smoother[min(level, len(smoother) - 1)]
+
+        A = self.A[level]
+        if smoother == 'GS':
+            return GaussSeidelSmoother(A, self.L[level], self.U[level], self.sstep)
+        elif smoother == 'MCGS':
+            return MulticolorGaussSeidelSmoother(A, self.sstep, seed=self.seed)
+        elif smoother == 'L1Jacobi':
+            return L1JacobiSmoother(A, self.sstep)
+        elif smoother == 'Chebyshev':
+            return ChebyshevSmoother(A, self.sstep, seed=self.seed)
+        else:
+            raise ValueError(f"Unknown smoother '{smoother}'")
+
     def construct_coarse_equation(self, A, F, level=1):
         """
         Given a linear algebraic system, construct a smaller-scale problem
@@ -180,6 +309,19 @@ class GAMGSolver():
         return uh
 
 
+    def grid_complexity(self):
+        """
+        The total number of unknowns on all levels over that of the finest level.
+        """
+        return sum(A.shape[0] for A in self.A) / self.A[0].shape[0]
+
+    def operator_complexity(self):
+        """
+        The total number of nonzeros of the matrices on all levels over that
+        of the finest level, which measures the memory and the work of a cycle.
+        """
+        return sum(A.nnz for A in self.A) / self.A[0].nnz
+
     def print(self):
         """
         Print information about the algebraic multigrid.
@@ -187,13 +329,15 @@ class GAMGSolver():
         NL = len(self.A)
         for l in range(NL):
             print(f"{l}-th level:")
-            print(f"A.shape = {self.A[l].shape}")
+            print(f"A.shape = {self.A[l].shape}, A.nnz = {self.A[l].nnz}")
             if l < NL-1:
                 print(f"L.shape = {self.L[l].shape}") 
                 print(f"U.shape = {self.U[l].shape}") 
-                print(f"D.shape = {self.D[l].shape}")
                 print(f"P.shape = {self.P[l].shape}") 
                 print(f"R.shape = {self.R[l].shape}")
+        print(f"setup time = {self.setup_time:.3f}s")
+        print(f"grid complexity = {self.grid_complexity():.3f}")
+        print(f"operator complexity = {self.operator_complexity():.3f}")
 
     def solve(self, b):
         """ 
@@ -253,6 +397,18 @@ class GAMGSolver():
 
         return x,info
     
+    def presmooth(self, r, level):
+        """
+        Presmoothing for Ae = r on the level, from a zero guess.
+        """
+        return self.smoothers[level].presmooth(r)
+
+    def postsmooth(self, r, e, level):
+        """
+        Postsmoothing for Ae = r on the level, updating e in place.
+        """
+        return self.smoothers[level].postsmooth(r, e)
+
     def vcycle(self, r, level=0):
         """
         Solve Ae = r using the V-Cycle method.
@@ -282,21 +438,17 @@ class GAMGSolver():
 
         # Pre-smoothing
         for l in range(level, NL - 1, 1):
-            el = spsolve_triangular(self.L[l].to_scipy(), r[l])
-            for i in range(self.sstep):
-                el += spsolve_triangular(self.L[l].to_scipy(), r[l] - self.A[l] @ el)
+            el = self.presmooth(r[l], l)
             e.append(el)
             r.append(self.R[l] @ (r[l] - self.A[l] @ el))
 
-        el = spsolve(self.A[-1].to_scipy(), r[-1])
+        el = self.csolve(r[-1])
         e.append(el)
 
         # Post-smoothing
         for l in range(NL - 2, level - 1, -1):
             e[l] += self.P[l] @ e[l + 1]
-            e[l] += spsolve_triangular(self.U[l].to_scipy(), r[l] - self.A[l] @ e[l], lower=False)
-            for i in range(self.sstep): 
-                e[l] += spsolve_triangular(self.U[l].to_scipy(), r[l] - self.A[l] @ e[l], lower=False)
+            self.postsmooth(r[l], e[l], l)
 
         return e[level]
     
@@ -313,12 +465,10 @@ class GAMGSolver():
         """
         NL = len(self.A)
         if level == (NL - 1): 
-            e = spsolve(self.A[-1].to_scipy(), r)
+            e = self.csolve(r)
             return e
 
-        e = spsolve_triangular(self.L[level].to_scipy(), r)
-        for s in range(self.sstep):
-            e += spsolve_triangular(self.L[level].to_scipy(), r - self.A[level] @ e) 
+        e = self.presmooth(r, level)
 
         rc = self.R[level] @ ( r - self.A[level] @ e) 
 
@@ -326,9 +476,7 @@ class GAMGSolver():
         ec += self.wcycle( rc - self.A[level+1] @ ec, level=level+1)
         
         e += self.P[level] @ ec
-        e += spsolve_triangular(self.U[level].to_scipy(), r - self.A[level] @ e, lower=False)
-        for s in range(self.sstep):
-            e += spsolve_triangular(self.U[level].to_scipy(), r - self.A[level] @ e, lower=False)
+        self.postsmooth(r, e, level)
         return e
         
     def fcycle(self, r):
@@ -354,7 +502,7 @@ class GAMGSolver():
             e.append(el)
             r.append(self.R[l] @ (r[l] - self.A[l] @ e[l]))
 
-        ec = spsolve(self.A[-1].to_scipy(), r[-1])
+        ec = self.csolve(r[-1])
         e.append(ec)
 
         for l in range(NL - 2, -1, -1):
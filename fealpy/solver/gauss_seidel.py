@@ -3,6 +3,7 @@ from typing import Optional, Protocol
 
 from ..backend import backend_manager as bm
 from ..backend import TensorLike
+from ..sparse.bsr_tensor import BSRTensor
 
 from .. import logger
 
@@ -38,7 +39,13 @@ def gauss_seidel(A: SupportsMatmul, b: TensorLike, x0: Optional[TensorLike]=None
         until the residual norm meets the specified tolerance or the maximum number of iterations is reached.
 
         This method assumes that the system is well-conditioned for the Gauss-Seidel iteration.
+
+        If A is a BSRTensor, the block Gauss-Seidel method is used, updating the dofs
+        of a block row together by the inverse of its diagonal block.
     """
+    if isinstance(A, BSRTensor):
+        return _block_gauss_seidel(A, b, x0, rtol, maxit, returninfo)
+
     from .mumps import spsolve_triangular
     assert isinstance(b, TensorLike), "b must be a Tensor"
     if x0 is not None:
@@ -80,3 +87,38 @@ def gauss_seidel(A: SupportsMatmul, b: TensorLike, x0: Optional[TensorLike]=None
         return x, info
     else:
         return x
+
+
+def _block_gauss_seidel(A: BSRTensor, b: TensorLike, x0: Optional[TensorLike],
+                        rtol: float, maxit: Optional[int], returninfo: bool):
+    from scipy.sparse.linalg import spsolve_triangular
+    from .jacobi import block_diagonal_solve
+
+    x = bm.zeros_like(b) if x0 is None else x0
+    Dinv = bm.linalg.inv(A.diagonal_blocks())
+    U = A.triu(k=1)
+    # (D + L)x = b - Ux is equivalent to (I + D^{-1}L)x = D^{-1}(b - Ux),
+    # which is lower triangular with unit diagonal in scalar entries.
+    M = A.tril(k=-1).block_scale(Dinv).to_scipy().tocsr()
+    info = {}
+    niter = 0
+
+    while True:
+        B = block_diagonal_solve(Dinv, b - U @ x)
+        x = bm.from_numpy(spsolve_triangular(M, bm.to_numpy(B), lower=True, unit_diagonal=True))
+        res = bm.linalg.norm(b - A @ x)
+        niter += 1
+        if res < rtol:
+            logger.info(f"Block Gauss Seidel: converged in {niter} iterations, "
+                        "stopped by relative tolerance.")
+            break
+
+        if (maxit is not None) and (niter >= maxit):
+            logger.info(f"Block Gauss Seidel: failed, stopped by maxiter ({maxit}).")
+            break
+    info['residual'] = res
+    info['niter'] = niter
+    if returninfo is True:
+        return x, info
+    else:
+        return x
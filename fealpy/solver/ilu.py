@@ -0,0 +1,300 @@
+from typing import Optional
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+from ..sparse import CSRTensor
+
+
+def _gather_ranges(start: TensorLike, count: TensorLike) -> TensorLike:
+    """The positions start[i]:start[i]+count[i] for all i, concatenated."""
+    offset = bm.cumsum(count) - count
+    return bm.repeat(start - offset, count) + bm.arange(int(bm.sum(count)), dtype=start.dtype)
+
+
+def level_schedule(row: TensorLike, col: TensorLike, n: int) -> TensorLike:
+    """
+    Levels of the rows of a triangular system, where row i depends on the
+    rows col[e] of its entries e with row[e] == i. A row only depends on rows
+    of lower levels, so the rows of a level can be solved at the same time.
+    The levels are found level by level as in Kahn's topological sort.
+
+    Parameters:
+        row, col (TensorLike): the off-diagonal entries of the triangular matrix.
+        n (int): number of rows.
+
+    Returns:
+        TensorLike: the level of each row.
+    """
+    indeg = bm.bincount(row, minlength=n)
+    order = bm.argsort(col, stable=True)
+    dependent = row[order]
+    dptr = bm.concatenate(([0], bm.cumsum(bm.bincount(col, minlength=n))))
+
+    level = bm.full(n, -1, dtype=row.dtype)
+    frontier = bm.nonzero(indeg == 0)[0]
+    l = 0
+    while len(frontier) > 0:
+        level[frontier] = l
+        dep = dependent[_gather_ranges(dptr[frontier], dptr[frontier + 1] - dptr[frontier])]
+        dep, count = bm.unique(dep, return_counts=True)
+        indeg[dep] -= count
+        frontier = dep[indeg[dep] == 0]
+        l += 1
+
+    if bm.any(level < 0):
+        raise ValueError("the matrix is not triangular in any ordering.")
+    return level
+
+
+class LevelScheduledTriangularSolver():
+    """
+    Solve with a sparse triangular matrix level by level. The rows of a level
+    do not depend on each other, so each level is one SpMV with its rows,
+
+        x[rows] = (b[rows] - T[rows, :] @ x) / diag[rows].
+
+    The structure is built once; the values are read from a value array at
+    fixed positions, so that a new factorization with the same pattern only
+    needs `update`.
+
+    Parameters:
+        row, col (TensorLike): the off-diagonal entries of the matrix.
+        pos (TensorLike): positions of the entries in the value array.
+        n (int): number of rows.
+    """
+    def __init__(self, row: TensorLike, col: TensorLike, pos: TensorLike, n: int):
+        self.n = n
+        level = level_schedule(row, col, n)
+        NL = int(bm.max(level)) + 1 if n > 0 else 0
+        order = bm.argsort(level, stable=True)
+        lptr = bm.concatenate(([0], bm.cumsum(bm.bincount(level, minlength=NL))))
+
+        local = bm.zeros(n, dtype=row.dtype)
+        local[order] = bm.arange(n, dtype=row.dtype) - lptr[level[order]]
+        eorder = bm.argsort(level[row], stable=True)
+        eptr = bm.concatenate(([0], bm.cumsum(bm.bincount(level[row], minlength=NL))))
+
+        self.rows, self.crow, self.col, self.pos = [], [], [], []
+        for l in range(NL):
+            rows = order[lptr[l]:lptr[l+1]]
+            e = eorder[eptr[l]:eptr[l+1]]
+            e = e[bm.argsort(local[row[e]], stable=True)]
+            counts = bm.bincount(local[row[e]], minlength=len(rows))
+            self.rows.append(rows)
+            self.crow.append(bm.concatenate(([0], bm.cumsum(counts))))
+            self.col.append(col[e])
+            self.pos.append(pos[e])
+
+    @property
+    def number_of_levels(self) -> int:
+        return len(self.rows)
+
+    def update(self, val: TensorLike, diag: Optional[TensorLike]=None) -> None:
+        """Read the values of the off-diagonal entries from `val`, and the
+        diagonal from `diag`, None for a unit diagonal."""
+        self.mats = [CSRTensor(crow, col, val[pos], (len(rows), self.n))
+                     for rows, crow, col, pos in zip(self.rows, self.crow, self.col, self.pos)]
+        self.dinv = None if diag is None else [1/diag[rows] for rows in self.rows]
+
+    def solve(self, b: TensorLike) -> TensorLike:
+        x = bm.copy(b)
+        for l, (rows, M) in enumerate(zip(self.rows, self.mats)):
+            xl = x[rows]
+            if M.nnz > 0:
+                xl = xl - M @ x
+            if self.dinv is not None:
+                dinv = self.dinv[l]
+                xl = xl * (dinv if x.ndim == 1 else dinv[:, None])
+            x[rows] = xl
+        return x
+
+
+class ILU0():
+    """
+    Incomplete LU factorization without fill-in, A ~ LU, where L is unit
+    lower triangular, U is upper triangular and both keep the pattern of A.
+
+    The factorization is split into a symbolic and a numeric phase. The
+    symbolic phase lists all the updates a[i, j] -= a[i, k] * a[k, j] allowed
+    by the pattern and groups them by the level of row i and the rank of k in
+    the row, so that the numeric phase is a short loop of vectorized updates.
+    `update(A)` with a matrix of the same pattern, e.g. in the next time step,
+    repeats only the numeric phase. The triangular solves are level scheduled.
+
+    Parameters:
+        A (CSRTensor, optional): the matrix, with a nonzero diagonal.
+    """
+    def __init__(self, A: Optional[CSRTensor]=None):
+        self._pattern = None
+        if A is not None:
+            self.setup(A)
+
+    def setup(self, A: CSRTensor, matrix_type: str='G') -> None:
+        self.matrix_type = matrix_type
+        self.update(A)
+
+    def update(self, A: CSRTensor) -> None:
+        """Factorize A, reusing the symbolic phase if its pattern is unchanged."""
+        if not isinstance(A, CSRTensor):
+            A = A.tocoo().coalesce().tocsr()
+        if not self._same_pattern(A):
+            self.symbolic(A)
+        self.numeric(A)
+
+    def _same_pattern(self, A: CSRTensor) -> bool:
+        if self._pattern is None:
+            return False
+        crow, col = self._pattern
+        return (A.shape == self.shape) and (len(A.indices) == len(col)) and \
+            bool(bm.all(A.indptr == crow)) and bool(bm.all(A.indices == col))
+
+    def symbolic(self, A: CSRTensor) -> None:
+        n = A.shape[0]
+        self.shape = A.shape
+        crow, col = A.indptr, A.indices
+        row = bm.repeat(bm.arange(n, dtype=col.dtype), crow[1:] - crow[:-1])
+        row64 = bm.astype(row, bm.int64)
+        key = row64 * n + col
+        if bm.any(key[1:] <= key[:-1]):
+            raise ValueError("ILU0 requires sorted column indices without duplicates.")
+        self._pattern = (bm.copy(crow), bm.copy(col))
+
+        # 对角元的位置
+        isdiag = row == col
+        if int(bm.sum(isdiag)) != n:
+            raise ValueError("ILU0 requires all the diagonal entries in the pattern.")
+        self.diag = bm.nonzero(isdiag)[0]
+
+        lower = bm.nonzero(col < row)[0]
+        upper = bm.nonzero(col > row)[0]
+        self.L = LevelScheduledTriangularSolver(row[lower], col[lower], lower, n)
+        self.U = LevelScheduledTriangularSolver(row[upper], col[upper], upper, n)
+
+        # 更新 a[i, j] -= a[i, k] * a[k, j]：p = (i, k) 为下三角元，q = (k, j) 为上三角元
+        k = col[lower]
+        uptr = self.diag + 1 # 各行上三角元从对角元之后开始
+        count = crow[k + 1] - uptr[k]
+        q = _gather_ranges(uptr[k], count)
+        p = bm.repeat(lower, count)
+        pq = row64[p] * n + col[q]
+        target = bm.searchsorted(key, pq)
+        target = bm.minimum(target, len(key) - 1)
+        flag = key[target] == pq
+        p, q, target = p[flag], q[flag], target[flag]
+
+        # 按 (行的层次, k 在行中的次序) 分组
+        level = bm.zeros(n, dtype=col.dtype)
+        for l, rows in enumerate(self.L.rows):
+            level[rows] = l
+        rank = lower - crow[row[lower]]
+        T = int(bm.max(rank)) + 1 if len(lower) > 0 else 1
+        group = level[row[lower]] * T + rank
+        order = bm.argsort(group, stable=True)
+        ug, gptr = bm.unique(group[order], return_index=True)
+        self.lower = lower[order]
+        self.gptr = bm.concatenate((gptr, [len(order)]))
+        self.pivot = self.diag[col[self.lower]]
+
+        lookup = bm.zeros(len(key), dtype=col.dtype)
+        lookup[lower] = group
+        tgroup = bm.searchsorted(ug, lookup[p])
+        order = bm.argsort(tgroup, stable=True)
+        self.p, self.q, self.target = p[order], q[order], target[order]
+        self.tptr = bm.concatenate(([0], bm.cumsum(bm.bincount(tgroup, minlength=len(ug)))))
+
+    def numeric(self, A: CSRTensor) -> None:
+        val = bm.copy(A.data)
+        lower, pivot, gptr = self.lower, self.pivot, self.gptr
+        p, q, target, tptr = self.p, self.q, self.target, self.tptr
+        for g in range(len(gptr) - 1):
+            e = lower[gptr[g]:gptr[g+1]]
+            val[e] = val[e] / val[pivot[gptr[g]:gptr[g+1]]]
+            s = slice(tptr[g], tptr[g+1])
+            val[target[s]] = val[target[s]] - val[p[s]] * val[q[s]]
+
+        if bm.any(val[self.diag] == 0):
+            raise ZeroDivisionError("ILU0 breaks down with a zero pivot.")
+        self.val = val
+        self.L.update(val)
+        self.U.update(val, val[self.diag])
+
+    def solve(self, b: TensorLike) -> TensorLike:
+        """Apply the preconditioner, x = U^{-1} L^{-1} b."""
+        return self.U.solve(self.L.solve(b))
+
+    def __matmul__(self, b: TensorLike) -> TensorLike:
+        return self.solve(b)
+
+
+class IC0(ILU0):
+    """
+    Incomplete Cholesky factorization without fill-in, A ~ L D L^T, for
+    symmetric positive definite matrices. It is computed by ILU(0), whose
+    factors of a symmetric matrix satisfy U = D L^T, and applied as
+    L^{-T} D^{-1} L^{-1}, which is symmetric as CG requires.
+
+    Parameters:
+        A (CSRTensor, optional): the symmetric matrix.
+    """
+    def symbolic(self, A: CSRTensor) -> None:
+        super().symbolic(A)
+        crow, col = A.indptr, A.indices
+        n = A.shape[0]
+        row = bm.repeat(bm.arange(n, dtype=col.dtype), crow[1:] - crow[:-1])
+        lower = bm.nonzero(col < row)[0]
+        # L^T 的非零元 (k, i) 取 L 在位置 (i, k) 的值
+        self.LT = LevelScheduledTriangularSolver(col[lower], row[lower], lower, n)
+
+    def numeric(self, A: CSRTensor) -> None:
+        super().numeric(A)
+        self.dinv = 1/self.val[self.diag]
+        self.LT.update(self.val)
+
+    def solve(self, b: TensorLike) -> TensorLike:
+        """Apply the preconditioner, x = L^{-T} D^{-1} L^{-1} b."""
+        y = self.L.solve(b)
+        y = y * (self.dinv if y.ndim == 1 else self.dinv[:, None])
+        return self.LT.solve(y)
+
+
+class ILUT():
+    """
+    Threshold incomplete LU factorization (ILUTP of SuperLU, through
+    `scipy.sparse.linalg.spilu`). Entries smaller than `drop_tol` times the
+    norm of their column are dropped, and the fill-in is limited by
+    `fill_factor`. The pattern depends on the values, so `update` always
+    factorizes again.
+
+    Parameters:
+        A (CSRTensor, optional): the matrix.
+        drop_tol (float): the drop tolerance. Defaults to 1e-4.
+        fill_factor (float): the upper bound of nnz(L+U)/nnz(A). Defaults to 10.
+        permc_spec (str): the fill-reducing ordering of SuperLU. Defaults to
+            'MMD_AT_PLUS_A', which is more robust for incomplete factors than
+            the default 'COLAMD' of `spilu`.
+    """
+    def __init__(self, A: Optional[CSRTensor]=None, drop_tol: float=1e-4,
+                 fill_factor: float=10.0, permc_spec: str='MMD_AT_PLUS_A'):
+        self.drop_tol = drop_tol
+        self.fill_factor = fill_factor
+        self.permc_spec = permc_spec
+        if A is not None:
+            self.setup(A)
+
+    def setup(self, A: CSRTensor, matrix_type: str='G') -> None:
+        self.matrix_type = matrix_type
+        self.update(A)
+
+    def update(self, A: CSRTensor) -> None:
+        """Factorize A."""
+        from scipy.sparse.linalg import spilu
+        self.shape = A.shape
+        self.ilu = spilu(A.tocsr().to_scipy().tocsc(), drop_tol=self.drop_tol,
+                         fill_factor=self.fill_factor, permc_spec=self.permc_spec)
+
+    def solve(self, b: TensorLike) -> TensorLike:
+        """Apply the preconditioner, x = U^{-1} L^{-1} b with the permutations."""
+        return bm.from_numpy(self.ilu.solve(bm.to_numpy(b)))
+
+    def __matmul__(self, b: TensorLike) -> TensorLike:
+        return self.solve(b)
@@ -3,6 +3,7 @@ from typing import Optional, Dict, Any, List
 import numpy as np
 from ..backend import backend_manager as bm
 from ..sparse import COOTensor, CSRTensor
+from .ilu import ILU0, IC0, ILUT
 
 class IterativeSolverNotAvailableError(Exception):
     """Exception indicating no iterative solver is available"""
@@ -19,6 +20,11 @@ class IterativeSolverManager:
         ism.set_pc('ilu')               # optional: if omitted, no preconditioner
         ism.set_tolerances(rtol=1e-5, atol=1e-5, maxit=5000)
         x = ism.solve(b)
+
+    Preconditioners with an `update` method (ILU(0), IC(0)) are kept by
+    `set_matrix` and refactorized with the new matrix, so that a sequence of
+    matrices with the same pattern, e.g. in time stepping, reuses the
+    symbolic factorization.
     """
     _SOLVER_MAPPING: Dict[str, Any] = {}
     _PC_MAPPING: Dict[str, Any] = {}
@@ -49,6 +55,7 @@ class IterativeSolverManager:
         self.matrix_type: str = 'G'
         self.solver_name: Optional[str] = None
         self.pc_name: Optional[str] = None
+        self.pc_kwargs: Dict[str, Any] = {}
         self.raw_kwargs: Dict[str, Any] = {}
         self.rtol: float = 1e-8
         self.atol: float = 1e-8
@@ -60,9 +67,13 @@ class IterativeSolverManager:
         self.A = A
         self.matrix_type = matrix_type
         # clear cache
-        for attr in ('solver', 'pc'):
-            if hasattr(self._cache, attr):
-                delattr(self._cache, attr)
+        if hasattr(self._cache, 'solver'):
+            delattr(self._cache, 'solver')
+        if hasattr(self._cache, 'pc'):
+            if hasattr(self._cache.pc, 'update'):
+                self._cache.pc_stale = True # 在下次使用时用新矩阵重新分解
+            else:
+                delattr(self._cache, 'pc')
         # update available lists
         self._available_solvers = list(self._SOLVER_MAPPING.keys())
         self._available_pcs = list(self._PC_MAPPING.keys())
@@ -93,10 +104,11 @@ class IterativeSolverManager:
         self.pc_name = pc_name
         if self.pc_name and self.pc_name not in self._PC_MAPPING:
             raise IterativeSolverNotAvailableError(f"Preconditioner '{self.pc_name}' not registered; available: {self._available_pcs}")
-        self.raw_kwargs.update(kwargs)
+        self.pc_kwargs = kwargs
         # clear pc cache
         if hasattr(self._cache, 'pc'):
             delattr(self._cache, 'pc')
+        self._cache.pc_stale = False
 
     def set_tolerances(self, rtol: float = 1e-8, atol: float = 1e-8, maxit: int = 1000) -> None:
         self.rtol = rtol
@@ -107,9 +119,13 @@ class IterativeSolverManager:
         if not self.pc_name:
             return None
 
+        if hasattr(self._cache, 'pc') and getattr(self._cache, 'pc_stale', False):
+            self._cache.pc.update(self.A)
+            self._cache.pc_stale = False
+
         if not hasattr(self._cache, 'pc'):
             pc_cls = self._PC_MAPPING[self.pc_name]
-            pc = pc_cls()
+            pc = pc_cls(**self.pc_kwargs)
 
             if hasattr(pc, 'setup'):
                 pc.setup(self.A, matrix_type=self.matrix_type)
@@ -153,6 +169,19 @@ class IterativeSolverManager:
         return self._cache.solver
 
     def solve(self, b: Any):
+        """
+        Solve A x = b.
+
+        Parameters:
+            b: right-hand side shaped (N,) or (N, K). With 'cg' and 'bicgstab'
+                the K columns are solved together, so that the matrix is applied
+                to blocks of vectors; 'gmres' and 'minres' solve the columns one
+                after another; 'lgmres' and 'bicg' only take a single column.
+        Returns:
+            x: solution with the shape of `b`.
+        """
+        if b.ndim not in {1, 2}:
+            raise ValueError("b must be a 1D or 2D dense tensor")
         if self.A is None:
             raise ValueError("Matrix not set. Call set_matrix() first.")
         if self.solver_name is None or self.solver_name == 'auto':
@@ -279,6 +308,27 @@ class JacobiPreconditioner:
         diags = A.diags()
         return CSRTensor(diags.crow, diags.col, 1/diags.values, A.shape)
 
+@IterativeSolverManager.register_pc('ilu')
+@IterativeSolverManager.register_pc('ilu0')
+class ILU0Preconditioner(ILU0):
+    """
+    ILU(0) preconditioner for general matrices, with a cached symbolic
+    factorization and level-scheduled triangular solves.
+    """
+
+@IterativeSolverManager.register_pc('ilut')
+class ILUTPreconditioner(ILUT):
+    """
+    Threshold ILU preconditioner for hard nonsymmetric matrices, e.g. from
+    convection-dominated problems. Options: drop_tol, fill_factor, permc_spec.
+    """
+
+@IterativeSolverManager.register_pc('ic0')
+class IC0Preconditioner(IC0):
+    """
+    IC(0) preconditioner for symmetric positive definite matrices, e.g. with CG.
+    """
+
 @IterativeSolverManager.register_pc('mg')   
 class GAMGPreconditioner:
     
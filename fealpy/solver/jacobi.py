@@ -6,6 +6,7 @@ from scipy.sparse.linalg import spsolve,spsolve_triangular
 #from .mumps import spsolve, spsolve_triangular
 from ..sparse.coo_tensor import COOTensor
 from ..sparse.csr_tensor import CSRTensor
+from ..sparse.bsr_tensor import BSRTensor
 
 from .. import logger
 
@@ -28,6 +29,8 @@ def jacobi(A: SupportsMatmul, b: TensorLike, x0: Optional[TensorLike]=None,
 
     Returns:
         Tensor: The approximate solution to the system Ax = b.
+        If A is a BSRTensor, the block Jacobi method is used with the inverses
+        of the diagonal blocks.
 
     Raises:
         ValueError: If inputs do not meet the specified conditions (e.g., A is not sparse, dimensions mismatch).
@@ -51,6 +54,9 @@ def jacobi(A: SupportsMatmul, b: TensorLike, x0: Optional[TensorLike]=None,
         if x0.shape != b.shape:
             raise ValueError("x0 and b must have the same shape")
 
+    if isinstance(A, BSRTensor):
+        return _block_jacobi(A, b, x0, rtol, maxit, returninfo)
+
     # Tensor splitting
     info = {}
     U = A.triu(k=1)
@@ -82,3 +88,36 @@ def jacobi(A: SupportsMatmul, b: TensorLike, x0: Optional[TensorLike]=None,
         return x, info
     else:
         return x
+
+
+def block_diagonal_solve(Dinv: TensorLike, r: TensorLike) -> TensorLike:
+    """Apply the inverted diagonal blocks Dinv, shaped (NB, R, R), to r shaped (NB*R, ...)."""
+    R = Dinv.shape[-1]
+    rb = bm.reshape(r, (-1, R) + tuple(r.shape[1:]))
+    return bm.reshape(bm.einsum('bij, bj... -> bi...', Dinv, rb), r.shape)
+
+
+def _block_jacobi(A: BSRTensor, b: TensorLike, x: TensorLike,
+                  rtol: float, maxit: Optional[int], returninfo: bool):
+    Dinv = bm.linalg.inv(A.diagonal_blocks())
+    info = {}
+    niter = 0
+
+    while True:
+        x = x + block_diagonal_solve(Dinv, b - A @ x)
+        res = bm.linalg.norm(b - A @ x)
+        niter += 1
+        if res < rtol:
+            logger.info(f"Block Jacobi: converged in {niter} iterations, "
+                        "stopped by relative tolerance.")
+            break
+
+        if (maxit is not None) and (niter >= maxit):
+            logger.info(f"Block Jacobi: failed, stopped by maxiter ({maxit}).")
+            break
+    info['residual'] = res
+    info['niter'] = niter
+    if returninfo is True:
+        return x, info
+    else:
+        return x
@@ -27,6 +27,7 @@ def minres(
     Parameters:
         A (SupportsMatmul): The coefficient matrix of the linear system.
         b (TensorLike): The right-hand side vector of the linear system, can be a 1D or 2D tensor.
+            The columns of a 2D tensor are solved one after another.
         x0 (TensorLike, optional): Initial guess for the solution, a 1D or 2D tensor.
             Must have the same shape as b when reshaped appropriately. Defaults to None.
         atol (float, optional): Absolute tolerance for convergence. Defaults to 1e-12.
@@ -38,7 +39,8 @@ def minres(
 
     Returns:
         TensorLike: The approximate solution to the system Ax = b.
-        dict: Information dictionary containing residual, iteration count, and relative tolerance.
+        dict: Information dictionary containing residual, iteration count, and relative tolerance,
+            which are given for every column if b is a 2D tensor.
 
     Raises:
         ValueError: If inputs do not meet specified conditions (e.g., dimensions mismatch).
@@ -54,6 +56,15 @@ def minres(
     elif x0.shape != b.shape:
         raise ValueError("x0 and b must have the same shape")
     
+    if b.ndim == 2:
+        # Every column builds its own Krylov space, so they are solved in turn.
+        sols, infos = zip(*[minres(A, b[:, i], x0[:, i], atol, rtol, maxit, M)
+                            for i in range(b.shape[1])])
+        info = {'residual': bm.tensor([float(i['residual']) for i in infos]),
+                'niter': bm.tensor([int(i['niter']) for i in infos]),
+                'relative tolerance': bm.tensor([float(i['relative tolerance']) for i in infos])}
+        return bm.stack(sols, axis=1), info
+
     m, n = A.shape  # Matrix dimensions
 
     maxit = maxit or 5 * m  # Default maximum iterations
@@ -0,0 +1,504 @@
+from typing import Optional, Protocol
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+
+from .. import logger
+
+
+class SupportsMatmul(Protocol):
+    def __matmul__(self, other: TensorLike) -> TensorLike: ...
+
+
+def _check_input(b, x0):
+    assert isinstance(b, TensorLike), "b must be a Tensor"
+    if b.ndim not in {1, 2}:
+        raise ValueError("b must be a 1D or 2D dense tensor")
+    if x0 is None:
+        return bm.zeros_like(b)
+    assert isinstance(x0, TensorLike), "x0 must be a Tensor if not None"
+    if x0.shape != b.shape:
+        raise ValueError("x0 and b must have the same shape")
+    return bm.copy(x0)
+
+
+def _real_basis(vals, vecs, k):
+    """
+    A real basis of the eigenvectors of the k eigenvalues with the largest
+    modulus. A complex conjugate pair contributes the real and the imaginary
+    part of its eigenvector.
+    """
+    order = bm.argsort(-bm.abs(vals))
+    cols = []
+    for i in order:
+        if len(cols) >= k:
+            break
+        if bm.imag(vals[i]) < 0:
+            continue
+        cols.append(bm.real(vecs[:, i]))
+        if bm.imag(vals[i]) > 0:
+            cols.append(bm.imag(vecs[:, i]))
+    return bm.stack(cols[:k], axis=1)
+
+
+def _independent_qr(P, tol=1e-12):
+    """QR factorization of P with the nearly dependent columns dropped."""
+    Q, R = bm.linalg.qr(P)
+    i = bm.arange(R.shape[0])
+    d = bm.abs(R[i, i])
+    keep = d > tol*bm.max(d)
+    if not bm.all(keep):
+        Q, R = bm.linalg.qr(P[:, keep])
+    return Q, R, keep
+
+
+def gcrodr(
+    A: SupportsMatmul,
+    b: TensorLike,
+    x0: Optional[TensorLike] = None,
+    atol: float = 1e-12,
+    rtol: float = 1e-8,
+    restart: Optional[int] = None,
+    k: Optional[int] = None,
+    maxit: Optional[int] = None,
+    M: Optional[SupportsMatmul] = None,
+    U: Optional[TensorLike] = None
+) -> tuple[TensorLike, dict]:
+    """
+    Solve a linear system Ax = b using GMRES with deflated restarting and
+    Krylov subspace recycling (GCRO-DR).
+
+    At every restart the harmonic Ritz vectors of the k eigenvalues of `A`
+    closest to zero are kept in the recycle space U, and the next cycle
+    works on the complement of C = AU. The space U returned in the info
+    dictionary can be given to the next call on a nearby system, for
+    example the next time step, so that the new solve starts with the slow
+    eigenvectors already deflated.
+
+    Parameters:
+        A (SupportsMatmul): The coefficient matrix of the linear system.
+        b (TensorLike): The right-hand side vector of the linear system, can be a 1D or 2D tensor.
+            The columns of a 2D tensor are solved one after another, each one
+            recycling the space of the previous column.
+        x0 (TensorLike, optional): Initial guess for the solution, a 1D or 2D tensor.
+            Must have the same shape as b. Defaults to None.
+        atol (float, optional): Absolute tolerance for convergence. Defaults to 1e-12.
+        rtol (float, optional): Relative tolerance for convergence. Defaults to 1e-8.
+        restart (int, optional): Dimension of the search space of a cycle, the recycle
+            space included. Defaults to ``min(30, m)``.
+        k (int, optional): Dimension of the recycle space, less than `restart`. Defaults to 10.
+        maxit (int, optional): Maximum number of iterations allowed. Defaults to 5*m.
+        M (TensorLike): Inverse of the preconditioner of `A`. Left preconditioning is used
+            as in `gmres`, and the recycle space belongs to the preconditioned operator.
+            Defaults to None.
+        U (TensorLike, optional): The recycle space of a previous solve, with shape
+            (k, m), one vector per row. Defaults to None.
+
+    Returns:
+        TensorLike: The approximate solution to the system Ax = b.
+        dict: Information dictionary containing residual and iteration count, and the
+            recycle space 'U' for the next solve. The k products with A to rebuild
+            C = AU from a given U are not counted in the iterations.
+
+    Raises:
+        ValueError: If inputs do not meet specified conditions (e.g., dimensions mismatch).
+    """
+    x = _check_input(b, x0)
+
+    if b.ndim == 2:
+        sols, infos = [], []
+        for i in range(b.shape[1]):
+            sol, info = gcrodr(A, b[:, i], x[:, i], atol, rtol, restart, k, maxit, M, U)
+            U = info['U']
+            sols.append(sol)
+            infos.append(info)
+        info = {'residual': bm.tensor([float(i['residual']) for i in infos]),
+                'niter': bm.tensor([int(i['niter']) for i in infos]),
+                'U': U}
+        return bm.stack(sols, axis=1), info
+
+    m, n = A.shape
+    restart = min(30 if restart is None else restart, m)
+    k = min(10 if k is None else k, restart - 1)
+    if maxit is None:
+        maxit = 5 * m
+
+    kwags = bm.context(b)
+    eps = bm.finfo(b.dtype).eps
+
+    if M is None:
+        op = lambda v: A @ v
+    else:
+        op = lambda v: M @ (A @ v)
+
+    b_norm = bm.linalg.norm(b)
+    atol = max(float(atol), float(rtol) * float(b_norm))
+
+    rt = b - A @ x if bm.any(x) else bm.copy(b)
+    res = bm.linalg.norm(rt)
+    niter = 0
+
+    C = None
+    if (U is not None) and (U.shape[0] > 0) and (res > atol) and (k > 0):
+        # 对新的矩阵重新计算 C = AU，并正交化
+        C = bm.stack([op(u) for u in U[:k]], axis=0)
+        Q, R, keep = _independent_qr(C.T)
+        C = Q.T
+        U = bm.linalg.solve(R.T, U[:k][keep])
+    else:
+        U = None
+
+    while (res > atol) and (niter < maxit):
+        r = M @ rt if M is not None else rt
+        # 预条件残量与真实残量之比，用来换算循环内的停止条件
+        ptol = atol * bm.linalg.norm(r) / res
+        kc = 0
+        if C is not None:
+            kc = C.shape[0]
+            c = C @ r
+            x = x + c @ U
+            r = r - c @ C
+
+        beta = bm.linalg.norm(r)
+        if beta <= ptol:
+            rt = b - A @ x
+            res = bm.linalg.norm(rt)
+            break
+
+        s = restart - kc
+        V = bm.zeros((s + 1, n), **kwags)
+        V[0] = r / beta
+        G = bm.zeros((kc + s + 1, kc + s), **kwags)
+        t = bm.zeros(kc + s + 1, **kwags)
+        t[kc] = beta
+        if kc > 0:
+            d = 1 / bm.linalg.norm(U, axis=1)
+            idx = bm.arange(kc)
+            G[idx, idx] = d
+            Ut = U * d[:, None]
+
+        for j in range(s):
+            niter += 1
+            w = op(V[j])
+            h0 = bm.linalg.norm(w)
+            # 两次经典 Gram-Schmidt，先对 C 再对 V 正交化
+            for _ in range(2):
+                if kc > 0:
+                    h = C @ w
+                    G[:kc, kc + j] += h
+                    w = w - h @ C
+                h = V[:j + 1] @ w
+                G[kc:kc + j + 1, kc + j] += h
+                w = w - h @ V[:j + 1]
+            h1 = bm.linalg.norm(w)
+            G[kc + j + 1, kc + j] = h1
+            breakdown = h1 <= eps * h0
+            if not breakdown:
+                V[j + 1] = w / h1
+
+            l = kc + j + 1
+            y = bm.linalg.lstsq(G[:l + 1, :l], t[:l + 1], rcond=None)[0]
+            presid = bm.linalg.norm(t[:l + 1] - G[:l + 1, :l] @ y)
+            if (presid <= ptol) or breakdown or (niter >= maxit):
+                break
+
+        G = G[:l + 1, :l]
+        if kc > 0:
+            What = bm.concat([C, V[:j + 2]], axis=0)
+            Vhat = bm.concat([Ut, V[:j + 1]], axis=0)
+        else:
+            What, Vhat = V[:j + 2], V[:j + 1]
+        x = x + y @ Vhat
+
+        if k > 0:
+            # 调和 Ritz 向量: G^T G z = theta G^T What^T Vhat z，保留 |theta| 最小的 k 个
+            H = bm.linalg.solve(G.T @ G, G.T @ (What @ Vhat.T))
+            vals, vecs = bm.linalg.eig(H)
+            P = _real_basis(vals, vecs, min(k, l))
+            Q, R, keep = _independent_qr(G @ P)
+            C = Q.T @ What
+            U = bm.linalg.solve(R.T, P[:, keep].T @ Vhat)
+
+        rt = b - A @ x
+        res = bm.linalg.norm(rt)
+
+        if breakdown:
+            logger.info("Breakdown detected in Arnoldi process.")
+            break
+
+    if res <= atol:
+        logger.info(f"GCRO-DR converged in {niter} iterations (tolerance: {atol:.1e})")
+    else:
+        logger.info(f"GCRO-DR failed to converge within {maxit} iterations.")
+
+    return x, {'residual': res, 'niter': niter, 'U': U}
+
+
+def deflated_cg(
+    A: SupportsMatmul,
+    b: TensorLike,
+    x0: Optional[TensorLike] = None,
+    M: Optional[SupportsMatmul] = None, *,
+    W: Optional[TensorLike] = None,
+    k: Optional[int] = None,
+    atol: float = 1e-12,
+    rtol: float = 1e-8,
+    maxit: Optional[int] = 10000
+) -> tuple[TensorLike, dict]:
+    """
+    Solve a symmetric positive definite linear system Ax = b by the
+    preconditioned conjugate gradient method deflated with the space W.
+
+    The iterates stay A-orthogonal to W, so the eigenvalues of `A` captured
+    by W no longer slow down the convergence. After the solve, the Ritz
+    vectors of the k smallest eigenvalues in the space of W and the first
+    search directions become the new W, which can be given to the next call
+    on a nearby system.
+
+    Parameters:
+        A (SupportsMatmul): The symmetric positive definite coefficient matrix.
+        b (TensorLike): The right-hand side vector, can be a 1D or 2D tensor.
+            The columns of a 2D tensor are solved one after another, each one
+            recycling the space of the previous column.
+        x0 (TensorLike, optional): Initial guess for the solution. Defaults to None.
+        M (TensorLike): Inverse of the preconditioner of `A`. Defaults to None.
+        W (TensorLike, optional): The deflation space of a previous solve, with shape
+            (k, m), one vector per row. Defaults to None.
+        k (int, optional): Dimension of the deflation space. Defaults to 10.
+        atol (float, optional): Absolute tolerance for convergence. Defaults to 1e-12.
+        rtol (float, optional): Relative tolerance for convergence. Defaults to 1e-8.
+        maxit (int, optional): Maximum number of iterations allowed. Default is 10000.
+
+    Returns:
+        TensorLike: The approximate solution to the system Ax = b.
+        dict: Information dictionary containing residual and iteration count, and the
+            deflation space 'W' for the next solve.
+
+    Reference:
+        Y. Saad, M. Yeung, J. Erhel, F. Guyomarc'h, A deflated version of the
+        conjugate gradient algorithm, SIAM J. Sci. Comput., 2000.
+    """
+    x = _check_input(b, x0)
+
+    if b.ndim == 2:
+        sols, infos = [], []
+        for i in range(b.shape[1]):
+            sol, info = deflated_cg(A, b[:, i], x[:, i], M, W=W, k=k,
+                                    atol=atol, rtol=rtol, maxit=maxit)
+            W = info['W']
+            sols.append(sol)
+            infos.append(info)
+        info = {'residual': bm.tensor([float(i['residual']) for i in infos]),
+                'niter': bm.tensor([int(i['niter']) for i in infos]),
+                'W': W}
+        return bm.stack(sols, axis=1), info
+
+    k = 10 if k is None else k
+    atol = max(float(atol), float(rtol) * float(bm.linalg.norm(b)))
+
+    r = b - A @ x
+    if (W is not None) and (W.shape[0] > 0):
+        W = W[:k]
+        AW = bm.stack([A @ w for w in W], axis=0)
+        WAW = W @ AW.T
+        WAW = (WAW + WAW.T) / 2
+        mu = bm.linalg.solve(WAW, W @ r)
+        x = x + mu @ W
+        r = r - mu @ AW
+        project = lambda z: z - bm.linalg.solve(WAW, AW @ z) @ W
+    else:
+        W = AW = None
+        project = lambda z: z
+
+    res = bm.linalg.norm(r)
+    niter = 0
+    # 存下前 2k 个 A-单位化的搜索方向，求解后用来更新收缩空间
+    P, AP = [], []
+    if res > atol:
+        z = M @ r if M is not None else r
+        p = project(z)
+        rz = bm.dot(r, z)
+        while True:
+            Ap = A @ p
+            pAp = bm.dot(p, Ap)
+            alpha = rz / pAp
+            if len(P) < 2 * k:
+                s = 1 / bm.sqrt(pAp)
+                P.append(s * p)
+                AP.append(s * Ap)
+            x = x + alpha * p
+            r = r - alpha * Ap
+            res = bm.linalg.norm(r)
+            niter += 1
+            if res <= atol:
+                logger.info(f"Deflated CG: converged in {niter} iterations.")
+                break
+            if (maxit is not None) and (niter >= maxit):
+                logger.info(f"Deflated CG: failed, stopped by maxit ({maxit}).")
+                break
+            z = M @ r if M is not None else r
+            rz_new = bm.dot(r, z)
+            p = project(z) + (rz_new / rz) * p
+            rz = rz_new
+
+    if (k > 0) and (len(P) > 0):
+        Z = bm.stack(P, axis=0)
+        AZ = bm.stack(AP, axis=0)
+        if W is not None:
+            Z = bm.concat([W, Z], axis=0)
+            AZ = bm.concat([AW, AZ], axis=0)
+        # Rayleigh-Ritz: Z^T A Z y = theta Z^T Z y，先把 Z^T Z 化为单位阵
+        lam, S = bm.linalg.eigh(Z @ Z.T)
+        keep = lam > 1e-12 * bm.max(lam)
+        T = S[:, keep] / bm.sqrt(lam[keep])
+        F = Z @ AZ.T
+        F = T.T @ ((F + F.T) / 2) @ T
+        theta, Y = bm.linalg.eigh(F)
+        W = (T @ Y[:, :k]).T @ Z
+
+    return x, {'residual': res, 'niter': niter, 'W': W}
+
+
+class SolverSession():
+    """
+    Keep the state of an iterative solver over a sequence of slowly varying
+    linear systems, such as the systems of the time steps of a transient
+    simulation. Every solve
+
+    1. starts from an initial guess built from the previous solutions, and
+    2. recycles the Krylov subspace of the previous solve, by `gcrodr` for
+       general matrices or by `deflated_cg` for symmetric positive definite
+       ones.
+
+    A session belongs to one sequence of systems; use one session for each
+    of the systems solved in a time step. Since `__call__` takes `A` and `b`,
+    a session can be given directly as a custom solver.
+
+    Parameters:
+        method (str): 'gmres' or 'cg'. Defaults to 'gmres'.
+        M (SupportsMatmul, optional): Inverse of the preconditioner, kept
+            until a new one is given. Defaults to None.
+        recycle (int): Dimension of the recycle space, 0 for no recycling.
+            Defaults to 10.
+        guess (str, optional): The initial guess, one of
+            - None: zero,
+            - 'previous': the previous solution,
+            - 'extrapolate': polynomial extrapolation of the previous solutions
+              in the step index, up to the second order,
+            - 'project': the best approximation in the span of the previous
+              solutions, in the A-norm for 'cg' and in the residual norm for
+              'gmres'. It costs one product with A per stored solution.
+            Defaults to 'project'.
+        history (int): Number of previous solutions kept for the initial guess.
+            Defaults to 4.
+        atol, rtol (float): Tolerances of the solver.
+        restart (int, optional): Restart length of 'gmres'.
+        maxit (int, optional): Maximum number of iterations.
+
+    Example:
+        session = SolverSession(method='gmres', recycle=10)
+        for t in timeline:
+            A, b = assemble(t)
+            x = session.solve(b, A=A)
+        print(session.niter)
+    """
+    _methods = ('gmres', 'cg')
+    _guesses = (None, 'previous', 'extrapolate', 'project')
+
+    def __init__(self, method: str = 'gmres', M: Optional[SupportsMatmul] = None, *,
+                 recycle: int = 10, guess: Optional[str] = 'project', history: int = 4,
+                 atol: float = 1e-12, rtol: float = 1e-8,
+                 restart: Optional[int] = None, maxit: Optional[int] = None):
+        if method not in self._methods:
+            raise ValueError(f"method must be one of {self._methods}, got {method!r}")
+        if guess not in self._guesses:
+            raise ValueError(f"guess must be one of {self._guesses}, got {guess!r}")
+        self.method = method
+        self.M = M
+        self.recycle = recycle
+        self.guess = guess
+        self.history = max(int(history), 1)
+        self.atol = atol
+        self.rtol = rtol
+        self.restart = restart
+        self.maxit = maxit
+        self.A = None
+        self.reset()
+
+    def reset(self):
+        """Forget the recycle space, the previous solutions and the statistics."""
+        self.space = None
+        self.solutions = []
+        self.niter = []
+        self.info = {}
+
+    def set_matrix(self, A: SupportsMatmul, M: Optional[SupportsMatmul] = None):
+        """Set the matrix of the next solves, and the preconditioner if given."""
+        self.A = A
+        if M is not None:
+            self.M = M
+
+    def initial_guess(self, b: TensorLike) -> TensorLike:
+        """The initial guess of the system with the right-hand side b."""
+        X = self.solutions
+        if (self.guess is None) or (len(X) == 0):
+            return bm.zeros_like(b)
+        if self.guess == 'previous':
+            return bm.copy(X[-1])
+        if self.guess == 'extrapolate':
+            coef = [[1.0], [2.0, -1.0], [3.0, -3.0, 1.0]][min(len(X), 3) - 1]
+            return sum(c * X[-1 - i] for i, c in enumerate(coef))
+
+        Q, _, _ = _independent_qr(bm.stack(X, axis=1))
+        AQ = bm.stack([self.A @ q for q in Q.T], axis=1)
+        if self.method == 'cg':
+            c = bm.linalg.solve(Q.T @ AQ, Q.T @ b)
+        else:
+            c = bm.linalg.lstsq(AQ, b, rcond=None)[0]
+        return Q @ c
+
+    def solve(self, b: TensorLike, A: Optional[SupportsMatmul] = None,
+              M: Optional[SupportsMatmul] = None) -> TensorLike:
+        """
+        Solve the next system of the sequence.
+
+        Parameters:
+            b (TensorLike): The right-hand side, a 1D tensor.
+            A (SupportsMatmul, optional): The matrix of this system. Defaults
+                to the matrix of the previous solve.
+            M (SupportsMatmul, optional): A new preconditioner. Defaults to
+                the previous one.
+
+        Returns:
+            TensorLike: The solution.
+        """
+        if A is not None:
+            self.set_matrix(A, M)
+        elif M is not None:
+            self.M = M
+        if self.A is None:
+            raise ValueError("the matrix of the session is not set")
+        if b.ndim != 1:
+            raise ValueError("a solver session solves for one right-hand side at a time")
+
+        x0 = self.initial_guess(b)
+        if self.method == 'gmres':
+            x, info = gcrodr(self.A, b, x0, atol=self.atol, rtol=self.rtol,
+                             restart=self.restart, k=self.recycle, maxit=self.maxit,
+                             M=self.M, U=self.space)
+            self.space = info['U']
+        else:
+            x, info = deflated_cg(self.A, b, x0, self.M, W=self.space, k=self.recycle,
+                                  atol=self.atol, rtol=self.rtol,
+                                  maxit=10000 if self.maxit is None else self.maxit)
+            self.space = info['W']
+
+        self.solutions.append(x)
+        if len(self.solutions) > self.history:
+            self.solutions.pop(0)
+        self.niter.append(int(info['niter']))
+        self.info = info
+        return x
+
+    def __call__(self, A: SupportsMatmul, b: TensorLike) -> TensorLike:
+        return self.solve(b, A=A)
@@ -7,6 +7,7 @@ from ..backend import Size
 from .sparse_tensor import SparseTensor
 from .coo_tensor import COOTensor
 from .csr_tensor import CSRTensor
+from .bsr_tensor import BSRTensor
 
 from .ops import spdiags, speye
 
@@ -65,7 +66,7 @@ def coo_matrix(arg1, /, *,
         values = bm.copy(arg1[indices_tuple])
         return COOTensor(indices, values, arg1.shape)
 
-    elif isinstance(arg1, (COOTensor, CSRTensor)):
+    elif isinstance(arg1, SparseTensor):
         return arg1.tocoo()
 
     elif isinstance(arg1, (tuple, list)):
@@ -171,12 +172,13 @@ def csr_matrix(arg1,
 # values_context,
 # (COO) indices, values,
 # (CSR) crow, col, values
+# (BSR) crow, col, values, blocksize
 
 # 2. Data Type & Device Management:
 # astype, device_put
 
 # 3. Format Conversion:
-# to_dense (=toarray), tocsr, tocoo
+# to_dense (=toarray), tocsr, tocoo, tobsr
 
 # 4. Object Conversion:
 # to_scipy, from_scipy,
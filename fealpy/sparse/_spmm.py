@@ -50,24 +50,28 @@ def spmm_coo(indices: _DT, values: _DT, spshape: _Size, x: _DT) -> _DT:
 def spmm_csr(crow: _DT, col: _DT, values: _DT, spshape: _Size, x: _DT) -> _DT:
     _shape_check(spshape, x.shape)
     nrow = spshape[0]
-    unsqueezed = False
+    kwargs = bm.context(crow)
+    row = bm.repeat(bm.arange(nrow, **kwargs), crow[1:] - crow[:-1])
+    indices = bm.stack([row, col], axis=0)
 
-    if x.ndim == 1:
-        x = x[:, None]
-        unsqueezed = True
-
-    shape = x.shape[:-2] + (nrow, x.shape[-1])
-    result = bm.zeros(shape, dtype=x.dtype)
+    return spmm_coo(indices, values, spshape, x)
 
-    for i in range(nrow):
-        start = crow[i]
-        end = crow[i + 1]
-        r = bm.einsum('...i, ...ij -> ...j', values[..., start:end], x[..., col[start:end], :])
-        # result[..., i, :] = r
-        result = bm.set_at(result, (Ellipsis, i, slice(None)), r)
 
+def spmm_bsr(crow: _DT, col: _DT, values: _DT, spshape: _Size, x: _DT) -> _DT:
+    _shape_check(spshape, x.shape)
+    if x.ndim > 2:
+        raise ValueError("BSR tensor can only multiply 1-D or 2-D tensors.")
+    R, C = values.shape[-2:]
+    nbrow = crow.shape[0] - 1
+    kwargs = bm.context(crow)
+    row = bm.repeat(bm.arange(nbrow, **kwargs), crow[1:] - crow[:-1])
+    xb = bm.reshape(x, (-1, C) + tuple(x.shape[1:])) # (nbcol, C[, K])
 
-    if unsqueezed:
-        result = result[..., 0]
+    if x.ndim == 1:
+        new_vals = bm.einsum('bij, bj -> bi', values, xb[col])
+    else:
+        new_vals = bm.einsum('bij, bjk -> bik', values, xb[col])
 
-    return result
+    result = bm.zeros((nbrow, R) + tuple(x.shape[1:]), dtype=new_vals.dtype)
+    result = bm.index_add(result, row, new_vals, axis=0)
+    return bm.reshape(result, (spshape[0], ) + tuple(x.shape[1:]))
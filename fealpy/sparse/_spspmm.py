@@ -59,7 +59,8 @@ def spspmm_coo(indices1: _DT, values1: _DT, spshape1: _Size,
 
 
 def spspmm_csr(crow1: _DT, col1: _DT, values1: _DT, spshape1: _Size,
-               crow2: _DT, col2: _DT, values2: _DT, spshape2: _Size) -> Tuple[_DT, _DT, _Size]:
+               crow2: _DT, col2: _DT, values2: _DT, spshape2: _Size) -> Tuple[_DT, _DT, _DT, _Size]:
+    from .coo_tensor import COOTensor
     _shape_check(spshape1, spshape2)
 
     structure = values1.shape[:-1]
@@ -67,49 +68,18 @@ def spspmm_csr(crow1: _DT, col1: _DT, values1: _DT, spshape1: _Size,
         raise ValueError(f"the dense shape of matrix2 ({values2.shape[:-1]}) "
                          f"must match that of matrix1 {structure}")
 
-    size = spshape1[0]
-    indices_list = []
-    values_list = []
-    kargs = bm.context(crow1)
-    new_crow = bm.zeros(size+1, **kargs)
-
-    for i in range(size):
-        row = bm.array([], **kargs)
-        left_col_flag = (col1 == i)
-
-        for x in bm.where(left_col_flag == True)[0]+1:
-            flag = ~(x>crow1[:-1])^(x<=crow1[1:])
-            row = bm.concat((row,(bm.where(flag == True))[0]))
-
-        col = col2[crow2[i]:crow2[i+1]]
-
-        if not bm.any(row, axis=0):
-            continue
-
-        if not bm.any(col, axis=0):
-            continue
-
-        idx = bm.meshgrid(row, col, indexing='ij')
-        nnz = col.shape[0] * row.shape[0]
-        idx = bm.reshape(bm.stack(idx, axis=0), (2, nnz))
-        val1 = values1[..., left_col_flag]
-        val2 = values2[..., crow2[i]:crow2[i+1]]
-        val = bm.einsum('...i, ...j -> ...ij', val1, val2).reshape(*structure, nnz)
-
-        indices_list.append(idx)
-        values_list.append(val)
-
-    indices = bm.concat(indices_list, axis=1)
-    values = bm.concat(values_list, axis=-1)
-
-    unique_indices, inverse_indices = bm.unique(indices, return_inverse=True, axis=1)
-    new_values = bm.zeros(unique_indices.shape[1])
-    new_values = bm.index_add(new_values, inverse_indices, values, axis=-1)
-
-    for x in unique_indices[0,:]:
-        # new_crow[x+1]+=1
-        new_crow = bm.set_at(new_crow, x+1, new_crow[x+1])
-
-    new_crow=bm.cumsum(new_crow, axis =-1)
-
-    return new_crow, unique_indices[1,:], new_values,(spshape1[0], spshape2[1])
+    kwargs = bm.context(crow1)
+    row1 = bm.repeat(bm.arange(spshape1[0], **kwargs), crow1[1:] - crow1[:-1])
+    # Each nonzero A[i, k] meets the nonzeros in the k-th row of B.
+    count = (crow2[1:] - crow2[:-1])[col1]
+    start = bm.cumsum(count, axis=0) - count
+    total = int(bm.sum(count))
+    owner = bm.repeat(bm.arange(col1.shape[0], **kwargs), count)
+    position = bm.arange(total, **kwargs) - start[owner] + crow2[col1][owner]
+
+    indices = bm.stack([row1[owner], col2[position]], axis=0)
+    values = values1[..., owner] * values2[..., position]
+    spshape = (spshape1[0], spshape2[1])
+    result = COOTensor(indices, values, spshape).tocsr(coalesce=True)
+
+    return result.crow, result.col, result.values, spshape
@@ -0,0 +1,349 @@
+
+from typing import Optional, Union, overload, Tuple
+
+from ..backend import TensorLike, Number, Size
+from ..backend import backend_manager as bm
+from .sparse_tensor import SparseTensor
+from .utils import check_shape_match, check_spshape_match
+from ._spmm import spmm_bsr
+
+
+def _block_pattern(brow: TensorLike, bcol: TensorLike, nbshape: Tuple[int, int]):
+    """Sorted CSR structure of the (possibly duplicated) block indices, and the
+    location of each input block in it."""
+    flat = bm.astype(brow, bm.int64) * nbshape[1] + bcol
+    uflat, inverse = bm.unique(flat, return_inverse=True)
+    count = bm.bincount(uflat // nbshape[1], minlength=nbshape[0])
+    crow = bm.concat([bm.zeros((1,), **bm.context(count)), bm.cumsum(count, axis=0)])
+    itype = bcol.dtype
+    return bm.astype(crow, itype), bm.astype(uflat % nbshape[1], itype), inverse
+
+
+def _check_blocksize(spshape: Size, blocksize: Tuple[int, int]):
+    if len(blocksize) != 2:
+        raise ValueError(f"blocksize must be a 2-tuple, but got {blocksize}")
+    if (spshape[0] % blocksize[0] != 0) or (spshape[1] % blocksize[1] != 0):
+        raise ValueError(f"sparse shape {spshape} is not divisible "
+                         f"by the blocksize {blocksize}")
+
+
+class BSRTensor(SparseTensor):
+    def __init__(self, crow: TensorLike, col: TensorLike, values: TensorLike,
+                 spshape: Optional[Size]=None) -> None:
+        """Initializes BSR (Block Sparse Row) format sparse tensor.
+
+        The non-zeros are stored as dense blocks shaped (R, C), and the CSR
+        structure `crow` and `col` addresses the blocks instead of the entries.
+        This suits vector-valued problems whose dofs of a node are numbered
+        consecutively, where every node pair couples a dense block.
+
+        Parameters:
+            crow (Tensor): compressed block row pointers.
+            col (Tensor): block column indices of non-zero blocks, shaped (nnzb,).
+                Where nnzb is the number of non-zero blocks.
+            values (Tensor): non-zero blocks, shaped (nnzb, R, C).
+            spshape (Size | None, optional): shape in the sparse dimensions.
+        """
+        self._crow = crow
+        self._col = col
+        self._values = values
+
+        if spshape is None:
+            R, C = values.shape[-2:]
+            nbrow = crow.shape[0] - 1
+            nbcol = int(bm.max(col)) + 1 if col.shape[0] > 0 else 0
+            self._spshape = (nbrow * R, nbcol * C)
+        else:
+            self._spshape = tuple(spshape)
+
+        self._check(crow, col, values, self._spshape)
+
+    def _check(self, crow: TensorLike, col: TensorLike, values: TensorLike, spshape: Size):
+        if crow.ndim != 1:
+            raise ValueError(f"crow must be a 1-D tensor, but got {crow.ndim}")
+        if col.ndim != 1:
+            raise ValueError(f"col must be a 1-D tensor, but got {col.ndim}")
+        if len(spshape) != 2:
+            raise ValueError(f"spshape must be a 2-tuple for BSR format, but got {spshape}")
+        if not isinstance(values, TensorLike):
+            raise ValueError(f"values must be a Tensor, but got {type(values)}")
+        if values.ndim != 3:
+            raise ValueError("values must be a 3-D tensor shaped (nnzb, R, C), "
+                             f"but got {values.ndim}-D")
+        if values.shape[0] != col.shape[0]:
+            raise ValueError(f"values must have the same number of blocks as col ({col.shape[0]}), "
+                             f"but got {values.shape[0]}")
+
+        _check_blocksize(spshape, values.shape[-2:])
+
+        if spshape[0] // values.shape[-2] != crow.shape[0] - 1:
+            raise ValueError(f"crow.shape[0] - 1 must be equal to the number of block rows "
+                             f"{spshape[0] // values.shape[-2]}, but got {crow.shape[0] - 1}")
+
+    def __repr__(self) -> str:
+        return f"BSRTensor(crow={self._crow}, col={self._col}, "\
+               + f"values={self._values}, shape={self.shape}, blocksize={self.blocksize})"
+
+    ### 1. Data Fetching ###
+    @property
+    def itype(self): return self._col.dtype
+
+    @property
+    def nnz(self):
+        """Number of stored entries, including the zeros in the blocks."""
+        R, C = self.blocksize
+        return self._col.shape[0] * R * C
+
+    @property
+    def nnzb(self): return self._col.shape[0]
+
+    @property
+    def blocksize(self) -> Tuple[int, int]:
+        return tuple(self._values.shape[-2:])
+
+    @property
+    def dense_shape(self): return tuple()
+    @property
+    def dense_ndim(self): return 0
+
+    @property
+    def crow(self) -> TensorLike:
+        """Return the block row location of non-zero blocks."""
+        return self._crow
+
+    @property
+    def col(self): return self._col
+
+    @property
+    def values(self) -> TensorLike:
+        """Return the non-zero blocks"""
+        return self._values
+
+    @property
+    def row(self):
+        """Return the block row indices of non-zero blocks."""
+        count = self._crow[1:] - self._crow[:-1]
+        nrow = self._crow.shape[0] - 1
+        kargs = bm.context(self._crow)
+        return bm.repeat(bm.arange(nrow, **kargs), count)
+
+    @property
+    def indptr(self): return self._crow # scipy convention
+
+    @property
+    def indices(self): return self._col # scipy convention
+
+    @property
+    def data(self): return self._values # scipy convention
+
+    ### 2. Data Type & Device Management ###
+    def astype(self, dtype=None, /, *, copy=True):
+        values = bm.astype(self._values, dtype, copy=copy)
+        return BSRTensor(self._crow, self._col, values, self._spshape)
+
+    def device_put(self, device=None, /):
+        return BSRTensor(bm.device_put(self._crow, device),
+                         bm.device_put(self._col, device),
+                         bm.device_put(self._values, device),
+                         self._spshape)
+
+    ### 3. Format Conversion ###
+    def to_dense(self, *, fill_value: Union[Number, bool] = 1, dtype=None) -> TensorLike:
+        return self.tocoo().to_dense(fill_value=fill_value, dtype=dtype)
+
+    def _entry_indices(self):
+        R, C = self.blocksize
+        kargs = bm.context(self._col)
+        row = self.row[:, None, None] * R + bm.arange(R, **kargs)[None, :, None]
+        col = self._col[:, None, None] * C + bm.arange(C, **kargs)[None, None, :]
+        shape = (self.nnzb, R, C)
+        return bm.broadcast_to(row, shape).reshape(-1), bm.broadcast_to(col, shape).reshape(-1)
+
+    def tocoo(self, *, copy=False):
+        """Convert to COO format. Zeros stored in the blocks are kept."""
+        from .coo_tensor import COOTensor
+        indices = bm.stack(self._entry_indices(), axis=0)
+        new_values = bm.reshape(self._values, (-1,))
+        new_values = bm.copy(new_values) if copy else new_values
+        return COOTensor(indices, new_values, self._spshape, is_coalesced=True)
+
+    def tocsr(self, *, copy=False):
+        """Convert to CSR format. Zeros stored in the blocks are kept."""
+        return self.tocoo(copy=copy).tocsr()
+
+    def tobsr(self, blocksize: Optional[Tuple[int, int]]=None, *, copy=False):
+        if (blocksize is None) or (tuple(blocksize) == self.blocksize):
+            return self.copy() if copy else self
+        return self.tocoo().tobsr(blocksize)
+
+    ### 4. Object Conversion ###
+    def to_scipy(self):
+        from scipy.sparse import bsr_matrix
+
+        return bsr_matrix(
+            (bm.to_numpy(self._values), bm.to_numpy(self._col), bm.to_numpy(self._crow)),
+            shape = self._spshape
+        )
+
+    @classmethod
+    def from_scipy(cls, mat, /):
+        crow = bm.from_numpy(mat.indptr)
+        col = bm.from_numpy(mat.indices)
+        values = bm.from_numpy(mat.data)
+        return cls(crow, col, values, mat.shape)
+
+    @classmethod
+    def from_blocks(cls, brow: TensorLike, bcol: TensorLike, blocks: TensorLike,
+                    spshape: Size) -> 'BSRTensor':
+        """Build a BSR tensor from dense blocks at the given block indices.
+        Blocks with the same block indices are summed.
+
+        Parameters:
+            brow (Tensor): block row indices, shaped (n,).
+            bcol (Tensor): block column indices, shaped (n,).
+            blocks (Tensor): dense blocks, shaped (n, R, C).
+            spshape (Size): shape in the sparse dimensions.
+
+        Returns:
+            BSRTensor: The BSR tensor with sorted and unique block indices.
+        """
+        R, C = blocks.shape[-2:]
+        _check_blocksize(spshape, (R, C))
+        nbshape = (spshape[0] // R, spshape[1] // C)
+        crow, col, inverse = _block_pattern(brow, bcol, nbshape)
+        values = bm.zeros((col.shape[0], R, C), **bm.context(blocks))
+        values = bm.index_add(values, inverse, blocks, axis=0)
+        return cls(crow, col, values, spshape)
+
+    ### 5. Manipulation ###
+    def copy(self):
+        return BSRTensor(bm.copy(self._crow), bm.copy(self._col),
+                         bm.copy(self._values), self._spshape)
+
+    def coalesce(self, accumulate: bool=True) -> 'BSRTensor':
+        return BSRTensor.from_blocks(self.row, self._col, self._values, self._spshape)
+
+    @property
+    def T(self):
+        spshape = (self._spshape[1], self._spshape[0])
+        return BSRTensor.from_blocks(self._col, self.row, bm.swapaxes(self._values, -1, -2), spshape)
+
+    def partial(self, index: Union[TensorLike, slice]):
+        """Select the blocks by the index on the non-zero blocks."""
+        crow = self._crow
+        ZERO = bm.zeros([1], dtype=crow.dtype, device=bm.get_device(crow))
+        is_selected = bm.zeros((self.nnzb,), dtype=bm.bool, device=bm.get_device(crow))
+        is_selected = bm.set_at(is_selected, index, True)
+        selected_cum = bm.concat([ZERO, bm.cumsum(is_selected, axis=0)], axis=0)
+        new_nnz_per_row = selected_cum[crow[1:]] - selected_cum[crow[:-1]]
+        new_crow = bm.concat([ZERO, bm.cumsum(new_nnz_per_row, axis=0)], axis=0)
+        new_col = bm.copy(self._col[index])
+        new_values = bm.copy(self._values[index])
+
+        return BSRTensor(new_crow, new_col, new_values, self._spshape)
+
+    def tril(self, k: int = 0) -> 'BSRTensor':
+        """Blocks on and below the k-th block diagonal."""
+        return self.partial((self.row + k) >= self._col)
+
+    def triu(self, k: int = 0) -> 'BSRTensor':
+        """Blocks on and above the k-th block diagonal."""
+        return self.partial((self._col - k) >= self.row)
+
+    def diagonal_blocks(self) -> TensorLike:
+        """Return the blocks on the diagonal, shaped (NB, R, R).
+        Missing diagonal blocks are filled with zeros.
+
+        Block Jacobi and block Gauss-Seidel smoothers invert these blocks.
+        """
+        R, C = self.blocksize
+        if R != C:
+            raise ValueError(f"Diagonal blocks require square blocks, but got {self.blocksize}")
+        NB = min(self._crow.shape[0] - 1, self._spshape[1] // C)
+        row = self.row
+        is_diag = row == self._col
+        result = bm.zeros((NB, R, C), **bm.context(self._values))
+        return bm.index_add(result, row[is_diag], self._values[is_diag], axis=0)
+
+    def block_scale(self, left: TensorLike) -> 'BSRTensor':
+        """Left-multiply each block row by a dense block, i.e. diag(left) @ self.
+
+        Parameters:
+            left (Tensor): blocks for the block rows, shaped (nbrow, R', R).
+
+        Returns:
+            BSRTensor: A new BSR tensor sharing the block structure, with blocks shaped (R', C).
+        """
+        new_values = bm.einsum('bij, bjk -> bik', left[self.row], self._values)
+        spshape = (left.shape[-2] * (self._crow.shape[0] - 1), self._spshape[1])
+        return BSRTensor(self._crow, self._col, new_values, spshape)
+
+    ### 6. Arithmetic Operations ###
+    def neg(self) -> 'BSRTensor':
+        return BSRTensor(self._crow, self._col, -self._values, self._spshape)
+
+    @overload
+    def add(self, other: 'BSRTensor', alpha: Number=1) -> 'BSRTensor': ...
+    @overload
+    def add(self, other: TensorLike, alpha: Number=1) -> TensorLike: ...
+    def add(self, other: Union['BSRTensor', TensorLike], alpha: Number=1) -> Union['BSRTensor', TensorLike]:
+        """Adds another tensor to this BSRTensor, with an optional scaling factor.
+
+        Parameters:
+            other (BSRTensor | Tensor): The tensor to be added. BSRTensor must
+                have the same blocksize.\n
+            alpha (float, optional): The scaling factor for the other tensor. Defaults to 1.0.
+
+        Returns:
+            out (BSRTensor | Tensor): A new BSRTensor if `other` is a BSRTensor,\
+            or a Tensor if `other` is a dense tensor.
+        """
+        if isinstance(other, BSRTensor):
+            check_spshape_match(self.sparse_shape, other.sparse_shape)
+            if self.blocksize != other.blocksize:
+                raise ValueError(f"blocksize mismatch: {self.blocksize} != {other.blocksize}")
+            brow = bm.concat([self.row, other.row], axis=0)
+            bcol = bm.concat([self._col, other._col], axis=0)
+            blocks = bm.concat([self._values, other._values * alpha], axis=0)
+            return BSRTensor.from_blocks(brow, bcol, blocks, self._spshape)
+
+        elif isinstance(other, TensorLike):
+            check_shape_match(self.shape, other.shape)
+            return self.to_dense() + other * alpha
+
+        else:
+            raise TypeError(f"Unsupported type {type(other).__name__} in addition")
+
+    def mul(self, other: Number) -> 'BSRTensor':
+        """Multiplication by a scalar, sharing the block structure."""
+        if isinstance(other, (int, float)):
+            return BSRTensor(self._crow, self._col, self._values * other, self._spshape)
+        raise TypeError(f"Unsupported type {type(other).__name__} in multiplication")
+
+    def div(self, other: Number) -> 'BSRTensor':
+        """Division by a scalar, sharing the block structure."""
+        if isinstance(other, (int, float)):
+            return BSRTensor(self._crow, self._col, self._values / other, self._spshape)
+        raise TypeError(f"Unsupported type {type(other).__name__} in division")
+
+    def matmul(self, other: TensorLike) -> TensorLike:
+        """Matrix-multiply this BSRTensor with a dense tensor.
+
+        Parameters:
+            other (Tensor): A 1-D tensor for matrix-vector multiply,
+                or a 2-D tensor for matrix-matrix multiply.
+
+        Raises:
+            TypeError: If the type of `other` is not supported for matmul.
+
+        Returns:
+            out (Tensor): The dense result.
+        """
+        if isinstance(other, TensorLike):
+            if hasattr(bm, 'bsr_spmm'):
+                return bm.bsr_spmm(self._crow, self._col, self._values, self._spshape, other)
+            else:
+                return spmm_bsr(self._crow, self._col, self._values, self._spshape, other)
+
+        else:
+            raise TypeError(f"Unsupported type {type(other).__name__} in matmul")
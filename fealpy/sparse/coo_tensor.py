@@ -134,13 +134,40 @@ class COOTensor(SparseTensor):
             return self.copy()
         return self
 
-    def tocsr(self, *, copy=False):
+    def _backend_tocsr(self, coalesce: bool):
+        # Linear-time conversion by the backend for 2-D tensors with 1-D values,
+        # returning None if not available.
+        if (self.sparse_ndim != 2) or (self._values is None) or (self._values.ndim != 1):
+            return None
+        try:
+            return bm.coo_tocsr(self._indices, self._values, self._spshape, coalesce=coalesce)
+        except (AttributeError, NotImplementedError, TypeError):
+            return None
+
+    def tocsr(self, *, copy=False, coalesce=False):
+        """Convert to CSR format.
+
+        Parameters:
+            copy (bool, optional): Whether to copy the values. Defaults to False.
+            coalesce (bool, optional): Whether to sum the duplicated entries in
+                the conversion. Rows are bucketed by counting sort and columns
+                are sorted within each row, avoiding a global sort when the
+                backend supports it. Defaults to False.
+
+        Returns:
+            CSRTensor: The CSR tensor.
+        """
         from .csr_tensor import CSRTensor
-        # try:
-        #     crow, col, values = bm.coo_tocsr(self.indices, self.values, self.sparse_shape)
-        #     return CSRTensor(crow, col, values, spshape=self._spshape)
-        # except (AttributeError, NotImplementedError):
-        #     pass
+
+        if coalesce and not self.is_coalesced:
+            data = self._backend_tocsr(coalesce=True)
+            if data is None:
+                return self.coalesce().tocsr(copy=copy)
+            return CSRTensor(*data, spshape=self._spshape)
+
+        data = self._backend_tocsr(coalesce=False)
+        if data is not None:
+            return CSRTensor(*data, spshape=self._spshape)
 
         count = bm.bincount(self._indices[0], minlength=self._spshape[0])
         crow = bm.cumsum(count, axis=0)
@@ -156,6 +183,32 @@ class COOTensor(SparseTensor):
 
         return CSRTensor(crow, new_col, new_values, spshape=self._spshape)
 
+    def tobsr(self, blocksize: Tuple[int, int], *, copy=False):
+        """Convert to BSR format, summing the duplicated entries.
+
+        Parameters:
+            blocksize (Tuple[int, int]): Shape (R, C) of the dense blocks,
+                dividing the sparse shape.
+            copy (bool, optional): Unused, as the blocks are always new.
+
+        Returns:
+            BSRTensor: The BSR tensor.
+        """
+        from .bsr_tensor import BSRTensor, _block_pattern, _check_blocksize
+
+        if (self.sparse_ndim != 2) or (self._values is None) or (self._values.ndim != 1):
+            raise ValueError("Only 2-D COOTensor with 1-D values can be converted to BSR format.")
+        R, C = blocksize
+        _check_blocksize(self._spshape, (R, C))
+        nbshape = (self._spshape[0] // R, self._spshape[1] // C)
+        row, col = self._indices[0], self._indices[1]
+        crow, bcol, inverse = _block_pattern(row // R, col // C, nbshape)
+        flat = inverse * (R * C) + (row % R) * C + col % C
+        values = bm.zeros((bcol.shape[0] * R * C,), **bm.context(self._values))
+        values = bm.index_add(values, flat, self._values)
+
+        return BSRTensor(crow, bcol, bm.reshape(values, (-1, R, C)), self._spshape)
+
     ### 4. Object Conversion ###
     def to_scipy(self):
         from scipy.sparse import coo_matrix
@@ -185,6 +238,15 @@ class COOTensor(SparseTensor):
         if self.is_coalesced or self.nnz == 0:
             return self
 
+        data = self._backend_tocsr(coalesce=True)
+        if data is not None:
+            crow, col, new_values = data
+            nrow = self._spshape[0]
+            row = bm.repeat(bm.arange(nrow, dtype=col.dtype, device=bm.get_device(col)),
+                            crow[1:] - crow[:-1])
+            new_indices = bm.stack([row, col], axis=0)
+            return COOTensor(new_indices, new_values, self.sparse_shape, is_coalesced=True)
+
         order = bm.lexsort(tuple(reversed(self._indices)))
         sorted_indices = self._indices[:, order]
         unique_mask = bm.concat([
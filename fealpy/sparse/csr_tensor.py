@@ -160,6 +160,10 @@ class CSRTensor(SparseTensor):
                              bm.copy(self._values), self._spshape)
         return self
 
+    def tobsr(self, blocksize: Tuple[int, int], *, copy=False):
+        """Convert to BSR format with dense blocks shaped `blocksize`."""
+        return self.tocoo().tobsr(blocksize)
+
     ### 4. Object Conversion ###
     def to_scipy(self):
         from scipy.sparse import csr_matrix
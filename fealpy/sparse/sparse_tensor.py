@@ -84,6 +84,9 @@ class SparseTensor():
     def tocsr(self, *, copy=False):
         raise NotImplementedError
 
+    def tobsr(self, blocksize, *, copy=False):
+        raise NotImplementedError
+
     ### 4. Object Conversion ###
     def to_scipy(self):
         raise NotImplementedError
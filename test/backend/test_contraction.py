@@ -0,0 +1,105 @@
+import time
+
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.backend.contraction import ContractionPlanner
+from fealpy.mesh import TriangleMesh, TetrahedronMesh
+from fealpy.functionspace import LagrangeFESpace
+
+
+contraction_data = [
+    ('q, c, cqid, cqjd -> cij', [(6,), (10,), (10, 6, 4, 2), (10, 6, 4, 2)]),
+    ('q, c, cqid, cqjn, ...cqdn -> ...cij', [(6,), (10,), (10, 6, 4, 2), (10, 6, 4, 2), (3, 10, 6, 2, 2)]),
+    ('q, c, cqid, cqjd, ...cqd -> ...cij', [(6,), (10,), (10, 6, 4, 2), (10, 6, 4, 2), (10, 1, 1)]),
+    ('c, q, cq... -> c...', [(10,), (6,), (10, 6, 4, 3)]),
+    ('c, q, cqid, ...cq -> ...cid', [(10,), (6,), (10, 6, 4, 1), (10, 6)]),
+    ('c, q, ...cq -> ...', [(10,), (6,), (2, 10, 6)]),
+    ('ij, jk', [(3, 4), (4, 5)]),
+]
+
+
+class TestContractionPlanner:
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("lowering", [True, False])
+    @pytest.mark.parametrize("subscripts, shapes", contraction_data)
+    def test_contract(self, backend, lowering, subscripts, shapes):
+        bm.set_backend(backend)
+        rng = np.random.default_rng(0)
+        arrays = [rng.random(s) for s in shapes]
+        expected = np.einsum(subscripts, *arrays)
+
+        planner = ContractionPlanner(lowering={backend: lowering})
+        operands = [bm.from_numpy(a) for a in arrays]
+        for _ in range(2):
+            result = planner(subscripts, *operands)
+            np.testing.assert_allclose(bm.to_numpy(result), expected, atol=1e-12)
+
+        assert planner.misses == 1
+        assert planner.hits == 1
+
+    @pytest.mark.parametrize("backend", ['numpy'])
+    def test_threads(self, backend):
+        from concurrent.futures import ThreadPoolExecutor
+        bm.set_backend(backend)
+        # 很小的缓存使各线程不断淘汰彼此的计划
+        planner = ContractionPlanner(maxsize=2)
+
+        def work(k):
+            rng = np.random.default_rng(k)
+            for n in range(50):
+                a, b = rng.random((2, (k+n) % 7 + 1)), rng.random(((k+n) % 7 + 1, 3))
+                np.testing.assert_allclose(planner('ij, jk', a, b), a @ b, atol=1e-12)
+            return True
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            assert all(pool.map(work, range(16)))
+        assert planner.hits + planner.misses == 16 * 50
+        assert len(planner._plans[backend]) <= 2
+
+
+def _bench(func, number=3):
+    func()
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return (time.perf_counter() - start) / number
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+@pytest.mark.parametrize("mesh_type", ['tri', 'tet'])
+@pytest.mark.parametrize("p", range(1, 5))
+def test_bilinear_integral_benchmark(backend, mesh_type, p, n=4):
+    """Compare `bm.einsum` with the planned contraction in the kernels of
+    `bilinear_integral`. Run this file directly for larger meshes."""
+    bm.set_backend(backend)
+    if mesh_type == 'tri':
+        mesh = TriangleMesh.from_box(nx=4*n, ny=4*n)
+    else:
+        mesh = TetrahedronMesh.from_box(nx=n, ny=n, nz=n)
+    space = LagrangeFESpace(mesh, p)
+    bcs, ws = mesh.quadrature_formula(p+2).get_quadrature_points_and_weights()
+    gphi = space.grad_basis(bcs, variable='x')
+    cm = mesh.entity_measure('cell')
+    GD = mesh.geo_dimension()
+    coef = bm.ones(gphi.shape[:2] + (GD, GD), dtype=bm.float64)
+    planner = ContractionPlanner()
+
+    for subscripts, operands in [
+        ('q, c, cqid, cqjd -> cij', (ws, cm, gphi, gphi)),
+        ('q, c, cqid, cqjn, cqdn -> cij', (ws, cm, gphi, gphi, coef)),
+    ]:
+        t0 = _bench(lambda: bm.einsum(subscripts, *operands))
+        t1 = _bench(lambda: planner(subscripts, *operands))
+        np.testing.assert_allclose(bm.to_numpy(planner(subscripts, *operands)),
+                                   bm.to_numpy(bm.einsum(subscripts, *operands)), atol=1e-12)
+        print(f"{mesh_type} P{p} NC={mesh.number_of_cells()} '{subscripts}': "
+              f"einsum {t0*1e3:.3f}ms, planned {t1*1e3:.3f}ms, speedup {t0/t1:.2f}")
+
+
+if __name__ == "__main__":
+    for mesh_type in ['tri', 'tet']:
+        for p in range(1, 5):
+            test_bilinear_integral_benchmark('numpy', mesh_type, p, n=16 if mesh_type == 'tri' else 8)
@@ -2,11 +2,15 @@ import numpy as np
 import pytest
 from fealpy.backend import backend_manager as bm
 
-from fealpy.mesh import TriangleMesh
-from fealpy.functionspace import LagrangeFESpace
+from fealpy.mesh import TriangleMesh, QuadrangleMesh, HexahedronMesh, TetrahedronMesh
+from fealpy.solver import cg
+from fealpy.functionspace import LagrangeFESpace, TensorFunctionSpace
+from fealpy.material import LinearElasticMaterial
 from fealpy.fem import (
-        BilinearForm, ScalarDiffusionIntegrator
+        BilinearForm, ScalarDiffusionIntegrator, ScalarMassIntegrator,
+        LinearElasticIntegrator
     )
+from fealpy.fem.form import MemoryBudgetSplitter, UniformSplitter
 
 from bilinear_form_data import *
 
@@ -43,6 +47,226 @@ class TestBilinearFormInterface:
         z = bm.to_numpy(bform @ x)
         assert np.linalg.norm(y-z) < 1e-12 
 
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("data", mesh_data)
+    @pytest.mark.parametrize("p", range(1, 4))
+    def test_keep_pattern(self, backend, data, p):
+        bm.set_backend(backend)
+
+        Mesh = mesh_map[data["class"]]
+        node = bm.from_numpy(data['node'])
+        cell = bm.from_numpy(data['cell'])
+        mesh = Mesh(node, cell)
+        space = LagrangeFESpace(mesh, p)
+
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator())
+        A = bm.to_numpy(bform.assembly().to_dense())
+
+        bform.keep_pattern(True)
+        B = bform.assembly() # 符号组装
+        assert bform._pattern is not None
+        C = bform.assembly() # 只更新数值
+        assert C.crow is B.crow
+        np.testing.assert_allclose(bm.to_numpy(C.to_dense()), A, atol=1e-12)
+
+        D = bm.to_numpy(bform.T.assembly().to_dense())
+        np.testing.assert_allclose(D, A.T, atol=1e-12)
+
+        bform.keep_pattern(False)
+        assert bform._pattern is None
+
+    @pytest.mark.parametrize("backend", ['numpy'])
+    def test_keep_pattern_rebuild(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box(nx=4, ny=4)
+        space = LagrangeFESpace(mesh, 2)
+        bform = BilinearForm(space).keep_pattern(True)
+        bform.add_integrator(ScalarDiffusionIntegrator(), splitter=13)
+        bform.assembly()
+        pattern = bform._pattern
+
+        # 改变分块后重建稀疏模式
+        bform.splitters['_group_0'] = UniformSplitter(7)
+        A = bform.assembly()
+        assert bform._pattern is not pattern
+        pattern = bform._pattern
+
+        # 网格加密后重建稀疏模式
+        mesh.uniform_refine()
+        B = bform.assembly()
+        assert bform._pattern is not pattern
+        gdof = space.number_of_global_dofs()
+        assert B.shape == (gdof, gdof)
+
+        other = BilinearForm(LagrangeFESpace(mesh, 2))
+        other.add_integrator(ScalarDiffusionIntegrator())
+        np.testing.assert_allclose(bm.to_numpy(B.to_dense()),
+                                   bm.to_numpy(other.assembly().to_dense()), atol=1e-12)
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("store", ['tensor', 'factor'])
+    @pytest.mark.parametrize("p", range(1, 4))
+    def test_operator(self, backend, store, p):
+        bm.set_backend(backend)
+
+        mesh = TriangleMesh.from_box(nx=4, ny=4)
+        space = LagrangeFESpace(mesh, p)
+        gdof = space.number_of_global_dofs()
+
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator(method='fast'), splitter=7)
+        bform.add_integrator(ScalarMassIntegrator())
+        A = bform.assembly()
+        op = bform.operator(store=store)
+        assert op.shape == (gdof, gdof)
+
+        x = bm.random.rand(gdof, 2)
+        np.testing.assert_allclose(bm.to_numpy(op @ x), bm.to_numpy(A @ x), atol=1e-12)
+        np.testing.assert_allclose(bm.to_numpy(op @ x[:, 0]), bm.to_numpy(A @ x[:, 0]), atol=1e-12)
+
+        y = cg(op, A @ x[:, 0], atol=1e-14, rtol=1e-12)
+        np.testing.assert_allclose(bm.to_numpy(y), bm.to_numpy(x[:, 0]), atol=1e-8)
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("budget", [20000, '64KB'])
+    @pytest.mark.parametrize("p", range(1, 4))
+    def test_memory_budget(self, backend, budget, p):
+        bm.set_backend(backend)
+
+        mesh = TriangleMesh.from_box(nx=8, ny=8)
+        space = LagrangeFESpace(mesh, p)
+
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator())
+        A = bform.assembly()
+
+        splitter = MemoryBudgetSplitter(budget)
+        assert splitter.chunk_size(space, bform.integrators['_group_0']) < mesh.number_of_cells()
+
+        bform.set_memory_budget(budget)
+        B = bform.assembly()
+        assert B.nnz == A.nnz
+        np.testing.assert_allclose(bm.to_numpy(B.toarray()), bm.to_numpy(A.toarray()), atol=1e-12)
+
+    @pytest.mark.parametrize("backend", ['numpy'])
+    @pytest.mark.parametrize("num_workers", [1, 2])
+    def test_memory_budget_without_indices(self, backend, num_workers):
+        bm.set_backend(backend)
+
+        mesh = TriangleMesh.from_box(nx=8, ny=8)
+        space = LagrangeFESpace(mesh, 2)
+
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarMassIntegrator())
+        bform.add_integrator(ScalarDiffusionIntegrator())
+        A = bform.assembly()
+
+        # 质量积分子不支持 indices, 整体组装而不是报错
+        bform.set_memory_budget('1KB').set_parallel(num_workers)
+        B = bform.assembly()
+        np.testing.assert_allclose(bm.to_numpy(B.toarray()), bm.to_numpy(A.toarray()), atol=1e-12)
+
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarMassIntegrator(), splitter=7)
+        with pytest.raises(TypeError):
+            bform.assembly()
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("num_workers", [2, 4])
+    @pytest.mark.parametrize("p", range(1, 4))
+    def test_parallel(self, backend, num_workers, p):
+        bm.set_backend(backend)
+
+        mesh = TriangleMesh.from_box(nx=8, ny=8)
+        space = LagrangeFESpace(mesh, p)
+
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator(), splitter=13)
+        bform.add_integrator(ScalarDiffusionIntegrator(2.0))
+        bform.add_integrator(ScalarMassIntegrator())
+        A = bform.assembly()
+
+        bform.set_parallel(num_workers)
+        B = bform.assembly()
+        np.testing.assert_array_equal(bm.to_numpy(B.col), bm.to_numpy(A.col))
+        np.testing.assert_allclose(bm.to_numpy(B.values), bm.to_numpy(A.values), atol=1e-12)
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("mesh", [QuadrangleMesh.from_box(nx=3, ny=4),
+                                      HexahedronMesh.from_box(nx=2, ny=3, nz=2)])
+    @pytest.mark.parametrize("p", range(1, 4))
+    def test_sumfac(self, backend, mesh, p):
+        bm.set_backend(backend)
+        mesh = mesh.__class__(bm.from_numpy(mesh.node), bm.from_numpy(mesh.cell))
+        space = LagrangeFESpace(mesh, p)
+        gdof = space.number_of_global_dofs()
+
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator(2.0, q=p+2))
+        bform.add_integrator(ScalarMassIntegrator(q=p+2))
+        A = bform.assembly()
+
+        sform = BilinearForm(space)
+        sform.add_integrator(ScalarDiffusionIntegrator(2.0, q=p+2, method='sumfac'))
+        sform.add_integrator(ScalarMassIntegrator(q=p+2, method='sumfac'))
+        S = sform.assembly()
+        np.testing.assert_allclose(bm.to_numpy(S.toarray()), bm.to_numpy(A.toarray()), atol=1e-12)
+
+        op = sform.operator(store='factor')
+        x = bm.random.rand(gdof, 2)
+        np.testing.assert_allclose(bm.to_numpy(op @ x), bm.to_numpy(A @ x), atol=1e-12)
+        np.testing.assert_allclose(bm.to_numpy(op.T @ x[:, 0]), bm.to_numpy(A.T @ x[:, 0]), atol=1e-12)
+
+    @pytest.mark.parametrize("backend", ['numpy'])
+    def test_sumfac_coef_change(self, backend):
+        bm.set_backend(backend)
+        mesh = QuadrangleMesh.from_box(nx=3, ny=2)
+        space = LagrangeFESpace(mesh, 2)
+        x = bm.random.rand(space.number_of_global_dofs())
+
+        for Integrator in [ScalarDiffusionIntegrator, ScalarMassIntegrator]:
+            integrator = Integrator(1.0, q=4, method='sumfac').keep_data(True)
+            bform = BilinearForm(space)
+            bform.add_integrator(integrator)
+            A = bform.assembly().toarray()
+            y = bform.operator(store='factor') @ x
+
+            # 保留的数据不包含系数，改变系数后结果随之改变
+            integrator.coef = 3.0
+            B = bform.assembly().toarray()
+            np.testing.assert_allclose(bm.to_numpy(B), 3*bm.to_numpy(A), atol=1e-12)
+            np.testing.assert_allclose(bm.to_numpy(bform.operator(store='factor') @ x),
+                                       3*bm.to_numpy(y), atol=1e-12)
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("mesh, hypo", [(TriangleMesh.from_box(nx=4, ny=3), 'plane_strain'),
+                                            (TetrahedronMesh.from_box(nx=2, ny=2, nz=2), '3D')])
+    @pytest.mark.parametrize("p", range(1, 3))
+    def test_bsr_assembly(self, backend, mesh, hypo, p):
+        bm.set_backend(backend)
+        mesh = mesh.__class__(bm.from_numpy(mesh.node), bm.from_numpy(mesh.cell))
+        GD = mesh.geo_dimension()
+        material = LinearElasticMaterial('steel', elastic_modulus=1.0, poisson_ratio=0.3, hypo=hypo)
+        space = TensorFunctionSpace(LagrangeFESpace(mesh, p), (-1, GD))
+
+        bform = BilinearForm(space)
+        bform.add_integrator(LinearElasticIntegrator(material))
+        A = bform.assembly()
+        B = bform.assembly(format='bsr')
+        assert B.blocksize == (GD, GD)
+        assert B.nnzb * GD * GD == A.nnz
+        np.testing.assert_allclose(bm.to_numpy(B.toarray()), bm.to_numpy(A.toarray()), atol=1e-12)
+
+        x = bm.random.rand(space.number_of_global_dofs())
+        np.testing.assert_allclose(bm.to_numpy(B @ x), bm.to_numpy(A @ x), atol=1e-12)
+
+        with pytest.raises(ValueError):
+            space = TensorFunctionSpace(LagrangeFESpace(mesh, p), (GD, -1))
+            bform = BilinearForm(space)
+            bform.add_integrator(LinearElasticIntegrator(material))
+            bform.assembly(format='bsr')
+
 
 if __name__ == "__main__":
     pytest.main(['./test_bilinear_form.py', '-k', 'test_matmul'])
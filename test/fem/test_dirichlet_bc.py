@@ -29,3 +29,34 @@ def test_apply_csr_matrix(backend):
     assert isinstance(coo_result, COOTensor)
     assert isinstance(csr_result, CSRTensor)
     assert bm.allclose(A_COO.toarray(), A_CSR.toarray())
+
+
+@pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+@pytest.mark.parametrize("p", range(1, 4))
+def test_prepared_dirichlet_bc(backend, p):
+    from fealpy.fem import BilinearForm, ScalarDiffusionIntegrator, ScalarMassIntegrator
+
+    bm.set_backend(backend)
+    mesh = TriangleMesh.from_box([-1, 1, -1, 1], nx=4, ny=4)
+    space = LagrangeFESpace(mesh, p=p)
+    gdof = space.number_of_global_dofs()
+    gd = lambda points: bm.sin(points[..., 0]) * points[..., 1]
+    dbc = DirichletBC(space, gd=gd)
+
+    bform = BilinearForm(space)
+    bform.add_integrator(ScalarDiffusionIntegrator())
+    bform.add_integrator(ScalarMassIntegrator())
+    A = bform.assembly()
+    prepared = dbc.prepare(A)
+
+    for step in range(1, 3):
+        # New values on the same sparsity pattern.
+        A_step = CSRTensor(A.crow, A.col, A.values * step, A.sparse_shape)
+        f = bm.random.rand(gdof)
+        A0, f0 = dbc.apply(A_step, f)
+        A1, f1 = prepared.apply(A_step, f)
+        assert bm.allclose(A0.toarray(), A1.toarray())
+        assert bm.allclose(f0, f1)
+
+    with pytest.raises(ValueError):
+        prepared.apply_matrix(A_step.tril())
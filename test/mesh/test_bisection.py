@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh, TetrahedronMesh, BisectionRefiner
+
+
+def _check(mesh, measure):
+    """The mesh is conforming, positively oriented and covers the same domain."""
+    cell = bm.to_numpy(mesh.entity('cell'))
+    other = mesh.__class__(bm.copy(mesh.entity('node')), bm.copy(mesh.entity('cell')))
+    vol = bm.to_numpy(other.entity_measure('cell'))
+    assert np.all(vol > 0)
+    np.testing.assert_allclose(vol.sum(), measure)
+    # 非协调网格的悬挂节点会使边界面的总面积大于区域边界的面积
+    bd = bm.to_numpy(other.boundary_face_flag())
+    area = bm.to_numpy(other.entity_measure('face'))[bd].sum()
+    TD = mesh.top_dimension()
+    np.testing.assert_allclose(area, 2*TD)
+    assert len(np.unique(cell, axis=0)) == len(cell)
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+@pytest.mark.parametrize("meshdata", [
+    (TriangleMesh, dict(nx=4, ny=4)),
+    (TetrahedronMesh, dict(nx=2, ny=2, nz=2))
+])
+def test_refine_and_coarsen(backend, meshdata):
+    bm.set_backend(backend)
+    Mesh, kwargs = meshdata
+    mesh = Mesh.from_box(**kwargs)
+    NC0 = mesh.number_of_cells()
+    refiner = BisectionRefiner(mesh)
+
+    for i in range(6):
+        node = bm.to_numpy(mesh.entity('node'))
+        NN0, NC = node.shape[0], mesh.number_of_cells()
+        bc = bm.to_numpy(mesh.entity_barycenter('cell'))
+        isMarkedCell = bm.array(np.linalg.norm(bc, axis=-1) < 0.5)
+        P, parent = refiner.refine(isMarkedCell)
+        _check(mesh, 1.0)
+        assert mesh.number_of_cells() > NC
+        assert parent.shape == (mesh.number_of_cells(), )
+        assert bm.max(parent) < NC
+        # 插值矩阵对线性函数是精确的
+        u = node @ np.array([1.0, 2.0, 3.0][:node.shape[1]])
+        new = bm.to_numpy(mesh.entity('node'))
+        np.testing.assert_allclose(P.to_dense() @ u,
+                                   new @ np.array([1.0, 2.0, 3.0][:new.shape[1]]))
+        assert P.shape == (mesh.number_of_nodes(), NN0)
+
+    for i in range(12):
+        NC = mesh.number_of_cells()
+        P, children = refiner.coarsen(bm.ones(NC, dtype=bm.bool))
+        _check(mesh, 1.0)
+        assert children.shape == (mesh.number_of_cells(), 2)
+        assert P.shape[0] == mesh.number_of_nodes()
+        if mesh.number_of_cells() == NC:
+            break
+    assert mesh.number_of_cells() == NC0
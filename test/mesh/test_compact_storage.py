@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh, QuadrangleMesh, TetrahedronMesh, HexahedronMesh
+
+
+def _topology(mesh):
+    ret = {name: bm.to_numpy(getattr(mesh, name)) for name in
+           ['face2cell', 'cell2face', 'cell2edge']}
+    ret['face'] = bm.to_numpy(mesh.entity('face'))
+    ret['edge'] = bm.to_numpy(mesh.entity('edge'))
+    ret['cell2cell'] = bm.to_numpy(mesh.cell_to_cell())
+    ret['bdnode'] = bm.to_numpy(mesh.boundary_node_flag())
+    ret['c2p'] = bm.to_numpy(mesh.cell_to_ipoint(2))
+    return ret
+
+
+def _check(mesh, other):
+    ref = _topology(other)
+    for key, val in _topology(mesh).items():
+        np.testing.assert_array_equal(val, ref[key], err_msg=key)
+    assert mesh.number_of_faces() == other.number_of_faces()
+    assert mesh.number_of_edges() == other.number_of_edges()
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+@pytest.mark.parametrize("meshdata", [
+    (TriangleMesh, dict(nx=4, ny=3)),
+    (QuadrangleMesh, dict(nx=4, ny=3)),
+    (TetrahedronMesh, dict(nx=2, ny=2, nz=1)),
+    (HexahedronMesh, dict(nx=2, ny=2, nz=1))
+])
+def test_compact(backend, meshdata):
+    bm.set_backend(backend)
+    Mesh, kwargs = meshdata
+    mesh = Mesh.from_box(**kwargs)
+    other = Mesh.from_box(**kwargs)
+    nbytes = mesh.storage_nbytes()
+
+    mesh.compact(ftype=bm.float32)
+    assert mesh.is_compact()
+    assert mesh.storage_nbytes() < nbytes
+    assert mesh.entity('cell').dtype == bm.int32
+    assert mesh.entity('node').dtype == bm.float32
+    _check(mesh, other)
+
+    # 加密时仍保持紧凑存储
+    mesh.uniform_refine()
+    other.uniform_refine()
+    assert mesh.is_compact()
+    _check(mesh, other)
+
+    mesh.expand()
+    assert not mesh.is_compact()
+    _check(mesh, other)
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+def test_compact_without_edges(backend):
+    bm.set_backend(backend)
+    mesh = TetrahedronMesh.from_box(nx=2, ny=1, nz=2)
+    other = TetrahedronMesh.from_box(nx=2, ny=1, nz=2)
+    mesh.compact(keep_edges=False, cache=False)
+    assert 'cell2edge' not in mesh.__dict__
+    # 边按 construct 的方式重新编号，与原来的编号相同
+    _check(mesh, other)
+    assert mesh.relation_cache_info()['entries'].count(('_compact', 'face')) == 0
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh, TetrahedronMesh, IntervalMesh, PointLocator
+
+
+def _check(mesh, points, cell_index, bcs):
+    node = bm.to_numpy(mesh.entity('node'))
+    cell = bm.to_numpy(mesh.entity('cell'))
+    c, bcs = bm.to_numpy(cell_index), bm.to_numpy(bcs)
+    found = c >= 0
+    assert np.all(bcs[found] >= -1e-12)
+    np.testing.assert_allclose(bcs[found].sum(axis=1), 1.0, atol=1e-12)
+    x = np.einsum('pi, pid -> pd', bcs[found], node[cell[c[found]]])
+    np.testing.assert_allclose(x, bm.to_numpy(points)[found], atol=1e-12)
+    return found
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+@pytest.mark.parametrize("mesh", [
+    lambda: IntervalMesh.from_interval_domain([0, 1], nx=10),
+    lambda: TriangleMesh.from_box(nx=7, ny=5),
+    lambda: TetrahedronMesh.from_box(nx=3, ny=4, nz=2)])
+def test_location(backend, mesh):
+    bm.set_backend(backend)
+    mesh = mesh()
+    GD = mesh.geo_dimension()
+    points = bm.array(np.random.rand(5000, GD) * 1.2 - 0.1)
+    cell_index, bcs = mesh.location(points)
+    assert bcs.shape == (5000, GD + 1)
+    found = _check(mesh, points, cell_index, bcs)
+    inside = np.all((bm.to_numpy(points) >= 0) & (bm.to_numpy(points) <= 1), axis=1)
+    np.testing.assert_array_equal(found, inside)
+
+    # 网格节点和重心
+    ps = mesh.entity_barycenter('cell')
+    cell_index, bcs = mesh.location(ps)
+    np.testing.assert_array_equal(bm.to_numpy(cell_index), np.arange(mesh.number_of_cells()))
+    _check(mesh, mesh.entity('node'), *mesh.location(mesh.entity('node')))
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+def test_location_with_hole(backend):
+    bm.set_backend(backend)
+    mesh = TriangleMesh.from_box(nx=10, ny=10)
+    bc = bm.to_numpy(mesh.entity_barycenter('cell'))
+    keep = np.max(np.abs(bc - 0.5), axis=1) > 0.2
+    mesh = TriangleMesh(mesh.entity('node'), mesh.entity('cell')[bm.array(keep)])
+    points = bm.array([[0.5, 0.5], [0.05, 0.05], [0.95, 0.5], [1.5, 0.5]])
+    cell_index, bcs = mesh.location(points)
+    np.testing.assert_array_equal(bm.to_numpy(cell_index) >= 0, [False, True, True, False])
+    _check(mesh, points, cell_index, bcs)
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+def test_location_invalidation(backend):
+    bm.set_backend(backend)
+    mesh = TriangleMesh.from_box(nx=4, ny=4)
+    points = bm.array(np.random.rand(100, 2))
+    locator = mesh.point_locator()
+    assert mesh.point_locator() is locator
+    assert isinstance(locator, PointLocator)
+
+    mesh.uniform_refine()
+    cell_index, bcs = mesh.location(points)
+    assert mesh.point_locator() is not locator
+    assert bm.max(cell_index) >= 32
+    _check(mesh, points, cell_index, bcs)
+
+    # 原地移动节点
+    locator = mesh.point_locator()
+    mesh.node[:] = 2 * mesh.node
+    cell_index, bcs = mesh.location(2 * points)
+    assert mesh.point_locator() is not locator
+    assert bm.all(cell_index >= 0)
+    _check(mesh, 2 * points, cell_index, bcs)
+
+    with pytest.raises(ValueError):
+        TriangleMesh.from_unit_sphere_surface().location(points)
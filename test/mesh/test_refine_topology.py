@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh, TetrahedronMesh
+
+
+def _check(mesh):
+    """The incremental topology equals the one from `construct`, up to the
+    numbering of the edges and faces."""
+    cell = bm.to_numpy(mesh.entity('cell'))
+    other = mesh.__class__(bm.copy(mesh.entity('node')), bm.copy(mesh.entity('cell')))
+
+    for etype, local in [('edge', mesh.localEdge), ('face', mesh.localFace)]:
+        entity = bm.to_numpy(mesh.entity(etype))
+        local = bm.to_numpy(local)
+        c2e = bm.to_numpy(mesh.cell_to_edge() if etype == 'edge' else mesh.cell_to_face())
+        assert entity.shape == other.entity(etype).shape
+        np.testing.assert_array_equal(np.sort(entity[c2e], axis=-1),
+                                      np.sort(cell[:, local], axis=-1))
+        assert len(np.unique(np.sort(entity, axis=1), axis=0)) == len(entity)
+
+    face = bm.to_numpy(mesh.entity('face'))
+    local = bm.to_numpy(mesh.localFace)
+    f2c = bm.to_numpy(mesh.face_to_cell())
+    np.testing.assert_array_equal(face, cell[f2c[:, 0, None], local[f2c[:, 2]]])
+    np.testing.assert_array_equal(np.sort(face, axis=1),
+                                  np.sort(cell[f2c[:, 1, None], local[f2c[:, 3]]], axis=1))
+    np.testing.assert_array_equal(bm.to_numpy(mesh.boundary_face_flag()).sum(),
+                                  bm.to_numpy(other.boundary_face_flag()).sum())
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+def test_triangle_uniform_refine(backend):
+    bm.set_backend(backend)
+    mesh = TriangleMesh.from_box(nx=3, ny=2)
+    mesh.uniform_refine(2)
+    _check(mesh)
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+def test_triangle_bisect(backend):
+    bm.set_backend(backend)
+    mesh = TriangleMesh.from_box(nx=4, ny=4)
+    np.random.seed(0)
+    for i in range(4):
+        isMarkedCell = bm.array(np.random.rand(mesh.number_of_cells()) < 0.3)
+        mesh.bisect(isMarkedCell, options={'disp': False})
+        _check(mesh)
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+def test_tetrahedron_uniform_refine(backend):
+    bm.set_backend(backend)
+    mesh = TetrahedronMesh.from_box(nx=2, ny=1, nz=2)
+    mesh.uniform_refine(2)
+    _check(mesh)
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh, TetrahedronMesh
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+def test_relation_cache(backend):
+    bm.set_backend(backend)
+    mesh = TriangleMesh.from_box(nx=4, ny=4)
+
+    c2p = mesh.cell_to_ipoint(3)
+    assert mesh.cell_to_ipoint(3) is c2p
+    assert mesh.cell_to_ipoint(p=3) is c2p
+    np.testing.assert_array_equal(bm.to_numpy(mesh.cell_to_ipoint(3, index=bm.arange(3))),
+                                  bm.to_numpy(c2p[:3]))
+    assert mesh.cell_to_ipoint(2) is not c2p
+    info = mesh.relation_cache_info()
+    assert info['hits'] >= 3
+    assert ('cell_to_ipoint', ('p', 3)) in info['entries']
+
+    # 常被原地修改的边界标记返回副本
+    flag = mesh.boundary_node_flag()
+    flag[:] = False
+    assert bm.sum(mesh.boundary_node_flag()) == 16
+
+    cell2cell = mesh.cell_to_cell()
+    assert mesh.cell_to_cell() is cell2cell
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+def test_relation_cache_invalidation(backend):
+    bm.set_backend(backend)
+    mesh = TetrahedronMesh.from_box(nx=2, ny=2, nz=2)
+    c2p = mesh.cell_to_ipoint(2)
+    version = mesh.version('topology')
+
+    mesh.uniform_refine()
+    assert mesh.version('topology') > version
+    assert mesh.relation_cache_info()['entries'] == []
+    c2p = mesh.cell_to_ipoint(2)
+    assert bm.max(c2p) + 1 == mesh.number_of_global_ipoints(2)
+    mesh.clear_relation_cache()
+    np.testing.assert_array_equal(bm.to_numpy(c2p), bm.to_numpy(mesh.cell_to_ipoint(2)))
+
+    # 移动节点只改变节点的版本
+    version = mesh.version('topology')
+    mesh.node = mesh.node * 2
+    assert mesh.version('topology') == version
+    assert mesh.version('node') > 0
+    assert mesh.relation_cache_info()['entries'] == []
+
+    mesh.cell_to_cell()
+    mesh.clear_relation_cache()
+    assert mesh.relation_cache_info()['entries'] == []
@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh, TetrahedronMesh, QuadrangleMesh
+from fealpy.mesh.utils import hilbert_index, morton_index
+
+
+def _bandwidth(mesh):
+    edge = bm.to_numpy(mesh.entity('edge'))
+    return np.abs(edge[:, 0] - edge[:, 1]).max()
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+@pytest.mark.parametrize("GD", [2, 3])
+def test_space_filling_curve(backend, GD):
+    bm.set_backend(backend)
+    x = np.stack(np.meshgrid(*[np.arange(8)]*GD, indexing='ij'), axis=-1)
+    x = bm.array(x.reshape(-1, GD).astype(np.float64))
+    N = x.shape[0]
+
+    for index in [hilbert_index, morton_index]:
+        key = bm.to_numpy(index(x, bits=3))
+        np.testing.assert_array_equal(np.sort(key), np.arange(N))
+
+    # Hilbert 曲线上相邻的点在网格上也相邻
+    p = bm.to_numpy(x)[np.argsort(bm.to_numpy(hilbert_index(x, bits=3)))]
+    np.testing.assert_array_equal(np.abs(np.diff(p, axis=0)).sum(axis=-1), 1)
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+@pytest.mark.parametrize("meshdata", [
+    (TriangleMesh, dict(nx=8, ny=8)),
+    (QuadrangleMesh, dict(nx=8, ny=8)),
+    (TetrahedronMesh, dict(nx=3, ny=3, nz=3))
+])
+@pytest.mark.parametrize("method", [('rcm', 'hilbert'), ('hilbert', 'morton')])
+def test_reorder(backend, meshdata, method):
+    bm.set_backend(backend)
+    Mesh, kwargs = meshdata
+    mesh = Mesh.from_box(**kwargs)
+    NN, NC = mesh.number_of_nodes(), mesh.number_of_cells()
+    np.random.seed(0)
+    mesh.reorder(bm.array(np.random.permutation(NN)), bm.array(np.random.permutation(NC)))
+    bw = _bandwidth(mesh)
+
+    node = bm.copy(mesh.entity('node'))
+    measure = bm.copy(mesh.entity_measure('cell'))
+    mesh.nodedata['x'] = bm.copy(node[:, 0])
+    mesh.celldata['c'] = mesh.entity_barycenter('cell')
+    mesh.facedata['f'] = mesh.entity_barycenter('face')
+    nodeperm, cellperm = mesh.reorder(*method)
+
+    assert _bandwidth(mesh) < bw
+    np.testing.assert_array_equal(bm.to_numpy(mesh.entity('node')), bm.to_numpy(node[nodeperm]))
+    np.testing.assert_allclose(bm.to_numpy(mesh.entity_measure('cell')), bm.to_numpy(measure[cellperm]))
+    np.testing.assert_array_equal(bm.to_numpy(mesh.nodedata['x']), bm.to_numpy(mesh.entity('node')[:, 0]))
+    np.testing.assert_allclose(bm.to_numpy(mesh.celldata['c']),
+                               bm.to_numpy(mesh.entity_barycenter('cell')))
+    np.testing.assert_allclose(bm.to_numpy(mesh.facedata['f']),
+                               bm.to_numpy(mesh.entity_barycenter('face')))
+
+    cell = bm.to_numpy(mesh.entity('cell'))
+    face = bm.to_numpy(mesh.entity('face'))
+    f2c = bm.to_numpy(mesh.face_to_cell())
+    np.testing.assert_array_equal(face, cell[f2c[:, 0, None], bm.to_numpy(mesh.localFace)[f2c[:, 2]]])
+    edge = bm.to_numpy(mesh.entity('edge'))
+    c2e = bm.to_numpy(mesh.cell_to_edge())
+    np.testing.assert_array_equal(np.sort(edge[c2e], axis=-1),
+                                  np.sort(cell[:, bm.to_numpy(mesh.localEdge)], axis=-1))
+    assert bm.sum(mesh.boundary_node_flag()) == bm.sum(Mesh.from_box(**kwargs).boundary_node_flag())
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+def test_reorder_refinement_history(backend):
+    from fealpy.functionspace import LagrangeFESpace
+    from fealpy.fem import BilinearForm, ScalarDiffusionIntegrator, ScalarMassIntegrator
+    from fealpy.solver import GAMGSolver
+
+    bm.set_backend(backend)
+    mesh = TriangleMesh.from_box(nx=4, ny=4)
+    mesh.record_refinement()
+    mesh.uniform_refine(4)
+    P0 = [p.to_scipy().toarray() for p in mesh.refinement_history()]
+
+    nodeperm, _ = mesh.reorder()
+    P1 = [p.to_scipy().toarray() for p in mesh.refinement_history()]
+    # 只有最细层的行按新的节点编号排列
+    np.testing.assert_array_equal(P1[0], P0[0][bm.to_numpy(nodeperm)])
+    for p0, p1 in zip(P0[1:], P1[1:]):
+        np.testing.assert_array_equal(p1, p0)
+
+    space = LagrangeFESpace(mesh, 1)
+    bform = BilinearForm(space)
+    bform.add_integrator(ScalarDiffusionIntegrator())
+    bform.add_integrator(ScalarMassIntegrator())
+    A = bform.assembly().tocsr()
+    solver = GAMGSolver(isolver='CG')
+    solver.setup(A, mesh=mesh)
+    _, info = solver.solve(A @ bm.ones(A.shape[0], dtype=A.dtype))
+    assert info['niter'] < 20
@@ -417,1351 +417,1351 @@ uniform_refine = [{
        [1.  , 0.5 , 1.  ],
        [1.  , 1.  , 0.5 ],
        [0.  , 0.  , 0.25],
+       [0.  , 0.  , 0.75],
        [0.  , 0.25, 0.  ],
+       [0.  , 0.75, 0.  ],
        [0.  , 0.25, 0.25],
+       [0.  , 0.75, 0.75],
        [0.25, 0.  , 0.  ],
+       [0.75, 0.  , 0.  ],
        [0.25, 0.  , 0.25],
+       [0.75, 0.  , 0.75],
        [0.25, 0.25, 0.  ],
+       [0.75, 0.75, 0.  ],
        [0.25, 0.25, 0.25],
-       [0.  , 0.  , 0.75],
+       [0.75, 0.75, 0.75],
+       [0.  , 0.75, 1.  ],
        [0.  , 0.25, 1.  ],
        [0.25, 0.  , 1.  ],
+       [0.75, 0.  , 1.  ],
        [0.25, 0.25, 1.  ],
-       [0.  , 0.75, 0.  ],
+       [0.75, 0.75, 1.  ],
        [0.  , 1.  , 0.25],
+       [0.  , 1.  , 0.75],
+       [0.75, 1.  , 0.  ],
        [0.25, 1.  , 0.  ],
        [0.25, 1.  , 0.25],
-       [0.  , 0.75, 0.75],
-       [0.  , 0.75, 1.  ],
-       [0.  , 1.  , 0.75],
+       [0.75, 1.  , 0.75],
        [0.25, 1.  , 1.  ],
-       [0.75, 0.  , 0.  ],
+       [0.75, 1.  , 1.  ],
+       [1.  , 0.  , 0.75],
        [1.  , 0.  , 0.25],
        [1.  , 0.25, 0.  ],
-       [1.  , 0.25, 0.25],
-       [0.75, 0.  , 0.75],
-       [0.75, 0.  , 1.  ],
-       [1.  , 0.  , 0.75],
-       [1.  , 0.25, 1.  ],
-       [0.75, 0.75, 0.  ],
-       [0.75, 1.  , 0.  ],
        [1.  , 0.75, 0.  ],
-       [1.  , 1.  , 0.25],
-       [0.75, 0.75, 0.75],
-       [0.75, 0.75, 1.  ],
-       [0.75, 1.  , 0.75],
-       [0.75, 1.  , 1.  ],
+       [1.  , 0.25, 0.25],
        [1.  , 0.75, 0.75],
+       [1.  , 0.25, 1.  ],
        [1.  , 0.75, 1.  ],
+       [1.  , 1.  , 0.25],
        [1.  , 1.  , 0.75],
        [0.  , 0.25, 0.5 ],
-       [0.25, 0.  , 0.5 ],
-       [0.25, 0.25, 0.5 ],
        [0.  , 0.25, 0.75],
+       [0.  , 0.5 , 0.75],
+       [0.25, 0.  , 0.5 ],
+       [0.5 , 0.  , 0.75],
        [0.25, 0.  , 0.75],
+       [0.25, 0.25, 0.5 ],
        [0.25, 0.25, 0.75],
+       [0.5 , 0.5 , 0.75],
        [0.  , 0.5 , 0.25],
-       [0.25, 0.5 , 0.  ],
-       [0.25, 0.5 , 0.25],
+       [0.  , 0.75, 0.5 ],
        [0.  , 0.75, 0.25],
+       [0.25, 0.5 , 0.  ],
        [0.25, 0.75, 0.  ],
+       [0.5 , 0.75, 0.  ],
+       [0.25, 0.5 , 0.25],
        [0.25, 0.75, 0.25],
+       [0.5 , 0.75, 0.5 ],
        [0.25, 0.5 , 0.5 ],
-       [0.  , 0.5 , 0.75],
-       [0.25, 0.5 , 0.75],
-       [0.  , 0.75, 0.5 ],
-       [0.25, 0.75, 0.5 ],
        [0.25, 0.75, 0.75],
+       [0.5 , 0.75, 0.75],
        [0.5 , 0.  , 0.25],
-       [0.5 , 0.25, 0.  ],
-       [0.5 , 0.25, 0.25],
        [0.75, 0.  , 0.25],
+       [0.75, 0.  , 0.5 ],
+       [0.5 , 0.25, 0.  ],
+       [0.75, 0.5 , 0.  ],
        [0.75, 0.25, 0.  ],
+       [0.5 , 0.25, 0.25],
        [0.75, 0.25, 0.25],
+       [0.75, 0.5 , 0.5 ],
        [0.5 , 0.25, 0.5 ],
-       [0.5 , 0.  , 0.75],
-       [0.5 , 0.25, 0.75],
-       [0.75, 0.  , 0.5 ],
-       [0.75, 0.25, 0.5 ],
        [0.75, 0.25, 0.75],
-       [0.5 , 0.5 , 0.25],
-       [0.5 , 0.75, 0.  ],
-       [0.5 , 0.75, 0.25],
-       [0.75, 0.5 , 0.  ],
-       [0.75, 0.5 , 0.25],
-       [0.75, 0.75, 0.25],
-       [0.5 , 0.5 , 0.75],
-       [0.5 , 0.75, 0.5 ],
-       [0.5 , 0.75, 0.75],
-       [0.75, 0.5 , 0.5 ],
        [0.75, 0.5 , 0.75],
+       [0.5 , 0.5 , 0.25],
        [0.75, 0.75, 0.5 ],
-       [0.25, 0.5 , 1.  ],
+       [0.75, 0.75, 0.25],
        [0.25, 0.75, 1.  ],
+       [0.25, 0.5 , 1.  ],
+       [0.5 , 0.75, 1.  ],
        [0.5 , 0.25, 1.  ],
        [0.75, 0.25, 1.  ],
-       [0.5 , 0.75, 1.  ],
        [0.75, 0.5 , 1.  ],
        [0.25, 1.  , 0.5 ],
        [0.25, 1.  , 0.75],
-       [0.5 , 1.  , 0.25],
-       [0.75, 1.  , 0.25],
        [0.5 , 1.  , 0.75],
+       [0.75, 1.  , 0.25],
+       [0.5 , 1.  , 0.25],
        [0.75, 1.  , 0.5 ],
-       [1.  , 0.25, 0.5 ],
        [1.  , 0.25, 0.75],
+       [1.  , 0.25, 0.5 ],
+       [1.  , 0.5 , 0.75],
        [1.  , 0.5 , 0.25],
        [1.  , 0.75, 0.25],
-       [1.  , 0.5 , 0.75],
-       [1.  , 0.75, 0.5 ]]),
-       "cell":np.array([[ 85,  30,  84,  11],
-       [ 89,  31,  83,  12],
-       [ 67,  27,  66,   8],
-       [ 77,  29,  65,  10],
-       [ 73,  28,  71,   9],
-       [ 95,  32,  72,  13],
-       [ 87,  46,  88,  11],
-       [ 92,  50,  94,  12],
-       [ 69,  34,  70,   8],
-       [ 78,  42,  82,  10],
-       [ 74,  38,  76,   9],
-       [ 96,  54, 100,  13],
-       [100,  54,  98,  13],
-       [ 88,  46,  86,  11],
-       [ 94,  50,  90,  12],
-       [ 70,  34,  68,   8],
-       [ 82,  42,  80,  10],
-       [ 76,  38,  75,   9],
-       [104,  58, 106,  14],
-       [105,  58, 104,  14],
-       [101,  58, 105,  14],
-       [103,  58, 101,  14],
-       [102,  58, 103,  14],
-       [106,  58, 102,  14],
-       [ 85,  84,  88,  11],
-       [ 86,  83,  88,  11],
-       [ 67,  66,  70,   8],
-       [ 68,  65,  70,   8],
-       [ 73,  71,  76,   9],
-       [ 75,  72,  76,   9],
-       [106,  95, 104,  14],
-       [120,  92, 119,  22],
-       [105,  89, 101,  14],
-       [108,  78, 107,  15],
-       [103,  77, 102,  14],
-       [116,  96, 115,  19],
-       [122, 100, 124,  26],
-       [105,  94, 123,  25],
-       [110,  94, 112,  25],
-       [103,  82, 111,  21],
-       [114,  82, 117,  21],
-       [106, 100, 118,  26],
-       [ 87,  98, 121,  23],
-       [ 85,  89, 104,  14],
-       [ 69,  90, 109,  16],
-       [ 67,  77, 101,  14],
-       [ 74,  80, 113,  18],
-       [ 73,  95, 102,  14],
-       [ 85,  95,  33,  14],
-       [ 89,  85,  33,  14],
-       [ 67,  89,  33,  14],
-       [ 77,  67,  33,  14],
-       [ 73,  77,  33,  14],
-       [ 95,  73,  33,  14],
-       [ 87, 121,  48,  23],
-       [ 92, 120,  52,  22],
-       [ 69, 109,  36,  16],
-       [ 78, 108,  43,  15],
-       [ 74, 113,  39,  18],
-       [ 96, 116,  55,  19],
-       [100, 122,  57,  26],
-       [ 88, 119,  49,  24],
-       [ 94, 110,  53,  25],
-       [ 70, 107,  37,  17],
-       [ 82, 114,  45,  21],
-       [ 76, 115,  41,  20],
-       [104, 124,  62,  24],
-       [105, 123,  63,  25],
-       [101, 112,  59,  17],
-       [103, 111,  61,  21],
-       [102, 117,  60,  20],
-       [106, 118,  64,  26],
-       [ 85, 104,  95,  14],
-       [ 86, 119,  92,  22],
-       [ 67, 101,  89,  14],
-       [ 68, 107,  78,  15],
-       [ 73, 102,  77,  14],
-       [ 75, 115,  96,  19],
-       [106, 124, 100,  26],
-       [120, 123,  94,  25],
-       [105, 112,  94,  25],
-       [108, 111,  82,  21],
-       [103, 117,  82,  21],
-       [116, 118, 100,  26],
-       [122, 121,  98,  23],
-       [105, 104,  89,  14],
-       [110, 109,  90,  16],
-       [103, 101,  77,  14],
-       [114, 113,  80,  18],
-       [106, 102,  95,  14],
-       [ 87,  88,  84,  11],
-       [ 85,  88,  83,  11],
-       [ 69,  70,  66,   8],
-       [ 67,  70,  65,   8],
-       [ 74,  76,  71,   9],
-       [ 73,  76,  72,   9],
-       [ 84,  32,  95,  13],
-       [ 83,  30,  85,  11],
-       [ 66,  31,  89,  12],
-       [ 65,  27,  67,   8],
-       [ 71,  29,  77,  10],
-       [ 72,  28,  73,   9],
-       [ 88,  49, 121,  24],
-       [ 94,  53, 120,  25],
-       [ 70,  37, 109,  17],
-       [ 82,  45, 108,  21],
-       [ 76,  41, 113,  20],
-       [100,  57, 116,  26],
-       [ 98,  56, 122,  23],
-       [ 86,  47, 119,  22],
-       [ 90,  51, 110,  16],
-       [ 68,  35, 107,  15],
-       [ 80,  44, 114,  18],
-       [ 75,  40, 115,  19],
-       [106,  64, 124,  26],
-       [104,  62, 123,  24],
-       [105,  63, 112,  25],
-       [101,  59, 111,  17],
-       [103,  61, 117,  21],
-       [102,  60, 118,  20],
-       [ 88,  99, 104,  24],
-       [ 88,  93, 119,  24],
-       [ 70,  91, 101,  17],
-       [ 70,  79, 107,  17],
-       [ 76,  81, 102,  20],
-       [ 76,  97, 115,  20],
-       [104,  99, 124,  24],
-       [119,  93, 123,  24],
-       [101,  91, 112,  17],
-       [107,  79, 111,  17],
-       [102,  81, 117,  20],
-       [115,  97, 118,  20],
-       [124,  99, 121,  24],
-       [123,  93, 104,  24],
-       [112,  91, 109,  17],
-       [111,  79, 101,  17],
-       [117,  81, 113,  20],
-       [118,  97, 102,  20],
-       [121,  99,  88,  24],
-       [104,  93,  88,  24],
-       [109,  91,  70,  17],
-       [101,  79,  70,  17],
-       [113,  81,  76,  20],
-       [102,  97,  76,  20],
-       [ 30,  33,  32,   0],
-       [ 31,  33,  30,   0],
-       [ 27,  33,  31,   0],
-       [ 29,  33,  27,   0],
-       [ 28,  33,  29,   0],
-       [ 32,  33,  28,   0],
-       [ 46,  48,  49,   4],
-       [ 50,  52,  53,   5],
-       [ 34,  36,  37,   1],
-       [ 42,  43,  45,   3],
-       [ 38,  39,  41,   2],
-       [ 54,  55,  57,   6],
-       [ 54,  57,  56,   6],
-       [ 46,  49,  47,   4],
-       [ 50,  53,  51,   5],
-       [ 34,  37,  35,   1],
-       [ 42,  45,  44,   3],
-       [ 38,  41,  40,   2],
-       [ 58,  62,  64,   7],
-       [ 58,  63,  62,   7],
-       [ 58,  59,  63,   7],
-       [ 58,  61,  59,   7],
-       [ 58,  60,  61,   7],
-       [ 58,  64,  60,   7],
-       [ 84,  95,  99,  13],
-       [ 83,  92,  93,  12],
-       [ 66,  89,  91,  12],
-       [ 65,  78,  79,  10],
-       [ 71,  77,  81,  10],
-       [ 72,  96,  97,  13],
-       [ 95, 100,  99,  13],
-       [ 92,  94,  93,  12],
-       [ 89,  94,  91,  12],
-       [ 78,  82,  79,  10],
-       [ 77,  82,  81,  10],
-       [ 96, 100,  97,  13],
-       [100,  98,  99,  13],
-       [ 94,  89,  93,  12],
-       [ 94,  90,  91,  12],
-       [ 82,  77,  79,  10],
-       [ 82,  80,  81,  10],
-       [100,  95,  97,  13],
-       [ 98,  84,  99,  13],
-       [ 89,  83,  93,  12],
-       [ 90,  66,  91,  12],
-       [ 77,  65,  79,  10],
-       [ 80,  71,  81,  10],
-       [ 95,  72,  97,  13],
-       [ 84,  95,  32,  85],
-       [ 89,  31,  33,  83],
-       [ 66,  89,  31,  67],
-       [ 77,  29,  33,  65],
-       [ 71,  77,  29,  73],
-       [ 95,  32,  33,  72],
-       [ 88, 121,  49,  87],
-       [ 92,  50,  52,  94],
-       [ 70, 109,  37,  69],
-       [ 78,  42,  43,  82],
-       [ 76, 113,  41,  74],
-       [ 96,  54,  55, 100],
-       [ 98, 122,  56, 100],
-       [ 86, 119,  47,  88],
-       [ 90, 110,  51,  94],
-       [ 68, 107,  35,  70],
-       [ 80, 114,  44,  82],
-       [ 75, 115,  40,  76],
-       [104,  58,  62, 106],
-       [104, 123,  62, 105],
-       [101,  58,  59, 105],
-       [101, 111,  59, 103],
-       [102,  58,  60, 103],
-       [102, 118,  60, 106],
-       [ 88, 104,  99,  85],
-       [ 88, 119,  93,  86],
-       [ 70, 101,  91,  67],
-       [ 70, 107,  79,  68],
-       [ 76, 102,  81,  73],
-       [ 76, 115,  97,  75],
-       [104, 124,  99, 106],
-       [119, 123,  93, 120],
-       [101, 112,  91, 105],
-       [107, 111,  79, 108],
-       [102, 117,  81, 103],
-       [115, 118,  97, 116],
-       [124, 121,  99, 122],
-       [123, 104,  93, 105],
-       [112, 109,  91, 110],
-       [111, 101,  79, 103],
-       [117, 113,  81, 114],
-       [118, 102,  97, 106],
-       [121,  88,  99,  87],
-       [104,  88,  93,  85],
-       [109,  70,  91,  69],
-       [101,  70,  79,  67],
-       [113,  76,  81,  74],
-       [102,  76,  97,  73],
-       [ 95,  33,  32,  85],
-       [ 31,  30,  33,  83],
-       [ 89,  33,  31,  67],
-       [ 29,  27,  33,  65],
-       [ 77,  33,  29,  73],
-       [ 32,  28,  33,  72],
-       [121,  48,  49,  87],
-       [ 50,  53,  52,  94],
-       [109,  36,  37,  69],
-       [ 42,  45,  43,  82],
-       [113,  39,  41,  74],
-       [ 54,  57,  55, 100],
-       [122,  57,  56, 100],
-       [119,  49,  47,  88],
-       [110,  53,  51,  94],
-       [107,  37,  35,  70],
-       [114,  45,  44,  82],
-       [115,  41,  40,  76],
-       [ 58,  64,  62, 106],
-       [123,  63,  62, 105],
-       [ 58,  63,  59, 105],
-       [111,  61,  59, 103],
-       [ 58,  61,  60, 103],
-       [118,  64,  60, 106],
-       [104,  95,  99,  85],
-       [119,  92,  93,  86],
-       [101,  89,  91,  67],
-       [107,  78,  79,  68],
-       [102,  77,  81,  73],
-       [115,  96,  97,  75],
-       [124, 100,  99, 106],
-       [123,  94,  93, 120],
-       [112,  94,  91, 105],
-       [111,  82,  79, 108],
-       [117,  82,  81, 103],
-       [118, 100,  97, 116],
-       [121,  98,  99, 122],
-       [104,  89,  93, 105],
-       [109,  90,  91, 110],
-       [101,  77,  79, 103],
-       [113,  80,  81, 114],
-       [102,  95,  97, 106],
-       [ 88,  84,  99,  87],
-       [ 88,  83,  93,  85],
-       [ 70,  66,  91,  69],
-       [ 70,  65,  79,  67],
-       [ 76,  71,  81,  74],
-       [ 76,  72,  97,  73],
-       [ 33,  30,  32,  85],
-       [ 30,  85,  33,  83],
-       [ 33,  27,  31,  67],
-       [ 27,  67,  33,  65],
-       [ 33,  28,  29,  73],
-       [ 28,  73,  33,  72],
-       [ 48,  46,  49,  87],
-       [ 53, 120,  52,  94],
-       [ 36,  34,  37,  69],
-       [ 45, 108,  43,  82],
-       [ 39,  38,  41,  74],
-       [ 57, 116,  55, 100],
-       [ 57,  54,  56, 100],
-       [ 49,  46,  47,  88],
-       [ 53,  50,  51,  94],
-       [ 37,  34,  35,  70],
-       [ 45,  42,  44,  82],
-       [ 41,  38,  40,  76],
-       [ 64, 124,  62, 106],
-       [ 63,  58,  62, 105],
-       [ 63, 112,  59, 105],
-       [ 61,  58,  59, 103],
-       [ 61, 117,  60, 103],
-       [ 64,  58,  60, 106],
-       [ 95,  84,  99,  85],
-       [ 92,  83,  93,  86],
-       [ 89,  66,  91,  67],
-       [ 78,  65,  79,  68],
-       [ 77,  71,  81,  73],
-       [ 96,  72,  97,  75],
-       [100,  95,  99, 106],
-       [ 94,  92,  93, 120],
-       [ 94,  89,  91, 105],
-       [ 82,  78,  79, 108],
-       [ 82,  77,  81, 103],
-       [100,  96,  97, 116],
-       [ 98, 100,  99, 122],
-       [ 89,  94,  93, 105],
-       [ 90,  94,  91, 110],
-       [ 77,  82,  79, 103],
-       [ 80,  82,  81, 114],
-       [ 95, 100,  97, 106],
-       [ 84,  98,  99,  87],
-       [ 83,  89,  93,  85],
-       [ 66,  90,  91,  69],
-       [ 65,  77,  79,  67],
-       [ 71,  80,  81,  74],
-       [ 72,  95,  97,  73],
-       [ 30,  84,  32,  85],
-       [ 85,  89,  33,  83],
-       [ 27,  66,  31,  67],
-       [ 67,  77,  33,  65],
-       [ 28,  71,  29,  73],
-       [ 73,  95,  33,  72],
-       [ 46,  88,  49,  87],
-       [120,  92,  52,  94],
-       [ 34,  70,  37,  69],
-       [108,  78,  43,  82],
-       [ 38,  76,  41,  74],
-       [116,  96,  55, 100],
-       [ 54,  98,  56, 100],
-       [ 46,  86,  47,  88],
-       [ 50,  90,  51,  94],
-       [ 34,  68,  35,  70],
-       [ 42,  80,  44,  82],
-       [ 38,  75,  40,  76],
-       [124, 104,  62, 106],
-       [ 58, 104,  62, 105],
-       [112, 101,  59, 105],
-       [ 58, 101,  59, 103],
-       [117, 102,  60, 103],
-       [ 58, 102,  60, 106],
-       [ 84,  88,  99,  85],
-       [ 83,  88,  93,  86],
-       [ 66,  70,  91,  67],
-       [ 65,  70,  79,  68],
-       [ 71,  76,  81,  73],
-       [ 72,  76,  97,  75],
-       [ 95, 104,  99, 106],
-       [ 92, 119,  93, 120],
-       [ 89, 101,  91, 105],
-       [ 78, 107,  79, 108],
-       [ 77, 102,  81, 103],
-       [ 96, 115,  97, 116],
-       [100, 124,  99, 122],
-       [ 94, 123,  93, 105],
-       [ 94, 112,  91, 110],
-       [ 82, 111,  79, 103],
-       [ 82, 117,  81, 114],
-       [100, 118,  97, 106],
-       [ 98, 121,  99,  87],
-       [ 89, 104,  93,  85],
-       [ 90, 109,  91,  69],
-       [ 77, 101,  79,  67],
-       [ 80, 113,  81,  74],
-       [ 95, 102,  97,  73]],dtype=np.int32),
-       "face2cell":np.array([[147, 147,   1,   1],
-       [146, 146,   1,   1],
-       [146, 147,   2,   0],
-       [148, 148,   1,   1],
-       [149, 149,   1,   1],
-       [148, 149,   2,   0],
-       [147, 148,   2,   0],
-       [145, 145,   1,   1],
-       [144, 144,   1,   1],
-       [144, 145,   2,   0],
-       [145, 146,   2,   0],
-       [144, 149,   0,   2],
+       [1.  , 0.75, 0.5 ],
+       [0.75, 0.5 , 0.25],
+       [0.75, 0.25, 0.5 ],
+       [0.5 , 0.25, 0.75],
+       [0.25, 0.5 , 0.75],
+       [0.25, 0.75, 0.5 ],
+       [0.5 , 0.75, 0.25]]),
+       "cell":np.array([[ 92,  33,  89,  11],
+       [ 95,  35,  86,  12],
+       [ 71,  27,  68,   8],
+       [ 83,  31,  65,  10],
+       [ 80,  29,  74,   9],
+       [ 98,  37,  77,  13],
+       [ 91,  34,  93,  11],
+       [ 88,  36,  96,  12],
+       [ 70,  28,  72,   8],
+       [ 67,  32,  84,  10],
+       [ 76,  30,  81,   9],
+       [ 79,  38, 100,  13],
+       [100,  38,  90,  13],
+       [ 93,  34,  87,  11],
+       [ 96,  36,  69,  12],
+       [ 72,  28,  66,   8],
+       [ 84,  32,  75,  10],
+       [ 81,  30,  78,   9],
+       [ 94,  40,  99,  14],
+       [ 97,  40,  94,  14],
+       [ 73,  40,  97,  14],
+       [ 85,  40,  73,  14],
+       [ 82,  40,  85,  14],
+       [ 99,  40,  82,  14],
+       [ 92,  89,  93,  11],
+       [ 87,  86,  93,  11],
+       [ 71,  68,  72,   8],
+       [ 66,  65,  72,   8],
+       [ 80,  74,  81,   9],
+       [ 78,  77,  81,   9],
+       [ 99,  98,  94,  14],
+       [113,  88, 114,  22],
+       [ 97,  95,  73,  14],
+       [101,  67, 102,  15],
+       [ 85,  83,  82,  14],
+       [110,  79, 111,  19],
+       [117, 100, 118,  26],
+       [ 97,  96, 115,  25],
+       [105,  96, 106,  25],
+       [ 85,  84, 103,  21],
+       [108,  84, 109,  21],
+       [ 99, 100, 112,  26],
+       [ 91,  90, 116,  23],
+       [ 92,  95,  94,  14],
+       [ 70,  69, 104,  16],
+       [ 71,  83,  73,  14],
+       [ 76,  75, 107,  18],
+       [ 80,  98,  82,  14],
+       [ 92,  98,  39,  14],
+       [ 95,  92,  39,  14],
+       [ 71,  95,  39,  14],
+       [ 83,  71,  39,  14],
+       [ 80,  83,  39,  14],
+       [ 98,  80,  39,  14],
+       [ 91, 116,  57,  23],
+       [ 88, 113,  55,  22],
+       [ 70, 104,  43,  16],
+       [ 67, 101,  41,  15],
+       [ 76, 107,  47,  18],
+       [ 79, 110,  49,  19],
+       [100, 117,  63,  26],
+       [ 93, 114,  59,  24],
+       [ 96, 105,  61,  25],
+       [ 72, 102,  45,  17],
+       [ 84, 108,  53,  21],
+       [ 81, 111,  51,  20],
+       [ 94, 118,  60,  24],
+       [ 97, 115,  62,  25],
+       [ 73, 106,  46,  17],
+       [ 85, 103,  54,  21],
+       [ 82, 109,  52,  20],
+       [ 99, 112,  64,  26],
+       [ 92,  94,  98,  14],
+       [ 87, 114,  88,  22],
+       [ 71,  73,  95,  14],
+       [ 66, 102,  67,  15],
+       [ 80,  82,  83,  14],
+       [ 78, 111,  79,  19],
+       [ 99, 118, 100,  26],
+       [113, 115,  96,  25],
+       [ 97, 106,  96,  25],
+       [101, 103,  84,  21],
+       [ 85, 109,  84,  21],
+       [110, 112, 100,  26],
+       [117, 116,  90,  23],
+       [ 97,  94,  95,  14],
+       [105, 104,  69,  16],
+       [ 85,  73,  83,  14],
+       [108, 107,  75,  18],
+       [ 99,  82,  98,  14],
+       [ 91,  93,  89,  11],
+       [ 92,  93,  86,  11],
+       [ 70,  72,  68,   8],
+       [ 71,  72,  65,   8],
+       [ 76,  81,  74,   9],
+       [ 80,  81,  77,   9],
+       [ 89,  37,  98,  13],
+       [ 86,  33,  92,  11],
+       [ 68,  35,  95,  12],
+       [ 65,  27,  71,   8],
+       [ 74,  31,  83,  10],
+       [ 77,  29,  80,   9],
+       [ 93,  59, 116,  24],
+       [ 96,  61, 113,  25],
+       [ 72,  45, 104,  17],
+       [ 84,  53, 101,  21],
+       [ 81,  51, 107,  20],
+       [100,  63, 110,  26],
+       [ 90,  58, 117,  23],
+       [ 87,  56, 114,  22],
+       [ 69,  44, 105,  16],
+       [ 66,  42, 102,  15],
+       [ 75,  48, 108,  18],
+       [ 78,  50, 111,  19],
+       [ 99,  64, 118,  26],
+       [ 94,  60, 115,  24],
+       [ 97,  62, 106,  25],
+       [ 73,  46, 103,  17],
+       [ 85,  54, 109,  21],
+       [ 82,  52, 112,  20],
+       [ 93, 119,  94,  24],
+       [ 93, 120, 114,  24],
+       [ 72, 121,  73,  17],
+       [ 72, 122, 102,  17],
+       [ 81, 123,  82,  20],
+       [ 81, 124, 111,  20],
+       [ 94, 119, 118,  24],
+       [114, 120, 115,  24],
+       [ 73, 121, 106,  17],
+       [102, 122, 103,  17],
+       [ 82, 123, 109,  20],
+       [111, 124, 112,  20],
+       [118, 119, 116,  24],
+       [115, 120,  94,  24],
+       [106, 121, 104,  17],
+       [103, 122,  73,  17],
+       [109, 123, 107,  20],
+       [112, 124,  82,  20],
+       [116, 119,  93,  24],
+       [ 94, 120,  93,  24],
+       [104, 121,  72,  17],
+       [ 73, 122,  72,  17],
+       [107, 123,  81,  20],
+       [ 82, 124,  81,  20],
+       [ 33,  39,  37,   0],
+       [ 35,  39,  33,   0],
+       [ 27,  39,  35,   0],
+       [ 31,  39,  27,   0],
+       [ 29,  39,  31,   0],
+       [ 37,  39,  29,   0],
+       [ 34,  57,  59,   4],
+       [ 36,  55,  61,   5],
+       [ 28,  43,  45,   1],
+       [ 32,  41,  53,   3],
+       [ 30,  47,  51,   2],
+       [ 38,  49,  63,   6],
+       [ 38,  63,  58,   6],
+       [ 34,  59,  56,   4],
+       [ 36,  61,  44,   5],
+       [ 28,  45,  42,   1],
+       [ 32,  53,  48,   3],
+       [ 30,  51,  50,   2],
+       [ 40,  60,  64,   7],
+       [ 40,  62,  60,   7],
+       [ 40,  46,  62,   7],
+       [ 40,  54,  46,   7],
+       [ 40,  52,  54,   7],
+       [ 40,  64,  52,   7],
+       [ 89,  98, 119,  13],
+       [ 86,  88, 120,  12],
+       [ 68,  95, 121,  12],
+       [ 65,  67, 122,  10],
+       [ 74,  83, 123,  10],
+       [ 77,  79, 124,  13],
+       [ 98, 100, 119,  13],
+       [ 88,  96, 120,  12],
+       [ 95,  96, 121,  12],
+       [ 67,  84, 122,  10],
+       [ 83,  84, 123,  10],
+       [ 79, 100, 124,  13],
+       [100,  90, 119,  13],
+       [ 96,  95, 120,  12],
+       [ 96,  69, 121,  12],
+       [ 84,  83, 122,  10],
+       [ 84,  75, 123,  10],
+       [100,  98, 124,  13],
+       [ 90,  89, 119,  13],
+       [ 95,  86, 120,  12],
+       [ 69,  68, 121,  12],
+       [ 83,  65, 122,  10],
+       [ 75,  74, 123,  10],
+       [ 98,  77, 124,  13],
+       [ 89,  98,  37,  92],
+       [ 95,  35,  39,  86],
+       [ 68,  95,  35,  71],
+       [ 83,  31,  39,  65],
+       [ 74,  83,  31,  80],
+       [ 98,  37,  39,  77],
+       [ 93, 116,  59,  91],
+       [ 88,  36,  55,  96],
+       [ 72, 104,  45,  70],
+       [ 67,  32,  41,  84],
+       [ 81, 107,  51,  76],
+       [ 79,  38,  49, 100],
+       [ 90, 117,  58, 100],
+       [ 87, 114,  56,  93],
+       [ 69, 105,  44,  96],
+       [ 66, 102,  42,  72],
+       [ 75, 108,  48,  84],
+       [ 78, 111,  50,  81],
+       [ 94,  40,  60,  99],
+       [ 94, 115,  60,  97],
+       [ 73,  40,  46,  97],
+       [ 73, 103,  46,  85],
+       [ 82,  40,  52,  85],
+       [ 82, 112,  52,  99],
+       [ 93,  94, 119,  92],
+       [ 93, 114, 120,  87],
+       [ 72,  73, 121,  71],
+       [ 72, 102, 122,  66],
+       [ 81,  82, 123,  80],
+       [ 81, 111, 124,  78],
+       [ 94, 118, 119,  99],
+       [114, 115, 120, 113],
+       [ 73, 106, 121,  97],
+       [102, 103, 122, 101],
+       [ 82, 109, 123,  85],
+       [111, 112, 124, 110],
+       [118, 116, 119, 117],
+       [115,  94, 120,  97],
+       [106, 104, 121, 105],
+       [103,  73, 122,  85],
+       [109, 107, 123, 108],
+       [112,  82, 124,  99],
+       [116,  93, 119,  91],
+       [ 94,  93, 120,  92],
+       [104,  72, 121,  70],
+       [ 73,  72, 122,  71],
+       [107,  81, 123,  76],
+       [ 82,  81, 124,  80],
+       [ 98,  39,  37,  92],
+       [ 35,  33,  39,  86],
+       [ 95,  39,  35,  71],
+       [ 31,  27,  39,  65],
+       [ 83,  39,  31,  80],
+       [ 37,  29,  39,  77],
+       [116,  57,  59,  91],
+       [ 36,  61,  55,  96],
+       [104,  43,  45,  70],
+       [ 32,  53,  41,  84],
+       [107,  47,  51,  76],
+       [ 38,  63,  49, 100],
+       [117,  63,  58, 100],
+       [114,  59,  56,  93],
+       [105,  61,  44,  96],
+       [102,  45,  42,  72],
+       [108,  53,  48,  84],
+       [111,  51,  50,  81],
+       [ 40,  64,  60,  99],
+       [115,  62,  60,  97],
+       [ 40,  62,  46,  97],
+       [103,  54,  46,  85],
+       [ 40,  54,  52,  85],
+       [112,  64,  52,  99],
+       [ 94,  98, 119,  92],
+       [114,  88, 120,  87],
+       [ 73,  95, 121,  71],
+       [102,  67, 122,  66],
+       [ 82,  83, 123,  80],
+       [111,  79, 124,  78],
+       [118, 100, 119,  99],
+       [115,  96, 120, 113],
+       [106,  96, 121,  97],
+       [103,  84, 122, 101],
+       [109,  84, 123,  85],
+       [112, 100, 124, 110],
+       [116,  90, 119, 117],
+       [ 94,  95, 120,  97],
+       [104,  69, 121, 105],
+       [ 73,  83, 122,  85],
+       [107,  75, 123, 108],
+       [ 82,  98, 124,  99],
+       [ 93,  89, 119,  91],
+       [ 93,  86, 120,  92],
+       [ 72,  68, 121,  70],
+       [ 72,  65, 122,  71],
+       [ 81,  74, 123,  76],
+       [ 81,  77, 124,  80],
+       [ 39,  33,  37,  92],
+       [ 33,  92,  39,  86],
+       [ 39,  27,  35,  71],
+       [ 27,  71,  39,  65],
+       [ 39,  29,  31,  80],
+       [ 29,  80,  39,  77],
+       [ 57,  34,  59,  91],
+       [ 61, 113,  55,  96],
+       [ 43,  28,  45,  70],
+       [ 53, 101,  41,  84],
+       [ 47,  30,  51,  76],
+       [ 63, 110,  49, 100],
+       [ 63,  38,  58, 100],
+       [ 59,  34,  56,  93],
+       [ 61,  36,  44,  96],
+       [ 45,  28,  42,  72],
+       [ 53,  32,  48,  84],
+       [ 51,  30,  50,  81],
+       [ 64, 118,  60,  99],
+       [ 62,  40,  60,  97],
+       [ 62, 106,  46,  97],
+       [ 54,  40,  46,  85],
+       [ 54, 109,  52,  85],
+       [ 64,  40,  52,  99],
+       [ 98,  89, 119,  92],
+       [ 88,  86, 120,  87],
+       [ 95,  68, 121,  71],
+       [ 67,  65, 122,  66],
+       [ 83,  74, 123,  80],
+       [ 79,  77, 124,  78],
+       [100,  98, 119,  99],
+       [ 96,  88, 120, 113],
+       [ 96,  95, 121,  97],
+       [ 84,  67, 122, 101],
+       [ 84,  83, 123,  85],
+       [100,  79, 124, 110],
+       [ 90, 100, 119, 117],
+       [ 95,  96, 120,  97],
+       [ 69,  96, 121, 105],
+       [ 83,  84, 122,  85],
+       [ 75,  84, 123, 108],
+       [ 98, 100, 124,  99],
+       [ 89,  90, 119,  91],
+       [ 86,  95, 120,  92],
+       [ 68,  69, 121,  70],
+       [ 65,  83, 122,  71],
+       [ 74,  75, 123,  76],
+       [ 77,  98, 124,  80],
+       [ 33,  89,  37,  92],
+       [ 92,  95,  39,  86],
+       [ 27,  68,  35,  71],
+       [ 71,  83,  39,  65],
+       [ 29,  74,  31,  80],
+       [ 80,  98,  39,  77],
+       [ 34,  93,  59,  91],
+       [113,  88,  55,  96],
+       [ 28,  72,  45,  70],
+       [101,  67,  41,  84],
+       [ 30,  81,  51,  76],
+       [110,  79,  49, 100],
+       [ 38,  90,  58, 100],
+       [ 34,  87,  56,  93],
+       [ 36,  69,  44,  96],
+       [ 28,  66,  42,  72],
+       [ 32,  75,  48,  84],
+       [ 30,  78,  50,  81],
+       [118,  94,  60,  99],
+       [ 40,  94,  60,  97],
+       [106,  73,  46,  97],
+       [ 40,  73,  46,  85],
+       [109,  82,  52,  85],
+       [ 40,  82,  52,  99],
+       [ 89,  93, 119,  92],
+       [ 86,  93, 120,  87],
+       [ 68,  72, 121,  71],
+       [ 65,  72, 122,  66],
+       [ 74,  81, 123,  80],
+       [ 77,  81, 124,  78],
+       [ 98,  94, 119,  99],
+       [ 88, 114, 120, 113],
+       [ 95,  73, 121,  97],
+       [ 67, 102, 122, 101],
+       [ 83,  82, 123,  85],
+       [ 79, 111, 124, 110],
+       [100, 118, 119, 117],
+       [ 96, 115, 120,  97],
+       [ 96, 106, 121, 105],
+       [ 84, 103, 122,  85],
+       [ 84, 109, 123, 108],
+       [100, 112, 124,  99],
+       [ 90, 116, 119,  91],
+       [ 95,  94, 120,  92],
+       [ 69, 104, 121,  70],
+       [ 83,  73, 122,  71],
+       [ 75, 107, 123,  76],
+       [ 98,  82, 124,  80]],dtype=np.int32),
+       "face2cell":np.array([[  3,   3,   0,   0],
+       [147, 147,   1,   1],
+       [ 99,  99,   2,   2],
+       [243, 243,   2,   2],
+       [ 15,  15,   0,   0],
        [159, 159,   1,   1],
-       [152, 152,   2,   2],
-       [152, 159,   1,   2],
-       [159, 159,   0,   0],
-       [152, 152,   0,   0],
-       [154, 154,   2,   2],
-       [161, 161,   1,   1],
-       [154, 161,   1,   2],
-       [154, 154,   0,   0],
-       [161, 161,   0,   0],
+       [111, 111,   2,   2],
+       [351, 351,   3,   3],
+       [  9,   9,   2,   2],
+       [ 57,  57,   1,   1],
        [153, 153,   2,   2],
-       [160, 160,   1,   1],
-       [153, 160,   1,   2],
-       [153, 153,   0,   0],
-       [160, 160,   0,   0],
-       [157, 157,   1,   1],
-       [150, 150,   2,   2],
-       [150, 157,   1,   2],
-       [157, 157,   0,   0],
-       [150, 150,   0,   0],
-       [158, 158,   1,   1],
-       [151, 151,   2,   2],
-       [151, 158,   1,   2],
-       [158, 158,   0,   0],
-       [151, 151,   0,   0],
-       [155, 155,   2,   2],
-       [156, 156,   1,   1],
-       [155, 156,   1,   2],
-       [155, 155,   0,   0],
-       [156, 156,   0,   0],
-       [164, 165,   2,   1],
-       [166, 167,   2,   1],
-       [165, 166,   2,   1],
-       [162, 163,   2,   1],
-       [163, 164,   2,   1],
-       [162, 167,   1,   2],
-       [165, 165,   0,   0],
-       [164, 164,   0,   0],
-       [166, 166,   0,   0],
-       [167, 167,   0,   0],
-       [163, 163,   0,   0],
-       [162, 162,   0,   0],
-       [ 99,  99,   2,   2],
+       [201, 201,   3,   3],
+       [ 27,  27,   2,   2],
+       [ 75,  75,   1,   1],
+       [171, 171,   2,   2],
+       [315, 315,   2,   2],
        [  2,   2,   0,   0],
-       [  2,  99,   2,   0],
-       [ 15,  15,   0,   0],
+       [146, 146,   1,   1],
+       [ 98,  98,   2,   2],
+       [338, 338,   3,   3],
+       [ 14,  14,   0,   0],
+       [158, 158,   1,   1],
+       [110, 110,   2,   2],
+       [350, 350,   3,   3],
        [  8,   8,   2,   2],
-       [  8,  15,   0,   2],
-       [ 93,  99,   1,   1],
-       [ 27,  27,   2,   2],
-       [ 27,  93,   0,   0],
-       [  2,  26,   1,   2],
+       [ 56,  56,   1,   1],
+       [152, 152,   2,   2],
+       [296, 296,   2,   2],
+       [ 44,  44,   2,   2],
        [ 92,  92,   1,   1],
-       [ 26,  92,   0,   0],
+       [188, 188,   2,   2],
+       [332, 332,   2,   2],
+       [  2,  99,   2,   0],
+       [ 50,  51,   1,   0],
+       [146, 147,   2,   0],
+       [290, 291,   2,   3],
+       [  8,  15,   0,   2],
+       [152, 159,   1,   2],
+       [ 63, 104,   1,   2],
+       [303, 344,   2,   3],
+       [ 20,  21,   2,   0],
+       [ 68, 117,   1,   2],
+       [164, 165,   2,   1],
+       [212, 357,   3,   3],
        [ 26,  93,   1,   2],
-       [ 15,  27,   1,   1],
-       [  8,  92,   1,   2],
+       [122, 141,   1,   1],
+       [ 45,  74,   1,   2],
+       [218, 237,   2,   2],
        [  4,   4,   0,   0],
-       [101, 101,   2,   2],
-       [  4, 101,   2,   0],
+       [148, 148,   1,   1],
+       [100, 100,   2,   2],
+       [340, 340,   3,   3],
+       [ 16,  16,   0,   0],
+       [160, 160,   1,   1],
+       [112, 112,   2,   2],
+       [352, 352,   3,   3],
        [ 10,  10,   2,   2],
-       [ 17,  17,   0,   0],
-       [ 10,  17,   0,   2],
-       [  4,  28,   1,   2],
+       [ 58,  58,   1,   1],
+       [154, 154,   2,   2],
+       [298, 298,   2,   2],
+       [ 46,  46,   2,   2],
        [ 94,  94,   1,   1],
-       [ 28,  94,   0,   0],
-       [ 95, 101,   1,   1],
+       [190, 190,   2,   2],
+       [334, 334,   2,   2],
+       [  5,   5,   0,   0],
+       [149, 149,   1,   1],
+       [101, 101,   2,   2],
+       [245, 245,   2,   2],
+       [ 17,  17,   0,   0],
+       [161, 161,   1,   1],
+       [113, 113,   2,   2],
+       [353, 353,   3,   3],
+       [ 11,  11,   2,   2],
+       [ 59,  59,   1,   1],
+       [155, 155,   2,   2],
+       [203, 203,   3,   3],
        [ 29,  29,   2,   2],
-       [ 29,  95,   0,   0],
+       [ 77,  77,   1,   1],
+       [173, 173,   2,   2],
+       [317, 317,   2,   2],
+       [  4, 101,   2,   0],
+       [ 52,  53,   1,   0],
+       [148, 149,   2,   0],
+       [292, 293,   2,   3],
+       [ 10,  17,   0,   2],
+       [154, 161,   1,   2],
+       [ 65, 106,   1,   2],
+       [305, 346,   2,   3],
+       [ 22,  23,   2,   0],
+       [ 70, 119,   1,   2],
+       [166, 167,   2,   1],
+       [214, 359,   3,   3],
        [ 28,  95,   1,   2],
-       [ 10,  94,   1,   2],
-       [ 17,  29,   1,   1],
-       [  3,   3,   0,   0],
-       [100, 100,   2,   2],
+       [124, 143,   1,   1],
+       [ 47,  76,   1,   2],
+       [220, 239,   2,   2],
        [  3, 100,   2,   0],
-       [  9,   9,   2,   2],
-       [ 16,  16,   0,   0],
+       [ 51,  52,   1,   0],
+       [147, 148,   2,   0],
+       [195, 244,   3,   3],
        [  9,  16,   0,   2],
-       [  3, 189,   1,   2],
-       [171, 171,   2,   2],
-       [171, 189,   1,   0],
-       [100, 172,   1,   2],
-       [190, 190,   2,   2],
-       [172, 190,   1,   0],
-       [183, 189,   0,   1],
-       [172, 178,   0,   1],
+       [153, 160,   1,   2],
+       [ 64, 105,   1,   2],
+       [249, 304,   2,   2],
+       [ 21,  22,   2,   0],
+       [ 69, 118,   1,   2],
+       [165, 166,   2,   1],
+       [262, 309,   2,   2],
+       [ 34,  87,   2,   1],
+       [ 39,  82,   2,   1],
        [178, 183,   2,   2],
-       [171, 177,   0,   1],
-       [  9, 177,   1,   2],
-       [177, 183,   0,   1],
-       [184, 190,   0,   1],
-       [ 16, 184,   1,   2],
-       [178, 184,   0,   1],
+       [322, 327,   2,   2],
+       [  1,   1,   0,   0],
+       [145, 145,   1,   1],
        [ 97,  97,   2,   2],
-       [  0,   0,   0,   0],
-       [  0,  97,   2,   0],
+       [241, 241,   2,   2],
        [ 13,  13,   0,   0],
-       [  6,   6,   2,   2],
-       [  6,  13,   0,   2],
-       [ 91,  97,   1,   1],
-       [ 25,  25,   2,   2],
-       [ 25,  91,   0,   0],
-       [  0,  24,   1,   2],
-       [ 90,  90,   1,   1],
-       [ 24,  90,   0,   0],
-       [ 24,  91,   1,   2],
-       [ 13,  25,   1,   1],
-       [  6,  90,   1,   2],
-       [ 98,  98,   2,   2],
-       [  1,   1,   0,   0],
-       [  1,  98,   2,   0],
-       [ 14,  14,   0,   0],
+       [157, 157,   1,   1],
+       [109, 109,   2,   2],
+       [349, 349,   3,   3],
        [  7,   7,   2,   2],
-       [  7,  14,   0,   2],
-       [ 98, 170,   1,   2],
-       [188, 188,   2,   2],
-       [170, 188,   1,   0],
-       [  1, 187,   1,   2],
+       [ 55,  55,   1,   1],
+       [151, 151,   2,   2],
+       [199, 199,   3,   3],
+       [ 25,  25,   2,   2],
+       [ 73,  73,   1,   1],
        [169, 169,   2,   2],
-       [169, 187,   1,   0],
-       [170, 176,   0,   1],
-       [181, 187,   0,   1],
-       [176, 181,   2,   2],
-       [182, 188,   0,   1],
-       [ 14, 182,   1,   2],
-       [176, 182,   0,   1],
-       [169, 175,   0,   1],
-       [  7, 175,   1,   2],
-       [175, 181,   0,   1],
-       [  5,   5,   0,   0],
+       [313, 313,   2,   2],
+       [  0,   0,   0,   0],
+       [144, 144,   1,   1],
        [ 96,  96,   2,   2],
-       [  5,  96,   2,   0],
-       [ 11,  11,   2,   2],
+       [336, 336,   3,   3],
        [ 12,  12,   0,   0],
-       [ 11,  12,   0,   2],
-       [  5, 191,   1,   2],
-       [173, 173,   2,   2],
-       [173, 191,   1,   0],
-       [ 96, 168,   1,   2],
+       [156, 156,   1,   1],
+       [108, 108,   2,   2],
+       [348, 348,   3,   3],
+       [  6,   6,   2,   2],
+       [ 54,  54,   1,   1],
+       [150, 150,   2,   2],
+       [294, 294,   2,   2],
+       [ 42,  42,   2,   2],
+       [ 90,  90,   1,   1],
        [186, 186,   2,   2],
-       [168, 186,   1,   0],
-       [185, 191,   0,   1],
-       [168, 174,   0,   1],
-       [174, 185,   2,   2],
-       [173, 179,   0,   1],
-       [ 11, 179,   1,   2],
-       [179, 185,   0,   1],
-       [180, 186,   0,   1],
-       [ 12, 180,   1,   2],
-       [174, 180,   0,   1],
-       [ 50,  51,   1,   0],
-       [ 52,  53,   1,   0],
-       [ 51,  52,   1,   0],
+       [330, 330,   2,   2],
+       [  0,  97,   2,   0],
        [ 48,  49,   1,   0],
-       [ 49,  50,   1,   0],
-       [ 48,  53,   0,   1],
-       [ 20,  21,   2,   0],
-       [ 22,  23,   2,   0],
-       [ 21,  22,   2,   0],
+       [144, 145,   2,   0],
+       [288, 289,   2,   3],
+       [  6,  13,   0,   2],
+       [150, 157,   1,   2],
+       [ 61, 102,   1,   2],
+       [301, 342,   2,   3],
        [ 18,  19,   2,   0],
-       [ 19,  20,   2,   0],
-       [ 18,  23,   0,   2],
-       [ 45,  51,   2,   2],
-       [ 50,  74,   2,   1],
-       [ 45,  74,   1,   2],
-       [ 52,  76,   2,   1],
-       [ 47,  53,   2,   2],
-       [ 47,  76,   1,   2],
-       [ 45,  87,   0,   0],
-       [ 34,  76,   0,   0],
-       [ 34,  87,   2,   1],
-       [ 43,  49,   2,   2],
-       [ 48,  72,   2,   1],
+       [ 66, 115,   1,   2],
+       [162, 163,   2,   1],
+       [210, 355,   3,   3],
+       [ 24,  91,   1,   2],
+       [120, 139,   1,   1],
        [ 43,  72,   1,   2],
-       [ 32,  74,   0,   0],
-       [ 43,  85,   0,   0],
+       [216, 235,   2,   2],
+       [  1,  98,   2,   0],
+       [ 49,  50,   1,   0],
+       [145, 146,   2,   0],
+       [193, 242,   3,   3],
+       [  7,  14,   0,   2],
+       [151, 158,   1,   2],
+       [ 62, 103,   1,   2],
+       [247, 302,   2,   2],
+       [ 19,  20,   2,   0],
+       [ 67, 116,   1,   2],
+       [163, 164,   2,   1],
+       [260, 307,   2,   2],
        [ 32,  85,   2,   1],
-       [ 47,  89,   0,   0],
-       [ 30,  72,   0,   0],
+       [ 37,  80,   2,   1],
+       [176, 181,   2,   2],
+       [320, 325,   2,   2],
+       [ 48,  53,   0,   1],
+       [  5,  96,   2,   0],
+       [144, 149,   0,   2],
+       [197, 240,   3,   3],
+       [ 18,  23,   0,   2],
+       [162, 167,   1,   2],
+       [ 71, 114,   1,   2],
+       [258, 311,   2,   2],
+       [ 11,  12,   0,   2],
+       [155, 156,   1,   2],
+       [ 60, 107,   1,   2],
+       [251, 300,   2,   2],
        [ 30,  89,   2,   1],
-       [ 21,  87,   1,   2],
-       [ 20,  32,   1,   1],
-       [ 22,  34,   1,   1],
-       [ 23,  89,   1,   2],
-       [ 19,  85,   1,   2],
-       [ 18,  30,   1,   1],
-       [111, 111,   2,   2],
-       [111, 111,   0,   0],
-       [ 57,  57,   1,   1],
+       [ 41,  78,   2,   1],
+       [174, 185,   2,   2],
+       [318, 329,   2,   2],
        [ 57,  57,   0,   0],
-       [ 75,  75,   1,   1],
-       [ 75, 111,   2,   1],
-       [ 33,  75,   0,   0],
-       [ 33,  57,   2,   2],
+       [105, 105,   0,   0],
+       [153, 153,   0,   0],
+       [297, 297,   3,   3],
+       [ 63,  63,   0,   0],
+       [111, 111,   0,   0],
+       [159, 159,   0,   0],
+       [255, 255,   3,   3],
+       [ 69,  69,   0,   0],
+       [117, 117,   0,   0],
+       [165, 165,   0,   0],
+       [261, 261,   3,   3],
        [ 33,  33,   1,   1],
-       [ 56,  56,   1,   1],
+       [129, 129,   1,   1],
+       [ 81,  81,   2,   2],
+       [225, 225,   2,   2],
        [ 56,  56,   0,   0],
-       [110, 110,   2,   2],
-       [110, 110,   0,   0],
-       [ 44,  44,   2,   2],
-       [ 44,  56,   1,   2],
-       [ 44,  86,   0,   0],
-       [ 86, 110,   1,   1],
-       [ 86,  86,   2,   2],
-       [ 63, 104,   1,   2],
-       [ 63,  63,   0,   0],
        [104, 104,   0,   0],
-       [ 68, 117,   1,   2],
-       [117, 117,   0,   0],
+       [152, 152,   0,   0],
+       [248, 248,   3,   3],
+       [ 62,  62,   0,   0],
+       [110, 110,   0,   0],
+       [158, 158,   0,   0],
+       [254, 254,   3,   3],
        [ 68,  68,   0,   0],
-       [123, 141,   2,   0],
-       [122, 140,   2,   0],
-       [122, 141,   1,   1],
-       [ 63, 123,   2,   1],
-       [104, 140,   1,   1],
-       [135, 141,   0,   2],
-       [123, 129,   0,   2],
-       [129, 135,   0,   2],
-       [122, 128,   0,   2],
-       [134, 140,   0,   2],
-       [128, 134,   0,   2],
-       [117, 135,   1,   1],
-       [ 68, 128,   2,   1],
-       [129, 129,   1,   1],
+       [116, 116,   0,   0],
+       [164, 164,   0,   0],
+       [308, 308,   3,   3],
+       [ 38,  38,   1,   1],
        [134, 134,   1,   1],
-       [ 58,  58,   1,   1],
+       [ 86,  86,   2,   2],
+       [230, 230,   2,   2],
        [ 58,  58,   0,   0],
-       [112, 112,   2,   2],
+       [106, 106,   0,   0],
+       [154, 154,   0,   0],
+       [250, 250,   3,   3],
+       [ 64,  64,   0,   0],
        [112, 112,   0,   0],
-       [ 46,  46,   2,   2],
-       [ 46,  58,   1,   2],
-       [ 46,  88,   0,   0],
-       [ 88, 112,   1,   1],
+       [160, 160,   0,   0],
+       [256, 256,   3,   3],
+       [ 70,  70,   0,   0],
+       [118, 118,   0,   0],
+       [166, 166,   0,   0],
+       [310, 310,   3,   3],
+       [ 40,  40,   1,   1],
+       [136, 136,   1,   1],
        [ 88,  88,   2,   2],
-       [113, 113,   2,   2],
-       [113, 113,   0,   0],
-       [ 59,  59,   1,   1],
+       [232, 232,   2,   2],
        [ 59,  59,   0,   0],
-       [ 77,  77,   1,   1],
-       [ 77, 113,   2,   1],
-       [ 35,  77,   0,   0],
-       [ 35,  59,   2,   2],
-       [ 35,  35,   1,   1],
-       [ 65, 106,   1,   2],
-       [106, 106,   0,   0],
+       [107, 107,   0,   0],
+       [155, 155,   0,   0],
+       [299, 299,   3,   3],
        [ 65,  65,   0,   0],
-       [ 70, 119,   1,   2],
-       [ 70,  70,   0,   0],
+       [113, 113,   0,   0],
+       [161, 161,   0,   0],
+       [257, 257,   3,   3],
+       [ 71,  71,   0,   0],
        [119, 119,   0,   0],
-       [124, 142,   2,   0],
-       [125, 143,   2,   0],
-       [124, 143,   1,   1],
-       [106, 142,   1,   1],
-       [ 65, 125,   2,   1],
-       [124, 130,   0,   2],
-       [136, 142,   0,   2],
-       [130, 136,   0,   2],
-       [137, 143,   0,   2],
-       [125, 131,   0,   2],
-       [131, 137,   0,   2],
-       [ 70, 130,   2,   1],
-       [119, 137,   1,   1],
-       [136, 136,   1,   1],
+       [167, 167,   0,   0],
+       [263, 263,   3,   3],
+       [ 35,  35,   1,   1],
        [131, 131,   1,   1],
-       [ 64, 105,   1,   2],
-       [105, 105,   0,   0],
-       [ 64,  64,   0,   0],
-       [ 69, 118,   1,   2],
-       [ 69,  69,   0,   0],
-       [118, 118,   0,   0],
-       [ 39,  82,   2,   1],
-       [ 81, 105,   1,   1],
-       [ 39,  81,   0,   0],
-       [ 40,  64,   2,   2],
-       [ 40,  82,   0,   0],
-       [ 39,  69,   1,   2],
-       [ 82, 118,   2,   1],
-       [ 81,  81,   2,   2],
-       [ 40,  40,   1,   1],
-       [109, 109,   2,   2],
-       [109, 109,   0,   0],
-       [ 55,  55,   1,   1],
+       [ 83,  83,   2,   2],
+       [227, 227,   2,   2],
        [ 55,  55,   0,   0],
-       [ 73,  73,   1,   1],
-       [ 73, 109,   2,   1],
-       [ 31,  73,   0,   0],
-       [ 31,  55,   2,   2],
+       [103, 103,   0,   0],
+       [151, 151,   0,   0],
+       [295, 295,   3,   3],
+       [ 61,  61,   0,   0],
+       [109, 109,   0,   0],
+       [157, 157,   0,   0],
+       [253, 253,   3,   3],
+       [ 67,  67,   0,   0],
+       [115, 115,   0,   0],
+       [163, 163,   0,   0],
+       [259, 259,   3,   3],
        [ 31,  31,   1,   1],
-       [ 54,  54,   1,   1],
+       [127, 127,   1,   1],
+       [ 79,  79,   2,   2],
+       [223, 223,   2,   2],
        [ 54,  54,   0,   0],
-       [108, 108,   2,   2],
+       [102, 102,   0,   0],
+       [150, 150,   0,   0],
+       [246, 246,   3,   3],
+       [ 60,  60,   0,   0],
        [108, 108,   0,   0],
-       [ 42,  42,   2,   2],
+       [156, 156,   0,   0],
+       [252, 252,   3,   3],
+       [ 66,  66,   0,   0],
+       [114, 114,   0,   0],
+       [162, 162,   0,   0],
+       [306, 306,   3,   3],
+       [ 36,  36,   1,   1],
+       [132, 132,   1,   1],
+       [ 84,  84,   2,   2],
+       [228, 228,   2,   2],
+       [  0,  24,   1,   2],
+       [ 96, 168,   1,   2],
+       [ 48,  72,   2,   1],
+       [192, 312,   2,   2],
+       [  6,  90,   1,   2],
+       [102, 138,   1,   1],
        [ 42,  54,   1,   2],
-       [ 42,  84,   0,   0],
+       [198, 234,   2,   2],
+       [ 12, 180,   1,   2],
        [ 84, 108,   1,   1],
-       [ 84,  84,   2,   2],
-       [ 61, 102,   1,   2],
-       [ 61,  61,   0,   0],
-       [102, 102,   0,   0],
-       [ 66, 115,   1,   2],
-       [115, 115,   0,   0],
-       [ 66,  66,   0,   0],
-       [121, 139,   2,   0],
+       [ 36,  60,   2,   2],
+       [204, 324,   2,   2],
+       [ 18,  30,   1,   1],
+       [ 78, 114,   2,   1],
+       [ 66, 126,   2,   1],
+       [222, 354,   2,   2],
+       [ 30,  72,   0,   0],
+       [120, 126,   0,   2],
+       [168, 174,   0,   1],
+       [264, 366,   3,   3],
+       [ 24,  90,   0,   0],
+       [168, 186,   1,   0],
        [120, 138,   2,   0],
-       [120, 139,   1,   1],
+       [282, 360,   3,   3],
+       [ 36,  78,   0,   0],
+       [126, 132,   0,   2],
+       [174, 180,   0,   1],
+       [270, 372,   3,   3],
+       [ 42,  84,   0,   0],
+       [132, 138,   0,   2],
+       [180, 186,   0,   1],
+       [276, 378,   3,   3],
+       [  1, 187,   1,   2],
+       [ 91,  97,   1,   1],
+       [ 43,  49,   2,   2],
+       [331, 337,   2,   2],
+       [  7, 175,   1,   2],
+       [ 79, 103,   1,   1],
+       [ 31,  55,   2,   2],
+       [319, 343,   2,   2],
+       [ 13,  25,   1,   1],
+       [ 73, 109,   2,   1],
        [ 61, 121,   2,   1],
-       [102, 138,   1,   1],
-       [133, 139,   0,   2],
+       [205, 217,   2,   2],
+       [ 19,  85,   1,   2],
+       [115, 133,   1,   1],
+       [ 37,  67,   1,   2],
+       [211, 229,   2,   2],
+       [ 31,  73,   0,   0],
        [121, 127,   0,   2],
+       [169, 175,   0,   1],
+       [265, 367,   3,   3],
+       [ 25,  91,   0,   0],
+       [169, 187,   1,   0],
+       [121, 139,   2,   0],
+       [283, 361,   3,   3],
+       [ 37,  79,   0,   0],
        [127, 133,   0,   2],
-       [120, 126,   0,   2],
-       [132, 138,   0,   2],
-       [126, 132,   0,   2],
-       [115, 133,   1,   1],
-       [ 66, 126,   2,   1],
-       [127, 127,   1,   1],
-       [132, 132,   1,   1],
-       [ 62, 103,   1,   2],
-       [ 62,  62,   0,   0],
-       [103, 103,   0,   0],
-       [ 67, 116,   1,   2],
-       [116, 116,   0,   0],
-       [ 67,  67,   0,   0],
-       [ 37,  80,   2,   1],
+       [175, 181,   0,   1],
+       [271, 373,   3,   3],
+       [ 43,  85,   0,   0],
+       [133, 139,   0,   2],
+       [181, 187,   0,   1],
+       [277, 379,   3,   3],
+       [  2,  26,   1,   2],
+       [ 98, 170,   1,   2],
+       [ 50,  74,   2,   1],
+       [194, 314,   2,   2],
+       [  8,  92,   1,   2],
+       [104, 140,   1,   1],
+       [ 44,  56,   1,   2],
+       [200, 236,   2,   2],
+       [ 14, 182,   1,   2],
+       [ 86, 110,   1,   1],
        [ 38,  62,   2,   2],
-       [ 38,  80,   0,   0],
-       [ 79, 103,   1,   1],
-       [ 37,  79,   0,   0],
+       [206, 326,   2,   2],
+       [ 20,  32,   1,   1],
        [ 80, 116,   2,   1],
-       [ 37,  67,   1,   2],
-       [ 38,  38,   1,   1],
-       [ 79,  79,   2,   2],
-       [ 60, 107,   1,   2],
-       [107, 107,   0,   0],
-       [ 60,  60,   0,   0],
-       [ 71, 114,   1,   2],
-       [ 71,  71,   0,   0],
-       [114, 114,   0,   0],
-       [ 41,  78,   2,   1],
-       [ 83, 107,   1,   1],
-       [ 41,  83,   0,   0],
-       [ 36,  60,   2,   2],
-       [ 36,  78,   0,   0],
-       [ 41,  71,   1,   2],
-       [ 78, 114,   2,   1],
-       [ 83,  83,   2,   2],
-       [ 36,  36,   1,   1],
-       [147, 243,   3,   3],
-       [243, 243,   2,   2],
-       [146, 290,   3,   3],
-       [338, 338,   3,   3],
-       [290, 338,   0,   1],
-       [243, 291,   0,   1],
-       [290, 291,   2,   3],
-       [ 99, 291,   3,   2],
-       [  2, 338,   3,   2],
-       [148, 292,   3,   3],
-       [340, 340,   3,   3],
-       [292, 340,   0,   1],
-       [149, 245,   3,   3],
-       [245, 245,   2,   2],
-       [245, 293,   0,   1],
-       [292, 293,   2,   3],
-       [  4, 340,   3,   2],
-       [101, 293,   3,   2],
-       [195, 243,   0,   1],
-       [244, 292,   0,   1],
-       [195, 244,   3,   3],
-       [  3, 195,   3,   2],
-       [196, 340,   1,   0],
-       [100, 196,   3,   3],
-       [196, 244,   0,   1],
-       [145, 241,   3,   3],
-       [241, 241,   2,   2],
-       [144, 288,   3,   3],
-       [336, 336,   3,   3],
-       [288, 336,   0,   1],
-       [241, 289,   0,   1],
-       [288, 289,   2,   3],
-       [ 97, 289,   3,   2],
-       [  0, 336,   3,   2],
-       [242, 290,   0,   1],
-       [193, 241,   0,   1],
-       [193, 242,   3,   3],
-       [194, 338,   1,   0],
-       [ 98, 194,   3,   3],
-       [194, 242,   0,   1],
-       [  1, 193,   3,   2],
-       [197, 245,   0,   1],
-       [240, 288,   0,   1],
-       [197, 240,   3,   3],
-       [  5, 197,   3,   2],
-       [192, 336,   1,   0],
-       [ 96, 192,   3,   3],
-       [192, 240,   0,   1],
-       [291, 339,   0,   1],
-       [195, 339,   1,   0],
-       [ 51, 339,   3,   3],
-       [ 50, 242,   3,   2],
-       [293, 341,   0,   1],
-       [197, 341,   1,   0],
-       [ 52, 244,   3,   2],
-       [ 53, 341,   3,   3],
-       [289, 337,   0,   1],
-       [193, 337,   1,   0],
-       [ 49, 337,   3,   3],
+       [ 68, 128,   2,   1],
+       [224, 356,   2,   2],
+       [ 32,  74,   0,   0],
+       [122, 128,   0,   2],
+       [170, 176,   0,   1],
+       [266, 368,   3,   3],
+       [ 26,  92,   0,   0],
+       [170, 188,   1,   0],
+       [122, 140,   2,   0],
+       [284, 362,   3,   3],
+       [ 38,  80,   0,   0],
+       [128, 134,   0,   2],
+       [176, 182,   0,   1],
+       [272, 374,   3,   3],
+       [ 44,  86,   0,   0],
+       [134, 140,   0,   2],
+       [182, 188,   0,   1],
+       [278, 380,   3,   3],
+       [  3, 189,   1,   2],
+       [ 93,  99,   1,   1],
+       [ 45,  51,   2,   2],
+       [333, 339,   2,   2],
+       [  9, 177,   1,   2],
+       [ 81, 105,   1,   1],
+       [ 33,  57,   2,   2],
+       [321, 345,   2,   2],
+       [ 15,  27,   1,   1],
+       [ 75, 111,   2,   1],
+       [ 63, 123,   2,   1],
+       [207, 219,   2,   2],
+       [ 21,  87,   1,   2],
+       [117, 135,   1,   1],
+       [ 39,  69,   1,   2],
+       [213, 231,   2,   2],
+       [ 33,  75,   0,   0],
+       [123, 129,   0,   2],
+       [171, 177,   0,   1],
+       [267, 369,   3,   3],
+       [ 27,  93,   0,   0],
+       [171, 189,   1,   0],
+       [123, 141,   2,   0],
+       [285, 363,   3,   3],
+       [ 39,  81,   0,   0],
+       [129, 135,   0,   2],
+       [177, 183,   0,   1],
+       [273, 375,   3,   3],
+       [ 45,  87,   0,   0],
+       [135, 141,   0,   2],
+       [183, 189,   0,   1],
+       [279, 381,   3,   3],
+       [  4,  28,   1,   2],
+       [100, 172,   1,   2],
+       [ 52,  76,   2,   1],
+       [196, 316,   2,   2],
+       [ 10,  94,   1,   2],
+       [106, 142,   1,   1],
+       [ 46,  58,   1,   2],
+       [202, 238,   2,   2],
+       [ 16, 184,   1,   2],
+       [ 88, 112,   1,   1],
+       [ 40,  64,   2,   2],
+       [208, 328,   2,   2],
+       [ 22,  34,   1,   1],
+       [ 82, 118,   2,   1],
+       [ 70, 130,   2,   1],
+       [226, 358,   2,   2],
+       [ 34,  76,   0,   0],
+       [124, 130,   0,   2],
+       [172, 178,   0,   1],
+       [268, 370,   3,   3],
+       [ 28,  94,   0,   0],
+       [172, 190,   1,   0],
+       [124, 142,   2,   0],
+       [286, 364,   3,   3],
+       [ 40,  82,   0,   0],
+       [130, 136,   0,   2],
+       [178, 184,   0,   1],
+       [274, 376,   3,   3],
+       [ 46,  88,   0,   0],
+       [136, 142,   0,   2],
+       [184, 190,   0,   1],
+       [280, 382,   3,   3],
+       [  5, 191,   1,   2],
+       [ 95, 101,   1,   1],
+       [ 47,  53,   2,   2],
+       [335, 341,   2,   2],
+       [ 11, 179,   1,   2],
+       [ 83, 107,   1,   1],
+       [ 35,  59,   2,   2],
+       [323, 347,   2,   2],
+       [ 17,  29,   1,   1],
+       [ 77, 113,   2,   1],
+       [ 65, 125,   2,   1],
+       [209, 221,   2,   2],
+       [ 23,  89,   1,   2],
+       [119, 137,   1,   1],
+       [ 41,  71,   1,   2],
+       [215, 233,   2,   2],
+       [ 35,  77,   0,   0],
+       [125, 131,   0,   2],
+       [173, 179,   0,   1],
+       [269, 371,   3,   3],
+       [ 29,  95,   0,   0],
+       [173, 191,   1,   0],
+       [125, 143,   2,   0],
+       [287, 365,   3,   3],
+       [ 41,  83,   0,   0],
+       [131, 137,   0,   2],
+       [179, 185,   0,   1],
+       [275, 377,   3,   3],
+       [ 47,  89,   0,   0],
+       [137, 143,   0,   2],
+       [185, 191,   0,   1],
+       [281, 383,   3,   3],
+       [  0, 336,   3,   2],
        [ 48, 240,   3,   2],
-       [159, 303,   3,   3],
-       [351, 351,   3,   3],
-       [303, 351,   0,   1],
-       [152, 296,   3,   3],
-       [296, 296,   2,   2],
-       [296, 344,   0,   1],
-       [303, 344,   2,   3],
-       [ 15, 351,   3,   2],
-       [  8, 344,   3,   2],
-       [255, 303,   0,   1],
-       [255, 255,   3,   3],
-       [207, 351,   1,   0],
-       [111, 207,   3,   3],
-       [207, 255,   0,   1],
-       [248, 296,   0,   1],
-       [248, 248,   3,   3],
-       [ 56, 248,   3,   2],
-       [200, 344,   1,   0],
-       [200, 248,   0,   1],
-       [ 63, 255,   3,   2],
-       [104, 200,   3,   3],
-       [154, 298,   3,   3],
-       [298, 298,   2,   2],
-       [161, 305,   3,   3],
-       [353, 353,   3,   3],
-       [305, 353,   0,   1],
-       [298, 346,   0,   1],
-       [305, 346,   2,   3],
-       [ 10, 346,   3,   2],
-       [ 17, 353,   3,   2],
-       [250, 298,   0,   1],
-       [250, 250,   3,   3],
-       [ 58, 250,   3,   2],
-       [257, 305,   0,   1],
-       [257, 257,   3,   3],
-       [209, 353,   1,   0],
-       [113, 209,   3,   3],
-       [209, 257,   0,   1],
-       [202, 346,   1,   0],
-       [202, 250,   0,   1],
-       [106, 202,   3,   3],
-       [ 65, 257,   3,   2],
-       [153, 249,   3,   3],
-       [201, 201,   3,   3],
-       [201, 249,   0,   1],
-       [160, 304,   3,   3],
-       [352, 352,   3,   3],
-       [304, 352,   0,   1],
-       [249, 304,   2,   2],
-       [  9, 201,   3,   2],
-       [ 16, 352,   3,   2],
-       [249, 297,   0,   1],
-       [297, 297,   3,   3],
-       [201, 345,   1,   0],
-       [ 57, 345,   3,   3],
-       [297, 345,   0,   1],
-       [256, 304,   0,   1],
-       [256, 256,   3,   3],
-       [208, 352,   1,   0],
-       [112, 208,   3,   3],
-       [208, 256,   0,   1],
-       [105, 297,   3,   2],
-       [ 64, 256,   3,   2],
-       [157, 301,   3,   3],
-       [349, 349,   3,   3],
-       [301, 349,   0,   1],
-       [150, 294,   3,   3],
-       [294, 294,   2,   2],
-       [294, 342,   0,   1],
-       [301, 342,   2,   3],
-       [ 13, 349,   3,   2],
+       [ 96, 192,   3,   3],
+       [144, 288,   3,   3],
+       [192, 240,   0,   1],
+       [192, 336,   1,   0],
+       [240, 288,   0,   1],
+       [288, 336,   0,   1],
+       [  1, 193,   3,   2],
+       [ 49, 337,   3,   3],
+       [ 97, 289,   3,   2],
+       [145, 241,   3,   3],
+       [193, 241,   0,   1],
+       [193, 337,   1,   0],
+       [241, 289,   0,   1],
+       [289, 337,   0,   1],
+       [  2, 338,   3,   2],
+       [ 50, 242,   3,   2],
+       [ 98, 194,   3,   3],
+       [146, 290,   3,   3],
+       [194, 242,   0,   1],
+       [194, 338,   1,   0],
+       [242, 290,   0,   1],
+       [290, 338,   0,   1],
+       [  3, 195,   3,   2],
+       [ 51, 339,   3,   3],
+       [ 99, 291,   3,   2],
+       [147, 243,   3,   3],
+       [195, 243,   0,   1],
+       [195, 339,   1,   0],
+       [243, 291,   0,   1],
+       [291, 339,   0,   1],
+       [  4, 340,   3,   2],
+       [ 52, 244,   3,   2],
+       [100, 196,   3,   3],
+       [148, 292,   3,   3],
+       [196, 244,   0,   1],
+       [196, 340,   1,   0],
+       [244, 292,   0,   1],
+       [292, 340,   0,   1],
+       [  5, 197,   3,   2],
+       [ 53, 341,   3,   3],
+       [101, 293,   3,   2],
+       [149, 245,   3,   3],
+       [197, 245,   0,   1],
+       [197, 341,   1,   0],
+       [245, 293,   0,   1],
+       [293, 341,   0,   1],
        [  6, 342,   3,   2],
-       [253, 301,   0,   1],
-       [253, 253,   3,   3],
-       [205, 349,   1,   0],
-       [109, 205,   3,   3],
-       [205, 253,   0,   1],
-       [246, 294,   0,   1],
-       [246, 246,   3,   3],
        [ 54, 246,   3,   2],
-       [198, 342,   1,   0],
-       [198, 246,   0,   1],
-       [ 61, 253,   3,   2],
        [102, 198,   3,   3],
-       [158, 302,   3,   3],
-       [350, 350,   3,   3],
-       [302, 350,   0,   1],
+       [150, 294,   3,   3],
+       [198, 246,   0,   1],
+       [198, 342,   1,   0],
+       [246, 294,   0,   1],
+       [294, 342,   0,   1],
+       [  7, 199,   3,   2],
+       [ 55, 343,   3,   3],
+       [103, 295,   3,   2],
        [151, 247,   3,   3],
-       [199, 199,   3,   3],
        [199, 247,   0,   1],
-       [247, 302,   2,   2],
-       [ 14, 350,   3,   2],
-       [  7, 199,   3,   2],
-       [254, 302,   0,   1],
-       [254, 254,   3,   3],
-       [206, 350,   1,   0],
-       [110, 206,   3,   3],
-       [206, 254,   0,   1],
-       [247, 295,   0,   1],
-       [295, 295,   3,   3],
        [199, 343,   1,   0],
-       [ 55, 343,   3,   3],
+       [247, 295,   0,   1],
        [295, 343,   0,   1],
-       [ 62, 254,   3,   2],
-       [103, 295,   3,   2],
+       [  8, 344,   3,   2],
+       [ 56, 248,   3,   2],
+       [104, 200,   3,   3],
+       [152, 296,   3,   3],
+       [200, 248,   0,   1],
+       [200, 344,   1,   0],
+       [248, 296,   0,   1],
+       [296, 344,   0,   1],
+       [  9, 201,   3,   2],
+       [ 57, 345,   3,   3],
+       [105, 297,   3,   2],
+       [153, 249,   3,   3],
+       [201, 249,   0,   1],
+       [201, 345,   1,   0],
+       [249, 297,   0,   1],
+       [297, 345,   0,   1],
+       [ 10, 346,   3,   2],
+       [ 58, 250,   3,   2],
+       [106, 202,   3,   3],
+       [154, 298,   3,   3],
+       [202, 250,   0,   1],
+       [202, 346,   1,   0],
+       [250, 298,   0,   1],
+       [298, 346,   0,   1],
+       [ 11, 203,   3,   2],
+       [ 59, 347,   3,   3],
+       [107, 299,   3,   2],
        [155, 251,   3,   3],
-       [203, 203,   3,   3],
        [203, 251,   0,   1],
-       [156, 300,   3,   3],
-       [348, 348,   3,   3],
-       [300, 348,   0,   1],
-       [251, 300,   2,   2],
-       [ 11, 203,   3,   2],
-       [ 12, 348,   3,   2],
-       [251, 299,   0,   1],
-       [299, 299,   3,   3],
        [203, 347,   1,   0],
-       [ 59, 347,   3,   3],
+       [251, 299,   0,   1],
        [299, 347,   0,   1],
-       [252, 300,   0,   1],
-       [252, 252,   3,   3],
-       [204, 348,   1,   0],
+       [ 12, 348,   3,   2],
+       [ 60, 252,   3,   2],
        [108, 204,   3,   3],
+       [156, 300,   3,   3],
        [204, 252,   0,   1],
-       [107, 299,   3,   2],
-       [ 60, 252,   3,   2],
-       [165, 309,   3,   3],
-       [164, 260,   3,   3],
-       [212, 357,   3,   3],
-       [309, 357,   0,   1],
-       [212, 260,   0,   1],
-       [166, 262,   3,   3],
-       [167, 311,   3,   3],
-       [214, 359,   3,   3],
-       [214, 262,   0,   1],
-       [311, 359,   0,   1],
-       [262, 309,   2,   2],
-       [163, 307,   3,   3],
+       [204, 348,   1,   0],
+       [252, 300,   0,   1],
+       [300, 348,   0,   1],
+       [ 13, 349,   3,   2],
+       [ 61, 253,   3,   2],
+       [109, 205,   3,   3],
+       [157, 301,   3,   3],
+       [205, 253,   0,   1],
+       [205, 349,   1,   0],
+       [253, 301,   0,   1],
+       [301, 349,   0,   1],
+       [ 14, 350,   3,   2],
+       [ 62, 254,   3,   2],
+       [110, 206,   3,   3],
+       [158, 302,   3,   3],
+       [206, 254,   0,   1],
+       [206, 350,   1,   0],
+       [254, 302,   0,   1],
+       [302, 350,   0,   1],
+       [ 15, 351,   3,   2],
+       [ 63, 255,   3,   2],
+       [111, 207,   3,   3],
+       [159, 303,   3,   3],
+       [207, 255,   0,   1],
+       [207, 351,   1,   0],
+       [255, 303,   0,   1],
+       [303, 351,   0,   1],
+       [ 16, 352,   3,   2],
+       [ 64, 256,   3,   2],
+       [112, 208,   3,   3],
+       [160, 304,   3,   3],
+       [208, 256,   0,   1],
+       [208, 352,   1,   0],
+       [256, 304,   0,   1],
+       [304, 352,   0,   1],
+       [ 17, 353,   3,   2],
+       [ 65, 257,   3,   2],
+       [113, 209,   3,   3],
+       [161, 305,   3,   3],
+       [209, 257,   0,   1],
+       [209, 353,   1,   0],
+       [257, 305,   0,   1],
+       [305, 353,   0,   1],
+       [ 18, 210,   3,   2],
+       [ 66, 354,   3,   3],
+       [114, 306,   3,   2],
        [162, 258,   3,   3],
-       [210, 355,   3,   3],
-       [307, 355,   0,   1],
        [210, 258,   0,   1],
-       [260, 307,   2,   2],
-       [258, 311,   2,   2],
-       [ 21, 357,   3,   2],
-       [ 20, 212,   3,   2],
-       [ 22, 214,   3,   2],
-       [ 23, 359,   3,   2],
+       [210, 354,   1,   0],
+       [258, 306,   0,   1],
+       [306, 354,   0,   1],
        [ 19, 355,   3,   2],
-       [ 18, 210,   3,   2],
-       [261, 309,   0,   1],
-       [261, 261,   3,   3],
-       [260, 308,   0,   1],
-       [308, 308,   3,   3],
-       [213, 357,   1,   0],
+       [ 67, 259,   3,   2],
+       [115, 211,   3,   3],
+       [163, 307,   3,   3],
+       [211, 259,   0,   1],
+       [211, 355,   1,   0],
+       [259, 307,   0,   1],
+       [307, 355,   0,   1],
+       [ 20, 212,   3,   2],
+       [ 68, 356,   3,   3],
+       [116, 308,   3,   2],
+       [164, 260,   3,   3],
+       [212, 260,   0,   1],
        [212, 356,   1,   0],
+       [260, 308,   0,   1],
+       [308, 356,   0,   1],
+       [ 21, 357,   3,   2],
+       [ 69, 261,   3,   2],
        [117, 213,   3,   3],
-       [ 68, 356,   3,   3],
+       [165, 309,   3,   3],
        [213, 261,   0,   1],
-       [308, 356,   0,   1],
-       [262, 310,   0,   1],
-       [310, 310,   3,   3],
-       [263, 311,   0,   1],
-       [263, 263,   3,   3],
-       [214, 358,   1,   0],
-       [215, 359,   1,   0],
+       [213, 357,   1,   0],
+       [261, 309,   0,   1],
+       [309, 357,   0,   1],
+       [ 22, 214,   3,   2],
        [ 70, 358,   3,   3],
-       [119, 215,   3,   3],
-       [310, 358,   0,   1],
-       [215, 263,   0,   1],
-       [ 69, 261,   3,   2],
        [118, 310,   3,   2],
-       [259, 307,   0,   1],
-       [259, 259,   3,   3],
-       [258, 306,   0,   1],
-       [306, 306,   3,   3],
-       [211, 355,   1,   0],
-       [210, 354,   1,   0],
-       [115, 211,   3,   3],
-       [ 66, 354,   3,   3],
-       [211, 259,   0,   1],
-       [306, 354,   0,   1],
-       [116, 308,   3,   2],
-       [ 67, 259,   3,   2],
+       [166, 262,   3,   3],
+       [214, 262,   0,   1],
+       [214, 358,   1,   0],
+       [262, 310,   0,   1],
+       [310, 358,   0,   1],
+       [ 23, 359,   3,   2],
        [ 71, 263,   3,   2],
-       [114, 306,   3,   2],
-       [ 93, 285,   3,   2],
-       [333, 339,   2,   2],
-       [285, 333,   0,   1],
-       [ 27, 363,   3,   2],
-       [315, 315,   2,   2],
-       [315, 363,   0,   1],
-       [285, 363,   3,   3],
-       [189, 333,   3,   3],
-       [171, 315,   3,   3],
+       [119, 215,   3,   3],
+       [167, 311,   3,   3],
+       [215, 263,   0,   1],
+       [215, 359,   1,   0],
+       [263, 311,   0,   1],
+       [311, 359,   0,   1],
+       [ 24, 360,   3,   2],
+       [ 72, 264,   3,   2],
+       [120, 216,   3,   3],
+       [168, 312,   3,   3],
+       [216, 264,   0,   1],
+       [216, 360,   1,   0],
+       [264, 312,   0,   1],
+       [312, 360,   0,   1],
+       [ 25, 361,   3,   2],
+       [ 73, 265,   3,   2],
+       [121, 217,   3,   3],
+       [169, 313,   3,   3],
+       [217, 265,   0,   1],
+       [217, 361,   1,   0],
+       [265, 313,   0,   1],
+       [313, 361,   0,   1],
        [ 26, 362,   3,   2],
-       [194, 314,   2,   2],
-       [314, 362,   0,   1],
-       [ 92, 284,   3,   2],
-       [332, 332,   2,   2],
-       [284, 332,   0,   1],
-       [284, 362,   3,   3],
+       [ 74, 266,   3,   2],
+       [122, 218,   3,   3],
        [170, 314,   3,   3],
-       [188, 332,   3,   3],
-       [237, 285,   0,   1],
+       [218, 266,   0,   1],
        [218, 362,   1,   0],
-       [218, 237,   2,   2],
-       [333, 381,   0,   1],
-       [ 45, 381,   3,   2],
-       [237, 381,   1,   0],
        [266, 314,   0,   1],
-       [ 74, 266,   3,   2],
-       [218, 266,   0,   1],
-       [219, 363,   1,   0],
-       [207, 219,   2,   2],
-       [267, 315,   0,   1],
+       [314, 362,   0,   1],
+       [ 27, 363,   3,   2],
        [ 75, 267,   3,   2],
-       [219, 267,   0,   1],
-       [236, 284,   0,   1],
-       [200, 236,   2,   2],
-       [332, 380,   0,   1],
-       [ 44, 380,   3,   2],
-       [236, 380,   1,   0],
-       [141, 237,   3,   3],
        [123, 219,   3,   3],
-       [122, 218,   3,   3],
-       [140, 236,   3,   3],
+       [171, 315,   3,   3],
+       [219, 267,   0,   1],
+       [219, 363,   1,   0],
+       [267, 315,   0,   1],
+       [315, 363,   0,   1],
        [ 28, 364,   3,   2],
-       [196, 316,   2,   2],
-       [316, 364,   0,   1],
-       [ 94, 286,   3,   2],
-       [334, 334,   2,   2],
-       [286, 334,   0,   1],
-       [286, 364,   3,   3],
+       [ 76, 268,   3,   2],
+       [124, 220,   3,   3],
        [172, 316,   3,   3],
-       [190, 334,   3,   3],
-       [ 95, 287,   3,   2],
-       [335, 341,   2,   2],
-       [287, 335,   0,   1],
-       [ 29, 365,   3,   2],
-       [317, 317,   2,   2],
-       [317, 365,   0,   1],
-       [287, 365,   3,   3],
-       [191, 335,   3,   3],
-       [173, 317,   3,   3],
+       [220, 268,   0,   1],
        [220, 364,   1,   0],
-       [239, 287,   0,   1],
-       [220, 239,   2,   2],
        [268, 316,   0,   1],
-       [ 76, 268,   3,   2],
-       [220, 268,   0,   1],
-       [335, 383,   0,   1],
-       [ 47, 383,   3,   2],
-       [239, 383,   1,   0],
-       [238, 286,   0,   1],
-       [202, 238,   2,   2],
-       [334, 382,   0,   1],
-       [ 46, 382,   3,   2],
-       [238, 382,   1,   0],
-       [221, 365,   1,   0],
-       [209, 221,   2,   2],
-       [269, 317,   0,   1],
+       [316, 364,   0,   1],
+       [ 29, 365,   3,   2],
        [ 77, 269,   3,   2],
-       [221, 269,   0,   1],
-       [124, 220,   3,   3],
-       [142, 238,   3,   3],
-       [143, 239,   3,   3],
        [125, 221,   3,   3],
-       [183, 327,   3,   3],
-       [279, 381,   3,   3],
-       [279, 327,   0,   1],
-       [178, 322,   3,   3],
-       [268, 370,   3,   3],
-       [322, 370,   0,   1],
-       [322, 327,   2,   2],
-       [ 87, 279,   3,   2],
-       [ 34, 370,   3,   2],
-       [177, 321,   3,   3],
-       [267, 369,   3,   3],
-       [321, 369,   0,   1],
-       [321, 345,   2,   2],
+       [173, 317,   3,   3],
+       [221, 269,   0,   1],
+       [221, 365,   1,   0],
+       [269, 317,   0,   1],
+       [317, 365,   0,   1],
+       [ 30, 366,   3,   2],
+       [ 78, 270,   3,   2],
+       [126, 222,   3,   3],
+       [174, 318,   3,   3],
+       [222, 270,   0,   1],
+       [222, 366,   1,   0],
+       [270, 318,   0,   1],
+       [318, 366,   0,   1],
+       [ 31, 367,   3,   2],
+       [ 79, 271,   3,   2],
+       [127, 223,   3,   3],
+       [175, 319,   3,   3],
+       [223, 271,   0,   1],
+       [223, 367,   1,   0],
+       [271, 319,   0,   1],
+       [319, 367,   0,   1],
+       [ 32, 368,   3,   2],
+       [ 80, 272,   3,   2],
+       [128, 224,   3,   3],
+       [176, 320,   3,   3],
+       [224, 272,   0,   1],
+       [224, 368,   1,   0],
+       [272, 320,   0,   1],
+       [320, 368,   0,   1],
        [ 33, 369,   3,   2],
-       [327, 375,   0,   1],
-       [273, 321,   0,   1],
-       [273, 375,   3,   3],
-       [231, 279,   0,   1],
-       [135, 231,   3,   3],
-       [231, 375,   1,   0],
-       [225, 369,   1,   0],
+       [ 81, 273,   3,   2],
        [129, 225,   3,   3],
+       [177, 321,   3,   3],
        [225, 273,   0,   1],
-       [184, 328,   3,   3],
-       [280, 382,   3,   3],
-       [280, 328,   0,   1],
-       [208, 328,   2,   2],
-       [ 88, 280,   3,   2],
-       [274, 322,   0,   1],
-       [328, 376,   0,   1],
-       [274, 376,   3,   3],
-       [226, 370,   1,   0],
+       [225, 369,   1,   0],
+       [273, 321,   0,   1],
+       [321, 369,   0,   1],
+       [ 34, 370,   3,   2],
+       [ 82, 274,   3,   2],
        [130, 226,   3,   3],
+       [178, 322,   3,   3],
        [226, 274,   0,   1],
-       [232, 280,   0,   1],
-       [136, 232,   3,   3],
-       [232, 376,   1,   0],
-       [ 39, 375,   3,   2],
-       [ 82, 274,   3,   2],
-       [ 81, 273,   3,   2],
-       [ 40, 376,   3,   2],
-       [ 91, 283,   3,   2],
-       [331, 337,   2,   2],
-       [283, 331,   0,   1],
-       [ 25, 361,   3,   2],
-       [313, 313,   2,   2],
-       [313, 361,   0,   1],
-       [283, 361,   3,   3],
-       [187, 331,   3,   3],
-       [169, 313,   3,   3],
-       [ 24, 360,   3,   2],
-       [192, 312,   2,   2],
-       [312, 360,   0,   1],
-       [ 90, 282,   3,   2],
-       [330, 330,   2,   2],
-       [282, 330,   0,   1],
-       [282, 360,   3,   3],
-       [168, 312,   3,   3],
-       [186, 330,   3,   3],
-       [235, 283,   0,   1],
-       [216, 360,   1,   0],
-       [216, 235,   2,   2],
-       [331, 379,   0,   1],
-       [ 43, 379,   3,   2],
-       [235, 379,   1,   0],
-       [264, 312,   0,   1],
-       [ 72, 264,   3,   2],
-       [216, 264,   0,   1],
-       [217, 361,   1,   0],
-       [205, 217,   2,   2],
-       [265, 313,   0,   1],
-       [ 73, 265,   3,   2],
-       [217, 265,   0,   1],
-       [234, 282,   0,   1],
-       [198, 234,   2,   2],
-       [330, 378,   0,   1],
-       [ 42, 378,   3,   2],
-       [234, 378,   1,   0],
-       [139, 235,   3,   3],
-       [121, 217,   3,   3],
-       [120, 216,   3,   3],
-       [138, 234,   3,   3],
-       [176, 320,   3,   3],
-       [266, 368,   3,   3],
-       [320, 368,   0,   1],
+       [226, 370,   1,   0],
+       [274, 322,   0,   1],
+       [322, 370,   0,   1],
+       [ 35, 371,   3,   2],
+       [ 83, 275,   3,   2],
+       [131, 227,   3,   3],
+       [179, 323,   3,   3],
+       [227, 275,   0,   1],
+       [227, 371,   1,   0],
+       [275, 323,   0,   1],
+       [323, 371,   0,   1],
+       [ 36, 372,   3,   2],
+       [ 84, 276,   3,   2],
+       [132, 228,   3,   3],
+       [180, 324,   3,   3],
+       [228, 276,   0,   1],
+       [228, 372,   1,   0],
+       [276, 324,   0,   1],
+       [324, 372,   0,   1],
+       [ 37, 373,   3,   2],
+       [ 85, 277,   3,   2],
+       [133, 229,   3,   3],
        [181, 325,   3,   3],
-       [277, 379,   3,   3],
+       [229, 277,   0,   1],
+       [229, 373,   1,   0],
        [277, 325,   0,   1],
-       [320, 325,   2,   2],
-       [ 32, 368,   3,   2],
-       [ 85, 277,   3,   2],
-       [182, 326,   3,   3],
-       [278, 380,   3,   3],
-       [278, 326,   0,   1],
-       [206, 326,   2,   2],
+       [325, 373,   0,   1],
+       [ 38, 374,   3,   2],
        [ 86, 278,   3,   2],
-       [272, 320,   0,   1],
-       [326, 374,   0,   1],
-       [272, 374,   3,   3],
-       [224, 368,   1,   0],
-       [128, 224,   3,   3],
-       [224, 272,   0,   1],
-       [230, 278,   0,   1],
        [134, 230,   3,   3],
+       [182, 326,   3,   3],
+       [230, 278,   0,   1],
        [230, 374,   1,   0],
-       [175, 319,   3,   3],
-       [265, 367,   3,   3],
-       [319, 367,   0,   1],
-       [319, 343,   2,   2],
-       [ 31, 367,   3,   2],
-       [325, 373,   0,   1],
-       [271, 319,   0,   1],
-       [271, 373,   3,   3],
-       [229, 277,   0,   1],
-       [133, 229,   3,   3],
-       [229, 373,   1,   0],
-       [223, 367,   1,   0],
-       [127, 223,   3,   3],
-       [223, 271,   0,   1],
-       [ 80, 272,   3,   2],
-       [ 37, 373,   3,   2],
-       [ 38, 374,   3,   2],
-       [ 79, 271,   3,   2],
-       [185, 329,   3,   3],
-       [281, 383,   3,   3],
-       [281, 329,   0,   1],
-       [174, 318,   3,   3],
-       [264, 366,   3,   3],
-       [318, 366,   0,   1],
-       [318, 329,   2,   2],
+       [278, 326,   0,   1],
+       [326, 374,   0,   1],
+       [ 39, 375,   3,   2],
+       [ 87, 279,   3,   2],
+       [135, 231,   3,   3],
+       [183, 327,   3,   3],
+       [231, 279,   0,   1],
+       [231, 375,   1,   0],
+       [279, 327,   0,   1],
+       [327, 375,   0,   1],
+       [ 40, 376,   3,   2],
+       [ 88, 280,   3,   2],
+       [136, 232,   3,   3],
+       [184, 328,   3,   3],
+       [232, 280,   0,   1],
+       [232, 376,   1,   0],
+       [280, 328,   0,   1],
+       [328, 376,   0,   1],
+       [ 41, 377,   3,   2],
        [ 89, 281,   3,   2],
-       [ 30, 366,   3,   2],
-       [179, 323,   3,   3],
-       [269, 371,   3,   3],
-       [323, 371,   0,   1],
-       [323, 347,   2,   2],
-       [ 35, 371,   3,   2],
-       [329, 377,   0,   1],
-       [275, 323,   0,   1],
-       [275, 377,   3,   3],
-       [233, 281,   0,   1],
        [137, 233,   3,   3],
+       [185, 329,   3,   3],
+       [233, 281,   0,   1],
        [233, 377,   1,   0],
-       [227, 371,   1,   0],
-       [131, 227,   3,   3],
-       [227, 275,   0,   1],
-       [180, 324,   3,   3],
-       [276, 378,   3,   3],
-       [276, 324,   0,   1],
-       [204, 324,   2,   2],
-       [ 84, 276,   3,   2],
-       [270, 318,   0,   1],
-       [324, 372,   0,   1],
-       [270, 372,   3,   3],
-       [222, 366,   1,   0],
-       [126, 222,   3,   3],
-       [222, 270,   0,   1],
-       [228, 276,   0,   1],
-       [132, 228,   3,   3],
-       [228, 372,   1,   0],
-       [ 41, 377,   3,   2],
-       [ 78, 270,   3,   2],
-       [ 83, 275,   3,   2],
-       [ 36, 372,   3,   2],
-       [213, 231,   2,   2],
-       [224, 356,   2,   2],
-       [226, 358,   2,   2],
-       [215, 233,   2,   2],
-       [211, 229,   2,   2],
-       [222, 354,   2,   2],
-       [225, 225,   2,   2],
-       [230, 230,   2,   2],
-       [232, 232,   2,   2],
-       [227, 227,   2,   2],
-       [223, 223,   2,   2],
-       [228, 228,   2,   2]],dtype=np.int32)}]
+       [281, 329,   0,   1],
+       [329, 377,   0,   1],
+       [ 42, 378,   3,   2],
+       [ 90, 282,   3,   2],
+       [138, 234,   3,   3],
+       [186, 330,   3,   3],
+       [234, 282,   0,   1],
+       [234, 378,   1,   0],
+       [282, 330,   0,   1],
+       [330, 378,   0,   1],
+       [ 43, 379,   3,   2],
+       [ 91, 283,   3,   2],
+       [139, 235,   3,   3],
+       [187, 331,   3,   3],
+       [235, 283,   0,   1],
+       [235, 379,   1,   0],
+       [283, 331,   0,   1],
+       [331, 379,   0,   1],
+       [ 44, 380,   3,   2],
+       [ 92, 284,   3,   2],
+       [140, 236,   3,   3],
+       [188, 332,   3,   3],
+       [236, 284,   0,   1],
+       [236, 380,   1,   0],
+       [284, 332,   0,   1],
+       [332, 380,   0,   1],
+       [ 45, 381,   3,   2],
+       [ 93, 285,   3,   2],
+       [141, 237,   3,   3],
+       [189, 333,   3,   3],
+       [237, 285,   0,   1],
+       [237, 381,   1,   0],
+       [285, 333,   0,   1],
+       [333, 381,   0,   1],
+       [ 46, 382,   3,   2],
+       [ 94, 286,   3,   2],
+       [142, 238,   3,   3],
+       [190, 334,   3,   3],
+       [238, 286,   0,   1],
+       [238, 382,   1,   0],
+       [286, 334,   0,   1],
+       [334, 382,   0,   1],
+       [ 47, 383,   3,   2],
+       [ 95, 287,   3,   2],
+       [143, 239,   3,   3],
+       [191, 335,   3,   3],
+       [239, 287,   0,   1],
+       [239, 383,   1,   0],
+       [287, 335,   0,   1],
+       [335, 383,   0,   1]],dtype=np.int32)}]
 from_one_tetrahedron_data  = [
     {
         "meshtype": 'equ',
@@ -0,0 +1,277 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh, TetrahedronMesh
+from fealpy.functionspace import LagrangeFESpace, TensorFunctionSpace
+from fealpy.material import LinearElasticMaterial
+from fealpy.fem import BilinearForm, ScalarDiffusionIntegrator, LinearElasticIntegrator, DirichletBC
+from fealpy.sparse import csr_matrix
+from fealpy.solver import GAMGSolver
+from fealpy.solver.amg_core import (
+    signed_strength_of_connection,
+    classical_strength_of_connection,
+    pmis_cf_splitting,
+    rs_cf_splitting,
+    rs_direct_interpolation,
+    rs_standard_interpolation,
+    rigid_body_modes,
+    nodal_strength_of_connection,
+    standard_aggregation,
+    fit_candidates,
+    approximate_spectral_radius,
+    multicolor,
+    MulticolorGaussSeidelSmoother
+)
+
+
+def _laplace(mesh_type, n, dirichlet=False):
+    if mesh_type == 'tri':
+        mesh = TriangleMesh.from_box(nx=n, ny=n)
+    else:
+        mesh = TetrahedronMesh.from_box(nx=n, ny=n, nz=n)
+    space = LagrangeFESpace(mesh, 1)
+    bform = BilinearForm(space)
+    bform.add_integrator(ScalarDiffusionIntegrator())
+    A = bform.assembly()
+    f = bm.ones(A.shape[0], dtype=bm.float64)
+    if dirichlet:
+        A, f = DirichletBC(space, gd=0.0).apply(A, f)
+    return A.tocsr(), f
+
+
+def _elasticity(GD, n, dirichlet=False):
+    if GD == 2:
+        mesh = TriangleMesh.from_box(nx=n, ny=n)
+        material = LinearElasticMaterial('steel', elastic_modulus=1.0, poisson_ratio=0.3,
+                                         hypo='plane_strain')
+    else:
+        mesh = TetrahedronMesh.from_box(nx=n, ny=n, nz=n)
+        material = LinearElasticMaterial('steel', elastic_modulus=1.0, poisson_ratio=0.3)
+    space = TensorFunctionSpace(LagrangeFESpace(mesh, 1), (-1, GD))
+    bform = BilinearForm(space)
+    bform.add_integrator(LinearElasticIntegrator(material))
+    A = bform.assembly()
+    f = bm.ones(A.shape[0], dtype=bm.float64)
+    if dirichlet:
+        threshold = lambda p: bm.abs(p[..., 0]) < 1e-12
+        A, f = DirichletBC(space, gd=lambda p: bm.zeros(p.shape, dtype=p.dtype),
+                           threshold=threshold).apply(A, f)
+    return mesh, A.tocsr(), f
+
+
+def _strength(A, theta, signed=True):
+    n = A.shape[0]
+    func = signed_strength_of_connection if signed else classical_strength_of_connection
+    Sp, Sj, Sx = func(A.indptr, A.indices, A.data, n, theta)
+    S = csr_matrix((Sx, Sj, Sp), shape=(n, n))
+    return S, S.T
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+def test_signed_strength_of_connection(backend):
+    bm.set_backend(backend)
+    A, _ = _laplace('tri', 8)
+    S, _ = _strength(A, 0.25)
+    D = A.to_scipy().toarray()
+    offdiag = -(D - np.diag(np.diag(D)))
+    expected = (offdiag > 0) & (offdiag >= 0.25 * offdiag.max(axis=1, keepdims=True))
+    np.testing.assert_array_equal(S.to_scipy().toarray() != 0, expected)
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+@pytest.mark.parametrize("mesh_type, n", [('tri', 16), ('tet', 5)])
+def test_cf_splitting(backend, mesh_type, n):
+    bm.set_backend(backend)
+    A, _ = _laplace(mesh_type, n)
+    S, T = _strength(A, 0.25)
+    splitting = pmis_cf_splitting(S.indptr, S.indices, T.indptr, T.indices, A.shape[0])
+    assert set(np.unique(splitting)) <= {0, 1}
+    # C 点之间没有强连接
+    isC = splitting == 1
+    row = S.row
+    assert not np.any(isC[row] & isC[S.indices])
+    # 影响其他点的 F 点都强依赖于某个 C 点
+    lam = np.diff(bm.to_numpy(T.indptr))
+    depends_on_C = np.bincount(row[isC[S.indices]], minlength=A.shape[0]) > 0
+    assert np.all(depends_on_C[~isC & (lam > 0)])
+
+    # the classical splitting really coarsens
+    S, T = _strength(A, 0.25, signed=False)
+    splitting = rs_cf_splitting(S.indptr, S.indices, T.indptr, T.indices, A.shape[0])
+    assert 0 < np.sum(splitting) < A.shape[0]
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+@pytest.mark.parametrize("interpolation", [rs_direct_interpolation, rs_standard_interpolation])
+def test_interpolation(backend, interpolation):
+    bm.set_backend(backend)
+    A, _ = _laplace('tri', 16)
+    S, T = _strength(A, 0.25)
+    n = A.shape[0]
+    splitting = pmis_cf_splitting(S.indptr, S.indices, T.indptr, T.indices, n)
+    P, R = interpolation(A.indptr, A.indices, A.data, S.indptr, S.indices, S.data, splitting)
+    isC = splitting == 1
+    assert P.shape == (n, int(np.sum(isC)))
+    assert R.shape == (P.shape[1], n)
+
+    Ps = P.to_scipy()
+    # C 点直接注入
+    np.testing.assert_array_equal(Ps[isC].toarray(), np.eye(P.shape[1]))
+    # 行和为零的 M 矩阵，插值保持常数
+    np.testing.assert_allclose(Ps @ np.ones(P.shape[1]), np.ones(n), rtol=1e-12)
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+@pytest.mark.parametrize("ctype, itype", [('C', 'T'), ('PMIS', 'D'), ('PMIS', 'S')])
+def test_gamg_algebraic_setup(backend, ctype, itype, capsys):
+    bm.set_backend(backend)
+    A, f = _laplace('tri', 64, dirichlet=True)
+    solver = GAMGSolver(ctype=ctype, itype=itype, theta=0.25, isolver='CG')
+    solver.setup(A)
+    assert len(solver.A) > 2
+    assert all(solver.A[l+1].shape[0] < solver.A[l].shape[0] for l in range(len(solver.A) - 1))
+    assert 1.0 < solver.operator_complexity() < 4.0
+
+    x, info = solver.solve(f)
+    assert info['niter'] < 30
+    np.testing.assert_allclose(bm.to_numpy(A @ x), bm.to_numpy(f), atol=1e-6)
+
+    solver.print()
+    out = capsys.readouterr().out
+    assert "operator complexity" in out and "setup time" in out
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+@pytest.mark.parametrize("GD, n", [(2, 8), (3, 3)])
+def test_rigid_body_modes(backend, GD, n):
+    bm.set_backend(backend)
+    mesh, A, _ = _elasticity(GD, n)
+    B = rigid_body_modes(mesh.node)
+    assert B.shape == (A.shape[0], 3*(GD - 1))
+    np.testing.assert_allclose(bm.to_numpy(A @ B), 0.0, atol=1e-10)
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+@pytest.mark.parametrize("GD, n", [(2, 16), (3, 4)])
+def test_aggregation(backend, GD, n):
+    bm.set_backend(backend)
+    mesh, A, _ = _elasticity(GD, n, dirichlet=True)
+    N = A.shape[0]
+    dof_node = bm.arange(N) // GD
+    n_node = N // GD
+    Sp, Sj, Sx = nodal_strength_of_connection(A, dof_node, n_node, 0.0)
+    agg = standard_aggregation(Sp, Sj, n_node)
+    S = csr_matrix((Sx, Sj, Sp), shape=(n_node, n_node))
+    isolated = np.diff(bm.to_numpy(Sp)) == 1
+    # 只有孤立点 (Dirichlet 点) 不被聚集，聚集编号连续
+    np.testing.assert_array_equal(agg < 0, isolated)
+    n_agg = int(agg.max()) + 1
+    assert set(np.unique(agg[agg >= 0])) == set(range(n_agg))
+    assert n_agg < n_node // 2
+    # 每个聚集在强连接图中连通：聚集内的点都有同聚集的邻居
+    row = S.row
+    same = (agg[row] == agg[S.indices]) & (row != S.indices)
+    assert np.all(np.bincount(row[same], minlength=n_node)[~isolated] > 0)
+
+    B = rigid_body_modes(mesh.node)
+    T, Bc, cnode = fit_candidates(agg[dof_node], B)
+    assert T.shape == (N, Bc.shape[0])
+    assert cnode.shape == (Bc.shape[0], )
+    Ts = T.to_scipy()
+    # T 的列正交归一，并精确插值候选向量
+    np.testing.assert_allclose((Ts.T @ Ts).toarray(), np.eye(T.shape[1]), atol=1e-10)
+    flag = bm.to_numpy(agg[dof_node]) >= 0
+    np.testing.assert_allclose((Ts @ Bc)[flag], B[flag], atol=1e-10)
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+def test_gamg_smoothed_aggregation(backend):
+    bm.set_backend(backend)
+    mesh, A, f = _elasticity(3, 8, dirichlet=True)
+    niter = {}
+    for ctype, kwargs in [('C', {}),
+                          ('SA', dict(dof_numel=3, B=rigid_body_modes(mesh.node)))]:
+        solver = GAMGSolver(ctype=ctype, isolver='CG', maxit=500)
+        solver.setup(A, **kwargs)
+        x, info = solver.solve(f)
+        np.testing.assert_allclose(bm.to_numpy(A @ x), bm.to_numpy(f), atol=1e-6)
+        niter[ctype] = info['niter']
+        if ctype == 'SA':
+            assert len(solver.A) > 2
+            assert solver.operator_complexity() < 1.6
+    assert niter['SA'] < niter['C']
+
+    # 标量问题上默认的候选向量是常数
+    A, f = _laplace('tri', 64, dirichlet=True)
+    solver = GAMGSolver(ctype='SA', isolver='CG')
+    solver.setup(A)
+    x, info = solver.solve(f)
+    assert info['niter'] < 40
+    np.testing.assert_allclose(bm.to_numpy(A @ x), bm.to_numpy(f), atol=1e-6)
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+def test_spectral_radius_and_coloring(backend):
+    bm.set_backend(backend)
+    A, _ = _laplace('tri', 16, dirichlet=True)
+    D = A.to_scipy().toarray()
+    d = np.diag(D)
+    rho = np.abs(np.linalg.eigvalsh(D / np.sqrt(np.outer(d, d)))).max()
+    est = approximate_spectral_radius(A, 1/d)
+    assert 0.9 * rho < est <= rho * (1 + 1e-10)
+
+    color = multicolor(A.indptr, A.indices, A.shape[0])
+    row, col = A.row, A.indices
+    offdiag = row != col
+    assert np.all(color >= 0)
+    assert not np.any(color[row[offdiag]] == color[col[offdiag]])
+
+    # 多色 Gauss-Seidel 是按颜色排序后的 Gauss-Seidel
+    smoother = MulticolorGaussSeidelSmoother(A, sstep=0)
+    r = np.random.rand(A.shape[0])
+    e = smoother.presmooth(r)
+    order = np.concatenate(smoother.index)
+    Dp = D[np.ix_(order, order)]
+    np.testing.assert_allclose(e[order], np.linalg.solve(np.tril(Dp), r[order]), rtol=1e-10)
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+@pytest.mark.parametrize("smoother", ['GS', 'MCGS', 'L1Jacobi', 'Chebyshev', ['MCGS', 'Chebyshev']])
+@pytest.mark.parametrize("isolver", ['CG', 'MG'])
+def test_gamg_smoother(backend, smoother, isolver):
+    bm.set_backend(backend)
+    A, f = _laplace('tri', 64, dirichlet=True)
+    solver = GAMGSolver(ctype='SA', smoother=smoother, isolver=isolver, maxit=100)
+    solver.setup(A)
+    x, info = solver.solve(f)
+    assert info['niter'] < (30 if isolver == 'CG' else 100)
+    np.testing.assert_allclose(bm.to_numpy(A @ x), bm.to_numpy(f), atol=1e-6)
+
+    with pytest.raises(ValueError):
+        GAMGSolver(smoother='SOR').setup(A)
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+@pytest.mark.parametrize("ctype, smoother", [('SA', 'MCGS'), ('PMIS', 'Chebyshev')])
+def test_gamg_seed(backend, ctype, smoother):
+    bm.set_backend(backend)
+    A, f = _laplace('tri', 32, dirichlet=True)
+    # 随机权重由 seed 固定，两次 setup 得到相同的层次和迭代步数
+    result = []
+    for _ in range(2):
+        np.random.seed(None)
+        solver = GAMGSolver(ctype=ctype, itype='S', smoother=smoother, isolver='CG')
+        solver.setup(A, seed=0)
+        x, info = solver.solve(f)
+        result.append((solver, info['niter']))
+    (s0, n0), (s1, n1) = result
+    assert n0 == n1
+    assert len(s0.P) == len(s1.P)
+    for p0, p1 in zip(s0.P, s1.P):
+        assert (p0.to_scipy() != p1.to_scipy()).nnz == 0
+    if smoother == 'Chebyshev':
+        assert s0.smoothers[0].bounds == s1.smoothers[0].bounds
+    else:
+        for i0, i1 in zip(s0.smoothers[0].index, s1.smoothers[0].index):
+            np.testing.assert_array_equal(i0, i1)
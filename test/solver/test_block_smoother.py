@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh
+from fealpy.functionspace import LagrangeFESpace, TensorFunctionSpace
+from fealpy.material import LinearElasticMaterial
+from fealpy.fem import BilinearForm, LinearElasticIntegrator, ScalarMassIntegrator
+from fealpy.solver import jacobi, gauss_seidel
+
+
+@pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+@pytest.mark.parametrize("smoother", [jacobi, gauss_seidel])
+def test_block_smoother(backend, smoother):
+    bm.set_backend(backend)
+    mesh = TriangleMesh.from_box(nx=4, ny=4)
+    material = LinearElasticMaterial('steel', elastic_modulus=1.0, poisson_ratio=0.3,
+                                     hypo='plane_stress')
+    space = TensorFunctionSpace(LagrangeFESpace(mesh, 1), (-1, 2))
+    bform = BilinearForm(space)
+    bform.add_integrator(LinearElasticIntegrator(material))
+    bform.add_integrator(ScalarMassIntegrator(100.0))
+    A = bform.assembly(format='bsr')
+
+    x0 = bm.random.rand(A.shape[0])
+    b = A @ x0
+    x, info = smoother(A, b, rtol=1e-10, maxit=2000, returninfo=True)
+    assert info['residual'] < 1e-10
+    np.testing.assert_allclose(bm.to_numpy(x), bm.to_numpy(x0), atol=1e-8)
@@ -57,6 +57,37 @@ class TestDirectSolverManager:
         # 验证解的准确性
         assert np.allclose(x0_np, x_true_np, atol=1e-8)
 
+    @pytest.mark.parametrize("backend", ["numpy"])
+    def test_factorize_and_refactor(self, backend):
+        A, x_true, b = self._make_data(shape=(300, 300), density=0.05, backend=backend)
+        A = A.tocsr()
+
+        mgr = DirectSolverManager(solver_name="scipy")
+        mgr.set_matrix(A, matrix_type='G', factorize=True)
+        factor = mgr._factor
+        x_true_np = bm.to_numpy(x_true)
+
+        # 同一分解求解多个右端项
+        X = np.random.rand(300, 3)
+        B = A.to_scipy() @ X
+        for i in range(3):
+            x0 = mgr.solve(bm.tensor(B[:, i]))
+            assert np.allclose(bm.to_numpy(x0), X[:, i], atol=1e-8)
+        x0 = mgr.solve(bm.tensor(B))
+        assert np.allclose(bm.to_numpy(x0), X, atol=1e-8)
+        assert mgr._factor is factor
+
+        # 稀疏模式不变，仅数值改变
+        values = A.values * bm.linspace(1.0, 2.0, A.nnz)
+        mgr.refactor(values)
+        A1 = CSRTensor(A.crow, A.col, values, A.sparse_shape)
+        b1 = A1 @ x_true
+        x1 = mgr.solve(b1)
+        assert np.allclose(bm.to_numpy(x1), x_true_np, atol=1e-8)
+
+        with pytest.raises(ValueError):
+            mgr.refactor(values[:-1])
+
     def test_gpu_cupy(self):
         try:
             import cupy
@@ -0,0 +1,90 @@
+import time
+
+import numpy as np
+import pytest
+from scipy.sparse.linalg import spsolve, spsolve_triangular
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh, TetrahedronMesh
+from fealpy.functionspace import LagrangeFESpace
+from fealpy.fem import BilinearForm, ScalarDiffusionIntegrator, ScalarMassIntegrator
+from fealpy.solver import GAMGSolver
+
+
+def _bench(func, number=5):
+    func()
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return (time.perf_counter() - start) / number
+
+
+def _matrix(mesh_type, n, m):
+    """The matrix on a mesh refined m times, with the prolongations of the refinements."""
+    if mesh_type == 'tri':
+        mesh = TriangleMesh.from_box(nx=n, ny=n)
+    else:
+        mesh = TetrahedronMesh.from_box(nx=n, ny=n, nz=n)
+    P = mesh.uniform_refine(n=m, returnim=True)
+    space = LagrangeFESpace(mesh, 1)
+    bform = BilinearForm(space)
+    bform.add_integrator(ScalarDiffusionIntegrator())
+    bform.add_integrator(ScalarMassIntegrator())
+    return bform.assembly().tocsr(), P
+
+
+def _uncached_smooth(solver, r, level):
+    """One pre- and post-smoothing as done before the cycle operators were cached."""
+    A = solver.A[level]
+    e = spsolve_triangular(solver.L[level].to_scipy(), r)
+    for i in range(solver.sstep):
+        e += spsolve_triangular(solver.L[level].to_scipy(), r - A @ e)
+    e += spsolve_triangular(solver.U[level].to_scipy(), r - A @ e, lower=False)
+    for i in range(solver.sstep):
+        e += spsolve_triangular(solver.U[level].to_scipy(), r - A @ e, lower=False)
+    return e
+
+
+def _cached_smooth(solver, r, level):
+    e = solver.presmooth(r, level)
+    return solver.postsmooth(r, e, level)
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+@pytest.mark.parametrize("mesh_type, n, m", [('tri', 8, 3), ('tet', 3, 2)])
+def test_gamg_cycle_benchmark(backend, mesh_type, n, m):
+    """Time the smoothing of every level and the coarsest solve of the cycles.
+    Run this file directly for larger matrices."""
+    bm.set_backend(backend)
+    A, P = _matrix(mesh_type, n, m)
+    solver = GAMGSolver(isolver='MG', ptype='V')
+    solver.setup(A, P=P)
+
+    NL = len(solver.A)
+    for l in range(NL - 1):
+        r = np.random.rand(solver.A[l].shape[0])
+        e0, e1 = _cached_smooth(solver, r, l), _uncached_smooth(solver, r, l)
+        np.testing.assert_allclose(e0, e1, rtol=1e-10, atol=1e-12)
+        t0 = _bench(lambda: _cached_smooth(solver, r, l))
+        t1 = _bench(lambda: _uncached_smooth(solver, r, l))
+        print(f"{mesh_type} level {l} N={solver.A[l].shape[0]} smoothing: "
+              f"cached {t0*1e3:.3f}ms, uncached {t1*1e3:.3f}ms, speedup {t1/t0:.2f}")
+
+    rc = np.random.rand(solver.A[-1].shape[0])
+    Ac = solver.A[-1]
+    np.testing.assert_allclose(solver.csolve(rc), spsolve(Ac.to_scipy(), rc), rtol=1e-10)
+    t0 = _bench(lambda: solver.csolve(rc))
+    t1 = _bench(lambda: spsolve(Ac.to_scipy(), rc))
+    print(f"{mesh_type} level {NL-1} N={Ac.shape[0]} coarse solve: "
+          f"cached {t0*1e3:.3f}ms, uncached {t1*1e3:.3f}ms, speedup {t1/t0:.2f}")
+
+    b = A @ np.ones(A.shape[0])
+    t0 = _bench(lambda: solver.vcycle(b), number=3)
+    print(f"{mesh_type} N={A.shape[0]} V-cycle: {t0*1e3:.3f}ms")
+    x, info = solver.solve(b)
+    assert info['niter'] < solver.maxit
+
+
+if __name__ == "__main__":
+    for mesh_type, n, m in [('tri', 16, 5), ('tet', 4, 3)]:
+        test_gamg_cycle_benchmark('numpy', mesh_type, n, m)
@@ -0,0 +1,121 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh, TetrahedronMesh
+from fealpy.functionspace import LagrangeFESpace, TensorFunctionSpace
+from fealpy.material import LinearElasticMaterial
+from fealpy.fem import (
+    BilinearForm, ScalarDiffusionIntegrator, LinearElasticIntegrator, DirichletBC
+)
+from fealpy.solver import GAMGSolver
+
+
+def _laplace(mesh, p):
+    space = LagrangeFESpace(mesh, p)
+    bform = BilinearForm(space)
+    bform.add_integrator(ScalarDiffusionIntegrator())
+    A = bform.assembly()
+    f = bm.ones(A.shape[0], dtype=bm.float64)
+    A, f = DirichletBC(space, gd=0.0).apply(A, f)
+    return space, A.tocsr(), f
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+@pytest.mark.parametrize("mesh_type, n, m, p", [('tri', 4, 4, 1), ('tri', 4, 3, 2), ('tet', 2, 3, 1)])
+def test_gamg_geometric(backend, mesh_type, n, m, p):
+    bm.set_backend(backend)
+    if mesh_type == 'tri':
+        mesh = TriangleMesh.from_box(nx=n, ny=n)
+    else:
+        mesh = TetrahedronMesh.from_box(nx=n, ny=n, nz=n)
+    NN0 = mesh.number_of_nodes()
+    mesh.record_refinement()
+    mesh.uniform_refine(m)
+    IM = mesh.refinement_history()
+    assert len(IM) == m
+    assert IM[-1].shape[1] == NN0
+    assert IM[0].shape[0] == mesh.number_of_nodes()
+
+    space, A, f = _laplace(mesh, p)
+    solver = GAMGSolver(isolver='CG')
+    solver.setup(A, mesh=mesh, space=space if p > 1 else None)
+    # p 粗化后接几何粗化，最后一层是初始网格上的 P1 空间
+    assert len(solver.A) == m + 1 + (p > 1)
+    assert solver.A[-1].shape[0] == NN0
+    x, info = solver.solve(f)
+    assert info['niter'] < 15
+    np.testing.assert_allclose(bm.to_numpy(A @ x), bm.to_numpy(f), atol=1e-6)
+
+    mesh.record_refinement(False)
+    assert mesh.refinement_history() == []
+    with pytest.raises(ValueError):
+        GAMGSolver().setup(A, mesh=mesh)
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+def test_gamg_geometric_rediscretization(backend):
+    bm.set_backend(backend)
+    mesh = TriangleMesh.from_box(nx=4, ny=4)
+    mesh.record_refinement()
+    Ac = []
+    for i in range(4):
+        Ac.append(_laplace(mesh, 1)[1])
+        mesh.uniform_refine()
+    space, A, f = _laplace(mesh, 1)
+
+    solver = GAMGSolver(isolver='CG')
+    solver.setup(A, mesh=mesh, Ac=Ac[::-1])
+    assert all(solver.A[l+1] is Ac[-1-l] for l in range(4))
+    x, info = solver.solve(f)
+    assert info['niter'] < 15
+    np.testing.assert_allclose(bm.to_numpy(A @ x), bm.to_numpy(f), atol=1e-6)
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+def test_gamg_geometric_elasticity(backend):
+    bm.set_backend(backend)
+    mesh = TriangleMesh.from_box(nx=4, ny=4)
+    mesh.record_refinement()
+    mesh.uniform_refine(4)
+    material = LinearElasticMaterial('steel', elastic_modulus=1.0, poisson_ratio=0.3,
+                                     hypo='plane_strain')
+    space = TensorFunctionSpace(LagrangeFESpace(mesh, 1), (-1, 2))
+    bform = BilinearForm(space)
+    bform.add_integrator(LinearElasticIntegrator(material))
+    A = bform.assembly()
+    f = bm.ones(A.shape[0], dtype=bm.float64)
+    threshold = lambda p: bm.abs(p[..., 0]) < 1e-12
+    A, f = DirichletBC(space, gd=lambda p: bm.zeros(p.shape, dtype=p.dtype),
+                       threshold=threshold).apply(A, f)
+    A = A.tocsr()
+
+    solver = GAMGSolver(isolver='CG')
+    solver.setup(A, mesh=mesh, dof_numel=2)
+    assert solver.A[-1].shape[0] == 2 * 25
+    x, info = solver.solve(f)
+    assert info['niter'] < 30
+    np.testing.assert_allclose(bm.to_numpy(A @ x), bm.to_numpy(f), atol=1e-6)
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+def test_refinement_history_bisect(backend):
+    bm.set_backend(backend)
+    mesh = TriangleMesh.from_box(nx=4, ny=4)
+    mesh.record_refinement()
+    for i in range(3):
+        NN = mesh.number_of_nodes()
+        node = mesh.entity('node')
+        isMarkedCell = bm.linalg.norm(mesh.entity_barycenter('cell'), axis=1) < 0.5
+        mesh.bisect(isMarkedCell, options={'disp': False})
+        P = mesh.refinement_history()[0]
+        assert P.shape == (mesh.number_of_nodes(), NN)
+        # 线性函数被精确插值
+        np.testing.assert_allclose(bm.to_numpy(P @ node), bm.to_numpy(mesh.entity('node')), atol=1e-14)
+    assert len(mesh.refinement_history()) == 3
+
+    space, A, f = _laplace(mesh, 1)
+    solver = GAMGSolver(isolver='CG')
+    solver.setup(A, mesh=mesh)
+    x, info = solver.solve(f)
+    np.testing.assert_allclose(bm.to_numpy(A @ x), bm.to_numpy(f), atol=1e-6)
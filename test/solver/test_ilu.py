@@ -0,0 +1,122 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.decorator import cartesian
+from fealpy.mesh import TriangleMesh
+from fealpy.functionspace import LagrangeFESpace
+from fealpy.fem import (
+    BilinearForm, ScalarDiffusionIntegrator, ScalarConvectionIntegrator,
+    ScalarMassIntegrator, DirichletBC
+)
+from fealpy.solver import ILU0, IC0, ILUT, gmres, cg
+from fealpy.solver.ilu import level_schedule
+from fealpy.solver.iterative_solver_manger import IterativeSolverManager
+
+
+def _convection_diffusion(n, eps):
+    mesh = TriangleMesh.from_box(nx=n, ny=n)
+    space = LagrangeFESpace(mesh, 1)
+
+    @cartesian
+    def beta(p):
+        v = bm.zeros(p.shape, dtype=p.dtype)
+        v[..., 0] = 1.0
+        v[..., 1] = 0.5
+        return v
+
+    bform = BilinearForm(space)
+    bform.add_integrator(ScalarDiffusionIntegrator(eps))
+    bform.add_integrator(ScalarConvectionIntegrator(beta))
+    A = bform.assembly()
+    f = bm.ones(A.shape[0], dtype=bm.float64)
+    A, f = DirichletBC(space, gd=0.0).apply(A, f)
+    return A.tocsr(), f
+
+
+def _dense_ilu0(D):
+    A = D.copy()
+    n = len(A)
+    P = D != 0
+    for i in range(1, n):
+        for k in range(i):
+            if P[i, k]:
+                A[i, k] /= A[k, k]
+                A[i, k+1:] -= np.where(P[i, k+1:], A[i, k] * A[k, k+1:], 0)
+    return np.tril(A, -1) + np.eye(n), np.triu(A)
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+def test_ilu0(backend):
+    bm.set_backend(backend)
+    A, _ = _convection_diffusion(8, 1e-2)
+    D = A.to_scipy().toarray()
+    L, U = _dense_ilu0(D)
+
+    ilu = ILU0(A)
+    b = np.random.rand(A.shape[0], 3)
+    expected = np.linalg.solve(U, np.linalg.solve(L, b))
+    np.testing.assert_allclose(ilu.solve(b), expected, rtol=1e-10)
+    np.testing.assert_allclose(ilu @ b[:, 0], expected[:, 0], rtol=1e-10)
+
+    # 每层内的行互不依赖
+    row, col = A.row, A.indices
+    lower = col < row
+    level = level_schedule(row[lower], col[lower], A.shape[0])
+    assert np.all(level[row[lower]] > level[col[lower]])
+    assert 1 < ilu.L.number_of_levels < A.shape[0]
+
+    # 相同的模式只重做数值分解
+    A2 = A.add(A.tocoo().tocsr(), alpha=1.0).tocoo().coalesce().tocsr()
+    lower_pos = ilu.lower
+    ilu.update(A2)
+    assert ilu.lower is lower_pos
+    np.testing.assert_allclose(ilu.solve(b), expected / 2, rtol=1e-10)
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+def test_ic0(backend):
+    bm.set_backend(backend)
+    mesh = TriangleMesh.from_box(nx=32, ny=32)
+    space = LagrangeFESpace(mesh, 1)
+    bform = BilinearForm(space)
+    bform.add_integrator(ScalarDiffusionIntegrator())
+    bform.add_integrator(ScalarMassIntegrator())
+    A = bform.assembly().tocsr()
+    f = bm.ones(A.shape[0], dtype=bm.float64)
+
+    M = IC0(A)
+    b = np.random.rand(A.shape[0])
+    c = np.random.rand(A.shape[0])
+    # 预条件子是对称的
+    np.testing.assert_allclose(c @ (M @ b), b @ (M @ c), rtol=1e-10)
+    x0, info0 = cg(A, f, atol=1e-12, rtol=1e-10, returninfo=True)
+    x1, info1 = cg(A, f, M=M, atol=1e-12, rtol=1e-10, returninfo=True)
+    assert info1['niter'] < info0['niter'] / 2
+    np.testing.assert_allclose(x1, x0, atol=1e-8)
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+@pytest.mark.parametrize("pc", ['jacobi', 'ilu0', 'ilut'])
+def test_ilu_preconditioners(backend, pc):
+    bm.set_backend(backend)
+    A, f = _convection_diffusion(32, 1e-3)
+    ism = IterativeSolverManager()
+    ism.set_matrix(A)
+    ism.set_solver('gmres')
+    ism.set_pc(pc)
+    ism.set_tolerances(rtol=1e-10, atol=1e-12, maxit=2000)
+    M = ism.get_preconditioner()
+    x, info = gmres(A, f, M=M, rtol=1e-10, atol=1e-12, maxit=2000, restart=30)
+    niter = {'jacobi': 1000, 'ilu0': 50, 'ilut': 10}[pc]
+    assert info['niter'] < niter
+    np.testing.assert_allclose(A @ ism.solve(f), f, atol=1e-8)
+
+    # 时间步进：同模式的新矩阵重用预条件子对象
+    ism.set_matrix(A.add(A, alpha=1.0).tocoo().coalesce().tocsr())
+    M2 = ism.get_preconditioner()
+    if pc == 'jacobi':
+        assert M2 is not M
+    else:
+        assert M2 is M
+    np.testing.assert_allclose(2 * (A @ ism.solve(f)), f, atol=1e-8)
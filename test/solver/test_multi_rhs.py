@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh
+from fealpy.functionspace import LagrangeFESpace
+from fealpy.fem import BilinearForm, ScalarDiffusionIntegrator, ScalarMassIntegrator
+from fealpy.solver import cg, gmres, minres, bicgstab, DirectSolverManager
+from fealpy.solver.iterative_solver_manger import IterativeSolverManager
+
+
+def _spd_matrix(n=16):
+    mesh = TriangleMesh.from_box(nx=n, ny=n)
+    space = LagrangeFESpace(mesh, 1)
+    bform = BilinearForm(space)
+    bform.add_integrator(ScalarDiffusionIntegrator())
+    bform.add_integrator(ScalarMassIntegrator())
+    return bform.assembly().tocsr()
+
+
+def _multi_rhs(A, k=4):
+    X = bm.tensor(np.random.default_rng(0).random((A.shape[0], k)))
+    # columns of different scales, and a zero column
+    X = X * bm.tensor([1.0, 1e-4, 0.0, 1e3][:k])
+    return X, A @ X
+
+
+@pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+def test_block_cg(backend):
+    bm.set_backend(backend)
+    A = _spd_matrix()
+    X, B = _multi_rhs(A)
+
+    x, info = cg(A, B, atol=1e-14, rtol=1e-10, returninfo=True)
+    assert x.shape == B.shape
+    assert info['residual'].shape == (4,)
+    assert info['niter'][2] == 0
+    for i in range(4):
+        np.testing.assert_allclose(bm.to_numpy(x[:, i]), bm.to_numpy(X[:, i]),
+                                   atol=1e-7*max(1.0, float(bm.max(bm.abs(X[:, i])))))
+        # each column stops as if it was solved alone, up to the rounding of
+        # the reductions
+        x1, info1 = cg(A, B[:, i], atol=1e-14, rtol=1e-10, returninfo=True)
+        assert abs(int(info['niter'][i]) - info1['niter']) <= 1 or i == 2
+
+    x, info = cg(A, B, maxit=3, returninfo=True)
+    assert bm.all(info['niter'] <= 3)
+
+
+@pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+@pytest.mark.parametrize("solver", [bicgstab, gmres, minres])
+def test_krylov_multi_rhs(backend, solver):
+    bm.set_backend(backend)
+    A = _spd_matrix()
+    X, B = _multi_rhs(A, k=2)
+
+    x, info = solver(A, B, atol=1e-12, rtol=1e-10)
+    assert x.shape == B.shape
+    assert info['niter'].shape == (2,)
+    np.testing.assert_allclose(bm.to_numpy(x), bm.to_numpy(X), atol=1e-6, rtol=1e-5)
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+@pytest.mark.parametrize("solver_name", ['cg', 'gmres', 'bicgstab'])
+def test_iterative_solver_manager_multi_rhs(backend, solver_name):
+    bm.set_backend(backend)
+    A = _spd_matrix()
+    X, B = _multi_rhs(A, k=3)
+
+    ism = IterativeSolverManager()
+    ism.set_matrix(A, matrix_type='SP')
+    ism.set_solver(solver_name)
+    ism.set_pc('jacobi')
+    ism.set_tolerances(rtol=1e-10, atol=1e-12)
+    x = ism.solve(B)
+    np.testing.assert_allclose(bm.to_numpy(x), bm.to_numpy(X), atol=1e-6, rtol=1e-5)
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+@pytest.mark.parametrize("matrix_type", ['G', 'L'])
+def test_direct_solver_manager_multi_rhs(backend, matrix_type):
+    bm.set_backend(backend)
+    A = _spd_matrix()
+    if matrix_type == 'L':
+        A = A.tril()
+    X, B = _multi_rhs(A)
+
+    mgr = DirectSolverManager(solver_name='scipy')
+    mgr.set_matrix(A, matrix_type=matrix_type)
+    x = mgr.solve(B)
+    assert x.shape == B.shape
+    np.testing.assert_allclose(bm.to_numpy(x), bm.to_numpy(X), atol=1e-8, rtol=1e-8)
@@ -0,0 +1,118 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.decorator import cartesian
+from fealpy.mesh import TriangleMesh
+from fealpy.functionspace import LagrangeFESpace
+from fealpy.fem import (
+    BilinearForm, ScalarDiffusionIntegrator, ScalarConvectionIntegrator,
+    ScalarMassIntegrator, DirichletBC
+)
+from fealpy.solver import gmres, cg, gcrodr, deflated_cg, SolverSession
+
+
+@cartesian
+def _beta(p):
+    v = bm.zeros(p.shape, dtype=p.dtype)
+    v[..., 0] = 1.0
+    v[..., 1] = 0.5
+    return v
+
+
+def _sequence(n, convection, nt=6):
+    """Backward Euler systems with a slowly growing time step."""
+    mesh = TriangleMesh.from_box(nx=n, ny=n)
+    space = LagrangeFESpace(mesh, 1)
+    x = mesh.entity('node')[:, 0]
+    for i in range(nt):
+        dt = 0.05 * (1 + 0.1 * i)
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator(1e-2))
+        if convection:
+            bform.add_integrator(ScalarConvectionIntegrator(_beta))
+        bform.add_integrator(ScalarMassIntegrator(1 / dt))
+        A = bform.assembly()
+        f = (1 + np.sin(0.3 * i)) + 0.1 * i * x
+        A, f = DirichletBC(space, gd=0.0).apply(A, f)
+        yield A.tocsr(), f
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+def test_gcrodr(backend):
+    bm.set_backend(backend)
+    mesh = TriangleMesh.from_box(nx=16, ny=16)
+    space = LagrangeFESpace(mesh, 1)
+    bform = BilinearForm(space)
+    bform.add_integrator(ScalarDiffusionIntegrator())
+    bform.add_integrator(ScalarConvectionIntegrator(_beta))
+    A = bform.assembly()
+    f = bm.ones(A.shape[0], dtype=bm.float64)
+    A, f = DirichletBC(space, gd=0.0).apply(A, f)
+    A = A.tocsr()
+    g = bm.sin(bm.arange(A.shape[0], dtype=bm.float64))
+
+    x, info = gcrodr(A, f, restart=20, k=0)
+    _, ginfo = gmres(A, f, restart=20)
+    assert info['niter'] == ginfo['niter']
+    assert info['U'] is None
+
+    x, info = gcrodr(A, f, restart=20, k=5)
+    assert info['U'].shape == (5, A.shape[0])
+    assert info['niter'] < ginfo['niter']
+    np.testing.assert_allclose(bm.to_numpy(A @ x), bm.to_numpy(f), atol=1e-7)
+
+    # 另一个右端项复用回收空间
+    _, info1 = gcrodr(A, g, restart=20, k=5)
+    x, info2 = gcrodr(A, g, restart=20, k=5, U=info['U'])
+    assert info2['niter'] < info1['niter']
+    np.testing.assert_allclose(bm.to_numpy(A @ x), bm.to_numpy(g), atol=1e-7)
+
+    X, info = gcrodr(A, bm.stack([f, g], axis=1), restart=20, k=5)
+    assert info['niter'][1] == info2['niter']
+    np.testing.assert_allclose(bm.to_numpy(A @ X), bm.to_numpy(bm.stack([f, g], axis=1)), atol=1e-7)
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+@pytest.mark.parametrize("method", ['gmres', 'cg'])
+def test_solver_session(backend, method):
+    bm.set_backend(backend)
+    convection = method == 'gmres'
+    session = SolverSession(method, recycle=8, restart=30)
+    recycle = SolverSession(method, recycle=8, guess=None, restart=30)
+    niter = 0
+    for A, f in _sequence(32, convection):
+        if convection:
+            niter += gmres(A, f, restart=30)[1]['niter']
+        else:
+            niter += cg(A, f, returninfo=True)[1]['niter']
+        for s in (session, recycle):
+            x = s(A, f)
+            assert np.linalg.norm(bm.to_numpy(A @ x - f)) <= 1.1e-8 * np.linalg.norm(bm.to_numpy(f))
+
+    assert len(session.niter) == 6
+    assert sum(recycle.niter) < niter
+    assert sum(session.niter) < 0.8 * niter
+    session.reset()
+    assert session.space is None and session.niter == []
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+@pytest.mark.parametrize("guess", ['extrapolate', 'project'])
+def test_solver_session_guess(backend, guess):
+    bm.set_backend(backend)
+    A, f = next(_sequence(8, False))
+    g = bm.linspace(0, 1, A.shape[0])
+    session = SolverSession('cg', recycle=0, guess=guess, rtol=1e-10)
+    for i in range(4):
+        # 右端项关于步数是线性的，解也是
+        session.solve(f + i * g, A=A)
+    assert session.niter[0] > 0
+    assert session.niter[-1] == 0
+
+    with pytest.raises(ValueError):
+        SolverSession('bicg')
+    with pytest.raises(ValueError):
+        SolverSession(guess='zero')
+    with pytest.raises(ValueError):
+        SolverSession().solve(f)
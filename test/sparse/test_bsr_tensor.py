@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.sparse import COOTensor, CSRTensor, BSRTensor
+
+ALL_BACKENDS = ['numpy', 'pytorch']
+
+
+def _random_coo(shape, density=0.4, seed=0):
+    rng = np.random.default_rng(seed)
+    dense = rng.random(shape) * (rng.random(shape) < density)
+    row, col = np.nonzero(dense)
+    values = dense[row, col]
+    # Split some entries into duplicates, which should be summed in the conversion.
+    values[:3] /= 2
+    row = np.concatenate([row, row[:3]])
+    col = np.concatenate([col, col[:3]])
+    values = np.concatenate([values, values[:3]])
+    indices = bm.from_numpy(np.stack([row, col]))
+    return COOTensor(indices, bm.from_numpy(values), shape), dense
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+@pytest.mark.parametrize("blocksize", [(2, 2), (3, 3), (2, 3)])
+def test_conversion(backend, blocksize):
+    bm.set_backend(backend)
+    coo, dense = _random_coo((12, 18))
+
+    bsr = coo.tobsr(blocksize)
+    assert bsr.blocksize == blocksize
+    assert bsr.shape == (12, 18)
+    assert bsr.nnz == bsr.nnzb * blocksize[0] * blocksize[1]
+    np.testing.assert_allclose(bm.to_numpy(bsr.to_dense()), dense, atol=1e-14)
+    np.testing.assert_allclose(bm.to_numpy(bsr.tocsr().to_dense()), dense, atol=1e-14)
+    np.testing.assert_allclose(bm.to_numpy(bsr.tocoo().to_dense()), dense, atol=1e-14)
+    np.testing.assert_allclose(bsr.to_scipy().toarray(), dense, atol=1e-14)
+
+    csr = coo.tocsr(coalesce=True)
+    bsr2 = csr.tobsr(blocksize)
+    np.testing.assert_array_equal(bm.to_numpy(bsr2.crow), bm.to_numpy(bsr.crow))
+    np.testing.assert_array_equal(bm.to_numpy(bsr2.col), bm.to_numpy(bsr.col))
+
+    with pytest.raises(ValueError):
+        coo.tobsr((5, 5))
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+@pytest.mark.parametrize("blocksize", [(2, 2), (3, 3), (2, 3)])
+def test_matmul(backend, blocksize):
+    bm.set_backend(backend)
+    coo, dense = _random_coo((12, 18))
+    bsr = coo.tobsr(blocksize)
+
+    x = np.random.rand(18)
+    X = np.random.rand(18, 4)
+    np.testing.assert_allclose(bm.to_numpy(bsr @ bm.from_numpy(x)), dense @ x, atol=1e-12)
+    np.testing.assert_allclose(bm.to_numpy(bsr @ bm.from_numpy(X)), dense @ X, atol=1e-12)
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+def test_manipulation(backend):
+    bm.set_backend(backend)
+    coo, dense = _random_coo((12, 12), density=0.5)
+    bsr = coo.tobsr((3, 3))
+
+    np.testing.assert_allclose(bm.to_numpy(bsr.T.to_dense()), dense.T, atol=1e-14)
+    np.testing.assert_allclose(bm.to_numpy((bsr + bsr.T).to_dense()), dense + dense.T, atol=1e-14)
+    np.testing.assert_allclose(bm.to_numpy((-bsr * 2.0).to_dense()), -2 * dense, atol=1e-14)
+
+    lower = np.kron(np.tril(np.ones((4, 4)), -1), np.ones((3, 3)))
+    upper = np.kron(np.triu(np.ones((4, 4))), np.ones((3, 3)))
+    np.testing.assert_allclose(bm.to_numpy(bsr.tril(-1).to_dense()), dense * lower, atol=1e-14)
+    np.testing.assert_allclose(bm.to_numpy(bsr.triu().to_dense()), dense * upper, atol=1e-14)
+
+    D = bm.to_numpy(bsr.diagonal_blocks())
+    assert D.shape == (4, 3, 3)
+    for i in range(4):
+        np.testing.assert_allclose(D[i], dense[3*i:3*i+3, 3*i:3*i+3], atol=1e-14)
+
+    scipy_bsr = BSRTensor.from_scipy(bsr.to_scipy())
+    np.testing.assert_allclose(bm.to_numpy(scipy_bsr.to_dense()), dense, atol=1e-14)
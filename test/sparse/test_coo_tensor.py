@@ -1,4 +1,5 @@
 # test_coo_tensor.py
+import numpy as np
 import pytest
 
 from fealpy.sparse import coo_matrix as fpy_coo_matrix
@@ -388,3 +389,27 @@ def test_coo_to_csr(backend):
         shape=(5, 3))
     assert bm.allclose(A.crow, B.crow)
     assert bm.allclose(A.toarray(), B.toarray())
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+def test_coo_to_csr_coalesce(backend):
+    bm.set_backend(backend)
+    rng = np.random.default_rng(0)
+    row = rng.integers(0, 50, 2000)
+    col = rng.integers(0, 40, 2000)
+    val = rng.random(2000)
+    indices = bm.from_numpy(np.stack([row, col], axis=0))
+    coo = COOTensor(indices, bm.from_numpy(val), (50, 40))
+    expected = np.zeros((50, 40))
+    np.add.at(expected, (row, col), val)
+
+    csr = coo.tocsr(coalesce=True)
+    assert csr.nnz == len(set(zip(row.tolist(), col.tolist())))
+    np.testing.assert_allclose(bm.to_numpy(csr.toarray()), expected, atol=1e-12)
+
+    # The same indices as the lexsort fallback, used by batched values.
+    coalesced = coo.coalesce()
+    fallback = COOTensor(indices, bm.from_numpy(val[None, :]), (50, 40)).coalesce()
+    np.testing.assert_array_equal(bm.to_numpy(coalesced.indices), bm.to_numpy(fallback.indices))
+    np.testing.assert_allclose(bm.to_numpy(coalesced.values), bm.to_numpy(fallback.values[0]), atol=1e-12)
+    np.testing.assert_array_equal(bm.to_numpy(csr.col), bm.to_numpy(coalesced.indices[1]))
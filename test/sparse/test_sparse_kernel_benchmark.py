@@ -0,0 +1,68 @@
+import time
+
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh, TetrahedronMesh
+from fealpy.functionspace import LagrangeFESpace
+from fealpy.fem import BilinearForm, ScalarDiffusionIntegrator
+
+
+def _bench(func, number=5):
+    func()
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return (time.perf_counter() - start) / number
+
+
+def _laplace_matrix(mesh_type, n, p):
+    if mesh_type == 'tri':
+        mesh = TriangleMesh.from_box(nx=n, ny=n)
+    else:
+        mesh = TetrahedronMesh.from_box(nx=n, ny=n, nz=n)
+    space = LagrangeFESpace(mesh, p)
+    bform = BilinearForm(space)
+    bform.add_integrator(ScalarDiffusionIntegrator())
+    return bform.assembly()
+
+
+@pytest.mark.parametrize("backend", ['numpy'])
+@pytest.mark.parametrize("mesh_type, n, p", [('tri', 32, 1), ('tri', 16, 3), ('tet', 6, 2)])
+@pytest.mark.parametrize("num_threads", [1, 4])
+def test_sparse_kernel_benchmark(backend, mesh_type, n, p, num_threads):
+    """Compare the CSR kernels of the NumPy backend with `scipy.sparse`.
+    Run this file directly for larger matrices."""
+    bm.set_backend(backend)
+    bm.set_sparse_threads(num_threads, min_nnz=0)
+    A = _laplace_matrix(mesh_type, n, p)
+    S = A.to_scipy()
+    rng = np.random.default_rng(0)
+    x = rng.random(A.shape[1])
+    X = rng.random((A.shape[1], 8))
+
+    cases = [
+        ('SpMV', lambda: A @ x, lambda: S @ x),
+        ('SpMM(8)', lambda: A @ X, lambda: S @ X),
+        ('SpGEMM', lambda: A @ A, lambda: S @ S),
+    ]
+
+    for name, fealpy_op, scipy_op in cases:
+        r0, r1 = fealpy_op(), scipy_op()
+        if name == 'SpGEMM':
+            r0, r1 = r0.to_scipy().toarray(), r1.toarray()
+        np.testing.assert_allclose(r0, r1, rtol=1e-12, atol=1e-12)
+        t0 = _bench(fealpy_op)
+        t1 = _bench(scipy_op)
+        print(f"{mesh_type} P{p} nnz={A.nnz} threads={num_threads} {name}: "
+              f"fealpy {t0*1e3:.3f}ms, scipy {t1*1e3:.3f}ms, speedup {t1/t0:.2f}")
+
+    bm.set_sparse_threads(1)
+
+
+if __name__ == "__main__":
+    import os
+    for mesh_type, n, p in [('tri', 256, 1), ('tri', 128, 3), ('tet', 24, 2)]:
+        for num_threads in sorted({1, os.cpu_count() or 1}):
+            test_sparse_kernel_benchmark('numpy', mesh_type, n, p, num_threads)